@@ -7802,8 +7802,8 @@ nk_utf_validate(nk_rune *u, int i)
 {
     NK_ASSERT(u);
     if (!u) return 0;
-    if (!NK_BETWEEN(*u, nk_utfmin[i], nk_utfmax[i]) ||
-         NK_BETWEEN(*u, 0xD800, 0xDFFF))
+    if (!NK_BETWEEN(*u, nk_utfmin[i], nk_utfmax[i]+1) ||
+         NK_BETWEEN(*u, 0xD800, 0xDFFF+1))
             *u = NK_UTF_INVALID;
     for (i = 1; *u > nk_utfmax[i]; ++i);
     return i;
@@ -7833,7 +7833,7 @@ nk_utf_decode(const char *c, nk_rune *u, int clen)
     *u = NK_UTF_INVALID;
 
     udecoded = nk_utf_decode_byte(c[0], &len);
-    if (!NK_BETWEEN(len, 1, NK_UTF_SIZE))
+    if (!NK_BETWEEN(len, 1, NK_UTF_SIZE+1))
         return 1;
 
     for (i = 1, j = 1; i < clen && j < len; ++i, ++j) {
@@ -0,0 +1,119 @@
+/*
+Copyright (c) 2017 William Emerison Six
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+
+/*
+  Counts the requests made to Python's memory allocators, for the
+  benchmarks in pynuklear.benchmark.  allocations_start() installs hooks
+  on the PYMEM_DOMAIN_MEM and PYMEM_DOMAIN_OBJ allocators, i.e. those of
+  PyMem_Malloc and of Python objects, which count every malloc, calloc and
+  realloc and then call the allocator they replaced; allocations_stop()
+  puts the allocators back and returns the count.  Unlike tracemalloc,
+  which only tells the blocks still allocated, this counts the blocks a
+  piece of code allocates and frees again too.
+
+  Both are called with the GIL held, as are the hooked allocators, so the
+  count needs no locking.
+ */
+
+static const PyMemAllocatorDomain nk_allocations_domains[] = {
+    PYMEM_DOMAIN_MEM, PYMEM_DOMAIN_OBJ
+};
+#define NK_ALLOCATIONS_DOMAINS \
+    (sizeof(nk_allocations_domains) / sizeof(nk_allocations_domains[0]))
+
+static PyMemAllocatorEx nk_allocations_saved[NK_ALLOCATIONS_DOMAINS];
+static Py_ssize_t nk_allocations_count;
+static int nk_allocations_counting;
+
+static void *
+nk_allocations_malloc(void *ctx, size_t size)
+{
+    PyMemAllocatorEx *saved = (PyMemAllocatorEx *)ctx;
+    nk_allocations_count++;
+    return saved->malloc(saved->ctx, size);
+}
+
+static void *
+nk_allocations_calloc(void *ctx, size_t nelem, size_t elsize)
+{
+    PyMemAllocatorEx *saved = (PyMemAllocatorEx *)ctx;
+    nk_allocations_count++;
+    return saved->calloc(saved->ctx, nelem, elsize);
+}
+
+static void *
+nk_allocations_realloc(void *ctx, void *ptr, size_t new_size)
+{
+    PyMemAllocatorEx *saved = (PyMemAllocatorEx *)ctx;
+    nk_allocations_count++;
+    return saved->realloc(saved->ctx, ptr, new_size);
+}
+
+static void
+nk_allocations_free(void *ctx, void *ptr)
+{
+    PyMemAllocatorEx *saved = (PyMemAllocatorEx *)ctx;
+    saved->free(saved->ctx, ptr);
+}
+
+static PyObject *
+allocations_start(PyObject *module, PyObject *unused)
+{
+    size_t i;
+    if (nk_allocations_counting) {
+        PyErr_SetString(PyExc_RuntimeError, "allocations are already being counted");
+        return NULL;
+    }
+    for (i = 0; i < NK_ALLOCATIONS_DOMAINS; i++) {
+        PyMemAllocatorEx hook = {&nk_allocations_saved[i],
+                                 nk_allocations_malloc, nk_allocations_calloc,
+                                 nk_allocations_realloc, nk_allocations_free};
+        PyMem_GetAllocator(nk_allocations_domains[i], &nk_allocations_saved[i]);
+        PyMem_SetAllocator(nk_allocations_domains[i], &hook);
+    }
+    nk_allocations_count = 0;
+    nk_allocations_counting = 1;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+allocations_stop(PyObject *module, PyObject *unused)
+{
+    size_t i;
+    Py_ssize_t count = nk_allocations_count;
+    if (!nk_allocations_counting) {
+        PyErr_SetString(PyExc_RuntimeError, "allocations are not being counted");
+        return NULL;
+    }
+    for (i = 0; i < NK_ALLOCATIONS_DOMAINS; i++)
+        PyMem_SetAllocator(nk_allocations_domains[i], &nk_allocations_saved[i]);
+    nk_allocations_counting = 0;
+    return PyLong_FromSsize_t(count);
+}
+
+#define NK_ALLOCATIONS_METHODS \
+    {"allocations_start", allocations_start, METH_NOARGS, \
+     "Starts counting the requests made to Python's memory allocators."}, \
+    {"allocations_stop", allocations_stop, METH_NOARGS, \
+     "Stops counting the requests made to Python's memory allocators, " \
+     "and returns their number since allocations_start()."},
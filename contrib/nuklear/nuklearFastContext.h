@@ -0,0 +1,1329 @@
+/*
+Copyright (c) 2017 William Emerison Six
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+*/
+
+/*
+  FastContext is a native Python type which holds a struct nk_context* and
+  exposes the most frequently called widget, layout and window procedures
+  as METH_FASTCALL methods.  Unlike the ctypes bindings in nuklear.py, a
+  call does not build c_int/c_float boxes, does not go through byref, and
+  does not go through libffi, which matters when thousands of widgets are
+  built every frame.
+
+  The arguments are plain Python values:  str or bytes for text, int for
+  flags and enums, int or float for numbers.  Rectangles, vectors and colors
+  may either be the ctypes structures from nuklear.py (anything exporting
+  the buffer protocol with the right size) or a sequence of numbers.
+
+  Widgets which modify a value return the same tuples as the methods on
+  NuklearContext, e.g. slider_float returns (modified, value).
+
+  This header must be included after Python.h and nuklear.h.
+ */
+
+typedef struct {
+    PyObject_HEAD
+    struct nk_context *ctx;
+} FastContextObject;
+
+
+/* argument conversion */
+
+static int
+fc_check_nargs(FastContextObject *self, const char *name, Py_ssize_t nargs,
+               Py_ssize_t expected)
+{
+    /* __init__ may have been skipped, e.g. by FastContext.__new__ */
+    if (self->ctx == NULL) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s() called on a FastContext without an nk_context", name);
+        return 0;
+    }
+    if (nargs != expected) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() takes exactly %zd arguments (%zd given)",
+                     name, expected, nargs);
+        return 0;
+    }
+    return 1;
+}
+
+#define FC_NARGS(name, n) \
+    if (!fc_check_nargs(self, name, nargs, n)) return NULL
+
+static int
+fc_text(PyObject *o, const char **text, int *len)
+{
+    Py_ssize_t size;
+    if (PyUnicode_Check(o)) {
+        *text = PyUnicode_AsUTF8AndSize(o, &size);
+        if (*text == NULL)
+            return 0;
+    } else if (PyBytes_Check(o)) {
+        *text = PyBytes_AS_STRING(o);
+        size = PyBytes_GET_SIZE(o);
+    } else {
+        PyErr_Format(PyExc_TypeError,
+                     "expected str or bytes, not %.200s",
+                     Py_TYPE(o)->tp_name);
+        return 0;
+    }
+    if (size > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "text is too long");
+        return 0;
+    }
+    *len = (int)size;
+    return 1;
+}
+
+static int
+fc_int(PyObject *o, int *value)
+{
+    long v = PyLong_AsLong(o);
+    if (v == -1 && PyErr_Occurred())
+        return 0;
+    if (v < INT_MIN || v > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "Python int too large to convert to C int");
+        return 0;
+    }
+    *value = (int)v;
+    return 1;
+}
+
+static int
+fc_float(PyObject *o, float *value)
+{
+    double v;
+    if (PyFloat_CheckExact(o)) {
+        *value = (float)PyFloat_AS_DOUBLE(o);
+        return 1;
+    }
+    v = PyFloat_AsDouble(o);
+    if (v == -1.0 && PyErr_Occurred())
+        return 0;
+    *value = (float)v;
+    return 1;
+}
+
+/* read a ctypes structure of floats, or a sequence of numbers */
+static int
+fc_floats(PyObject *o, float *out, Py_ssize_t count, const char *what)
+{
+    Py_ssize_t i;
+    PyObject *seq;
+
+    if (PyObject_CheckBuffer(o)) {
+        Py_buffer view;
+        int ok;
+        if (PyObject_GetBuffer(o, &view, PyBUF_SIMPLE) < 0)
+            return 0;
+        ok = view.len == (Py_ssize_t)(count * sizeof(float));
+        if (ok)
+            memcpy(out, view.buf, (size_t)view.len);
+        PyBuffer_Release(&view);
+        if (!ok)
+            PyErr_Format(PyExc_TypeError, "expected a %s", what);
+        return ok;
+    }
+    seq = PySequence_Fast(o, what);
+    if (seq == NULL)
+        return 0;
+    if (PySequence_Fast_GET_SIZE(seq) != count) {
+        Py_DECREF(seq);
+        PyErr_Format(PyExc_TypeError, "expected a %s", what);
+        return 0;
+    }
+    for (i = 0; i < count; ++i) {
+        if (!fc_float(PySequence_Fast_GET_ITEM(seq, i), &out[i])) {
+            Py_DECREF(seq);
+            return 0;
+        }
+    }
+    Py_DECREF(seq);
+    return 1;
+}
+
+static int
+fc_rect(PyObject *o, struct nk_rect *rect)
+{
+    float v[4];
+    if (!fc_floats(o, v, 4, "Rect or a sequence of 4 numbers"))
+        return 0;
+    *rect = nk_rect(v[0], v[1], v[2], v[3]);
+    return 1;
+}
+
+static int
+fc_vec2(PyObject *o, struct nk_vec2 *vec)
+{
+    float v[2];
+    if (!fc_floats(o, v, 2, "Vec2 or a sequence of 2 numbers"))
+        return 0;
+    *vec = nk_vec2(v[0], v[1]);
+    return 1;
+}
+
+static int
+fc_color(PyObject *o, struct nk_color *color)
+{
+    int i, c[4];
+    PyObject *seq;
+
+    if (PyObject_CheckBuffer(o)) {
+        Py_buffer view;
+        int ok;
+        if (PyObject_GetBuffer(o, &view, PyBUF_SIMPLE) < 0)
+            return 0;
+        ok = view.len == (Py_ssize_t)sizeof(struct nk_color);
+        if (ok)
+            memcpy(color, view.buf, sizeof(struct nk_color));
+        PyBuffer_Release(&view);
+        if (!ok)
+            PyErr_SetString(PyExc_TypeError, "expected a Color");
+        return ok;
+    }
+    seq = PySequence_Fast(o, "expected a Color or a sequence of 4 ints");
+    if (seq == NULL)
+        return 0;
+    if (PySequence_Fast_GET_SIZE(seq) != 4) {
+        Py_DECREF(seq);
+        PyErr_SetString(PyExc_TypeError, "expected a Color or a sequence of 4 ints");
+        return 0;
+    }
+    for (i = 0; i < 4; ++i) {
+        if (!fc_int(PySequence_Fast_GET_ITEM(seq, i), &c[i])) {
+            Py_DECREF(seq);
+            return 0;
+        }
+    }
+    Py_DECREF(seq);
+    *color = nk_rgba(c[0], c[1], c[2], c[3]);
+    return 1;
+}
+
+static PyObject *
+fc_rect_tuple(struct nk_rect r)
+{
+    return Py_BuildValue("(ffff)", r.x, r.y, r.w, r.h);
+}
+
+
+/* Window */
+
+static PyObject *
+fc_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *title; int len; struct nk_rect bounds; int flags;
+    FC_NARGS("begin", 3);
+    if (!fc_text(args[0], &title, &len) || !fc_rect(args[1], &bounds) ||
+        !fc_int(args[2], &flags))
+        return NULL;
+    return PyLong_FromLong(nk_begin(self->ctx, title, bounds, (nk_flags)flags));
+}
+
+static PyObject *
+fc_begin_titled(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *name, *title; int name_len, title_len; struct nk_rect bounds; int flags;
+    FC_NARGS("begin_titled", 4);
+    if (!fc_text(args[0], &name, &name_len) || !fc_text(args[1], &title, &title_len) ||
+        !fc_rect(args[2], &bounds) || !fc_int(args[3], &flags))
+        return NULL;
+    return PyLong_FromLong(nk_begin_titled(self->ctx, name, title, bounds, (nk_flags)flags));
+}
+
+static PyObject *
+fc_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("end", 0);
+    nk_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_window_get_bounds(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("window_get_bounds", 0);
+    return fc_rect_tuple(nk_window_get_bounds(self->ctx));
+}
+
+static PyObject *
+fc_window_is_hovered(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("window_is_hovered", 0);
+    return PyLong_FromLong(nk_window_is_hovered(self->ctx));
+}
+
+static PyObject *
+fc_item_is_any_active(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("item_is_any_active", 0);
+    return PyLong_FromLong(nk_item_is_any_active(self->ctx));
+}
+
+
+/* Layout */
+
+static PyObject *
+fc_layout_row_dynamic(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float height; int columns;
+    FC_NARGS("layout_row_dynamic", 2);
+    if (!fc_float(args[0], &height) || !fc_int(args[1], &columns))
+        return NULL;
+    nk_layout_row_dynamic(self->ctx, height, columns);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_layout_row_static(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float height; int item_width, columns;
+    FC_NARGS("layout_row_static", 3);
+    if (!fc_float(args[0], &height) || !fc_int(args[1], &item_width) ||
+        !fc_int(args[2], &columns))
+        return NULL;
+    nk_layout_row_static(self->ctx, height, item_width, columns);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_layout_row_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int format, columns; float height;
+    FC_NARGS("layout_row_begin", 3);
+    if (!fc_int(args[0], &format) || !fc_float(args[1], &height) ||
+        !fc_int(args[2], &columns))
+        return NULL;
+    nk_layout_row_begin(self->ctx, (enum nk_layout_format)format, height, columns);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_layout_row_push(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float value;
+    FC_NARGS("layout_row_push", 1);
+    if (!fc_float(args[0], &value))
+        return NULL;
+    nk_layout_row_push(self->ctx, value);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_layout_row_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("layout_row_end", 0);
+    nk_layout_row_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_spacing(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int columns;
+    FC_NARGS("spacing", 1);
+    if (!fc_int(args[0], &columns))
+        return NULL;
+    nk_spacing(self->ctx, columns);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_widget_width(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("widget_width", 0);
+    return PyFloat_FromDouble(nk_widget_width(self->ctx));
+}
+
+static PyObject *
+fc_widget_bounds(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("widget_bounds", 0);
+    return fc_rect_tuple(nk_widget_bounds(self->ctx));
+}
+
+
+/* Group */
+
+static PyObject *
+fc_group_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *title; int len, flags;
+    FC_NARGS("group_begin", 2);
+    if (!fc_text(args[0], &title, &len) || !fc_int(args[1], &flags))
+        return NULL;
+    return PyLong_FromLong(nk_group_begin(self->ctx, title, (nk_flags)flags));
+}
+
+static PyObject *
+fc_group_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("group_end", 0);
+    nk_group_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+
+/* Tree */
+
+static PyObject *
+fc_tree_push_hashed(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int type, state, seed, title_len, hash_len;
+    const char *title, *hash;
+    FC_NARGS("tree_push_hashed", 5);
+    if (!fc_int(args[0], &type) || !fc_text(args[1], &title, &title_len) ||
+        !fc_int(args[2], &state) || !fc_text(args[3], &hash, &hash_len) ||
+        !fc_int(args[4], &seed))
+        return NULL;
+    return PyLong_FromLong(nk_tree_push_hashed(self->ctx, (enum nk_tree_type)type, title,
+                                               (enum nk_collapse_states)state,
+                                               hash, hash_len, seed));
+}
+
+static PyObject *
+fc_tree_pop(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("tree_pop", 0);
+    nk_tree_pop(self->ctx);
+    Py_RETURN_NONE;
+}
+
+
+/* Text */
+
+static PyObject *
+fc_text_widget(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len, align;
+    FC_NARGS("text", 2);
+    if (!fc_text(args[0], &text, &len) || !fc_int(args[1], &align))
+        return NULL;
+    nk_text(self->ctx, text, len, (nk_flags)align);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_label_colored(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len, align; struct nk_color color;
+    FC_NARGS("label_colored", 3);
+    if (!fc_text(args[0], &text, &len) || !fc_int(args[1], &align) ||
+        !fc_color(args[2], &color))
+        return NULL;
+    nk_text_colored(self->ctx, text, len, (nk_flags)align, color);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_label_wrap(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len;
+    FC_NARGS("label_wrap", 1);
+    if (!fc_text(args[0], &text, &len))
+        return NULL;
+    nk_text_wrap(self->ctx, text, len);
+    Py_RETURN_NONE;
+}
+
+
+/* Button */
+
+static PyObject *
+fc_button_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *title; int len;
+    FC_NARGS("button_label", 1);
+    if (!fc_text(args[0], &title, &len))
+        return NULL;
+    return PyLong_FromLong(nk_button_text(self->ctx, title, len));
+}
+
+static PyObject *
+fc_button_symbol(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int symbol;
+    FC_NARGS("button_symbol", 1);
+    if (!fc_int(args[0], &symbol))
+        return NULL;
+    return PyLong_FromLong(nk_button_symbol(self->ctx, (enum nk_symbol_type)symbol));
+}
+
+static PyObject *
+fc_button_symbol_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *label; int symbol, len, align;
+    FC_NARGS("button_symbol_label", 3);
+    if (!fc_int(args[0], &symbol) || !fc_text(args[1], &label, &len) ||
+        !fc_int(args[2], &align))
+        return NULL;
+    return PyLong_FromLong(nk_button_symbol_text(self->ctx, (enum nk_symbol_type)symbol,
+                                                 label, len, (nk_flags)align));
+}
+
+static PyObject *
+fc_button_color(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    struct nk_color color;
+    FC_NARGS("button_color", 1);
+    if (!fc_color(args[0], &color))
+        return NULL;
+    return PyLong_FromLong(nk_button_color(self->ctx, color));
+}
+
+
+/* Checkbox, Radio Button, Selectable */
+
+static PyObject *
+fc_checkbox_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len, active, modified;
+    FC_NARGS("checkbox_label", 2);
+    if (!fc_text(args[0], &text, &len))
+        return NULL;
+    active = PyObject_IsTrue(args[1]);
+    if (active < 0)
+        return NULL;
+    modified = nk_checkbox_text(self->ctx, text, len, &active);
+    return Py_BuildValue("(ii)", modified, active);
+}
+
+static PyObject *
+fc_option_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *label; int len, active;
+    FC_NARGS("option_label", 2);
+    if (!fc_text(args[0], &label, &len))
+        return NULL;
+    active = PyObject_IsTrue(args[1]);
+    if (active < 0)
+        return NULL;
+    return PyLong_FromLong(nk_option_text(self->ctx, label, len, active));
+}
+
+static PyObject *
+fc_selectable_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *label; int len, align, value, modified;
+    FC_NARGS("selectable_label", 3);
+    if (!fc_text(args[0], &label, &len) || !fc_int(args[1], &align))
+        return NULL;
+    value = PyObject_IsTrue(args[2]);
+    if (value < 0)
+        return NULL;
+    modified = nk_selectable_text(self->ctx, label, len, (nk_flags)align, &value);
+    return Py_BuildValue("(ii)", modified, value);
+}
+
+
+/* Slider, Progress */
+
+static PyObject *
+fc_slider_float(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float min, value, max, step; int modified;
+    FC_NARGS("slider_float", 4);
+    if (!fc_float(args[0], &min) || !fc_float(args[1], &value) ||
+        !fc_float(args[2], &max) || !fc_float(args[3], &step))
+        return NULL;
+    modified = nk_slider_float(self->ctx, min, &value, max, step);
+    return Py_BuildValue("(if)", modified, value);
+}
+
+static PyObject *
+fc_slider_int(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int min, value, max, step, modified;
+    FC_NARGS("slider_int", 4);
+    if (!fc_int(args[0], &min) || !fc_int(args[1], &value) ||
+        !fc_int(args[2], &max) || !fc_int(args[3], &step))
+        return NULL;
+    modified = nk_slider_int(self->ctx, min, &value, max, step);
+    return Py_BuildValue("(ii)", modified, value);
+}
+
+static PyObject *
+fc_slide_float(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float min, value, max, step;
+    FC_NARGS("slide_float", 4);
+    if (!fc_float(args[0], &min) || !fc_float(args[1], &value) ||
+        !fc_float(args[2], &max) || !fc_float(args[3], &step))
+        return NULL;
+    return PyFloat_FromDouble(nk_slide_float(self->ctx, min, value, max, step));
+}
+
+static PyObject *
+fc_slide_int(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int min, value, max, step;
+    FC_NARGS("slide_int", 4);
+    if (!fc_int(args[0], &min) || !fc_int(args[1], &value) ||
+        !fc_int(args[2], &max) || !fc_int(args[3], &step))
+        return NULL;
+    return PyLong_FromLong(nk_slide_int(self->ctx, min, value, max, step));
+}
+
+static PyObject *
+fc_progress(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int cur, max, modifiable, modified; nk_size value;
+    FC_NARGS("progress", 3);
+    if (!fc_int(args[0], &cur) || !fc_int(args[1], &max) ||
+        !fc_int(args[2], &modifiable))
+        return NULL;
+    /* nk_size is unsigned; a negative value is an empty bar */
+    value = cur > 0 ? (nk_size)cur : 0;
+    modified = nk_progress(self->ctx, &value, max > 0 ? (nk_size)max : 0, modifiable);
+    return Py_BuildValue("(in)", modified, (Py_ssize_t)value);
+}
+
+
+/* Properties */
+
+static PyObject *
+fc_property_int(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *name; int len, min, value, max, step; float inc_per_pixel;
+    FC_NARGS("property_int", 6);
+    if (!fc_text(args[0], &name, &len) || !fc_int(args[1], &min) ||
+        !fc_int(args[2], &value) || !fc_int(args[3], &max) ||
+        !fc_int(args[4], &step) || !fc_float(args[5], &inc_per_pixel))
+        return NULL;
+    nk_property_int(self->ctx, name, min, &value, max, step, inc_per_pixel);
+    return PyLong_FromLong(value);
+}
+
+static PyObject *
+fc_property_float(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *name; int len; float min, value, max, step, inc_per_pixel;
+    FC_NARGS("property_float", 6);
+    if (!fc_text(args[0], &name, &len) || !fc_float(args[1], &min) ||
+        !fc_float(args[2], &value) || !fc_float(args[3], &max) ||
+        !fc_float(args[4], &step) || !fc_float(args[5], &inc_per_pixel))
+        return NULL;
+    nk_property_float(self->ctx, name, min, &value, max, step, inc_per_pixel);
+    return PyFloat_FromDouble(value);
+}
+
+static PyObject *
+fc_propertyi(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *name; int len, min, value, max, step; float inc_per_pixel;
+    FC_NARGS("propertyi", 6);
+    if (!fc_text(args[0], &name, &len) || !fc_int(args[1], &min) ||
+        !fc_int(args[2], &value) || !fc_int(args[3], &max) ||
+        !fc_int(args[4], &step) || !fc_float(args[5], &inc_per_pixel))
+        return NULL;
+    return PyLong_FromLong(nk_propertyi(self->ctx, name, min, value, max, step, inc_per_pixel));
+}
+
+static PyObject *
+fc_propertyf(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *name; int len; float min, value, max, step, inc_per_pixel;
+    FC_NARGS("propertyf", 6);
+    if (!fc_text(args[0], &name, &len) || !fc_float(args[1], &min) ||
+        !fc_float(args[2], &value) || !fc_float(args[3], &max) ||
+        !fc_float(args[4], &step) || !fc_float(args[5], &inc_per_pixel))
+        return NULL;
+    return PyFloat_FromDouble(nk_propertyf(self->ctx, name, min, value, max, step, inc_per_pixel));
+}
+
+
+/* Chart */
+
+static PyObject *
+fc_chart_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int type, count; float min, max;
+    FC_NARGS("chart_begin", 4);
+    if (!fc_int(args[0], &type) || !fc_int(args[1], &count) ||
+        !fc_float(args[2], &min) || !fc_float(args[3], &max))
+        return NULL;
+    return PyLong_FromLong(nk_chart_begin(self->ctx, (enum nk_chart_type)type, count, min, max));
+}
+
+static PyObject *
+fc_chart_push(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    float value;
+    FC_NARGS("chart_push", 1);
+    if (!fc_float(args[0], &value))
+        return NULL;
+    return PyLong_FromUnsignedLong(nk_chart_push(self->ctx, value));
+}
+
+static PyObject *
+fc_chart_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("chart_end", 0);
+    nk_chart_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+
+/* Popup, Contextual, Tooltip */
+
+static PyObject *
+fc_popup_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *title; int type, len, flags; struct nk_rect rect;
+    FC_NARGS("popup_begin", 4);
+    if (!fc_int(args[0], &type) || !fc_text(args[1], &title, &len) ||
+        !fc_int(args[2], &flags) || !fc_rect(args[3], &rect))
+        return NULL;
+    return PyLong_FromLong(nk_popup_begin(self->ctx, (enum nk_popup_type)type,
+                                          title, (nk_flags)flags, rect));
+}
+
+static PyObject *
+fc_popup_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("popup_end", 0);
+    nk_popup_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_contextual_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int flags; struct nk_vec2 size; struct nk_rect trigger_bounds;
+    FC_NARGS("contextual_begin", 3);
+    if (!fc_int(args[0], &flags) || !fc_vec2(args[1], &size) ||
+        !fc_rect(args[2], &trigger_bounds))
+        return NULL;
+    return PyLong_FromLong(nk_contextual_begin(self->ctx, (nk_flags)flags, size, trigger_bounds));
+}
+
+static PyObject *
+fc_contextual_item_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len, align;
+    FC_NARGS("contextual_item_label", 2);
+    if (!fc_text(args[0], &text, &len) || !fc_int(args[1], &align))
+        return NULL;
+    return PyLong_FromLong(nk_contextual_item_text(self->ctx, text, len, (nk_flags)align));
+}
+
+static PyObject *
+fc_contextual_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("contextual_end", 0);
+    nk_contextual_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_tooltip(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len;
+    FC_NARGS("tooltip", 1);
+    if (!fc_text(args[0], &text, &len))
+        return NULL;
+    nk_tooltip(self->ctx, text);
+    Py_RETURN_NONE;
+}
+
+
+/* Menu */
+
+static PyObject *
+fc_menubar_begin(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("menubar_begin", 0);
+    nk_menubar_begin(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_menubar_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("menubar_end", 0);
+    nk_menubar_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+fc_menu_begin_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *text; int len, align; struct nk_vec2 size;
+    FC_NARGS("menu_begin_label", 3);
+    if (!fc_text(args[0], &text, &len) || !fc_int(args[1], &align) ||
+        !fc_vec2(args[2], &size))
+        return NULL;
+    return PyLong_FromLong(nk_menu_begin_text(self->ctx, text, len, (nk_flags)align, size));
+}
+
+static PyObject *
+fc_menu_item_label(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    const char *label; int len, align;
+    FC_NARGS("menu_item_label", 2);
+    if (!fc_text(args[0], &label, &len) || !fc_int(args[1], &align))
+        return NULL;
+    return PyLong_FromLong(nk_menu_item_text(self->ctx, label, len, (nk_flags)align));
+}
+
+static PyObject *
+fc_menu_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("menu_end", 0);
+    nk_menu_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+
+/* Combo */
+
+static PyObject *
+fc_combo_begin_color(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    struct nk_color color; struct nk_vec2 size;
+    FC_NARGS("combo_begin_color", 2);
+    if (!fc_color(args[0], &color) || !fc_vec2(args[1], &size))
+        return NULL;
+    return PyLong_FromLong(nk_combo_begin_color(self->ctx, color, size));
+}
+
+static PyObject *
+fc_combo_end(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    FC_NARGS("combo_end", 0);
+    nk_combo_end(self->ctx);
+    Py_RETURN_NONE;
+}
+
+
+/* Display lists
+
+  run(ops, floats, strings, results) interprets a display list recorded by
+  nuklear.DisplayList, so that a whole panel is built with a single call.
+
+  ops is an array('i') of opcodes, each followed by its int arguments,
+  floats an array('f') and strings a list of str or bytes, both consumed in
+  order by the opcodes that need them.  results is an array('d'); widgets
+  which report something take the index of their slot in results as their
+  last int argument.  Stateful widgets read their value from the slot and
+  write the new value back, so that the same list can be run every frame,
+  and they store whether it was modified in the slot after it.
+
+  If begin, group_begin or tree_push is closed, the ops up to the matching
+  end are skipped, but their events (clicked, modified) are cleared.  The
+  end of a skipped window is still run, as nuklear requires.
+
+  The opcodes must be kept in the order of DisplayList in nuklear.py.
+ */
+
+enum fc_opcode {
+    FC_OP_BEGIN,
+    FC_OP_END,
+    FC_OP_LAYOUT_ROW_DYNAMIC,
+    FC_OP_LAYOUT_ROW_STATIC,
+    FC_OP_SPACING,
+    FC_OP_LABEL,
+    FC_OP_LABEL_COLORED,
+    FC_OP_LABEL_WRAP,
+    FC_OP_BUTTON_LABEL,
+    FC_OP_CHECKBOX_LABEL,
+    FC_OP_OPTION_LABEL,
+    FC_OP_SELECTABLE_LABEL,
+    FC_OP_SLIDER_FLOAT,
+    FC_OP_SLIDER_INT,
+    FC_OP_PROGRESS,
+    FC_OP_PROPERTY_INT,
+    FC_OP_PROPERTY_FLOAT,
+    FC_OP_GROUP_BEGIN,
+    FC_OP_GROUP_END,
+    FC_OP_TREE_PUSH,
+    FC_OP_TREE_POP,
+    FC_OP_COUNT
+};
+
+enum fc_block {
+    FC_BLOCK_NONE,
+    FC_BLOCK_OPEN,
+    FC_BLOCK_CLOSE
+};
+
+/* event is the offset in results of what has to be cleared when the op is
+   skipped, relative to the slot, or -1 if the op has no slot */
+static const struct {
+    unsigned char ints, floats, strings, block;
+    signed char event;
+} fc_ops[FC_OP_COUNT] = {
+    /* BEGIN             flags, slot; x, y, w, h; title */
+    {2, 4, 1, FC_BLOCK_OPEN, 0},
+    /* END */
+    {0, 0, 0, FC_BLOCK_CLOSE, -1},
+    /* LAYOUT_ROW_DYNAMIC columns; height */
+    {1, 1, 0, FC_BLOCK_NONE, -1},
+    /* LAYOUT_ROW_STATIC item_width, columns; height */
+    {2, 1, 0, FC_BLOCK_NONE, -1},
+    /* SPACING           columns */
+    {1, 0, 0, FC_BLOCK_NONE, -1},
+    /* LABEL             align; text */
+    {1, 0, 1, FC_BLOCK_NONE, -1},
+    /* LABEL_COLORED     align, r, g, b, a; text */
+    {5, 0, 1, FC_BLOCK_NONE, -1},
+    /* LABEL_WRAP        text */
+    {0, 0, 1, FC_BLOCK_NONE, -1},
+    /* BUTTON_LABEL      slot; title */
+    {1, 0, 1, FC_BLOCK_NONE, 0},
+    /* CHECKBOX_LABEL    slot; text */
+    {1, 0, 1, FC_BLOCK_NONE, 1},
+    /* OPTION_LABEL      slot; text */
+    {1, 0, 1, FC_BLOCK_NONE, 1},
+    /* SELECTABLE_LABEL  align, slot; text */
+    {2, 0, 1, FC_BLOCK_NONE, 1},
+    /* SLIDER_FLOAT      slot; min, max, step */
+    {1, 3, 0, FC_BLOCK_NONE, 1},
+    /* SLIDER_INT        min, max, step, slot */
+    {4, 0, 0, FC_BLOCK_NONE, 1},
+    /* PROGRESS          max, modifiable, slot */
+    {3, 0, 0, FC_BLOCK_NONE, 1},
+    /* PROPERTY_INT      min, max, step, slot; inc_per_pixel; name */
+    {4, 1, 1, FC_BLOCK_NONE, 1},
+    /* PROPERTY_FLOAT    slot; min, max, step, inc_per_pixel; name */
+    {1, 4, 1, FC_BLOCK_NONE, 1},
+    /* GROUP_BEGIN       flags, slot; title */
+    {2, 0, 1, FC_BLOCK_OPEN, 0},
+    /* GROUP_END */
+    {0, 0, 0, FC_BLOCK_CLOSE, -1},
+    /* TREE_PUSH         type, state, seed, slot; title, hash */
+    {4, 0, 2, FC_BLOCK_OPEN, 0},
+    /* TREE_POP */
+    {0, 0, 0, FC_BLOCK_CLOSE, -1},
+};
+
+struct fc_display_list {
+    const int *ops;
+    Py_ssize_t ops_len, pc;
+    const float *floats;
+    Py_ssize_t floats_len, fc;
+    PyObject *strings;
+    Py_ssize_t strings_len, sc;
+    double *results;
+    Py_ssize_t results_len;
+};
+
+static int
+fc_get_array(PyObject *o, Py_buffer *view, const char *format, Py_ssize_t itemsize,
+             int flags, const char *what)
+{
+    if (PyObject_GetBuffer(o, view, flags | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0)
+        return 0;
+    if (view->itemsize != itemsize || view->format == NULL ||
+        strcmp(view->format, format) != 0) {
+        PyBuffer_Release(view);
+        PyErr_Format(PyExc_TypeError, "%s must be an array('%s')", what, format);
+        return 0;
+    }
+    return 1;
+}
+
+/* check that the arguments of the op at dl->pc are there, and return its
+   slot (or 0 if it has none) */
+static int
+fc_op_check(struct fc_display_list *dl, int op, Py_ssize_t *slot)
+{
+    Py_ssize_t ints = fc_ops[op].ints;
+
+    if (dl->pc + 1 + ints > dl->ops_len ||
+        dl->fc + fc_ops[op].floats > dl->floats_len ||
+        dl->sc + fc_ops[op].strings > dl->strings_len) {
+        PyErr_Format(PyExc_ValueError, "truncated display list at op %zd", dl->pc);
+        return 0;
+    }
+    *slot = 0;
+    if (fc_ops[op].event >= 0) {
+        *slot = dl->ops[dl->pc + ints];
+        if (*slot < 0 || *slot + fc_ops[op].event >= dl->results_len) {
+            PyErr_Format(PyExc_ValueError, "result slot %zd out of range at op %zd",
+                         *slot, dl->pc);
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static int
+fc_op_next(struct fc_display_list *dl, int *op)
+{
+    *op = dl->ops[dl->pc];
+    if (*op < 0 || *op >= FC_OP_COUNT) {
+        PyErr_Format(PyExc_ValueError, "unknown opcode %d at op %zd", *op, dl->pc);
+        return 0;
+    }
+    return 1;
+}
+
+static void
+fc_op_advance(struct fc_display_list *dl, int op)
+{
+    dl->pc += 1 + fc_ops[op].ints;
+    dl->fc += fc_ops[op].floats;
+    dl->sc += fc_ops[op].strings;
+}
+
+/* skip the ops after an opener up to the matching close, which is left
+   to be run next */
+static int
+fc_skip_block(struct fc_display_list *dl)
+{
+    int depth = 0, op;
+    Py_ssize_t slot;
+
+    while (dl->pc < dl->ops_len) {
+        if (!fc_op_next(dl, &op) || !fc_op_check(dl, op, &slot))
+            return 0;
+        if (fc_ops[op].block == FC_BLOCK_CLOSE && depth-- == 0)
+            return 1;
+        if (fc_ops[op].block == FC_BLOCK_OPEN)
+            ++depth;
+        if (fc_ops[op].event >= 0)
+            dl->results[slot + fc_ops[op].event] = 0;
+        fc_op_advance(dl, op);
+    }
+    PyErr_SetString(PyExc_ValueError, "display list has an unclosed block");
+    return 0;
+}
+
+static int
+fc_dl_text(struct fc_display_list *dl, Py_ssize_t i, const char **text, int *len)
+{
+    return fc_text(PySequence_Fast_GET_ITEM(dl->strings, dl->sc + i), text, len);
+}
+
+static int
+fc_run_op(FastContextObject *self, struct fc_display_list *dl, int op, Py_ssize_t slot)
+{
+    struct nk_context *ctx = self->ctx;
+    const int *a = dl->ops + dl->pc + 1;
+    const float *f = dl->floats + dl->fc;
+    double *r = dl->results + slot;
+    const char *text, *hash;
+    int len, hash_len, value, open;
+    float fvalue;
+    nk_size size;
+
+    switch (op) {
+    case FC_OP_BEGIN:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        open = nk_begin(ctx, text, nk_rect(f[0], f[1], f[2], f[3]), (nk_flags)a[0]);
+        r[0] = open;
+        fc_op_advance(dl, op);
+        /* nk_end has to be called even if the window is closed */
+        return open || fc_skip_block(dl);
+    case FC_OP_END:
+        nk_end(ctx);
+        break;
+    case FC_OP_LAYOUT_ROW_DYNAMIC:
+        nk_layout_row_dynamic(ctx, f[0], a[0]);
+        break;
+    case FC_OP_LAYOUT_ROW_STATIC:
+        nk_layout_row_static(ctx, f[0], a[0], a[1]);
+        break;
+    case FC_OP_SPACING:
+        nk_spacing(ctx, a[0]);
+        break;
+    case FC_OP_LABEL:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        nk_text(ctx, text, len, (nk_flags)a[0]);
+        break;
+    case FC_OP_LABEL_COLORED:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        nk_text_colored(ctx, text, len, (nk_flags)a[0], nk_rgba(a[1], a[2], a[3], a[4]));
+        break;
+    case FC_OP_LABEL_WRAP:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        nk_text_wrap(ctx, text, len);
+        break;
+    case FC_OP_BUTTON_LABEL:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        r[0] = nk_button_text(ctx, text, len);
+        break;
+    case FC_OP_CHECKBOX_LABEL:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        value = r[0] != 0;
+        r[1] = nk_checkbox_text(ctx, text, len, &value);
+        r[0] = value;
+        break;
+    case FC_OP_OPTION_LABEL:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        value = nk_option_text(ctx, text, len, r[0] != 0);
+        r[1] = value != (r[0] != 0);
+        r[0] = value;
+        break;
+    case FC_OP_SELECTABLE_LABEL:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        value = r[0] != 0;
+        r[1] = nk_selectable_text(ctx, text, len, (nk_flags)a[0], &value);
+        r[0] = value;
+        break;
+    case FC_OP_SLIDER_FLOAT:
+        fvalue = (float)r[0];
+        r[1] = nk_slider_float(ctx, f[0], &fvalue, f[1], f[2]);
+        r[0] = fvalue;
+        break;
+    case FC_OP_SLIDER_INT:
+        value = (int)r[0];
+        r[1] = nk_slider_int(ctx, a[0], &value, a[1], a[2]);
+        r[0] = value;
+        break;
+    case FC_OP_PROGRESS:
+        size = r[0] > 0 ? (nk_size)r[0] : 0;
+        r[1] = nk_progress(ctx, &size, a[0] > 0 ? (nk_size)a[0] : 0, a[1]);
+        r[0] = (double)size;
+        break;
+    case FC_OP_PROPERTY_INT:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        value = (int)r[0];
+        nk_property_int(ctx, text, a[0], &value, a[1], a[2], f[0]);
+        r[1] = value != (int)r[0];
+        r[0] = value;
+        break;
+    case FC_OP_PROPERTY_FLOAT:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        fvalue = (float)r[0];
+        nk_property_float(ctx, text, f[0], &fvalue, f[1], f[2], f[3]);
+        r[1] = fvalue != (float)r[0];
+        r[0] = fvalue;
+        break;
+    case FC_OP_GROUP_BEGIN:
+        if (!fc_dl_text(dl, 0, &text, &len))
+            return 0;
+        open = nk_group_begin(ctx, text, (nk_flags)a[0]);
+        r[0] = open;
+        fc_op_advance(dl, op);
+        if (open)
+            return 1;
+        /* a closed group has no nk_group_end */
+        if (!fc_skip_block(dl))
+            return 0;
+        fc_op_advance(dl, FC_OP_GROUP_END);
+        return 1;
+    case FC_OP_GROUP_END:
+        nk_group_end(ctx);
+        break;
+    case FC_OP_TREE_PUSH:
+        if (!fc_dl_text(dl, 0, &text, &len) || !fc_dl_text(dl, 1, &hash, &hash_len))
+            return 0;
+        open = nk_tree_push_hashed(ctx, (enum nk_tree_type)a[0], text,
+                                   (enum nk_collapse_states)a[1], hash, hash_len, a[2]);
+        r[0] = open;
+        fc_op_advance(dl, op);
+        if (open)
+            return 1;
+        /* a closed tree node has no nk_tree_pop */
+        if (!fc_skip_block(dl))
+            return 0;
+        fc_op_advance(dl, FC_OP_TREE_POP);
+        return 1;
+    case FC_OP_TREE_POP:
+        nk_tree_pop(ctx);
+        break;
+    }
+    fc_op_advance(dl, op);
+    return 1;
+}
+
+static PyObject *
+fc_run(FastContextObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    struct fc_display_list dl;
+    Py_buffer ops, floats, results;
+    PyObject *ret = NULL;
+    Py_ssize_t slot;
+    int op;
+
+    FC_NARGS("run", 4);
+    if (!fc_get_array(args[0], &ops, "i", sizeof(int), PyBUF_SIMPLE, "ops"))
+        return NULL;
+    if (!fc_get_array(args[1], &floats, "f", sizeof(float), PyBUF_SIMPLE, "floats"))
+        goto release_ops;
+    if (!fc_get_array(args[3], &results, "d", sizeof(double), PyBUF_WRITABLE, "results"))
+        goto release_floats;
+    dl.strings = PySequence_Fast(args[2], "strings must be a sequence");
+    if (dl.strings == NULL)
+        goto release_results;
+
+    dl.ops = (const int *)ops.buf;
+    dl.ops_len = ops.len / (Py_ssize_t)sizeof(int);
+    dl.floats = (const float *)floats.buf;
+    dl.floats_len = floats.len / (Py_ssize_t)sizeof(float);
+    dl.strings_len = PySequence_Fast_GET_SIZE(dl.strings);
+    dl.results = (double *)results.buf;
+    dl.results_len = results.len / (Py_ssize_t)sizeof(double);
+    dl.pc = dl.fc = dl.sc = 0;
+
+    while (dl.pc < dl.ops_len) {
+        if (!fc_op_next(&dl, &op) || !fc_op_check(&dl, op, &slot) ||
+            !fc_run_op(self, &dl, op, slot))
+            goto release_strings;
+    }
+    ret = Py_None;
+    Py_INCREF(ret);
+
+release_strings:
+    Py_DECREF(dl.strings);
+release_results:
+    PyBuffer_Release(&results);
+release_floats:
+    PyBuffer_Release(&floats);
+release_ops:
+    PyBuffer_Release(&ops);
+    return ret;
+}
+
+
+/* Type */
+
+#define FC_METHOD(name, fn) \
+    {name, (PyCFunction)(void(*)(void))fn, METH_FASTCALL, NULL}
+
+static PyMethodDef FastContext_methods[] = {
+    FC_METHOD("begin", fc_begin),
+    FC_METHOD("begin_titled", fc_begin_titled),
+    FC_METHOD("end", fc_end),
+    FC_METHOD("window_get_bounds", fc_window_get_bounds),
+    FC_METHOD("window_is_hovered", fc_window_is_hovered),
+    FC_METHOD("item_is_any_active", fc_item_is_any_active),
+    FC_METHOD("layout_row_dynamic", fc_layout_row_dynamic),
+    FC_METHOD("layout_row_static", fc_layout_row_static),
+    FC_METHOD("layout_row_begin", fc_layout_row_begin),
+    FC_METHOD("layout_row_push", fc_layout_row_push),
+    FC_METHOD("layout_row_end", fc_layout_row_end),
+    FC_METHOD("spacing", fc_spacing),
+    FC_METHOD("widget_width", fc_widget_width),
+    FC_METHOD("widget_bounds", fc_widget_bounds),
+    FC_METHOD("group_begin", fc_group_begin),
+    FC_METHOD("group_end", fc_group_end),
+    FC_METHOD("tree_push_hashed", fc_tree_push_hashed),
+    FC_METHOD("tree_pop", fc_tree_pop),
+    FC_METHOD("text", fc_text_widget),
+    FC_METHOD("label", fc_text_widget),
+    FC_METHOD("label_colored", fc_label_colored),
+    FC_METHOD("label_wrap", fc_label_wrap),
+    FC_METHOD("button_label", fc_button_label),
+    FC_METHOD("button_symbol", fc_button_symbol),
+    FC_METHOD("button_symbol_label", fc_button_symbol_label),
+    FC_METHOD("button_color", fc_button_color),
+    FC_METHOD("checkbox_label", fc_checkbox_label),
+    FC_METHOD("option_label", fc_option_label),
+    FC_METHOD("selectable_label", fc_selectable_label),
+    FC_METHOD("slider_float", fc_slider_float),
+    FC_METHOD("slider_int", fc_slider_int),
+    FC_METHOD("slide_float", fc_slide_float),
+    FC_METHOD("slide_int", fc_slide_int),
+    FC_METHOD("progress", fc_progress),
+    FC_METHOD("property_int", fc_property_int),
+    FC_METHOD("property_float", fc_property_float),
+    FC_METHOD("propertyi", fc_propertyi),
+    FC_METHOD("propertyf", fc_propertyf),
+    FC_METHOD("chart_begin", fc_chart_begin),
+    FC_METHOD("chart_push", fc_chart_push),
+    FC_METHOD("chart_end", fc_chart_end),
+    FC_METHOD("popup_begin", fc_popup_begin),
+    FC_METHOD("popup_end", fc_popup_end),
+    FC_METHOD("contextual_begin", fc_contextual_begin),
+    FC_METHOD("contextual_item_label", fc_contextual_item_label),
+    FC_METHOD("contextual_end", fc_contextual_end),
+    FC_METHOD("tooltip", fc_tooltip),
+    FC_METHOD("menubar_begin", fc_menubar_begin),
+    FC_METHOD("menubar_end", fc_menubar_end),
+    FC_METHOD("menu_begin_label", fc_menu_begin_label),
+    FC_METHOD("menu_item_label", fc_menu_item_label),
+    FC_METHOD("menu_end", fc_menu_end),
+    FC_METHOD("combo_begin_color", fc_combo_begin_color),
+    FC_METHOD("combo_end", fc_combo_end),
+    FC_METHOD("run", fc_run),
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+static int
+FastContext_init(FastContextObject *self, PyObject *args, PyObject *kwds)
+{
+    PyObject *address;
+    static char *kwlist[] = {"address", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O", kwlist, &address))
+        return -1;
+    self->ctx = (struct nk_context *)PyLong_AsVoidPtr(address);
+    if (self->ctx == NULL) {
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_ValueError, "FastContext needs a non-NULL nk_context address");
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *
+FastContext_get_address(FastContextObject *self, void *closure)
+{
+    return PyLong_FromVoidPtr(self->ctx);
+}
+
+static PyGetSetDef FastContext_getset[] = {
+    {"address", (getter)FastContext_get_address, NULL,
+     "address of the wrapped struct nk_context", NULL},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject FastContextType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "pynuklearc.FastContext",
+    .tp_doc = "FastContext(address)\n\n"
+              "Native fast path for the most frequently used procedures "
+              "of the struct nk_context found at address.",
+    .tp_basicsize = sizeof(FastContextObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)FastContext_init,
+    .tp_methods = FastContext_methods,
+    .tp_getset = FastContext_getset,
+};
+
+static int
+FastContext_add_to_module(PyObject *m)
+{
+    if (PyType_Ready(&FastContextType) < 0)
+        return -1;
+    Py_INCREF(&FastContextType);
+    if (PyModule_AddObject(m, "FastContext", (PyObject *)&FastContextType) < 0) {
+        Py_DECREF(&FastContextType);
+        return -1;
+    }
+    return 0;
+}
@@ -24,8 +24,12 @@
 
 #define NK_IMPLEMENTATION
 #define NK_GLFW_GL2_IMPLEMENTATION
+#define NK_RASTER_IMPLEMENTATION
+#define NK_FONTS_IMPLEMENTATION
 #include "nuklear.h"
+#include "nuklear_fonts.h"
 #include "nuklear_glfw_gl2.h"
+#include "nuklear_raster.h"
 #include "nuklearWrappers.h"
 
 
@@ -41,9 +45,12 @@
  */
 
 #include <Python.h>
+#include "nuklearFastContext.h"
+#include "nuklearAllocations.h"
 
 static PyMethodDef pynuklearMethods[] = {
-                                         {{NULL, NULL, 0, NULL}}        /* Sentinel */
+                                         NK_ALLOCATIONS_METHODS
+                                         {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
 static struct PyModuleDef pynuklearmoduleGLFWOpenGL2 = {
@@ -70,5 +77,10 @@ PyInit_pynuklearc(void)
     pynuklearError = PyErr_NewException("pynuklear.error", NULL, NULL);
     Py_INCREF(pynuklearError);
     PyModule_AddObject(m, "error", pynuklearError);
+
+    if (FastContext_add_to_module(m) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
     return m;
 }
@@ -22,12 +22,18 @@
 #define NK_INCLUDE_VERTEX_BUFFER_OUTPUT
 #define NK_INCLUDE_FONT_BAKING
 #define NK_INCLUDE_DEFAULT_FONT
+/* 32 bit indices, so that frames of more than 65536 vertices draw */
+#define NK_UINT_DRAW_INDEX
 
 
 #define NK_IMPLEMENTATION
 #define NK_GLFW_GL3_IMPLEMENTATION
+#define NK_RASTER_IMPLEMENTATION
+#define NK_FONTS_IMPLEMENTATION
 #include "nuklear.h"
+#include "nuklear_fonts.h"
 #include "nuklear_glfw_gl3.h"
+#include "nuklear_raster.h"
 #include "nuklearWrappers.h"
 
 
@@ -43,9 +49,12 @@
  */
 
 #include <Python.h>
+#include "nuklearFastContext.h"
+#include "nuklearAllocations.h"
 
 static PyMethodDef pynuklearMethods[] = {
-                                         {{NULL, NULL, 0, NULL}}        /* Sentinel */
+                                         NK_ALLOCATIONS_METHODS
+                                         {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
 static struct PyModuleDef pynuklearmoduleGLFWOpenGL3 = {
@@ -72,5 +81,10 @@ PyInit_pynuklearc(void)
     pynuklearError = PyErr_NewException("pynuklear.error", NULL, NULL);
     Py_INCREF(pynuklearError);
     PyModule_AddObject(m, "error", pynuklearError);
+
+    if (FastContext_add_to_module(m) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
     return m;
 }
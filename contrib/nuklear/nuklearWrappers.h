@@ -52,16 +52,34 @@ nkWrapper_style_push_button_rounding(struct nk_context *ctx,
 
 float
 nkWrapper_get_text_width(struct nk_context *ctx,
-                         char *str)
+                         const char *str)
 {
   const struct nk_user_font *f = ctx->style.font;
   float text_width = f->width(f->userdata, f->height, str, nk_strlen(str));
   return text_width + 3 * ctx->style.button.padding.x;
 }
 
+/* The advance of each code point in font, i.e. the width of its text alone
+   at the font's height, as the font's width callback measures it.  The
+   width of a text in a font whose widths are the sums of their glyphs'
+   advances, such as nuklear's nk_font, is the sum of these. */
+void
+nkWrapper_font_advances(const struct nk_user_font *font,
+                        const nk_rune *codepoints,
+                        int count,
+                        float *advances)
+{
+  int i;
+  for (i = 0; i < count; i++) {
+    char glyph[NK_UTF_SIZE];
+    int len = nk_utf_encode(codepoints[i], glyph, NK_UTF_SIZE);
+    advances[i] = len ? font->width(font->userdata, font->height, glyph, len) : 0;
+  }
+}
+
 int
 nkWrapper_button_label_active(struct nk_context *ctx,
-			      char *str)
+			      const char *str)
 {
   /* active tab gets highlighted */
   struct nk_style_item button_color = ctx->style.button.normal;
@@ -70,3 +88,72 @@ nkWrapper_button_label_active(struct nk_context *ctx,
   ctx->style.button.normal = button_color;
   return wrapped_return_val;
 }
+
+/* Lists the commands of the current frame, in drawing order, as their
+   types and their offsets into ctx->memory.  Fills at most capacity
+   entries and returns the number of commands, so a caller whose arrays
+   were too small can grow them and call again. */
+int
+nkWrapper_command_list(struct nk_context *ctx,
+                       int *types,
+                       nk_size *offsets,
+                       int capacity)
+{
+  const struct nk_command *cmd = 0;
+  const nk_byte *base = (const nk_byte*)ctx->memory.memory.ptr;
+  int count = 0;
+  nk_foreach(cmd, ctx) {
+    if (count < capacity) {
+      types[count] = (int)cmd->type;
+      offsets[count] = (nk_size)((const nk_byte*)cmd - base);
+    }
+    count++;
+  }
+  return count;
+}
+
+/* Sets up the fonts of an atlas from the tables of an earlier bake of the
+   same fonts, e.g. read from a cache, instead of baking them.  fonts holds
+   the baked info of each font of the atlas, in order, and glyphs the glyph
+   array they index.  The image of that bake goes to the renderer in place
+   of nk_font_atlas_bake's, and nk_font_atlas_end ends the atlas as usual.
+   Returns 0 if the tables do not fit the atlas' fonts. */
+int
+nkWrapper_font_atlas_restore(struct nk_font_atlas *atlas,
+                             int width,
+                             int height,
+                             struct nk_recti custom,
+                             const struct nk_cursor *cursors,
+                             const struct nk_baked_font *fonts,
+                             int font_count,
+                             const struct nk_font_glyph *glyphs,
+                             int glyph_count)
+{
+  struct nk_font *font;
+  int i = 0;
+  for (font = atlas->fonts; font; font = font->next, i++) {
+    if (i >= font_count || glyph_count <= 0 ||
+        fonts[i].glyph_offset + fonts[i].glyph_count > (nk_rune)glyph_count)
+      return 0;
+  }
+  if (i != font_count || atlas->glyphs) return 0;
+
+  atlas->glyphs = (struct nk_font_glyph*)atlas->permanent.alloc(atlas->permanent.userdata, 0,
+      sizeof(struct nk_font_glyph) * (nk_size)glyph_count);
+  if (!atlas->glyphs) return 0;
+  NK_MEMCPY(atlas->glyphs, glyphs, sizeof(struct nk_font_glyph) * (nk_size)glyph_count);
+  atlas->glyph_count = glyph_count;
+  atlas->tex_width = width;
+  atlas->tex_height = height;
+  atlas->custom = custom;
+  NK_MEMCPY(atlas->cursors, cursors, sizeof(atlas->cursors));
+
+  for (font = atlas->fonts, i = 0; font; font = font->next, i++) {
+    struct nk_font_config *config = font->config;
+    font->info = fonts[i];
+    font->info.ranges = config->range;
+    nk_font_init(font, config->size, config->fallback_glyph, atlas->glyphs,
+                 &font->info, nk_handle_ptr(0));
+  }
+  return 1;
+}
@@ -0,0 +1,433 @@
+/*
+ * Nuklear - 1.32.0 - public domain
+ * no warrenty implied; use at your own risk.
+ */
+/*
+ * Fonts of an nk_font_atlas beyond what nuklear.h offers: TTF files added
+ * as read-only memory maps instead of copies, and lazily baked glyph
+ * pages, which add to the atlas only the code points the UI asks for, so
+ * that fonts of large alphabets need neither bake nor texture memory for
+ * the glyphs never shown.
+ */
+/*
+ * ==============================================================
+ *
+ *                              API
+ *
+ * ===============================================================
+ */
+#ifndef NK_FONTS_H_
+#define NK_FONTS_H_
+
+/* Adds the TTF file at path to the atlas as nk_font_atlas_add_from_file
+   does, but memory maps the file instead of reading it into the atlas'
+   memory; the atlas unmaps it where it would free its copy, i.e. in
+   nk_font_atlas_cleanup or nk_font_atlas_clear.  The atlas must use the
+   default allocator, as nk_font_atlas_init_default sets up, and be used by
+   one thread at a time; on Windows, and for other allocators, the file is
+   read as nk_font_atlas_add_from_file does. */
+NK_API struct nk_font *nk_font_atlas_add_mapped(struct nk_font_atlas*, const char *path,
+                                                float height, const struct nk_font_config*);
+
+/* Lazily baked glyph pages.  nk_font_pages_create, once the atlas is baked
+   and ended, takes over the width and glyph queries of its fonts to note
+   the code points asked for that the atlas lacks but a font's TTF has,
+   recording the code points seen in bitmaps of NK_FONT_PAGE_SIZE code
+   points.  nk_font_pages_pending tells how many of them are waiting, and
+   nk_font_pages_bake bakes the atlas again with them added to the ranges
+   of the fonts, for the renderer to upload and nk_font_atlas_end as after
+   nk_font_atlas_bake.  The fonts keep their addresses, so the contexts
+   using them need no change; text measured before the bake used the
+   fallback glyph, and lays out right from the next frame on.  The atlas
+   must keep its TTF blobs, i.e. not be cleaned up, and the pages are freed
+   after the atlas is cleared. */
+#define NK_FONT_PAGE_SIZE 256
+
+struct nk_font_pages;
+
+NK_API struct nk_font_pages *nk_font_pages_create(struct nk_font_atlas*);
+NK_API int nk_font_pages_pending(const struct nk_font_pages*);
+NK_API const void *nk_font_pages_bake(struct nk_font_pages*, int *width, int *height,
+                                      enum nk_font_atlas_format);
+NK_API void nk_font_pages_free(struct nk_font_pages*);
+
+#endif
+/*
+ * ==============================================================
+ *
+ *                          IMPLEMENTATION
+ *
+ * ===============================================================
+ */
+#ifdef NK_FONTS_IMPLEMENTATION
+
+#ifndef _WIN32
+#include <sys/types.h>
+#include <sys/stat.h>
+#include <sys/mman.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+/* the TTF files mapped by nk_font_atlas_add_mapped */
+struct nk_font_mapping {
+    void *memory;
+    size_t size;
+    struct nk_font_mapping *next;
+};
+static struct nk_font_mapping *nk_font_mappings;
+
+/* the permanent free of an atlas with mapped files */
+NK_INTERN void
+nk_font_mapped_free(nk_handle unused, void *ptr)
+{
+    struct nk_font_mapping **link;
+    for (link = &nk_font_mappings; *link; link = &(*link)->next) {
+        struct nk_font_mapping *mapping = *link;
+        if (mapping->memory == ptr) {
+            *link = mapping->next;
+            munmap(mapping->memory, mapping->size);
+            free(mapping);
+            return;
+        }
+    }
+    nk_mfree(unused, ptr);
+}
+#endif
+
+NK_API struct nk_font*
+nk_font_atlas_add_mapped(struct nk_font_atlas *atlas, const char *path, float height,
+    const struct nk_font_config *config)
+{
+#ifdef _WIN32
+    return nk_font_atlas_add_from_file(atlas, path, height, config);
+#else
+    struct nk_font_config cfg;
+    struct nk_font_mapping *mapping;
+    struct stat info;
+    void *memory;
+    int fd;
+
+    if (!atlas || !path || height <= 0.0f) return 0;
+    if (atlas->permanent.free != nk_mfree && atlas->permanent.free != nk_font_mapped_free)
+        return nk_font_atlas_add_from_file(atlas, path, height, config);
+
+    fd = open(path, O_RDONLY);
+    if (fd < 0) return 0;
+    if (fstat(fd, &info) || info.st_size <= 0) {
+        close(fd);
+        return 0;
+    }
+    memory = mmap(0, (size_t)info.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (memory == MAP_FAILED) return 0;
+    mapping = (struct nk_font_mapping*)malloc(sizeof(*mapping));
+    if (!mapping) {
+        munmap(memory, (size_t)info.st_size);
+        return 0;
+    }
+    mapping->memory = memory;
+    mapping->size = (size_t)info.st_size;
+    mapping->next = nk_font_mappings;
+    nk_font_mappings = mapping;
+    atlas->permanent.free = nk_font_mapped_free;
+
+    cfg = (config) ? *config: nk_font_config(height);
+    cfg.ttf_blob = memory;
+    cfg.ttf_size = (nk_size)info.st_size;
+    cfg.size = height;
+    cfg.ttf_data_owned_by_atlas = 1;
+    return nk_font_atlas_add(atlas, &cfg);
+#endif
+}
+
+/* a TTF of a font, i.e. its config or one merged into it */
+struct nk_font_pages_source {
+    struct nk_font_config *config;
+    struct nk_tt_fontinfo info;
+    int valid;
+    /* the range it was added with, the one baked with its added code
+       points, or 0, and the one being baked */
+    const nk_rune *base;
+    nk_rune *range;
+    nk_rune *baking;
+    nk_rune *added;
+    int added_count, added_capacity;
+};
+
+struct nk_font_pages_font {
+    struct nk_font *font;
+    struct nk_font_pages *pages;
+    struct nk_font_pages_source *sources;
+    int source_count;
+    /* its baked info while it is baked again */
+    struct nk_baked_font baked;
+    /* the code points seen lacking a glyph, a bitmap per page, allocated
+       when one of its code points is first seen */
+    unsigned char *seen[0x110000 / NK_FONT_PAGE_SIZE];
+};
+
+struct nk_font_pages {
+    struct nk_font_atlas *atlas;
+    struct nk_font_pages_font *fonts;
+    int font_count;
+    int pending;
+};
+
+NK_INTERN void
+nk_font_pages_note(struct nk_font_pages_font *f, nk_rune unicode)
+{
+    unsigned char **page;
+    int bit, i;
+
+    if (unicode >= 0x110000) return;
+    page = &f->seen[unicode / NK_FONT_PAGE_SIZE];
+    if (!*page && !(*page = (unsigned char*)calloc(1, NK_FONT_PAGE_SIZE / 8)))
+        return;
+    bit = (int)(unicode % NK_FONT_PAGE_SIZE);
+    if ((*page)[bit / 8] & (1 << (bit % 8))) return;
+    (*page)[bit / 8] |= (unsigned char)(1 << (bit % 8));
+
+    /* the first TTF of the font with a glyph for it bakes it */
+    for (i = 0; i < f->source_count; ++i) {
+        struct nk_font_pages_source *s = &f->sources[i];
+        if (!s->valid || !nk_tt_FindGlyphIndex(&s->info, (int)unicode))
+            continue;
+        if (s->added_count == s->added_capacity) {
+            int capacity = s->added_capacity ? s->added_capacity * 2 : 64;
+            nk_rune *added = (nk_rune*)realloc(s->added, sizeof(nk_rune) * (nk_size)capacity);
+            if (!added) return;
+            s->added = added;
+            s->added_capacity = capacity;
+        }
+        s->added[s->added_count++] = unicode;
+        f->pages->pending++;
+        return;
+    }
+}
+
+/* nk_font_text_width, noting the code points that fall back */
+NK_INTERN float
+nk_font_pages_text_width(nk_handle handle, float height, const char *text, int len)
+{
+    struct nk_font_pages_font *f = (struct nk_font_pages_font*)handle.ptr;
+    struct nk_font *font = f->font;
+    nk_rune unicode;
+    int text_len, glyph_len;
+    float text_width = 0;
+    float scale;
+
+    if (!text || !len) return 0;
+    scale = height/font->info.height;
+    glyph_len = text_len = nk_utf_decode(text, &unicode, len);
+    if (!glyph_len) return 0;
+    while (text_len <= len && glyph_len) {
+        const struct nk_font_glyph *g;
+        if (unicode == NK_UTF_INVALID) break;
+        g = nk_font_find_glyph(font, unicode);
+        if (g == font->fallback && unicode != font->fallback_codepoint)
+            nk_font_pages_note(f, unicode);
+        text_width += g->xadvance * scale;
+        glyph_len = nk_utf_decode(text + text_len, &unicode, len - text_len);
+        text_len += glyph_len;
+    }
+    return text_width;
+}
+
+#ifdef NK_INCLUDE_VERTEX_BUFFER_OUTPUT
+NK_INTERN void
+nk_font_pages_query(nk_handle handle, float height, struct nk_user_font_glyph *glyph,
+    nk_rune codepoint, nk_rune next_codepoint)
+{
+    struct nk_font_pages_font *f = (struct nk_font_pages_font*)handle.ptr;
+    if (nk_font_find_glyph(f->font, codepoint) == f->font->fallback &&
+        codepoint != f->font->fallback_codepoint)
+        nk_font_pages_note(f, codepoint);
+    nk_font_query_font_glyph(nk_handle_ptr(f->font), height, glyph, codepoint, next_codepoint);
+}
+#endif
+
+/* points the fonts' queries at the pages, again after each bake, since
+   nk_font_init sets nuklear's */
+NK_INTERN void
+nk_font_pages_hook(struct nk_font_pages *pages)
+{
+    int i;
+    for (i = 0; i < pages->font_count; ++i) {
+        struct nk_font_pages_font *f = &pages->fonts[i];
+        f->font->handle.userdata = nk_handle_ptr(f);
+        f->font->handle.width = nk_font_pages_text_width;
+#ifdef NK_INCLUDE_VERTEX_BUFFER_OUTPUT
+        f->font->handle.query = nk_font_pages_query;
+#endif
+    }
+}
+
+NK_API struct nk_font_pages*
+nk_font_pages_create(struct nk_font_atlas *atlas)
+{
+    struct nk_font_pages *pages;
+    struct nk_font *font;
+    int i = 0;
+
+    if (!atlas || !atlas->fonts || !atlas->glyphs) return 0;
+    pages = (struct nk_font_pages*)calloc(1, sizeof(*pages));
+    if (!pages) return 0;
+    pages->atlas = atlas;
+    for (font = atlas->fonts; font; font = font->next)
+        pages->font_count++;
+    pages->fonts = (struct nk_font_pages_font*)calloc((nk_size)pages->font_count,
+                                                      sizeof(*pages->fonts));
+    if (!pages->fonts) goto failed;
+
+    for (font = atlas->fonts; font; font = font->next, ++i) {
+        struct nk_font_pages_font *f = &pages->fonts[i];
+        struct nk_font_config *config = font->config;
+        int j = 0;
+        f->font = font;
+        f->pages = pages;
+        do {f->source_count++;
+        } while ((config = config->n) != font->config);
+        f->sources = (struct nk_font_pages_source*)calloc((nk_size)f->source_count,
+                                                          sizeof(*f->sources));
+        if (!f->sources) goto failed;
+        do {struct nk_font_pages_source *s = &f->sources[j++];
+            s->config = config;
+            s->base = config->range;
+            s->valid = config->ttf_blob &&
+                nk_tt_InitFont(&s->info, (const unsigned char*)config->ttf_blob, 0);
+        } while ((config = config->n) != font->config);
+    }
+    nk_font_pages_hook(pages);
+    return pages;
+
+failed:
+    nk_font_pages_free(pages);
+    return 0;
+}
+
+NK_API int
+nk_font_pages_pending(const struct nk_font_pages *pages)
+{
+    return pages ? pages->pending : 0;
+}
+
+NK_INTERN int
+nk_font_pages_compare(const void *a, const void *b)
+{
+    nk_rune x = *(const nk_rune*)a, y = *(const nk_rune*)b;
+    return (x > y) - (x < y);
+}
+
+/* the base range of s followed by the runs of its added code points */
+NK_INTERN nk_rune*
+nk_font_pages_range(struct nk_font_pages_source *s)
+{
+    int base = s->base ? nk_range_count(s->base) : 0;
+    nk_rune *range = (nk_rune*)malloc(sizeof(nk_rune) *
+                                      (nk_size)((base + s->added_count) * 2 + 1));
+    int n = base * 2, i;
+    if (!range) return 0;
+    if (base) NK_MEMCPY(range, s->base, sizeof(nk_rune) * (nk_size)n);
+    qsort(s->added, (size_t)s->added_count, sizeof(nk_rune), nk_font_pages_compare);
+    for (i = 0; i < s->added_count; ++i) {
+        if (n > base * 2 && range[n - 1] + 1 == s->added[i])
+            range[n - 1] = s->added[i];
+        else {
+            range[n++] = s->added[i];
+            range[n++] = s->added[i];
+        }
+    }
+    range[n] = 0;
+    return range;
+}
+
+NK_API const void*
+nk_font_pages_bake(struct nk_font_pages *pages, int *width, int *height,
+    enum nk_font_atlas_format fmt)
+{
+    struct nk_font_atlas *atlas;
+    struct nk_font_glyph *glyphs;
+    int glyph_count, i, j;
+    const void *image;
+
+    if (!pages || !width || !height) return 0;
+    atlas = pages->atlas;
+    for (i = 0; i < pages->font_count; ++i)
+        for (j = 0; j < pages->fonts[i].source_count; ++j)
+            if (!pages->fonts[i].sources[j].config->ttf_blob) return 0;
+
+    /* bake the added code points of each TTF after the range it had */
+    for (i = 0; i < pages->font_count; ++i) {
+        for (j = 0; j < pages->fonts[i].source_count; ++j) {
+            struct nk_font_pages_source *s = &pages->fonts[i].sources[j];
+            if (s->added_count && !(s->baking = nk_font_pages_range(s)))
+                goto failed;
+        }
+    }
+    for (i = 0; i < pages->font_count; ++i) {
+        struct nk_font_pages_font *f = &pages->fonts[i];
+        for (j = 0; j < f->source_count; ++j)
+            if (f->sources[j].baking)
+                f->sources[j].config->range = f->sources[j].baking;
+        /* nk_font_bake adds up the glyphs of a font's TTFs */
+        f->baked = f->font->info;
+        f->font->info.glyph_count = 0;
+    }
+
+    glyphs = atlas->glyphs;
+    glyph_count = atlas->glyph_count;
+    atlas->glyphs = 0;
+    image = nk_font_atlas_bake(atlas, width, height, fmt);
+    if (!image) {
+        atlas->glyphs = glyphs;
+        atlas->glyph_count = glyph_count;
+        for (i = 0; i < pages->font_count; ++i)
+            pages->fonts[i].font->info = pages->fonts[i].baked;
+        goto failed;
+    }
+    atlas->permanent.free(atlas->permanent.userdata, glyphs);
+    for (i = 0; i < pages->font_count; ++i) {
+        for (j = 0; j < pages->fonts[i].source_count; ++j) {
+            struct nk_font_pages_source *s = &pages->fonts[i].sources[j];
+            if (!s->baking) continue;
+            free(s->range);
+            s->range = s->baking;
+            s->baking = 0;
+        }
+    }
+    pages->pending = 0;
+    nk_font_pages_hook(pages);
+    return image;
+
+failed:
+    for (i = 0; i < pages->font_count; ++i) {
+        for (j = 0; j < pages->fonts[i].source_count; ++j) {
+            struct nk_font_pages_source *s = &pages->fonts[i].sources[j];
+            s->config->range = s->range ? s->range : (nk_rune*)s->base;
+            free(s->baking);
+            s->baking = 0;
+        }
+    }
+    return 0;
+}
+
+NK_API void
+nk_font_pages_free(struct nk_font_pages *pages)
+{
+    int i, j;
+    if (!pages) return;
+    for (i = 0; pages->fonts && i < pages->font_count; ++i) {
+        struct nk_font_pages_font *f = &pages->fonts[i];
+        for (j = 0; f->sources && j < f->source_count; ++j) {
+            free(f->sources[j].range);
+            free(f->sources[j].added);
+        }
+        free(f->sources);
+        for (j = 0; j < (int)NK_LEN(f->seen); ++j)
+            free(f->seen[j]);
+    }
+    free(pages->fonts);
+    free(pages);
+}
+
+#endif
@@ -22,10 +22,129 @@ enum nk_glfw_init_state{
 
 NK_API struct nk_context*   nk_glfw3_init(GLFWwindow *win, enum nk_glfw_init_state);
 NK_API void                 nk_glfw3_shutdown(void);
+
+/* instances of the backend, each with its own window, context, OpenGL
+   objects and input, so that one process can drive several windows.
+   nk_glfw3_init sets up the first one; nk_glfw3_create makes more.  The
+   other nk_glfw3_* functions act on the current instance, which
+   nk_glfw3_make_current selects along with its window's OpenGL context.
+   An instance created with share uses the fonts and the atlas texture of
+   share, which must be baked already, and whose window's OpenGL context
+   must share objects with the new window's. */
+struct nk_glfw;
+NK_API struct nk_glfw*      nk_glfw3_create(GLFWwindow *win, enum nk_glfw_init_state, struct nk_glfw *share);
+NK_API void                 nk_glfw3_destroy(struct nk_glfw*);
+NK_API void                 nk_glfw3_make_current(struct nk_glfw*);
+NK_API struct nk_glfw*      nk_glfw3_current(void);
+NK_API struct nk_context*   nk_glfw3_context(struct nk_glfw*);
 NK_API void                 nk_glfw3_font_stash_begin(struct nk_font_atlas **atlas);
 NK_API void                 nk_glfw3_font_stash_end(void);
+/* ends the font stash with its atlas baked in format.  An
+   NK_FONT_ATLAS_ALPHA8 atlas is uploaded as a GL_R8 texture swizzled to
+   read as white with the coverage as alpha, as an RGBA32 one reads, in a
+   quarter of the texture memory */
+NK_API void                 nk_glfw3_font_stash_end_format(enum nk_font_atlas_format);
+/* ends the font stash with an image of its atlas in format baked
+   elsewhere, e.g. restored from a cache with nkWrapper_font_atlas_restore */
+NK_API void                 nk_glfw3_font_stash_end_image(const void *image, int width, int height, enum nk_font_atlas_format);
+/* lazily baked glyph pages (nuklear_fonts.h) of the atlas of the current
+   instance, or of the instance it shares.  nk_glfw3_font_pages_enable,
+   once the font stash has ended, returns whether they are set up.
+   nk_glfw3_font_pages_update bakes the atlas again if the frames built
+   since asked for code points it lacks, uploads it in its format into the
+   same texture, and returns whether it did, in which case the next frame
+   should be built to lay out the text with the new glyphs.  Call it
+   between frames, after rendering. */
+NK_API int                  nk_glfw3_font_pages_enable(void);
+NK_API int                  nk_glfw3_font_pages_update(void);
 NK_API void                 nk_glfw3_new_frame(void);
 NK_API void                 nk_glfw3_render(enum nk_anti_aliasing, int max_vertex_buffer, int max_element_buffer);
+NK_API int                  nk_glfw3_frame_changed(void);
+NK_API int                  nk_glfw3_render_if_changed(enum nk_anti_aliasing, int max_vertex_buffer, int max_element_buffer);
+
+/* the OpenGL state nk_glfw3_render restores after drawing.  State that is
+   not protected is left as nuklear sets it, except that the program, the
+   buffer bindings, GL_BLEND and GL_SCISSOR_TEST are reset to their
+   defaults.  With NK_GLFW3_STATE_SHADOWED the state is not queried every
+   frame: the shadow, which nk_glfw3_protect_state reads once, is restored
+   instead, and the application keeps it up to date through
+   nk_glfw3_shadow_state when it changes protected state itself. */
+enum nk_glfw3_state {
+    NK_GLFW3_STATE_BLEND = 1 << 0,      /* GL_BLEND, the blend equation and function */
+    NK_GLFW3_STATE_CULL_FACE = 1 << 1,
+    NK_GLFW3_STATE_DEPTH_TEST = 1 << 2,
+    NK_GLFW3_STATE_SCISSOR = 1 << 3,    /* GL_SCISSOR_TEST and the scissor box */
+    NK_GLFW3_STATE_VIEWPORT = 1 << 4,
+    NK_GLFW3_STATE_PROGRAM = 1 << 5,
+    NK_GLFW3_STATE_TEXTURE = 1 << 6,    /* the active unit and unit 0's GL_TEXTURE_2D */
+    NK_GLFW3_STATE_BUFFERS = 1 << 7,    /* the vertex array and GL_ARRAY_BUFFER */
+    NK_GLFW3_STATE_SHADOWED = 1 << 8,
+    NK_GLFW3_STATE_DEFAULT = NK_GLFW3_STATE_BLEND|NK_GLFW3_STATE_CULL_FACE|
+        NK_GLFW3_STATE_DEPTH_TEST|NK_GLFW3_STATE_SCISSOR|NK_GLFW3_STATE_VIEWPORT,
+    NK_GLFW3_STATE_ALL = NK_GLFW3_STATE_DEFAULT|NK_GLFW3_STATE_PROGRAM|
+        NK_GLFW3_STATE_TEXTURE|NK_GLFW3_STATE_BUFFERS
+};
+
+struct nk_glfw3_gl_state {
+    int blend, cull_face, depth_test, scissor_test;
+    int blend_src_rgb, blend_dst_rgb, blend_src_alpha, blend_dst_alpha;
+    int blend_equation_rgb, blend_equation_alpha;
+    int viewport[4];
+    int scissor_box[4];
+    int program;
+    int active_texture, texture;
+    int vertex_array, array_buffer;
+};
+
+NK_API void                 nk_glfw3_protect_state(unsigned int state);
+NK_API unsigned int         nk_glfw3_protected_state(void);
+NK_API struct nk_glfw3_gl_state* nk_glfw3_shadow_state(void);
+
+/* how nk_glfw3_render streams the vertices and elements to the GPU.  The
+   ring strategies write each frame into the next of NK_GLFW_STREAM_FRAMES
+   regions of the buffers, waiting on the fence of the frame that used the
+   region last, instead of having the driver reallocate the buffers. */
+enum nk_glfw3_stream {
+    NK_GLFW3_STREAM_ORPHAN,         /* glBufferData and glMapBuffer every frame */
+    NK_GLFW3_STREAM_UNSYNCHRONIZED, /* the ring, mapped unsynchronized, flushing the bytes written */
+    NK_GLFW3_STREAM_PERSISTENT      /* the ring, mapped once, with ARB_buffer_storage */
+};
+
+NK_API enum nk_glfw3_stream nk_glfw3_set_stream(enum nk_glfw3_stream);
+
+/* measurements of the last nk_glfw3_render */
+struct nk_glfw3_stats {
+    double convert_time;    /* seconds spent in nk_convert, with the buffers mapped */
+    double draw_time;       /* seconds spent issuing the draw calls */
+    double gpu_time;        /* seconds the GPU spent drawing a recent frame, or -1 */
+    double state_time;      /* seconds spent saving and restoring the OpenGL state */
+    unsigned int vertices;
+    unsigned int elements;
+    unsigned int draw_commands; /* nuklear's draw commands with elements */
+    unsigned int batches;       /* the draw calls they were merged into */
+    unsigned int texture_binds;
+    unsigned int scissor_changes;
+    nk_size command_bytes;
+    nk_size streamed_bytes; /* vertex and element bytes written for the GPU */
+};
+
+NK_API const struct nk_glfw3_stats* nk_glfw3_get_stats(void);
+NK_API void                 nk_glfw3_gpu_timer(int enable);
+
+/* renders the current instance's frames on a native thread, which takes
+   its window's OpenGL context, so that the next frame is built while the
+   last one is converted, drawn and swapped.  nk_glfw3_submit hands over
+   a copy of the built frame's commands, waiting only while a frame is
+   still queued, and clears the context; without a render thread it
+   clears, renders and swaps itself.  While the thread runs the caller
+   must not use OpenGL or the nk_glfw3_* functions that do (font stashes
+   and pages, nk_glfw3_render, device, stream, state and timer settings),
+   and the statistics are those of the last frame drawn.  nk_glfw3_render_thread_start
+   returns whether the thread runs; nk_glfw3_render_thread_stop draws the
+   queued frame, joins the thread and makes the context current again. */
+NK_API int                  nk_glfw3_render_thread_start(void);
+NK_API void                 nk_glfw3_render_thread_stop(void);
+NK_API void                 nk_glfw3_submit(enum nk_anti_aliasing, int max_vertex_buffer, int max_element_buffer, struct nk_colorf clear);
 
 NK_API void                 nk_glfw3_device_destroy(void);
 NK_API void                 nk_glfw3_device_create(void);
@@ -53,6 +172,22 @@ NK_API void                 nk_glfw3_mouse_button_callback(GLFWwindow *win, int
 #ifndef NK_GLFW_DOUBLE_CLICK_HI
 #define NK_GLFW_DOUBLE_CLICK_HI 0.2
 #endif
+/* the OpenGL type of nk_draw_index: 32 bit with NK_UINT_DRAW_INDEX,
+   otherwise 16 bit, which limits a frame to 65536 vertices */
+#ifdef NK_UINT_DRAW_INDEX
+#define NK_GLFW_GL_INDEX GL_UNSIGNED_INT
+#else
+#define NK_GLFW_GL_INDEX GL_UNSIGNED_SHORT
+#endif
+#ifndef NK_GLFW_STREAM_FRAMES
+#define NK_GLFW_STREAM_FRAMES 3
+#endif
+#if defined(_WIN32) && !defined(NK_GLFW_NO_RENDER_THREAD)
+#define NK_GLFW_NO_RENDER_THREAD
+#endif
+#ifndef NK_GLFW_NO_RENDER_THREAD
+#include <pthread.h>
+#endif
 
 struct nk_glfw_device {
     struct nk_buffer cmds;
@@ -67,6 +202,22 @@ struct nk_glfw_device {
     GLint uniform_tex;
     GLint uniform_proj;
     GLuint font_tex;
+    /* GL_TIME_ELAPSED queries of the last two frames, read a frame late
+       so that reading them does not wait for the GPU */
+    GLuint queries[2];
+    int query_pending[2];
+    int query_index;
+    int gpu_timer;
+    /* the streaming strategy, the size of a region of the ring in each
+       buffer, the region of the next frame with the fences of the frames
+       drawn from the regions, and the persistent mappings */
+    enum nk_glfw3_stream stream;
+    nk_size vertex_region, element_region;
+    int region;
+    GLsync fences[NK_GLFW_STREAM_FRAMES];
+    void *vertex_map, *element_map;
+    /* the buffer sizes the largest frame so far needed */
+    int vertex_capacity, element_capacity;
 };
 
 struct nk_glfw_vertex {
@@ -75,13 +226,18 @@ struct nk_glfw_vertex {
     nk_byte col[4];
 };
 
-static struct nk_glfw {
+struct nk_glfw {
     GLFWwindow *win;
+    /* the instance whose fonts it uses, if any, and the next instance */
+    struct nk_glfw *share;
+    struct nk_glfw *next;
     int width, height;
     int display_width, display_height;
     struct nk_glfw_device ogl;
     struct nk_context ctx;
     struct nk_font_atlas atlas;
+    enum nk_font_atlas_format atlas_format;
+    struct nk_font_pages *font_pages;
     struct nk_vec2 fb_scale;
     unsigned int text[NK_GLFW_TEXT_MAX];
     int text_len;
@@ -89,7 +245,46 @@ static struct nk_glfw {
     double last_button_click;
     int is_double_click_down;
     struct nk_vec2 double_click_pos;
-} glfw;
+    /* the command memory and framebuffer size of the last rendered frame,
+       and whether the current frame differs from it (-1 until compared) */
+    void *last_cmds;
+    nk_size last_cmds_size, last_cmds_capacity;
+    int last_width, last_height;
+    int frame_changed;
+    struct nk_glfw3_stats stats;
+    /* the protected state, and its values while rendering or its shadow */
+    unsigned int protect;
+    struct nk_glfw3_gl_state saved;
+    /* the render thread, while it runs */
+    struct nk_glfw_render_thread *thread;
+};
+
+/* the instance of nk_glfw3_init, the current instance and the list of all
+   instances, in which the GLFW callbacks look up their window's */
+static struct nk_glfw nk_glfw3_first;
+static struct nk_glfw *nk_glfw3_instance = &nk_glfw3_first;
+static struct nk_glfw *nk_glfw3_instances;
+
+NK_INTERN void
+nk_glfw3_unlink(struct nk_glfw *glfw)
+{
+    struct nk_glfw **link;
+    for (link = &nk_glfw3_instances; *link; link = &(*link)->next) {
+        if (*link == glfw) {
+            *link = glfw->next;
+            break;
+        }
+    }
+}
+
+NK_INTERN struct nk_glfw*
+nk_glfw3_find(GLFWwindow *win)
+{
+    struct nk_glfw *glfw;
+    for (glfw = nk_glfw3_instances; glfw; glfw = glfw->next)
+        if (glfw->win == win) return glfw;
+    return nk_glfw3_instance;
+}
 
 #ifdef __APPLE__
   #define NK_SHADER_VERSION "#version 150\n"
@@ -97,9 +292,88 @@ static struct nk_glfw {
   #define NK_SHADER_VERSION "#version 300 es\n"
 #endif
 
+NK_INTERN int
+nk_glfw3_buffer_storage_supported(void)
+{
+    GLint i, count = 0;
+    if (!glBufferStorage) return 0;
+    if (gl3w_is_supported(4, 4)) return 1;
+    glGetIntegerv(GL_NUM_EXTENSIONS, &count);
+    for (i = 0; i < count; ++i) {
+        const char *extension = (const char*)glGetStringi(GL_EXTENSIONS, (GLuint)i);
+        if (extension && !strcmp(extension, "GL_ARB_buffer_storage"))
+            return 1;
+    }
+    return 0;
+}
+
+NK_INTERN void
+nk_glfw3_stream_release(struct nk_glfw_device *dev)
+{
+    int i;
+    for (i = 0; i < NK_GLFW_STREAM_FRAMES; ++i) {
+        if (dev->fences[i]) glDeleteSync(dev->fences[i]);
+        dev->fences[i] = 0;
+    }
+    /* deleting a buffer unmaps it */
+    if (dev->vbo) glDeleteBuffers(1, &dev->vbo);
+    if (dev->ebo) glDeleteBuffers(1, &dev->ebo);
+    dev->vbo = dev->ebo = 0;
+    dev->vertex_map = dev->element_map = NULL;
+}
+
+/* (re)creates the vertex and element buffers for the streaming strategy,
+   with regions of at least vertex_size and element_size bytes */
+NK_INTERN void
+nk_glfw3_stream_create(struct nk_glfw_device *dev, nk_size vertex_size, nk_size element_size)
+{
+    GLsizei vs = sizeof(struct nk_glfw_vertex);
+    size_t vp = offsetof(struct nk_glfw_vertex, position);
+    size_t vt = offsetof(struct nk_glfw_vertex, uv);
+    size_t vc = offsetof(struct nk_glfw_vertex, col);
+    GLsizeiptr vertex_bytes, element_bytes;
+
+    nk_glfw3_stream_release(dev);
+    /* a region holds whole vertices, so that its first one has an index */
+    dev->vertex_region = (vertex_size + (nk_size)vs - 1) / (nk_size)vs * (nk_size)vs;
+    dev->element_region = (element_size + 3) & ~(nk_size)3;
+    dev->region = 0;
+    vertex_bytes = (GLsizeiptr)(dev->vertex_region * NK_GLFW_STREAM_FRAMES);
+    element_bytes = (GLsizeiptr)(dev->element_region * NK_GLFW_STREAM_FRAMES);
+
+    glGenBuffers(1, &dev->vbo);
+    glGenBuffers(1, &dev->ebo);
+    glBindVertexArray(dev->vao);
+    glBindBuffer(GL_ARRAY_BUFFER, dev->vbo);
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, dev->ebo);
+    if (vertex_bytes && element_bytes) {
+        if (dev->stream == NK_GLFW3_STREAM_PERSISTENT) {
+            GLbitfield flags = GL_MAP_WRITE_BIT|GL_MAP_PERSISTENT_BIT|GL_MAP_COHERENT_BIT;
+            glBufferStorage(GL_ARRAY_BUFFER, vertex_bytes, NULL, flags);
+            glBufferStorage(GL_ELEMENT_ARRAY_BUFFER, element_bytes, NULL, flags);
+            dev->vertex_map = glMapBufferRange(GL_ARRAY_BUFFER, 0, vertex_bytes, flags);
+            dev->element_map = glMapBufferRange(GL_ELEMENT_ARRAY_BUFFER, 0, element_bytes, flags);
+            if (!dev->vertex_map || !dev->element_map) {
+                dev->stream = NK_GLFW3_STREAM_UNSYNCHRONIZED;
+                nk_glfw3_stream_create(dev, vertex_size, element_size);
+                return;
+            }
+        } else if (dev->stream == NK_GLFW3_STREAM_UNSYNCHRONIZED) {
+            glBufferData(GL_ARRAY_BUFFER, vertex_bytes, NULL, GL_STREAM_DRAW);
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, element_bytes, NULL, GL_STREAM_DRAW);
+        }
+    }
+    glVertexAttribPointer((GLuint)dev->attrib_pos, 2, GL_FLOAT, GL_FALSE, vs, (void*)vp);
+    glVertexAttribPointer((GLuint)dev->attrib_uv, 2, GL_FLOAT, GL_FALSE, vs, (void*)vt);
+    glVertexAttribPointer((GLuint)dev->attrib_col, 4, GL_UNSIGNED_BYTE, GL_TRUE, vs, (void*)vc);
+    glBindVertexArray(0);
+    glBindBuffer(GL_ARRAY_BUFFER, 0);
+}
+
 NK_API void
 nk_glfw3_device_create(void)
 {
+    struct nk_glfw *glfw = nk_glfw3_instance;
     GLint status;
     static const GLchar *vertex_shader =
         NK_SHADER_VERSION
@@ -125,7 +399,7 @@ nk_glfw3_device_create(void)
         "   Out_Color = Frag_Color * texture(Texture, Frag_UV.st);\n"
         "}\n";
 
-    struct nk_glfw_device *dev = &glfw.ogl;
+    struct nk_glfw_device *dev = &glfw->ogl;
     nk_buffer_init_default(&dev->cmds);
     dev->prog = glCreateProgram();
     dev->vert_shdr = glCreateShader(GL_VERTEX_SHADER);
@@ -150,67 +424,339 @@ nk_glfw3_device_create(void)
     dev->attrib_uv = glGetAttribLocation(dev->prog, "TexCoord");
     dev->attrib_col = glGetAttribLocation(dev->prog, "Color");
 
-    {
-        /* buffer setup */
-        GLsizei vs = sizeof(struct nk_glfw_vertex);
-        size_t vp = offsetof(struct nk_glfw_vertex, position);
-        size_t vt = offsetof(struct nk_glfw_vertex, uv);
-        size_t vc = offsetof(struct nk_glfw_vertex, col);
-
-        glGenBuffers(1, &dev->vbo);
-        glGenBuffers(1, &dev->ebo);
-        glGenVertexArrays(1, &dev->vao);
-
-        glBindVertexArray(dev->vao);
-        glBindBuffer(GL_ARRAY_BUFFER, dev->vbo);
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, dev->ebo);
-
-        glEnableVertexAttribArray((GLuint)dev->attrib_pos);
-        glEnableVertexAttribArray((GLuint)dev->attrib_uv);
-        glEnableVertexAttribArray((GLuint)dev->attrib_col);
-
-        glVertexAttribPointer((GLuint)dev->attrib_pos, 2, GL_FLOAT, GL_FALSE, vs, (void*)vp);
-        glVertexAttribPointer((GLuint)dev->attrib_uv, 2, GL_FLOAT, GL_FALSE, vs, (void*)vt);
-        glVertexAttribPointer((GLuint)dev->attrib_col, 4, GL_UNSIGNED_BYTE, GL_TRUE, vs, (void*)vc);
-    }
+    /* buffer setup */
+    glGenVertexArrays(1, &dev->vao);
+    glBindVertexArray(dev->vao);
+    glEnableVertexAttribArray((GLuint)dev->attrib_pos);
+    glEnableVertexAttribArray((GLuint)dev->attrib_uv);
+    glEnableVertexAttribArray((GLuint)dev->attrib_col);
+    dev->stream = nk_glfw3_buffer_storage_supported() ?
+        NK_GLFW3_STREAM_PERSISTENT: NK_GLFW3_STREAM_UNSYNCHRONIZED;
+    nk_glfw3_stream_create(dev, 0, 0);
 
     glBindTexture(GL_TEXTURE_2D, 0);
-    glBindBuffer(GL_ARRAY_BUFFER, 0);
-    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0);
-    glBindVertexArray(0);
 }
 
+/* the ring strategy when ARB_buffer_storage is missing, or the given one */
+NK_API enum nk_glfw3_stream
+nk_glfw3_set_stream(enum nk_glfw3_stream stream)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_device *dev = &glfw->ogl;
+    if (stream == NK_GLFW3_STREAM_PERSISTENT && !nk_glfw3_buffer_storage_supported())
+        stream = NK_GLFW3_STREAM_UNSYNCHRONIZED;
+    if (stream != dev->stream) {
+        dev->stream = stream;
+        nk_glfw3_stream_create(dev, 0, 0);
+    }
+    return stream;
+}
+
+/* uploads the atlas image into the font texture, created on the first
+   upload and kept by those after, e.g. of lazily baked glyph pages, so
+   that the handles of the fonts stay valid */
 NK_INTERN void
-nk_glfw3_device_upload_atlas(const void *image, int width, int height)
+nk_glfw3_device_upload_atlas(struct nk_glfw *glfw, const void *image, int width, int height,
+    enum nk_font_atlas_format format)
 {
-    struct nk_glfw_device *dev = &glfw.ogl;
-    glGenTextures(1, &dev->font_tex);
+    struct nk_glfw_device *dev = &glfw->ogl;
+    if (!dev->font_tex)
+        glGenTextures(1, &dev->font_tex);
     glBindTexture(GL_TEXTURE_2D, dev->font_tex);
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR);
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR);
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, (GLsizei)width, (GLsizei)height, 0,
-                GL_RGBA, GL_UNSIGNED_BYTE, image);
+    if (format == NK_FONT_ATLAS_ALPHA8) {
+        /* rows of one byte pixels need not be 4 byte aligned */
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1);
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_R8, (GLsizei)width, (GLsizei)height, 0,
+                    GL_RED, GL_UNSIGNED_BYTE, image);
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_R, GL_ONE);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_G, GL_ONE);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_B, GL_ONE);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_A, GL_RED);
+    } else {
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, (GLsizei)width, (GLsizei)height, 0,
+                    GL_RGBA, GL_UNSIGNED_BYTE, image);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_R, GL_RED);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_G, GL_GREEN);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_B, GL_BLUE);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_SWIZZLE_A, GL_ALPHA);
+    }
 }
 
 NK_API void
 nk_glfw3_device_destroy(void)
 {
-    struct nk_glfw_device *dev = &glfw.ogl;
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_device *dev = &glfw->ogl;
     glDetachShader(dev->prog, dev->vert_shdr);
     glDetachShader(dev->prog, dev->frag_shdr);
     glDeleteShader(dev->vert_shdr);
     glDeleteShader(dev->frag_shdr);
     glDeleteProgram(dev->prog);
     glDeleteTextures(1, &dev->font_tex);
-    glDeleteBuffers(1, &dev->vbo);
-    glDeleteBuffers(1, &dev->ebo);
+    nk_glfw3_stream_release(dev);
+    glDeleteVertexArrays(1, &dev->vao);
+    if (dev->gpu_timer) glDeleteQueries(2, dev->queries);
+    dev->gpu_timer = 0;
     nk_buffer_free(&dev->cmds);
 }
 
+/* keep a copy of the commands being rendered, for nk_glfw3_frame_changed;
+   taken before nk_convert or nk__begin, whose nk_build links the last
+   command of each window to the next window's first, so that it compares
+   equal to the next frame's commands while they are still unbuilt */
+static void
+nk_glfw3_remember_frame(struct nk_glfw *glfw)
+{
+    nk_size size = glfw->ctx.memory.allocated;
+    if (size > glfw->last_cmds_capacity) {
+        void *cmds = realloc(glfw->last_cmds, size);
+        if (!cmds) {
+            /* without a copy every frame counts as changed */
+            free(glfw->last_cmds);
+            glfw->last_cmds = NULL;
+            glfw->last_cmds_capacity = 0;
+            glfw->last_cmds_size = 0;
+            glfw->frame_changed = -1;
+            return;
+        }
+        glfw->last_cmds = cmds;
+        glfw->last_cmds_capacity = size;
+    }
+    NK_MEMCPY(glfw->last_cmds, nk_buffer_memory(&glfw->ctx.memory), size);
+    glfw->last_cmds_size = size;
+    glfw->last_width = glfw->display_width;
+    glfw->last_height = glfw->display_height;
+    glfw->frame_changed = -1;
+}
+
+NK_INTERN void
+nk_glfw3_save_state(unsigned int state, struct nk_glfw3_gl_state *gl)
+{
+    if (state & NK_GLFW3_STATE_BLEND) {
+        gl->blend = glIsEnabled(GL_BLEND);
+        glGetIntegerv(GL_BLEND_SRC_RGB, &gl->blend_src_rgb);
+        glGetIntegerv(GL_BLEND_DST_RGB, &gl->blend_dst_rgb);
+        glGetIntegerv(GL_BLEND_SRC_ALPHA, &gl->blend_src_alpha);
+        glGetIntegerv(GL_BLEND_DST_ALPHA, &gl->blend_dst_alpha);
+        glGetIntegerv(GL_BLEND_EQUATION_RGB, &gl->blend_equation_rgb);
+        glGetIntegerv(GL_BLEND_EQUATION_ALPHA, &gl->blend_equation_alpha);
+    }
+    if (state & NK_GLFW3_STATE_CULL_FACE)
+        gl->cull_face = glIsEnabled(GL_CULL_FACE);
+    if (state & NK_GLFW3_STATE_DEPTH_TEST)
+        gl->depth_test = glIsEnabled(GL_DEPTH_TEST);
+    if (state & NK_GLFW3_STATE_SCISSOR) {
+        gl->scissor_test = glIsEnabled(GL_SCISSOR_TEST);
+        glGetIntegerv(GL_SCISSOR_BOX, gl->scissor_box);
+    }
+    if (state & NK_GLFW3_STATE_VIEWPORT)
+        glGetIntegerv(GL_VIEWPORT, gl->viewport);
+    if (state & NK_GLFW3_STATE_PROGRAM)
+        glGetIntegerv(GL_CURRENT_PROGRAM, &gl->program);
+    if (state & NK_GLFW3_STATE_TEXTURE) {
+        glGetIntegerv(GL_ACTIVE_TEXTURE, &gl->active_texture);
+        glActiveTexture(GL_TEXTURE0);
+        glGetIntegerv(GL_TEXTURE_BINDING_2D, &gl->texture);
+        glActiveTexture((GLenum)gl->active_texture);
+    }
+    if (state & NK_GLFW3_STATE_BUFFERS) {
+        glGetIntegerv(GL_VERTEX_ARRAY_BINDING, &gl->vertex_array);
+        glGetIntegerv(GL_ARRAY_BUFFER_BINDING, &gl->array_buffer);
+    }
+}
+
+NK_INTERN void
+nk_glfw3_enable(GLenum cap, int enable)
+{
+    if (enable) glEnable(cap);
+    else glDisable(cap);
+}
+
+/* restores the protected state, and resets the unprotected state nuklear
+   changed to the defaults */
+NK_INTERN void
+nk_glfw3_restore_state(unsigned int state, const struct nk_glfw3_gl_state *gl)
+{
+    if (state & NK_GLFW3_STATE_PROGRAM)
+        glUseProgram((GLuint)gl->program);
+    else glUseProgram(0);
+    if (state & NK_GLFW3_STATE_TEXTURE) {
+        glBindTexture(GL_TEXTURE_2D, (GLuint)gl->texture);
+        glActiveTexture((GLenum)gl->active_texture);
+    }
+    if (state & NK_GLFW3_STATE_BUFFERS) {
+        glBindVertexArray((GLuint)gl->vertex_array);
+        glBindBuffer(GL_ARRAY_BUFFER, (GLuint)gl->array_buffer);
+    } else {
+        glBindBuffer(GL_ARRAY_BUFFER, 0);
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0);
+        glBindVertexArray(0);
+    }
+    if (state & NK_GLFW3_STATE_BLEND) {
+        glBlendEquationSeparate((GLenum)gl->blend_equation_rgb, (GLenum)gl->blend_equation_alpha);
+        glBlendFuncSeparate((GLenum)gl->blend_src_rgb, (GLenum)gl->blend_dst_rgb,
+                            (GLenum)gl->blend_src_alpha, (GLenum)gl->blend_dst_alpha);
+        nk_glfw3_enable(GL_BLEND, gl->blend);
+    } else glDisable(GL_BLEND);
+    if (state & NK_GLFW3_STATE_CULL_FACE)
+        nk_glfw3_enable(GL_CULL_FACE, gl->cull_face);
+    if (state & NK_GLFW3_STATE_DEPTH_TEST)
+        nk_glfw3_enable(GL_DEPTH_TEST, gl->depth_test);
+    if (state & NK_GLFW3_STATE_SCISSOR) {
+        glScissor(gl->scissor_box[0], gl->scissor_box[1],
+                  (GLsizei)gl->scissor_box[2], (GLsizei)gl->scissor_box[3]);
+        nk_glfw3_enable(GL_SCISSOR_TEST, gl->scissor_test);
+    } else glDisable(GL_SCISSOR_TEST);
+    if (state & NK_GLFW3_STATE_VIEWPORT)
+        glViewport(gl->viewport[0], gl->viewport[1],
+                   (GLsizei)gl->viewport[2], (GLsizei)gl->viewport[3]);
+}
+
+/* chooses the state nk_glfw3_render restores, NK_GLFW3_STATE_DEFAULT
+   initially.  With NK_GLFW3_STATE_SHADOWED the current state is read
+   into the shadow, so call it with the state the application renders
+   the GUI in. */
 NK_API void
-nk_glfw3_render(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element_buffer)
+nk_glfw3_protect_state(unsigned int state)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    glfw->protect = state;
+    if (state & NK_GLFW3_STATE_SHADOWED)
+        nk_glfw3_save_state(state, &glfw->saved);
+}
+
+NK_API unsigned int
+nk_glfw3_protected_state(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    return glfw->protect;
+}
+
+/* the state restored in shadowed mode, for the application to update as
+   it changes protected state */
+NK_API struct nk_glfw3_gl_state*
+nk_glfw3_shadow_state(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    return &glfw->saved;
+}
+
+NK_API const struct nk_glfw3_stats*
+nk_glfw3_get_stats(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    return &glfw->stats;
+}
+
+/* times the draw pass of every frame with GL_TIME_ELAPSED queries, see
+   gpu_time of nk_glfw3_get_stats */
+NK_API void
+nk_glfw3_gpu_timer(int enable)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_device *dev = &glfw->ogl;
+    if (enable && !dev->gpu_timer) {
+        glGenQueries(2, dev->queries);
+        dev->query_pending[0] = dev->query_pending[1] = 0;
+        dev->query_index = 0;
+    } else if (!enable && dev->gpu_timer) {
+        glDeleteQueries(2, dev->queries);
+    }
+    dev->gpu_timer = enable != 0;
+    glfw->stats.gpu_time = -1;
+}
+
+/* whether the commands built since the last render, or the framebuffer
+   size, differ from what was rendered last; call it after the frame is
+   built and before rendering it */
+NK_API int
+nk_glfw3_frame_changed(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    if (glfw->frame_changed < 0) {
+        glfw->frame_changed = !glfw->last_cmds ||
+            glfw->last_width != glfw->display_width ||
+            glfw->last_height != glfw->display_height ||
+            glfw->last_cmds_size != glfw->ctx.memory.allocated ||
+            memcmp(glfw->last_cmds, nk_buffer_memory(&glfw->ctx.memory),
+                   (size_t)glfw->last_cmds_size) != 0;
+    }
+    return glfw->frame_changed;
+}
+
+/* render the frame only if it changed, otherwise just drop its commands;
+   returns whether it rendered */
+NK_API int
+nk_glfw3_render_if_changed(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element_buffer)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    if (nk_glfw3_frame_changed()) {
+        nk_glfw3_render(AA, max_vertex_buffer, max_element_buffer);
+        return 1;
+    }
+    nk_clear(&glfw->ctx);
+    glfw->frame_changed = -1;
+    return 0;
+}
+
+/* a frame to draw: a context whose commands are built, the size of the
+   window it was built for, and the statistics its render fills in */
+struct nk_glfw_frame {
+    struct nk_context *ctx;
+    int width, height;
+    int display_width, display_height;
+    struct nk_vec2 fb_scale;
+    struct nk_glfw3_stats *stats;
+};
+
+/* the draw commands of a frame gathered into one draw call, and the
+   texture and scissor box the last call drew with */
+struct nk_glfw_batch {
+    GLuint texture;
+    GLint scissor[4];
+    GLsizei count;
+    const nk_draw_index *offset;
+    GLint base_vertex;
+    GLuint bound_texture;
+    GLint bound_scissor[4];
+    int drawn;
+};
+
+NK_INTERN void
+nk_glfw3_draw_batch(struct nk_glfw3_stats *stats, struct nk_glfw_batch *batch)
 {
-    struct nk_glfw_device *dev = &glfw.ogl;
+    if (!batch->count) return;
+    if (!batch->drawn || batch->bound_texture != batch->texture) {
+        glBindTexture(GL_TEXTURE_2D, batch->texture);
+        batch->bound_texture = batch->texture;
+        stats->texture_binds++;
+    }
+    if (!batch->drawn || memcmp(batch->bound_scissor, batch->scissor, sizeof(batch->scissor))) {
+        glScissor(batch->scissor[0], batch->scissor[1],
+                  (GLsizei)batch->scissor[2], (GLsizei)batch->scissor[3]);
+        memcpy(batch->bound_scissor, batch->scissor, sizeof(batch->scissor));
+        stats->scissor_changes++;
+    }
+    batch->drawn = 1;
+    glDrawElementsBaseVertex(GL_TRIANGLES, batch->count, NK_GLFW_GL_INDEX,
+                             (void*)batch->offset, batch->base_vertex);
+    stats->batches++;
+    batch->offset += batch->count;
+    batch->count = 0;
+}
+
+/* draws a built frame with the instance's device, which must be in the
+   current OpenGL context */
+NK_INTERN void
+nk_glfw3_draw_frame(struct nk_glfw *glfw, const struct nk_glfw_frame *frame,
+    enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element_buffer)
+{
+    struct nk_context *ctx = frame->ctx;
+    struct nk_glfw3_stats *stats = frame->stats;
+    struct nk_glfw_device *dev = &glfw->ogl;
     struct nk_buffer vbuf, ebuf;
     GLfloat ortho[4][4] = {
         {2.0f, 0.0f, 0.0f, 0.0f},
@@ -218,8 +764,13 @@ nk_glfw3_render(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element
         {0.0f, 0.0f,-1.0f, 0.0f},
         {-1.0f,1.0f, 0.0f, 1.0f},
     };
-    ortho[0][0] /= (GLfloat)glfw.width;
-    ortho[1][1] /= (GLfloat)glfw.height;
+    double saving = glfwGetTime(), restoring;
+    ortho[0][0] /= (GLfloat)frame->width;
+    ortho[1][1] /= (GLfloat)frame->height;
+
+    if (!(glfw->protect & NK_GLFW3_STATE_SHADOWED))
+        nk_glfw3_save_state(glfw->protect, &glfw->saved);
+    stats->state_time = glfwGetTime() - saving;
 
     /* setup global state */
     glEnable(GL_BLEND);
@@ -234,204 +785,648 @@ nk_glfw3_render(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element
     glUseProgram(dev->prog);
     glUniform1i(dev->uniform_tex, 0);
     glUniformMatrix4fv(dev->uniform_proj, 1, GL_FALSE, &ortho[0][0]);
-    glViewport(0,0,(GLsizei)glfw.display_width,(GLsizei)glfw.display_height);
+    glViewport(0,0,(GLsizei)frame->display_width,(GLsizei)frame->display_height);
     {
         /* convert from command queue into draw list and draw to screen */
         const struct nk_draw_command *cmd;
         void *vertices, *elements;
-        const nk_draw_index *offset = NULL;
+        struct nk_convert_config config;
+        static const struct nk_draw_vertex_layout_element vertex_layout[] = {
+            {NK_VERTEX_POSITION, NK_FORMAT_FLOAT, NK_OFFSETOF(struct nk_glfw_vertex, position)},
+            {NK_VERTEX_TEXCOORD, NK_FORMAT_FLOAT, NK_OFFSETOF(struct nk_glfw_vertex, uv)},
+            {NK_VERTEX_COLOR, NK_FORMAT_R8G8B8A8, NK_OFFSETOF(struct nk_glfw_vertex, col)},
+            {NK_VERTEX_LAYOUT_END}
+        };
+        nk_flags result;
+        GLint base_vertex = 0;
+        GLintptr vertex_offset = 0, element_offset = 0;
 
-        /* allocate vertex and element buffer */
-        glBindVertexArray(dev->vao);
-        glBindBuffer(GL_ARRAY_BUFFER, dev->vbo);
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, dev->ebo);
+        struct nk_glfw_batch batch;
+        double start = glfwGetTime(), converted;
+        stats->command_bytes = ctx->memory.allocated;
+        stats->draw_commands = 0;
+        stats->batches = 0;
+        stats->texture_binds = 0;
+        stats->scissor_changes = 0;
 
-        glBufferData(GL_ARRAY_BUFFER, max_vertex_buffer, NULL, GL_STREAM_DRAW);
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, max_element_buffer, NULL, GL_STREAM_DRAW);
+        /* fill convert configuration */
+        NK_MEMSET(&config, 0, sizeof(config));
+        config.vertex_layout = vertex_layout;
+        config.vertex_size = sizeof(struct nk_glfw_vertex);
+        config.vertex_alignment = NK_ALIGNOF(struct nk_glfw_vertex);
+        config.null = dev->null;
+        config.circle_segment_count = 22;
+        config.curve_segment_count = 22;
+        config.arc_segment_count = 22;
+        config.global_alpha = 1.0f;
+        config.shape_AA = AA;
+        config.line_AA = AA;
 
-        /* load draw vertices & elements directly into vertex + element buffer */
-        vertices = glMapBuffer(GL_ARRAY_BUFFER, GL_WRITE_ONLY);
-        elements = glMapBuffer(GL_ELEMENT_ARRAY_BUFFER, GL_WRITE_ONLY);
-        {
-            /* fill convert configuration */
-            struct nk_convert_config config;
-            static const struct nk_draw_vertex_layout_element vertex_layout[] = {
-                {NK_VERTEX_POSITION, NK_FORMAT_FLOAT, NK_OFFSETOF(struct nk_glfw_vertex, position)},
-                {NK_VERTEX_TEXCOORD, NK_FORMAT_FLOAT, NK_OFFSETOF(struct nk_glfw_vertex, uv)},
-                {NK_VERTEX_COLOR, NK_FORMAT_R8G8B8A8, NK_OFFSETOF(struct nk_glfw_vertex, col)},
-                {NK_VERTEX_LAYOUT_END}
-            };
-            NK_MEMSET(&config, 0, sizeof(config));
-            config.vertex_layout = vertex_layout;
-            config.vertex_size = sizeof(struct nk_glfw_vertex);
-            config.vertex_alignment = NK_ALIGNOF(struct nk_glfw_vertex);
-            config.null = dev->null;
-            config.circle_segment_count = 22;
-            config.curve_segment_count = 22;
-            config.arc_segment_count = 22;
-            config.global_alpha = 1.0f;
-            config.shape_AA = AA;
-            config.line_AA = AA;
+        /* the buffers keep the size of the largest frame so far, as the
+           given sizes are only a start */
+        max_vertex_buffer = NK_MAX(max_vertex_buffer, dev->vertex_capacity);
+        max_element_buffer = NK_MAX(max_element_buffer, dev->element_capacity);
+        for (;;) {
+            /* allocate vertex and element buffer */
+            if (dev->stream != NK_GLFW3_STREAM_ORPHAN &&
+                (dev->vertex_region < (nk_size)max_vertex_buffer ||
+                 dev->element_region < (nk_size)max_element_buffer))
+                nk_glfw3_stream_create(dev, (nk_size)max_vertex_buffer, (nk_size)max_element_buffer);
+            glBindVertexArray(dev->vao);
+            glBindBuffer(GL_ARRAY_BUFFER, dev->vbo);
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, dev->ebo);
+
+            if (dev->stream != NK_GLFW3_STREAM_ORPHAN) {
+                GLsync fence = dev->fences[dev->region];
+                if (fence) {
+                    /* the GPU is done with the region once the frame drawn
+                       from it last is */
+                    while (glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000) == GL_TIMEOUT_EXPIRED);
+                    glDeleteSync(fence);
+                    dev->fences[dev->region] = 0;
+                }
+                vertex_offset = (GLintptr)(dev->vertex_region * (nk_size)dev->region);
+                element_offset = (GLintptr)(dev->element_region * (nk_size)dev->region);
+                base_vertex = (GLint)(vertex_offset / (GLintptr)sizeof(struct nk_glfw_vertex));
+            }
 
+            /* load draw vertices & elements directly into vertex + element buffer */
+            if (dev->stream == NK_GLFW3_STREAM_PERSISTENT) {
+                vertices = (char*)dev->vertex_map + vertex_offset;
+                elements = (char*)dev->element_map + element_offset;
+            } else if (dev->stream == NK_GLFW3_STREAM_UNSYNCHRONIZED) {
+                GLbitfield access = GL_MAP_WRITE_BIT|GL_MAP_INVALIDATE_RANGE_BIT|
+                    GL_MAP_UNSYNCHRONIZED_BIT|GL_MAP_FLUSH_EXPLICIT_BIT;
+                vertices = glMapBufferRange(GL_ARRAY_BUFFER, vertex_offset, max_vertex_buffer, access);
+                elements = glMapBufferRange(GL_ELEMENT_ARRAY_BUFFER, element_offset, max_element_buffer, access);
+            } else {
+                glBufferData(GL_ARRAY_BUFFER, max_vertex_buffer, NULL, GL_STREAM_DRAW);
+                glBufferData(GL_ELEMENT_ARRAY_BUFFER, max_element_buffer, NULL, GL_STREAM_DRAW);
+                vertices = glMapBuffer(GL_ARRAY_BUFFER, GL_WRITE_ONLY);
+                elements = glMapBuffer(GL_ELEMENT_ARRAY_BUFFER, GL_WRITE_ONLY);
+            }
             /* setup buffers to load vertices and elements */
+            nk_buffer_clear(&dev->cmds);
             nk_buffer_init_fixed(&vbuf, vertices, (size_t)max_vertex_buffer);
             nk_buffer_init_fixed(&ebuf, elements, (size_t)max_element_buffer);
-            nk_convert(&glfw.ctx, &dev->cmds, &vbuf, &ebuf, &config);
+            result = nk_convert(ctx, &dev->cmds, &vbuf, &ebuf, &config);
+            if (dev->stream == NK_GLFW3_STREAM_UNSYNCHRONIZED) {
+                /* only the bytes nk_convert wrote reach the GPU */
+                if (vbuf.allocated)
+                    glFlushMappedBufferRange(GL_ARRAY_BUFFER, 0, (GLsizeiptr)vbuf.allocated);
+                if (ebuf.allocated)
+                    glFlushMappedBufferRange(GL_ELEMENT_ARRAY_BUFFER, 0, (GLsizeiptr)ebuf.allocated);
+            }
+            if (dev->stream != NK_GLFW3_STREAM_PERSISTENT) {
+                glUnmapBuffer(GL_ARRAY_BUFFER);
+                glUnmapBuffer(GL_ELEMENT_ARRAY_BUFFER);
+            }
+
+            /* a frame that did not fit is converted again into buffers
+               twice as large, which later frames keep */
+            if (!(result & (NK_CONVERT_VERTEX_BUFFER_FULL|NK_CONVERT_ELEMENT_BUFFER_FULL)))
+                break;
+            if (result & NK_CONVERT_VERTEX_BUFFER_FULL)
+                max_vertex_buffer *= 2;
+            if (result & NK_CONVERT_ELEMENT_BUFFER_FULL)
+                max_element_buffer *= 2;
+        }
+        dev->vertex_capacity = max_vertex_buffer;
+        dev->element_capacity = max_element_buffer;
+        stats->streamed_bytes = vbuf.allocated + ebuf.allocated;
+        converted = glfwGetTime();
+        stats->convert_time = converted - start;
+        stats->vertices = ctx->draw_list.vertex_count;
+        stats->elements = ctx->draw_list.element_count;
+
+        if (dev->gpu_timer) {
+            /* the query begun two frames ago is read, if it is done */
+            int i = dev->query_index;
+            GLint available = 0;
+            if (dev->query_pending[i]) {
+                glGetQueryObjectiv(dev->queries[i], GL_QUERY_RESULT_AVAILABLE, &available);
+                if (available) {
+                    GLuint64 elapsed = 0;
+                    glGetQueryObjectui64v(dev->queries[i], GL_QUERY_RESULT, &elapsed);
+                    stats->gpu_time = (double)elapsed * 1e-9;
+                    dev->query_pending[i] = 0;
+                }
+            }
+            if (!dev->query_pending[i])
+                glBeginQuery(GL_TIME_ELAPSED, dev->queries[i]);
         }
-        glUnmapBuffer(GL_ARRAY_BUFFER);
-        glUnmapBuffer(GL_ELEMENT_ARRAY_BUFFER);
 
-        /* iterate over and execute each draw command */
-        nk_draw_foreach(cmd, &glfw.ctx, &dev->cmds)
+        /* iterate over the draw commands, drawing each run of adjacent
+           commands with the same texture and scissor box as one batch */
+        NK_MEMSET(&batch, 0, sizeof(batch));
+        batch.offset = (const nk_draw_index*)element_offset;
+        batch.base_vertex = base_vertex;
+        nk_draw_foreach(cmd, ctx, &dev->cmds)
         {
+            GLint scissor[4];
             if (!cmd->elem_count) continue;
-            glBindTexture(GL_TEXTURE_2D, (GLuint)cmd->texture.id);
-            glScissor(
-                (GLint)(cmd->clip_rect.x * glfw.fb_scale.x),
-                (GLint)((glfw.height - (GLint)(cmd->clip_rect.y + cmd->clip_rect.h)) * glfw.fb_scale.y),
-                (GLint)(cmd->clip_rect.w * glfw.fb_scale.x),
-                (GLint)(cmd->clip_rect.h * glfw.fb_scale.y));
-            glDrawElements(GL_TRIANGLES, (GLsizei)cmd->elem_count, GL_UNSIGNED_SHORT, offset);
-            offset += cmd->elem_count;
+            stats->draw_commands++;
+            scissor[0] = (GLint)(cmd->clip_rect.x * frame->fb_scale.x);
+            scissor[1] = (GLint)((frame->height - (GLint)(cmd->clip_rect.y + cmd->clip_rect.h)) * frame->fb_scale.y);
+            scissor[2] = (GLint)(cmd->clip_rect.w * frame->fb_scale.x);
+            scissor[3] = (GLint)(cmd->clip_rect.h * frame->fb_scale.y);
+            if (batch.count && batch.texture == (GLuint)cmd->texture.id &&
+                !memcmp(batch.scissor, scissor, sizeof(scissor))) {
+                batch.count += (GLsizei)cmd->elem_count;
+                continue;
+            }
+            nk_glfw3_draw_batch(stats, &batch);
+            batch.texture = (GLuint)cmd->texture.id;
+            memcpy(batch.scissor, scissor, sizeof(scissor));
+            batch.count = (GLsizei)cmd->elem_count;
         }
-        nk_clear(&glfw.ctx);
+        nk_glfw3_draw_batch(stats, &batch);
+        if (dev->gpu_timer && !dev->query_pending[dev->query_index]) {
+            glEndQuery(GL_TIME_ELAPSED);
+            dev->query_pending[dev->query_index] = 1;
+            dev->query_index ^= 1;
+        }
+        if (dev->stream != NK_GLFW3_STREAM_ORPHAN) {
+            dev->fences[dev->region] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+            dev->region = (dev->region + 1) % NK_GLFW_STREAM_FRAMES;
+        }
+        stats->draw_time = glfwGetTime() - converted;
     }
 
-    /* default OpenGL state */
-    glUseProgram(0);
-    glBindBuffer(GL_ARRAY_BUFFER, 0);
-    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0);
-    glBindVertexArray(0);
-    glDisable(GL_BLEND);
-    glDisable(GL_SCISSOR_TEST);
+    restoring = glfwGetTime();
+    nk_glfw3_restore_state(glfw->protect, &glfw->saved);
+    stats->state_time += glfwGetTime() - restoring;
+}
+
+NK_API void
+nk_glfw3_render(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element_buffer)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_frame frame;
+    frame.ctx = &glfw->ctx;
+    frame.width = glfw->width;
+    frame.height = glfw->height;
+    frame.display_width = glfw->display_width;
+    frame.display_height = glfw->display_height;
+    frame.fb_scale = glfw->fb_scale;
+    frame.stats = &glfw->stats;
+    nk_glfw3_remember_frame(glfw);
+    nk_glfw3_draw_frame(glfw, &frame, AA, max_vertex_buffer, max_element_buffer);
+    nk_clear(&glfw->ctx);
+}
+
+#ifndef NK_GLFW_NO_RENDER_THREAD
+/* a frame handed to the render thread: a copy of the built commands, in
+   a context holding a single window that spans them all */
+struct nk_glfw_slot {
+    struct nk_glfw_frame frame;
+    struct nk_context ctx;
+    struct nk_window window;
+    void *memory;
+    nk_size capacity;
+    int empty;
+    enum nk_anti_aliasing AA;
+    int max_vertex_buffer, max_element_buffer;
+    struct nk_colorf clear;
+};
+
+struct nk_glfw_render_thread {
+    pthread_t thread;
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    struct nk_glfw_slot slots[2];
+    /* the slots queued and being drawn, -1 for none */
+    int submitted, rendering;
+    int stop;
+    /* the statistics of the frame being drawn and of the last one drawn */
+    struct nk_glfw3_stats stats, drawn;
+};
+
+NK_INTERN void*
+nk_glfw3_render_main(void *arg)
+{
+    struct nk_glfw *glfw = (struct nk_glfw*)arg;
+    struct nk_glfw_render_thread *thread = glfw->thread;
+    glfwMakeContextCurrent(glfw->win);
+    pthread_mutex_lock(&thread->lock);
+    for (;;) {
+        struct nk_glfw_slot *slot;
+        while (thread->submitted < 0 && !thread->stop)
+            pthread_cond_wait(&thread->cond, &thread->lock);
+        if (thread->submitted < 0) break;
+        thread->rendering = thread->submitted;
+        thread->submitted = -1;
+        pthread_cond_broadcast(&thread->cond);
+        pthread_mutex_unlock(&thread->lock);
+
+        slot = &thread->slots[thread->rendering];
+        glViewport(0, 0, slot->frame.display_width, slot->frame.display_height);
+        glClearColor(slot->clear.r, slot->clear.g, slot->clear.b, slot->clear.a);
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
+        if (!slot->empty)
+            nk_glfw3_draw_frame(glfw, &slot->frame, slot->AA,
+                slot->max_vertex_buffer, slot->max_element_buffer);
+        glfwSwapBuffers(glfw->win);
+
+        pthread_mutex_lock(&thread->lock);
+        thread->drawn = thread->stats;
+        thread->rendering = -1;
+        pthread_cond_broadcast(&thread->cond);
+    }
+    pthread_mutex_unlock(&thread->lock);
+    glfwMakeContextCurrent(NULL);
+    return NULL;
+}
+
+/* copies the built frame into the free slot and queues it */
+NK_INTERN void
+nk_glfw3_queue_frame(struct nk_glfw *glfw, enum nk_anti_aliasing AA,
+    int max_vertex_buffer, int max_element_buffer, struct nk_colorf clear)
+{
+    struct nk_glfw_render_thread *thread = glfw->thread;
+    const struct nk_command *first = nk__begin(&glfw->ctx);
+    const nk_byte *memory = (const nk_byte*)nk_buffer_memory(&glfw->ctx.memory);
+    nk_size size = glfw->ctx.memory.allocated;
+    struct nk_glfw_slot *slot;
+    int index;
+
+    pthread_mutex_lock(&thread->lock);
+    while (thread->submitted >= 0)
+        pthread_cond_wait(&thread->cond, &thread->lock);
+    index = thread->rendering == 0 ? 1 : 0;
+    glfw->stats = thread->drawn;
+    pthread_mutex_unlock(&thread->lock);
+
+    /* neither queued nor drawn, the slot is the caller's until queued */
+    slot = &thread->slots[index];
+    if (first && size > slot->capacity) {
+        void *grown = realloc(slot->memory, size);
+        if (!grown) return;
+        slot->memory = grown;
+        slot->capacity = size;
+    }
+    slot->empty = !first;
+    if (first) {
+        NK_MEMCPY(slot->memory, memory, size);
+        nk_buffer_init_fixed(&slot->ctx.memory, slot->memory, size);
+        slot->ctx.memory.allocated = size;
+        slot->ctx.count = 1;
+        slot->ctx.seq = 0;
+        slot->ctx.build = nk_true;
+        slot->ctx.begin = slot->ctx.end = &slot->window;
+        slot->window.next = slot->window.prev = NULL;
+        slot->window.seq = 0;
+        slot->window.flags = 0;
+        slot->window.buffer.begin = (nk_size)((const nk_byte*)first - memory);
+        slot->window.buffer.end = size;
+    }
+    slot->frame.ctx = &slot->ctx;
+    slot->frame.width = glfw->width;
+    slot->frame.height = glfw->height;
+    slot->frame.display_width = glfw->display_width;
+    slot->frame.display_height = glfw->display_height;
+    slot->frame.fb_scale = glfw->fb_scale;
+    slot->frame.stats = &thread->stats;
+    slot->AA = AA;
+    slot->max_vertex_buffer = max_vertex_buffer;
+    slot->max_element_buffer = max_element_buffer;
+    slot->clear = clear;
+
+    pthread_mutex_lock(&thread->lock);
+    thread->submitted = index;
+    pthread_cond_broadcast(&thread->cond);
+    pthread_mutex_unlock(&thread->lock);
+}
+
+NK_API int
+nk_glfw3_render_thread_start(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_render_thread *thread;
+    if (glfw->thread) return 1;
+    thread = (struct nk_glfw_render_thread*)calloc(1, sizeof(*thread));
+    if (!thread) return 0;
+    thread->submitted = thread->rendering = -1;
+    thread->stats = thread->drawn = glfw->stats;
+    pthread_mutex_init(&thread->lock, NULL);
+    pthread_cond_init(&thread->cond, NULL);
+    glfw->thread = thread;
+    /* a context is current on one thread at a time */
+    glfwMakeContextCurrent(NULL);
+    if (pthread_create(&thread->thread, NULL, nk_glfw3_render_main, glfw)) {
+        glfw->thread = NULL;
+        pthread_cond_destroy(&thread->cond);
+        pthread_mutex_destroy(&thread->lock);
+        free(thread);
+        glfwMakeContextCurrent(glfw->win);
+        return 0;
+    }
+    return 1;
+}
+
+NK_API void
+nk_glfw3_render_thread_stop(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw_render_thread *thread = glfw->thread;
+    if (!thread) return;
+    pthread_mutex_lock(&thread->lock);
+    thread->stop = 1;
+    pthread_cond_broadcast(&thread->cond);
+    pthread_mutex_unlock(&thread->lock);
+    pthread_join(thread->thread, NULL);
+
+    glfw->stats = thread->drawn;
+    glfw->thread = NULL;
+    pthread_cond_destroy(&thread->cond);
+    pthread_mutex_destroy(&thread->lock);
+    free(thread->slots[0].memory);
+    free(thread->slots[1].memory);
+    free(thread);
+    glfwMakeContextCurrent(glfw->win);
+}
+#else
+NK_API int
+nk_glfw3_render_thread_start(void)
+{
+    return 0;
+}
+
+NK_API void
+nk_glfw3_render_thread_stop(void)
+{
+}
+#endif
+
+NK_API void
+nk_glfw3_submit(enum nk_anti_aliasing AA, int max_vertex_buffer, int max_element_buffer,
+    struct nk_colorf clear)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+#ifndef NK_GLFW_NO_RENDER_THREAD
+    if (glfw->thread) {
+        nk_glfw3_remember_frame(glfw);
+        nk_glfw3_queue_frame(glfw, AA, max_vertex_buffer, max_element_buffer, clear);
+        nk_clear(&glfw->ctx);
+        return;
+    }
+#endif
+    glViewport(0, 0, glfw->display_width, glfw->display_height);
+    glClearColor(clear.r, clear.g, clear.b, clear.a);
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
+    nk_glfw3_render(AA, max_vertex_buffer, max_element_buffer);
+    glfwSwapBuffers(glfw->win);
 }
 
 NK_API void
 nk_glfw3_char_callback(GLFWwindow *win, unsigned int codepoint)
 {
-    (void)win;
-    if (glfw.text_len < NK_GLFW_TEXT_MAX)
-        glfw.text[glfw.text_len++] = codepoint;
+    struct nk_glfw *glfw = nk_glfw3_find(win);
+    if (glfw->text_len < NK_GLFW_TEXT_MAX)
+        glfw->text[glfw->text_len++] = codepoint;
 }
 
 NK_API void
 nk_gflw3_scroll_callback(GLFWwindow *win, double xoff, double yoff)
 {
-    (void)win; (void)xoff;
-    glfw.scroll.x += (float)xoff;
-    glfw.scroll.y += (float)yoff;
+    struct nk_glfw *glfw = nk_glfw3_find(win);
+    glfw->scroll.x += (float)xoff;
+    glfw->scroll.y += (float)yoff;
 }
 
 NK_API void
 nk_glfw3_mouse_button_callback(GLFWwindow* window, int button, int action, int mods)
 {
+    struct nk_glfw *glfw = nk_glfw3_find(window);
     double x, y;
     if (button != GLFW_MOUSE_BUTTON_LEFT) return;
     glfwGetCursorPos(window, &x, &y);
     if (action == GLFW_PRESS)  {
-        double dt = glfwGetTime() - glfw.last_button_click;
+        double dt = glfwGetTime() - glfw->last_button_click;
         if (dt > NK_GLFW_DOUBLE_CLICK_LO && dt < NK_GLFW_DOUBLE_CLICK_HI) {
-            glfw.is_double_click_down = nk_true;
-            glfw.double_click_pos = nk_vec2((float)x, (float)y);
+            glfw->is_double_click_down = nk_true;
+            glfw->double_click_pos = nk_vec2((float)x, (float)y);
         }
-        glfw.last_button_click = glfwGetTime();
-    } else glfw.is_double_click_down = nk_false;
+        glfw->last_button_click = glfwGetTime();
+    } else glfw->is_double_click_down = nk_false;
 }
 
 NK_INTERN void
 nk_glfw3_clipbard_paste(nk_handle usr, struct nk_text_edit *edit)
 {
-    const char *text = glfwGetClipboardString(glfw.win);
+    struct nk_glfw *glfw = (struct nk_glfw*)usr.ptr;
+    const char *text = glfwGetClipboardString(glfw->win);
     if (text) nk_textedit_paste(edit, text, nk_strlen(text));
-    (void)usr;
 }
 
 NK_INTERN void
 nk_glfw3_clipbard_copy(nk_handle usr, const char *text, int len)
 {
+    struct nk_glfw *glfw = (struct nk_glfw*)usr.ptr;
     char *str = 0;
-    (void)usr;
     if (!len) return;
     str = (char*)malloc((size_t)len+1);
     if (!str) return;
     memcpy(str, text, (size_t)len);
     str[len] = '\0';
-    glfwSetClipboardString(glfw.win, str);
+    glfwSetClipboardString(glfw->win, str);
     free(str);
 }
 
-NK_API struct nk_context*
-nk_glfw3_init(GLFWwindow *win, enum nk_glfw_init_state init_state)
+NK_INTERN void
+nk_glfw3_setup(struct nk_glfw *glfw, GLFWwindow *win, enum nk_glfw_init_state init_state,
+    struct nk_glfw *share)
 {
+    static int loaded;
     // unlike normal nuklear, where the "main.c" can initialize
     // the opengl loader library, the python bindings require
     // that nuklear itself load OpenGL procedures.
 
-    if(gl3w_init())
-    {
-        printf("Could not init glew\n");
+    if (!loaded) {
+        if(gl3w_init())
+        {
+            printf("Could not init glew\n");
+        }
+        loaded = 1;
     }
-    glfw.win = win;
+    nk_glfw3_instance = glfw;
+    nk_glfw3_unlink(glfw);
+    glfw->win = win;
+    glfw->share = share;
+    glfw->next = nk_glfw3_instances;
+    nk_glfw3_instances = glfw;
     if (init_state == NK_GLFW3_INSTALL_CALLBACKS) {
         glfwSetScrollCallback(win, nk_gflw3_scroll_callback);
         glfwSetCharCallback(win, nk_glfw3_char_callback);
         glfwSetMouseButtonCallback(win, nk_glfw3_mouse_button_callback);
     }
-    nk_init_default(&glfw.ctx, 0);
-    glfw.ctx.clip.copy = nk_glfw3_clipbard_copy;
-    glfw.ctx.clip.paste = nk_glfw3_clipbard_paste;
-    glfw.ctx.clip.userdata = nk_handle_ptr(0);
-    glfw.last_button_click = 0;
+    nk_init_default(&glfw->ctx, 0);
+    glfw->ctx.clip.copy = nk_glfw3_clipbard_copy;
+    glfw->ctx.clip.paste = nk_glfw3_clipbard_paste;
+    glfw->ctx.clip.userdata = nk_handle_ptr(glfw);
+    glfw->last_button_click = 0;
     nk_glfw3_device_create();
+    if (share) {
+        glfw->ogl.null = share->ogl.null;
+        if (share->atlas.default_font)
+            nk_style_set_font(&glfw->ctx, &share->atlas.default_font->handle);
+    }
+
+    glfw->is_double_click_down = nk_false;
+    glfw->double_click_pos = nk_vec2(0, 0);
+    glfw->frame_changed = -1;
+    glfw->stats.gpu_time = -1;
+    glfw->protect = NK_GLFW3_STATE_DEFAULT;
+}
 
-    glfw.is_double_click_down = nk_false;
-    glfw.double_click_pos = nk_vec2(0, 0);
+NK_API struct nk_context*
+nk_glfw3_init(GLFWwindow *win, enum nk_glfw_init_state init_state)
+{
+    nk_glfw3_setup(&nk_glfw3_first, win, init_state, NULL);
+    return &nk_glfw3_first.ctx;
+}
 
-    return &glfw.ctx;
+/* a new instance for win, made current along with win's OpenGL context */
+NK_API struct nk_glfw*
+nk_glfw3_create(GLFWwindow *win, enum nk_glfw_init_state init_state, struct nk_glfw *share)
+{
+    struct nk_glfw *glfw = (struct nk_glfw*)calloc(1, sizeof(struct nk_glfw));
+    if (!glfw) return NULL;
+    glfwMakeContextCurrent(win);
+    nk_glfw3_setup(glfw, win, init_state, share);
+    return glfw;
+}
+
+NK_API void
+nk_glfw3_make_current(struct nk_glfw *glfw)
+{
+    nk_glfw3_instance = glfw;
+    /* the render thread holds the context while it runs */
+    if (glfw->win && !glfw->thread && glfwGetCurrentContext() != glfw->win)
+        glfwMakeContextCurrent(glfw->win);
+}
+
+NK_API struct nk_glfw*
+nk_glfw3_current(void)
+{
+    return nk_glfw3_instance;
+}
+
+NK_API struct nk_context*
+nk_glfw3_context(struct nk_glfw *glfw)
+{
+    return &glfw->ctx;
+}
+
+/* stops the instance's render thread and frees the instance and its
+   OpenGL objects, with its window's context made current; the instance of
+   nk_glfw3_init becomes current */
+NK_API void
+nk_glfw3_destroy(struct nk_glfw *glfw)
+{
+    nk_glfw3_make_current(glfw);
+    nk_glfw3_render_thread_stop();
+    nk_glfw3_unlink(glfw);
+    if (glfw->atlas.permanent.alloc)
+        nk_font_atlas_clear(&glfw->atlas);
+    nk_font_pages_free(glfw->font_pages);
+    nk_free(&glfw->ctx);
+    nk_glfw3_device_destroy();
+    free(glfw->last_cmds);
+    nk_glfw3_instance = &nk_glfw3_first;
+    if (glfw == &nk_glfw3_first)
+        memset(glfw, 0, sizeof(*glfw));
+    else free(glfw);
 }
 
 NK_API void
 nk_glfw3_font_stash_begin(struct nk_font_atlas **atlas)
 {
-    nk_font_atlas_init_default(&glfw.atlas);
-    nk_font_atlas_begin(&glfw.atlas);
-    *atlas = &glfw.atlas;
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    nk_font_atlas_init_default(&glfw->atlas);
+    nk_font_atlas_begin(&glfw->atlas);
+    *atlas = &glfw->atlas;
 }
 
 NK_API void
 nk_glfw3_font_stash_end(void)
 {
+    nk_glfw3_font_stash_end_format(NK_FONT_ATLAS_RGBA32);
+}
+
+NK_API void
+nk_glfw3_font_stash_end_format(enum nk_font_atlas_format format)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    const void *image; int w, h;
+    image = nk_font_atlas_bake(&glfw->atlas, &w, &h, format);
+    nk_glfw3_font_stash_end_image(image, w, h, format);
+}
+
+NK_API void
+nk_glfw3_font_stash_end_image(const void *image, int w, int h, enum nk_font_atlas_format format)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    glfw->atlas_format = format;
+    nk_glfw3_device_upload_atlas(glfw, image, w, h, format);
+    nk_font_atlas_end(&glfw->atlas, nk_handle_id((int)glfw->ogl.font_tex), &glfw->ogl.null);
+    if (glfw->atlas.default_font)
+        nk_style_set_font(&glfw->ctx, &glfw->atlas.default_font->handle);
+}
+
+NK_API int
+nk_glfw3_font_pages_enable(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    if (glfw->share) glfw = glfw->share;
+    if (!glfw->font_pages)
+        glfw->font_pages = nk_font_pages_create(&glfw->atlas);
+    return glfw->font_pages != 0;
+}
+
+NK_API int
+nk_glfw3_font_pages_update(void)
+{
+    struct nk_glfw *glfw = nk_glfw3_instance;
+    struct nk_glfw *iter;
     const void *image; int w, h;
-    image = nk_font_atlas_bake(&glfw.atlas, &w, &h, NK_FONT_ATLAS_RGBA32);
-    nk_glfw3_device_upload_atlas(image, w, h);
-    nk_font_atlas_end(&glfw.atlas, nk_handle_id((int)glfw.ogl.font_tex), &glfw.ogl.null);
-    if (glfw.atlas.default_font)
-        nk_style_set_font(&glfw.ctx, &glfw.atlas.default_font->handle);
+
+    if (glfw->share) glfw = glfw->share;
+    if (!nk_font_pages_pending(glfw->font_pages)) return 0;
+    image = nk_font_pages_bake(glfw->font_pages, &w, &h, glfw->atlas_format);
+    if (!image) return 0;
+    nk_glfw3_device_upload_atlas(glfw, image, w, h, glfw->atlas_format);
+    nk_font_atlas_end(&glfw->atlas, nk_handle_id((int)glfw->ogl.font_tex), &glfw->ogl.null);
+    /* the white pixel moves with the glyphs */
+    for (iter = nk_glfw3_instances; iter; iter = iter->next)
+        if (iter->share == glfw) iter->ogl.null = glfw->ogl.null;
+    return 1;
 }
 
 NK_API void
 nk_glfw3_new_frame(void)
 {
+    struct nk_glfw *glfw = nk_glfw3_instance;
     int i;
     double x, y;
-    struct nk_context *ctx = &glfw.ctx;
-    struct GLFWwindow *win = glfw.win;
+    struct nk_context *ctx = &glfw->ctx;
+    struct GLFWwindow *win = glfw->win;
 
-    glfwGetWindowSize(win, &glfw.width, &glfw.height);
-    glfwGetFramebufferSize(win, &glfw.display_width, &glfw.display_height);
-    glfw.fb_scale.x = (float)glfw.display_width/(float)glfw.width;
-    glfw.fb_scale.y = (float)glfw.display_height/(float)glfw.height;
+    glfwGetWindowSize(win, &glfw->width, &glfw->height);
+    glfwGetFramebufferSize(win, &glfw->display_width, &glfw->display_height);
+    glfw->fb_scale.x = (float)glfw->display_width/(float)glfw->width;
+    glfw->fb_scale.y = (float)glfw->display_height/(float)glfw->height;
 
     nk_input_begin(ctx);
-    for (i = 0; i < glfw.text_len; ++i)
-        nk_input_unicode(ctx, glfw.text[i]);
+    for (i = 0; i < glfw->text_len; ++i)
+        nk_input_unicode(ctx, glfw->text[i]);
 
 #ifdef NK_GLFW_GL3_MOUSE_GRABBING
     /* optional grabbing behavior */
     if (ctx->input.mouse.grab)
-        glfwSetInputMode(glfw.win, GLFW_CURSOR, GLFW_CURSOR_HIDDEN);
+        glfwSetInputMode(glfw->win, GLFW_CURSOR, GLFW_CURSOR_HIDDEN);
     else if (ctx->input.mouse.ungrab)
-        glfwSetInputMode(glfw.win, GLFW_CURSOR, GLFW_CURSOR_NORMAL);
+        glfwSetInputMode(glfw->win, GLFW_CURSOR, GLFW_CURSOR_NORMAL);
 #endif
 
     nk_input_key(ctx, NK_KEY_DEL, glfwGetKey(win, GLFW_KEY_DELETE) == GLFW_PRESS);
@@ -473,7 +1468,7 @@ nk_glfw3_new_frame(void)
     nk_input_motion(ctx, (int)x, (int)y);
 #ifdef NK_GLFW_GL3_MOUSE_GRABBING
     if (ctx->input.mouse.grabbed) {
-        glfwSetCursorPos(glfw.win, ctx->input.mouse.prev.x, ctx->input.mouse.prev.y);
+        glfwSetCursorPos(glfw->win, ctx->input.mouse.prev.x, ctx->input.mouse.prev.y);
         ctx->input.mouse.pos.x = ctx->input.mouse.prev.x;
         ctx->input.mouse.pos.y = ctx->input.mouse.prev.y;
     }
@@ -481,20 +1476,17 @@ nk_glfw3_new_frame(void)
     nk_input_button(ctx, NK_BUTTON_LEFT, (int)x, (int)y, glfwGetMouseButton(win, GLFW_MOUSE_BUTTON_LEFT) == GLFW_PRESS);
     nk_input_button(ctx, NK_BUTTON_MIDDLE, (int)x, (int)y, glfwGetMouseButton(win, GLFW_MOUSE_BUTTON_MIDDLE) == GLFW_PRESS);
     nk_input_button(ctx, NK_BUTTON_RIGHT, (int)x, (int)y, glfwGetMouseButton(win, GLFW_MOUSE_BUTTON_RIGHT) == GLFW_PRESS);
-    nk_input_button(ctx, NK_BUTTON_DOUBLE, (int)glfw.double_click_pos.x, (int)glfw.double_click_pos.y, glfw.is_double_click_down);
-    nk_input_scroll(ctx, glfw.scroll);
-    nk_input_end(&glfw.ctx);
-    glfw.text_len = 0;
-    glfw.scroll = nk_vec2(0,0);
+    nk_input_button(ctx, NK_BUTTON_DOUBLE, (int)glfw->double_click_pos.x, (int)glfw->double_click_pos.y, glfw->is_double_click_down);
+    nk_input_scroll(ctx, glfw->scroll);
+    nk_input_end(&glfw->ctx);
+    glfw->text_len = 0;
+    glfw->scroll = nk_vec2(0,0);
 }
 
 NK_API
 void nk_glfw3_shutdown(void)
 {
-    nk_font_atlas_clear(&glfw.atlas);
-    nk_free(&glfw.ctx);
-    nk_glfw3_device_destroy();
-    memset(&glfw, 0, sizeof(glfw));
+    nk_glfw3_destroy(&nk_glfw3_first);
 }
 
 #endif
@@ -0,0 +1,335 @@
+/*
+ * Nuklear - 1.32.0 - public domain
+ * no warrenty implied; use at your own risk.
+ */
+/*
+ * A software rasterizer for the output of nk_convert, drawing into an
+ * RGBA8 image in memory, for rendering without a GPU or a display.  It
+ * draws what the OpenGL3 backend draws: the triangles of every draw
+ * command, scissored to its clip rect, textured and alpha blended with
+ * glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA).
+ */
+/*
+ * ==============================================================
+ *
+ *                              API
+ *
+ * ===============================================================
+ */
+#ifndef NK_RASTER_H_
+#define NK_RASTER_H_
+
+/* the vertex layout to nk_convert into, the same as nk_glfw_vertex */
+struct nk_raster_vertex {
+    float position[2];
+    float uv[2];
+    nk_byte col[4];
+};
+
+/* an RGBA8 image, rows stride bytes apart, 4 byte aligned */
+struct nk_raster_image {
+    nk_byte *pixels;
+    int width;
+    int height;
+    int stride;
+};
+
+/* Draws the draw commands of the last nk_convert of ctx into cmds.
+   Textures are looked up by the id of the command's texture handle, and
+   ids outside of [0, texture_count) sample opaque white. */
+NK_API void nk_raster_render(const struct nk_context*, const struct nk_buffer *cmds,
+                             const struct nk_raster_vertex *vertices,
+                             const nk_draw_index *elements,
+                             const struct nk_raster_image *textures, int texture_count,
+                             const struct nk_raster_image *target);
+NK_API void nk_raster_clear(const struct nk_raster_image *target, struct nk_color);
+
+#endif
+/*
+ * ==============================================================
+ *
+ *                          IMPLEMENTATION
+ *
+ * ===============================================================
+ */
+#ifdef NK_RASTER_IMPLEMENTATION
+
+static const nk_byte nk_raster_white[4] = {255, 255, 255, 255};
+
+NK_INTERN const nk_byte*
+nk_raster_sample(const struct nk_raster_image *tex, float u, float v)
+{
+    int x, y;
+    if (!tex) return nk_raster_white;
+    x = (int)(u * (float)tex->width);
+    y = (int)(v * (float)tex->height);
+    x = NK_CLAMP(0, x, tex->width - 1);
+    y = NK_CLAMP(0, y, tex->height - 1);
+    return tex->pixels + y * tex->stride + x * 4;
+}
+
+NK_INTERN void
+nk_raster_blend(nk_byte *dst, int r, int g, int b, int a)
+{
+    int ia;
+    if (a <= 0) return;
+    if (a >= 255) {
+        dst[0] = (nk_byte)r; dst[1] = (nk_byte)g;
+        dst[2] = (nk_byte)b; dst[3] = 255;
+        return;
+    }
+    ia = 255 - a;
+    dst[0] = (nk_byte)((r * a + dst[0] * ia + 127) / 255);
+    dst[1] = (nk_byte)((g * a + dst[1] * ia + 127) / 255);
+    dst[2] = (nk_byte)((b * a + dst[2] * ia + 127) / 255);
+    dst[3] = (nk_byte)((a * a + dst[3] * ia + 127) / 255);
+}
+
+NK_INTERN int
+nk_raster_same_color(const struct nk_raster_vertex *a, const struct nk_raster_vertex *b)
+{
+    return a->col[0] == b->col[0] && a->col[1] == b->col[1]
+        && a->col[2] == b->col[2] && a->col[3] == b->col[3];
+}
+
+NK_INTERN int
+nk_raster_same_uv(const struct nk_raster_vertex *a, const struct nk_raster_vertex *b)
+{
+    return a->uv[0] == b->uv[0] && a->uv[1] == b->uv[1];
+}
+
+/* the edge a->b of a triangle, as w(x, y) = w + dx * x + dy * y */
+struct nk_raster_edge {
+    float w, dx, dy;
+    int inclusive;
+};
+
+NK_INTERN void
+nk_raster_edge_setup(struct nk_raster_edge *e, const float *a, const float *b)
+{
+    e->dx = -(b[1] - a[1]);
+    e->dy = b[0] - a[0];
+    /* of an edge shared by two triangles, exactly one of them owns the
+       pixels lying on it, so that they are not blended twice.  Both of
+       them evaluate it as b->a when it is not inclusive, so that their
+       w at a pixel are exact negations of each other. */
+    e->inclusive = e->dx < 0 || (e->dx == 0 && e->dy < 0);
+    if (e->inclusive) {
+        e->w = -(a[0] * e->dx + a[1] * e->dy);
+    } else {
+        e->dx = -e->dx;
+        e->dy = -e->dy;
+        e->w = -(b[0] * e->dx + b[1] * e->dy);
+        e->dx = -e->dx;
+        e->dy = -e->dy;
+        e->w = -e->w;
+    }
+}
+
+NK_INTERN float
+nk_raster_edge_eval(const struct nk_raster_edge *e, float px, float py)
+{
+    if (e->inclusive)
+        return e->w + e->dy * py + e->dx * px;
+    return -(-e->w + -e->dy * py + -e->dx * px);
+}
+
+NK_INTERN int
+nk_raster_inside(const struct nk_raster_edge *e, float w)
+{
+    return w > 0 || (w == 0 && e->inclusive);
+}
+
+NK_INTERN int
+nk_raster_covers(const struct nk_raster_edge *e0, const struct nk_raster_edge *e1,
+    const struct nk_raster_edge *e2, float px, float py)
+{
+    return nk_raster_inside(e0, nk_raster_edge_eval(e0, px, py))
+        && nk_raster_inside(e1, nk_raster_edge_eval(e1, px, py))
+        && nk_raster_inside(e2, nk_raster_edge_eval(e2, px, py));
+}
+
+/* narrows [*x0, *x1] to the pixels of the row that may lie inside of e,
+   leaving a pixel of slack for the exact test of nk_raster_inside */
+NK_INTERN void
+nk_raster_edge_span(const struct nk_raster_edge *e, float py, int *x0, int *x1)
+{
+    float w = e->w + e->dy * py;
+    float x;
+    if (e->dx == 0) {
+        if (w < 0) *x1 = *x0 - 1;
+        return;
+    }
+    x = -w / e->dx - 0.5f;
+    if (e->dx > 0) {
+        if (x - 1 > (float)*x0) *x0 = (x - 1 > (float)*x1) ? *x1 + 1 : (int)(x - 1);
+    } else {
+        if (x + 2 < (float)*x1) *x1 = (x + 2 < (float)*x0) ? *x0 - 1 : (int)(x + 2);
+    }
+}
+
+NK_INTERN void
+nk_raster_triangle(const struct nk_raster_image *target,
+    const struct nk_raster_vertex *v0, const struct nk_raster_vertex *v1,
+    const struct nk_raster_vertex *v2, const struct nk_raster_image *tex,
+    int cx0, int cy0, int cx1, int cy1)
+{
+    struct nk_raster_edge e0, e1, e2;
+    float area, inv_area;
+    float minx, miny, maxx, maxy;
+    int x0, y0, x1, y1, x, y;
+    int flat_color, flat_uv;
+    int r = 0, g = 0, b = 0, a = 0;
+
+    area = (v1->position[0] - v0->position[0]) * (v2->position[1] - v0->position[1])
+         - (v1->position[1] - v0->position[1]) * (v2->position[0] - v0->position[0]);
+    if (area == 0) return;
+    if (area < 0) {
+        const struct nk_raster_vertex *swap = v1;
+        v1 = v2; v2 = swap;
+        area = -area;
+    }
+    inv_area = 1.0f / area;
+
+    minx = NK_MIN(v0->position[0], NK_MIN(v1->position[0], v2->position[0]));
+    maxx = NK_MAX(v0->position[0], NK_MAX(v1->position[0], v2->position[0]));
+    miny = NK_MIN(v0->position[1], NK_MIN(v1->position[1], v2->position[1]));
+    maxy = NK_MAX(v0->position[1], NK_MAX(v1->position[1], v2->position[1]));
+    /* pixel centers are at +0.5 */
+    x0 = NK_MAX(cx0, nk_ifloorf(minx - 0.5f));
+    y0 = NK_MAX(cy0, nk_ifloorf(miny - 0.5f));
+    x1 = NK_MIN(cx1 - 1, (int)(maxx + 0.5f));
+    y1 = NK_MIN(cy1 - 1, (int)(maxy + 0.5f));
+    if (x0 > x1 || y0 > y1) return;
+
+    /* e0 is opposite v0, so e0's w weighs v0, and likewise for e1, e2 */
+    nk_raster_edge_setup(&e0, v1->position, v2->position);
+    nk_raster_edge_setup(&e1, v2->position, v0->position);
+    nk_raster_edge_setup(&e2, v0->position, v1->position);
+
+    flat_color = nk_raster_same_color(v0, v1) && nk_raster_same_color(v0, v2);
+    flat_uv = nk_raster_same_uv(v0, v1) && nk_raster_same_uv(v0, v2);
+    if (flat_color && flat_uv) {
+        const nk_byte *texel = nk_raster_sample(tex, v0->uv[0], v0->uv[1]);
+        r = (v0->col[0] * texel[0] + 127) / 255;
+        g = (v0->col[1] * texel[1] + 127) / 255;
+        b = (v0->col[2] * texel[2] + 127) / 255;
+        a = (v0->col[3] * texel[3] + 127) / 255;
+        if (a == 0) return;
+    }
+
+    for (y = y0; y <= y1; ++y) {
+        float py = (float)y + 0.5f;
+        int sx0 = x0, sx1 = x1;
+        nk_byte *dst;
+
+        nk_raster_edge_span(&e0, py, &sx0, &sx1);
+        nk_raster_edge_span(&e1, py, &sx0, &sx1);
+        nk_raster_edge_span(&e2, py, &sx0, &sx1);
+        /* a triangle covers a single run of pixels in a row, so only its
+           ends need the exact test */
+        while (sx0 <= sx1 && !nk_raster_covers(&e0, &e1, &e2, (float)sx0 + 0.5f, py))
+            sx0++;
+        while (sx1 >= sx0 && !nk_raster_covers(&e0, &e1, &e2, (float)sx1 + 0.5f, py))
+            sx1--;
+        if (sx0 > sx1) continue;
+
+        dst = target->pixels + y * target->stride + sx0 * 4;
+        if (flat_color && flat_uv) {
+            if (a == 255) {
+                nk_uint pixel, *out = (nk_uint*)dst;
+                nk_byte *bytes = (nk_byte*)&pixel;
+                bytes[0] = (nk_byte)r; bytes[1] = (nk_byte)g;
+                bytes[2] = (nk_byte)b; bytes[3] = 255;
+                for (x = sx0; x <= sx1; ++x)
+                    *out++ = pixel;
+            } else {
+                for (x = sx0; x <= sx1; ++x, dst += 4)
+                    nk_raster_blend(dst, r, g, b, a);
+            }
+        } else {
+            float px = (float)sx0 + 0.5f;
+            float l1 = nk_raster_edge_eval(&e1, px, py) * inv_area;
+            float l2 = nk_raster_edge_eval(&e2, px, py) * inv_area;
+            float dl1 = e1.dx * inv_area, dl2 = e2.dx * inv_area;
+            for (x = sx0; x <= sx1; ++x, dst += 4, l1 += dl1, l2 += dl2) {
+                float l0 = 1.0f - l1 - l2;
+                const nk_byte *texel;
+                if (flat_uv) {
+                    texel = nk_raster_sample(tex, v0->uv[0], v0->uv[1]);
+                } else {
+                    texel = nk_raster_sample(tex,
+                        v0->uv[0] * l0 + v1->uv[0] * l1 + v2->uv[0] * l2,
+                        v0->uv[1] * l0 + v1->uv[1] * l1 + v2->uv[1] * l2);
+                }
+                if (flat_color) {
+                    nk_raster_blend(dst,
+                        (v0->col[0] * texel[0] + 127) / 255,
+                        (v0->col[1] * texel[1] + 127) / 255,
+                        (v0->col[2] * texel[2] + 127) / 255,
+                        (v0->col[3] * texel[3] + 127) / 255);
+                } else {
+                    nk_raster_blend(dst,
+                        (int)((v0->col[0] * l0 + v1->col[0] * l1 + v2->col[0] * l2) * texel[0] / 255.0f + 0.5f),
+                        (int)((v0->col[1] * l0 + v1->col[1] * l1 + v2->col[1] * l2) * texel[1] / 255.0f + 0.5f),
+                        (int)((v0->col[2] * l0 + v1->col[2] * l1 + v2->col[2] * l2) * texel[2] / 255.0f + 0.5f),
+                        (int)((v0->col[3] * l0 + v1->col[3] * l1 + v2->col[3] * l2) * texel[3] / 255.0f + 0.5f));
+                }
+            }
+        }
+    }
+}
+
+NK_API void
+nk_raster_render(const struct nk_context *ctx, const struct nk_buffer *cmds,
+    const struct nk_raster_vertex *vertices, const nk_draw_index *elements,
+    const struct nk_raster_image *textures, int texture_count,
+    const struct nk_raster_image *target)
+{
+    const struct nk_draw_command *cmd;
+    const nk_draw_index *offset = elements;
+    NK_ASSERT(ctx);
+    NK_ASSERT(cmds);
+    NK_ASSERT(target);
+    if (!ctx || !cmds || !target || !vertices || !elements) return;
+
+    nk_draw_foreach(cmd, ctx, cmds)
+    {
+        const struct nk_raster_image *tex = 0;
+        int cx0, cy0, cx1, cy1;
+        unsigned int i;
+        if (!cmd->elem_count) continue;
+        if (cmd->texture.id >= 0 && cmd->texture.id < texture_count)
+            tex = &textures[cmd->texture.id];
+
+        /* the way glScissor truncates them */
+        cx0 = NK_MAX(0, (int)cmd->clip_rect.x);
+        cy0 = NK_MAX(0, (int)cmd->clip_rect.y);
+        cx1 = NK_MIN(target->width, (int)cmd->clip_rect.x + (int)cmd->clip_rect.w);
+        cy1 = NK_MIN(target->height, (int)cmd->clip_rect.y + (int)cmd->clip_rect.h);
+        if (cx0 < cx1 && cy0 < cy1) {
+            for (i = 0; i + 2 < cmd->elem_count; i += 3)
+                nk_raster_triangle(target, &vertices[offset[i]], &vertices[offset[i+1]],
+                    &vertices[offset[i+2]], tex, cx0, cy0, cx1, cy1);
+        }
+        offset += cmd->elem_count;
+    }
+}
+
+NK_API void
+nk_raster_clear(const struct nk_raster_image *target, struct nk_color color)
+{
+    nk_byte *row;
+    int x, y;
+    NK_ASSERT(target);
+    if (!target || !target->pixels || target->width <= 0 || target->height <= 0) return;
+    row = target->pixels;
+    for (x = 0; x < target->width; ++x) {
+        row[x*4+0] = color.r; row[x*4+1] = color.g;
+        row[x*4+2] = color.b; row[x*4+3] = color.a;
+    }
+    for (y = 1; y < target->height; ++y)
+        memcpy(target->pixels + y * target->stride, row, (size_t)target->width * 4);
+}
+
+#endif
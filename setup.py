@@ -4,7 +4,7 @@ module1 = Extension('pynuklearc',
                     sources = ['contrib/nuklear/nuklearGLFWOpenGL3.c'],
                     include_dirs = ['/usr/include',
                                     'contrib/nuklear/'],
-                    libraries = ['glfw'],
+                    libraries = ['glfw', 'pthread'],
                     library_dirs = ['/usr/lib'],)
 
 setup (name = 'pyNuklear',
@@ -16,9 +16,11 @@ setup (name = 'pyNuklear',
        keywords = "nuklear imgui",
        license = "MIT",
        packages=['pynuklear',
+                 'pynuklear/benchmark',
                  'pynuklear/demo',
                  'pynuklear/demo/glfw_opengl3'],
        package_dir={'pynuklear': 'src/pynuklear',
+                    'pynuklear/benchmark': 'src/pynuklear/benchmark',
                     'pynuklear/demo': 'src/pynuklear/demo/',
                     'pynuklear/demo/glfw_opengl3': 'src/pynuklear/demo/glfw_opengl3'},
        package_data={'pynuklear/demo/glfw_opengl3': ['triangle*'],
@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Micro-benchmarks for pyNuklear.  They need neither a window nor OpenGL,
+# so they run anywhere pynuklearc builds, e.g.
+#
+#     python -m pynuklear.benchmark.ffi
+#
+# pynuklear.benchmark.suite measures whole frames of UI workloads, and
+# saves and compares its results across commits.
+
+import timeit
+import ctypes
+
+import pynuklear.nuklear as nk
+
+
+# a fixed width font, so that a context can be made without a font atlas
+@nk.nk_text_width_f
+def _text_width(handle, height, text, length):
+    return 7.0 * length
+
+
+class BenchmarkContext:
+    """A nk_context that is never rendered, for timing the frame building."""
+
+    def __init__(self, width=1000, height=1000):
+        self.font = nk.UserFont()
+        self.font.height = 13.0
+        self.font.width = _text_width
+        self.context = nk.Context()
+        nk.nk_init_default(ctypes.byref(self.context), ctypes.byref(self.font))
+        self.ctx = ctypes.pointer(self.context)
+        self.bounds = nk.Rect(0, 0, width, height)
+
+    def begin(self):
+        nk.nk_begin(self.ctx, b"benchmark", self.bounds, 0)
+
+    def end(self):
+        nk.nk_end(self.ctx)
+        nk.nk_clear(self.ctx)
+
+    def free(self):
+        nk.nk_free(self.ctx)
+
+
+def time_per_call(function, number):
+    """Best of three runs of function(), in nanoseconds per call."""
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e9
+
+
+def print_table(title, rows):
+    print(title)
+    print('%-34s %12s %12s %8s' % ('', 'before ns', 'after ns', 'speedup'))
+    for name, before, after in rows:
+        print('%-34s %12.0f %12.0f %7.2fx' % (name, before, after, before / after))
@@ -0,0 +1,92 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Cost of a mostly static panel of labels, buttons and sliders, built with
+# the ctypes methods of NuklearContext, with FastContext, and by running a
+# recorded DisplayList.
+#
+#     python -m pynuklear.benchmark.displaylist [--rows N] [--frames N]
+
+import sys
+import argparse
+
+import pynuklear.nuklear as nk
+from pynuklear.benchmark import BenchmarkContext, time_per_call, print_table
+
+
+def ctypes_panel(nuklear, rows, values):
+    if nuklear.begin("Panel", nk.Rect(0, 0, 1000, 1000), nk.NK_WINDOW_BORDER):
+        for i in range(rows):
+            nuklear.layout_row_dynamic(20, 3)
+            nuklear.label("Row", nk.NK_TEXT_LEFT)
+            nuklear.button_label("Apply")
+            modified, values[i] = nuklear.slider_float(0.0, values[i], 1.0, 0.1)
+    nuklear.end()
+
+
+def fast_panel(fast, rows, values):
+    if fast.begin("Panel", (0, 0, 1000, 1000), nk.NK_WINDOW_BORDER):
+        for i in range(rows):
+            fast.layout_row_dynamic(20, 3)
+            fast.label("Row", nk.NK_TEXT_LEFT)
+            fast.button_label("Apply")
+            modified, values[i] = fast.slider_float(0.0, values[i], 1.0, 0.1)
+    fast.end()
+
+
+def record_panel(nuklear, rows):
+    panel = nuklear.record()
+    panel.begin("Panel", nk.Rect(0, 0, 1000, 1000), nk.NK_WINDOW_BORDER)
+    for i in range(rows):
+        panel.layout_row_dynamic(20, 3)
+        panel.label("Row", nk.NK_TEXT_LEFT)
+        panel.button_label("Apply")
+        panel.slider_float(0.0, 0.5, 1.0, 0.1)
+    panel.end()
+    return panel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='static panel cost')
+    parser.add_argument('--rows', type=int, default=100)
+    parser.add_argument('--frames', type=int, default=200,
+                        help='frames per timing run')
+    args = parser.parse_args(argv)
+
+    bench = BenchmarkContext()
+    nuklear = nk.NuklearContext(bench.ctx)
+    values = [0.5] * args.rows
+    panel = record_panel(nuklear, args.rows)
+
+    def frame(build):
+        def run():
+            build()
+            nk.nk_clear(bench.ctx)
+        return time_per_call(run, args.frames)
+
+    before = frame(lambda: ctypes_panel(nuklear, args.rows, values))
+    rows = [('FastContext', before, frame(lambda: fast_panel(nuklear.fast, args.rows, values))),
+            ('DisplayList', before, frame(lambda: nuklear.run(panel)))]
+    bench.free()
+    print_table('%d row panel per frame, against the ctypes methods' % args.rows, rows)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,99 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Per call cost of the ctypes foreign functions, before and after the
+# prototypes of nuklear_h were installed.
+#
+# "before" loads pynuklearc a second time, so its procedures have no
+# argtypes, and calls them the way nuklear.py used to: floats wrapped in
+# c_float by hand and only restype set.  "after" calls the prototyped
+# procedures of nuklear_h with plain Python values.
+#
+#     python -m pynuklear.benchmark.ffi [--number N]
+
+import sys
+import inspect
+import argparse
+import ctypes
+from ctypes import c_float, c_int, c_uint
+
+import pynuklearc
+import pynuklear.nuklear as nk
+from pynuklear.benchmark import BenchmarkContext, time_per_call, print_table
+
+
+def unprototyped(name, restype=c_int):
+    function = getattr(ctypes.CDLL(inspect.getfile(pynuklearc)), name)
+    function.restype = restype
+    return function
+
+
+def run(number):
+    bench = BenchmarkContext()
+    ctx = bench.ctx
+    rows = []
+
+    old_rgb_f = unprototyped('nk_rgb_f', nk.Color)
+    rows.append(('nk_rgb_f(r, g, b)',
+                 time_per_call(lambda: old_rgb_f(c_float(0.5), c_float(0.25), c_float(1.0)), number),
+                 time_per_call(lambda: nk.nk_rgb_f(0.5, 0.25, 1.0), number)))
+
+    old_rect = unprototyped('nk_rect', nk.Rect)
+    rows.append(('nk_rect(x, y, w, h)',
+                 time_per_call(lambda: old_rect(c_float(1), c_float(2), c_float(3), c_float(4)), number),
+                 time_per_call(lambda: nk.nk_rect(1, 2, 3, 4), number)))
+
+    old_murmur_hash = unprototyped('nk_murmur_hash', c_uint)
+    rows.append(('nk_murmur_hash(key, len, seed)',
+                 time_per_call(lambda: old_murmur_hash(b"overview.py", 11, 42), number),
+                 time_per_call(lambda: nk.nk_murmur_hash(b"overview.py", 11, 42), number)))
+
+    bench.begin()
+
+    old_layout_row_dynamic = unprototyped('nk_layout_row_dynamic', None)
+    rows.append(('nk_layout_row_dynamic(ctx, h, n)',
+                 time_per_call(lambda: old_layout_row_dynamic(ctx, c_float(0), 1), number),
+                 time_per_call(lambda: nk.nk_layout_row_dynamic(ctx, 0, 1), number)))
+
+    old_widget_width = unprototyped('nk_widget_width', c_float)
+    rows.append(('nk_widget_width(ctx)',
+                 time_per_call(lambda: old_widget_width(ctx), number),
+                 time_per_call(lambda: nk.nk_widget_width(ctx), number)))
+
+    old_window_get_bounds = unprototyped('nk_window_get_bounds', nk.Rect)
+    rows.append(('nk_window_get_bounds(ctx)',
+                 time_per_call(lambda: old_window_get_bounds(ctx), number),
+                 time_per_call(lambda: nk.nk_window_get_bounds(ctx), number)))
+
+    bench.end()
+    bench.free()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ctypes per call cost')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='calls per timing run')
+    args = parser.parse_args(argv)
+    print_table('per call cost, unprototyped vs. nuklear_h prototypes', run(args.number))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,137 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Cost of composing window flags, and of building full overview() frames,
+# with the flags and other constants unwrapped from Enum members with
+# .value, as overview used to, against IntFlag members and the NK_* ints
+# it uses now.  Only the ints are cheap: OR-ing IntFlag members runs
+# Python code for every |, which makes it slower than even the Enum.value
+# lookups, so overview and the demos compose flags from the NK_* ints.
+#
+# The frames run overview() with its constants served by properties of a
+# stand-in for the pynuklear module, in all three cases, so that they
+# differ only in the type of the constants.
+#
+#     python -m pynuklear.benchmark.frame [--frames N]
+
+import re
+import sys
+import inspect
+import argparse
+from enum import Enum, IntFlag
+
+import pynuklear.nuklear as nk
+import pynuklear.demo.overview as overviewModule
+from pynuklear.demo.overview import overview
+from pynuklear.benchmark import BenchmarkContext, time_per_call, print_table
+
+
+# PanelFlags as it was before it became an IntFlag
+class EnumPanelFlags(Enum):
+    WINDOW_BORDER = 1 << 0
+    WINDOW_MOVABLE = 1 << 1
+    WINDOW_SCALABLE = 1 << 2
+    WINDOW_MINIMIZABLE = 1 << 4
+
+
+def enum_window_flags():
+    return (EnumPanelFlags.WINDOW_BORDER.value
+            | EnumPanelFlags.WINDOW_SCALABLE.value
+            | EnumPanelFlags.WINDOW_MOVABLE.value
+            | EnumPanelFlags.WINDOW_MINIMIZABLE.value)
+
+
+def intflag_window_flags():
+    return (nk.PanelFlags.WINDOW_BORDER
+            | nk.PanelFlags.WINDOW_SCALABLE
+            | nk.PanelFlags.WINDOW_MOVABLE
+            | nk.PanelFlags.WINDOW_MINIMIZABLE)
+
+
+def int_window_flags():
+    return (nk.NK_WINDOW_BORDER
+            | nk.NK_WINDOW_SCALABLE
+            | nk.NK_WINDOW_MOVABLE
+            | nk.NK_WINDOW_MINIMIZABLE)
+
+
+def constants_module(kind):
+    """A stand-in for the pynuklear module overview() uses, whose NK_*
+    constants are members of a kind, Enum or IntFlag, class, or plain ints
+    if kind is int; an Enum's are unwrapped with .value on every use."""
+    names = sorted(set(re.findall(r'nk\.(NK_\w+)', inspect.getsource(overviewModule))))
+    if kind is int:
+        members = {name: getattr(nk, name) for name in names}
+    else:
+        members = kind('OverviewConstants', [(name, getattr(nk, name)) for name in names])
+
+    def constant(name):
+        if kind is Enum:
+            return property(lambda self: members[name].value)
+        return property(lambda self: members[name])
+
+    module = type('ConstantsModule', (), {name: constant(name) for name in names})()
+    module.__dict__.update((name, value) for name, value in vars(nk).items()
+                           if name not in names)
+    return module
+
+
+def overview_frame_time(frames, module):
+    """Time per overview() frame, with module as its pynuklear."""
+    bench = BenchmarkContext()
+    nuklear = nk.NuklearContext(bench.ctx)
+
+    def frame():
+        overview(nuklear)
+        nk.nk_clear(bench.ctx)
+
+    overviewModule.nk = module
+    try:
+        # the first frames create the windows and their tables
+        for i in range(3):
+            frame()
+        result = time_per_call(frame, frames)
+    finally:
+        overviewModule.nk = nk
+        bench.free()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='overview() frame cost')
+    parser.add_argument('--frames', type=int, default=1000,
+                        help='frames per timing run')
+    args = parser.parse_args(argv)
+
+    enum_ns = time_per_call(enum_window_flags, 100000)
+    print_table('window flags, Enum.value against IntFlag and NK_* ints',
+                [('IntFlag members', enum_ns, time_per_call(intflag_window_flags, 100000)),
+                 ('NK_* ints', enum_ns, time_per_call(int_window_flags, 100000))])
+    print()
+    enum_ns = overview_frame_time(args.frames, constants_module(Enum))
+    print_table('overview() frames, constants from Enum.value against IntFlag and NK_* ints',
+                [('IntFlag members', enum_ns,
+                  overview_frame_time(args.frames, constants_module(IntFlag))),
+                 ('NK_* ints', enum_ns,
+                  overview_frame_time(args.frames, constants_module(int)))])
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
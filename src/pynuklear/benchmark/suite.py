@@ -0,0 +1,240 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Per frame cost of real UI workloads on a window-less context: overview()
+# and synthetic scenes of N windows of M widgets of one type each.  For
+# every scene it reports
+#
+#   build us     time to build a frame, the best of three runs
+#   ffi calls    ctypes foreign function calls made by a frame
+#   allocs       Python memory blocks allocated while building a frame,
+#                counting those freed again before it ends
+#   alloc KB     peak Python memory allocated while building a frame
+#   cmd bytes    size of the frame's command buffer
+#   vertices     vertices nk_convert makes of the frame
+#
+# The results can be saved as JSON and compared against a saved run, e.g.
+# one of the previous commit:
+#
+#     python -m pynuklear.benchmark.suite --save before.json
+#     python -m pynuklear.benchmark.suite --compare before.json
+
+import sys
+import json
+import time
+import ctypes
+import argparse
+import platform
+import tracemalloc
+
+import pynuklearc
+import pynuklear
+import pynuklear.nuklear as nk
+from pynuklear.demo.overview import overview
+
+
+def widget_scene(widget, windows, widgets):
+    """A frame of windows windows holding widgets widgets each."""
+    titles = [nk.cString("%s %d" % (widget.__name__, i)) for i in range(windows)]
+    bounds = [nk.Rect(10 + 310 * i, 10, 300, 40 + 30 * widgets) for i in range(windows)]
+    state = [[0] * widgets for i in range(windows)]
+
+    def scene(nuklear):
+        for title, rect, values in zip(titles, bounds, state):
+            if nuklear.begin(title, rect, nk.NK_WINDOW_BORDER | nk.NK_WINDOW_TITLE):
+                nuklear.layout_row_dynamic(25, 1)
+                for i in range(widgets):
+                    widget(nuklear, values, i)
+            nuklear.end()
+    return scene
+
+
+def label(nuklear, values, i):
+    nuklear.label("Label", nk.NK_TEXT_LEFT)
+
+
+def button(nuklear, values, i):
+    nuklear.button_label("Button")
+
+
+def checkbox(nuklear, values, i):
+    values[i] = nuklear.checkbox_label("Checkbox", values[i])[1]
+
+
+def option(nuklear, values, i):
+    if nuklear.option_label("Option", values[i] == 0):
+        values[i] = 0
+
+
+def selectable(nuklear, values, i):
+    values[i] = nuklear.selectable_label("Selectable", nk.NK_TEXT_LEFT, values[i])[1]
+
+
+def slider(nuklear, values, i):
+    values[i] = nuklear.slider_int(0, values[i], 100, 1)[1]
+
+
+def progress(nuklear, values, i):
+    values[i] = nuklear.progress(values[i], 100, True)[1]
+
+
+def property(nuklear, values, i):
+    values[i] = nuklear.property_int("#Property:", 0, values[i], 100, 1, 1)
+
+
+WIDGETS = [label, button, checkbox, option, selectable, slider, progress, property]
+
+
+class ForeignCallCounter:
+    """Counts the calls of the ctypes functions of pynuklear's modules."""
+
+    class Counted:
+        def __init__(self, counter, function):
+            self.counter = counter
+            self.function = function
+            # so that it still converts to the function, e.g. nk.filter_default
+            self._as_parameter_ = function
+
+        def __call__(self, *args):
+            self.counter.calls += 1
+            return self.function(*args)
+
+    def __init__(self, modules=(nk, pynuklear)):
+        self.modules = modules
+        self.calls = 0
+        self.saved = []
+
+    def __enter__(self):
+        for module in self.modules:
+            for name, value in list(vars(module).items()):
+                if isinstance(value, ctypes._CFuncPtr):
+                    self.saved.append((module, name, value))
+                    setattr(module, name, self.Counted(self, value))
+        return self
+
+    def __exit__(self, *exc):
+        for module, name, value in self.saved:
+            setattr(module, name, value)
+        self.saved = []
+
+
+def measure(scene, frames):
+    nuklear = nk.NuklearContext.create()
+    converter = nk.Converter()
+
+    def frame():
+        scene(nuklear)
+        nuklear.clear()
+
+    # the first frames create the windows and their tables
+    for i in range(3):
+        frame()
+
+    best = None
+    for repeat in range(3):
+        start = time.perf_counter()
+        for i in range(frames):
+            frame()
+        elapsed = (time.perf_counter() - start) / frames
+        best = elapsed if best is None else min(best, elapsed)
+
+    with ForeignCallCounter() as counter:
+        frame()
+
+    pynuklearc.allocations_start()
+    try:
+        frame()
+    finally:
+        allocations = pynuklearc.allocations_stop()
+
+    tracemalloc.start()
+    frame()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    scene(nuklear)
+    commandBytes = nuklear.ctx.contents.memory.allocated
+    nuklear.convert(converter)
+    vertices = len(converter.vertices)
+    nuklear.clear()
+
+    converter.free()
+    nuklear.free()
+    return {'build us': best * 1e6,
+            'ffi calls': counter.calls,
+            'allocs': allocations,
+            'alloc KB': peak / 1024,
+            'cmd bytes': commandBytes,
+            'vertices': vertices}
+
+
+def scenes(windows, widgets):
+    yield 'overview', overview
+    for widget in WIDGETS:
+        yield ('%s %dx%d' % (widget.__name__, windows, widgets),
+               widget_scene(widget, windows, widgets))
+
+
+COLUMNS = ['build us', 'ffi calls', 'allocs', 'alloc KB', 'cmd bytes', 'vertices']
+
+
+def print_results(results, baseline=None):
+    print('%-22s' % 'scene' + ''.join('%12s' % column for column in COLUMNS)
+          + ('%10s' % 'speedup' if baseline else ''))
+    for name, result in results.items():
+        line = '%-22s' % name + ''.join('%12.1f' % result[column] if isinstance(result[column], float)
+                                        else '%12d' % result[column] for column in COLUMNS)
+        if baseline and name in baseline:
+            line += '%9.2fx' % (baseline[name]['build us'] / result['build us'])
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='per frame cost of UI workloads')
+    parser.add_argument('--frames', type=int, default=200,
+                        help='frames per timing run')
+    parser.add_argument('--windows', type=int, default=4)
+    parser.add_argument('--widgets', type=int, default=50,
+                        help='widgets per window')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='a JSON file of --save to compare against')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, scene in scenes(args.windows, args.widgets):
+        results[name] = measure(scene, args.frames)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'frames': args.frames,
+                       'windows': args.windows,
+                       'widgets': args.widgets,
+                       'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,72 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Cost of measuring the cells of a table, e.g. to size its columns, with
+# get_text_width per cell, measure_many at once and memoized measure, in
+# the default font and in the Python width callback of BenchmarkContext.
+#
+#     python -m pynuklear.benchmark.textwidth [--cells N]
+
+import sys
+import random
+import argparse
+
+import pynuklear.nuklear as nk
+from pynuklear.benchmark import BenchmarkContext, time_per_call, print_table
+
+
+def table_cells(count, seed=1):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ 0123456789.,-"
+    return ["".join(rng.choice(alphabet) for i in range(rng.randint(1, 16)))
+            for cell in range(count)]
+
+
+def rows(nuklear, cells):
+    def per_cell(function):
+        return time_per_call(function, 1) / len(cells)
+
+    before = per_cell(lambda: [nuklear.get_text_width(cell) for cell in cells])
+    nuklear.measure_many(cells)
+    memoized = cells[:nk.TextMeasure.MEMO_SIZE]
+    return [('measure_many, per cell', before, per_cell(lambda: nuklear.measure_many(cells))),
+            ('measure memoized', before,
+             time_per_call(lambda: [nuklear.measure(cell) for cell in memoized], 1) / len(memoized))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='table text measuring cost')
+    parser.add_argument('--cells', type=int, default=100000)
+    args = parser.parse_args(argv)
+    cells = table_cells(args.cells)
+
+    nuklear = nk.NuklearContext.create()
+    print_table('%d cells in the default font, against get_text_width' % args.cells,
+                rows(nuklear, cells))
+    nuklear.free()
+
+    bench = BenchmarkContext()
+    print_table('%d cells in a Python width callback, against get_text_width' % args.cells,
+                rows(nk.NuklearContext(bench.ctx), cells))
+    bench.free()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -64,7 +64,7 @@ def demo():
     ctx = nkglfw3.glfw3_init(window, nkglfw3.GLFW3_INSTALL_CALLBACKS)
     nuklear = nk.NuklearContext(ctx)
 
-    fontAtlas = nkglfw3.FontAtlas()
+    fontAtlas = ctypes.POINTER(nkglfw3.FontAtlas)()
     nkglfw3.glfw3_font_stash_begin(ctypes.byref(fontAtlas))
     nkglfw3.glfw3_font_stash_end()
 
@@ -100,31 +100,33 @@ def demo():
     triangle = Triangle()
     triangle.prepareToRender()
 
-    # does python have static local variables?  this declaration is way too far away from use
-    #property = ctypes.c_int(20)
+    class State:
+        def __init__(self):
+            self.op = 0
+            self.prop = 20
+            self.background = nk.ColorF(r=0.10,
+                                        g=0.18,
+                                        b=0.24,
+                                        a=1.0)
 
 
-    # Loop until the user closes the window
-    while not glfw.window_should_close(window):
-        # Render here
+    state = State()
 
-        # Poll for and process events
-        glfw.poll_events()
-        nkglfw3.glfw3_new_frame()
+    MAX_VERTEX_BUFFER = 512 * 1024
+    MAX_ELEMENT_BUFFER = 128 * 1024
 
-        width, height = glfw.get_framebuffer_size(window)
-        gl.glViewport(0, 0, width, height)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+    app = nkglfw3.Application(window, nuklear,
+                              vertex_buffer_size=MAX_VERTEX_BUFFER,
+                              element_buffer=MAX_ELEMENT_BUFFER)
+    app.clearColor = (0.1, 0.18, 0.24, 1.0)
 
-        ms.setToIdentityMatrix(ms.MatrixStack.model)
-        ms.setToIdentityMatrix(ms.MatrixStack.view)
-        ms.setToIdentityMatrix(ms.MatrixStack.projection)
+    CAMERA_KEYS = (glfw.KEY_RIGHT, glfw.KEY_LEFT, glfw.KEY_UP, glfw.KEY_DOWN)
 
-        # set the projection matrix to be perspective
-        ms.perspective(fov=45.0,
-                       aspectRatio=width / height,
-                       nearZ=0.1,
-                       farZ=10000.0)
+
+    # build the GUI; returns whether the camera is moving, so that the
+    # loop keeps rendering frames while it is
+    def gui(nuklear):
+        moving = False
 
         # get input from keyboard for camera movement
         if not nuklear.item_is_any_active():
@@ -143,31 +145,16 @@ def demo():
                 camera.x += math.sin(camera.rotationY)
                 camera.z += math.cos(camera.rotationY)
 
-        # move the camera to the correct position, which means
-        # updating the view stack
-        ms.rotateX(ms.MatrixStack.view,
-                   camera.rotationX)
-        ms.rotateY(ms.MatrixStack.view,
-                   -camera.rotationY)
-        ms.translate(ms.MatrixStack.view,
-                     -camera.x,
-                     -camera.y,
-                     -camera.z)
-
-        # render the models
-
-        triangle.render()
-
-        MAX_VERTEX_BUFFER = 512 * 1024
-        MAX_ELEMENT_BUFFER = 128 * 1024
+            moving = any(glfw.get_key(window, key) == glfw.PRESS
+                         for key in CAMERA_KEYS)
 
         if(nuklear.begin(title="Demonstration",
                          bounds=nk.Rect(10.0, 10.0, 230.0, 250.0),
-                         flags=nk.PanelFlags.WINDOW_BORDER.value
-                         | nk.PanelFlags.WINDOW_MOVABLE.value
-                         | nk.PanelFlags.WINDOW_SCALABLE.value
-                         | nk.PanelFlags.WINDOW_MINIMIZABLE.value
-                         | nk.PanelFlags.WINDOW_TITLE.value)):
+                         flags=nk.NK_WINDOW_BORDER
+                         | nk.NK_WINDOW_MOVABLE
+                         | nk.NK_WINDOW_SCALABLE
+                         | nk.NK_WINDOW_MINIMIZABLE
+                         | nk.NK_WINDOW_TITLE)):
 
             nuklear.layout_row_static(height=30.0,
                                       item_width=80,
@@ -178,85 +165,67 @@ def demo():
             nuklear.layout_row_dynamic(height=30.0,
                                        columns=2)
 
-            try:
-                op
-            except Exception:
-                op = 0
-
             if nuklear.option_label(label="easy",
-                                    active=op == 0):
-                                        op = 0
+                                    active=state.op == 0):
+                state.op = 0
             if nuklear.option_label(label="hard",
-                                    active=op == 1):
-                                        op = 1
+                                    active=state.op == 1):
+                state.op = 1
 
             nuklear.layout_row_dynamic(height=25.0,
                                        columns=1)
 
-            try:
-                prop
-            except Exception:
-                prop = 20
-
-            prop = nuklear.property_int(name="Compression:",
-                                        minV=0,
-                                        val=prop,
-                                        maxV=100,
-                                        step=10,
-                                        inc_per_pixel=1)
+            state.prop = nuklear.property_int(name="Compression:",
+                                              minV=0,
+                                              val=state.prop,
+                                              maxV=100,
+                                              step=10,
+                                              inc_per_pixel=1)
 
             nuklear.layout_row_dynamic(height=20.0,
                                        columns=1)
             nuklear.label(text="background:",
-                          alignment=nk.TextAlign.TEXT_LEFT)
-
-            try:
-                background
-            except Exception:
-                background = nk.ColorF(r=0.10,
-                                                      g=0.18,
-                                                      b=0.24,
-                                                      a=1.0)
+                          alignment=nk.NK_TEXT_LEFT)
 
             nuklear.layout_row_dynamic(height=25.0,
                                        columns=1)
-            if nuklear.combo_begin_color(color=nuklear.rgb_cf(background),
+            if nuklear.combo_begin_color(color=nuklear.rgb_cf(state.background),
                                          size=nk.Vec2(nuklear.widget_width(),
                                                                      400)):
                 nuklear.layout_row_dynamic(height=120.0,
                                            columns=1)
-                background = nuklear.color_picker(color=background,
-                                                  format=nk.ColorFormat.RGBA)
+                state.background = nuklear.color_picker(color=state.background,
+                                                        format=nk.NK_RGBA)
 
                 nuklear.layout_row_dynamic(height=25.0,
                                            columns=1)
-                background.r = nuklear.propertyf(name="#R:",
-                                                 minVal=0.0,
-                                                 val=background.r,
-                                                 maxVal=1.0,
-                                                 step=0.01,
-                                                 inc_per_pixel=0.005)
-                background.g = nuklear.propertyf(name="#G:",
-                                                 minVal=0.0,
-                                                 val=background.g,
-                                                 maxVal=1.0,
-                                                 step=0.01,
-                                                 inc_per_pixel=0.005)
-                background.b = nuklear.propertyf(name="#B:",
-                                                 minVal=0.0,
-                                                 val=background.b,
-                                                 maxVal=1.0,
-                                                 step=0.01,
-                                                 inc_per_pixel=0.005)
-                background.a = nuklear.propertyf(name="#A:",
-                                                 minVal=0.0,
-                                                 val=background.a,
-                                                 maxVal=1.0,
-                                                 step=0.01,
-                                                 inc_per_pixel=0.005)
-
-                gl.glClearColor(background.r, background.g,
-                                background.b, background.a)
+                state.background.r = nuklear.propertyf(name="#R:",
+                                                       minVal=0.0,
+                                                       val=state.background.r,
+                                                       maxVal=1.0,
+                                                       step=0.01,
+                                                       inc_per_pixel=0.005)
+                state.background.g = nuklear.propertyf(name="#G:",
+                                                       minVal=0.0,
+                                                       val=state.background.g,
+                                                       maxVal=1.0,
+                                                       step=0.01,
+                                                       inc_per_pixel=0.005)
+                state.background.b = nuklear.propertyf(name="#B:",
+                                                       minVal=0.0,
+                                                       val=state.background.b,
+                                                       maxVal=1.0,
+                                                       step=0.01,
+                                                       inc_per_pixel=0.005)
+                state.background.a = nuklear.propertyf(name="#A:",
+                                                       minVal=0.0,
+                                                       val=state.background.a,
+                                                       maxVal=1.0,
+                                                       step=0.01,
+                                                       inc_per_pixel=0.005)
+
+                app.clearColor = (state.background.r, state.background.g,
+                                  state.background.b, state.background.a)
 
                 nuklear.combo_end()
 
@@ -264,12 +233,38 @@ def demo():
 
         overview(nuklear)
 
-        nkglfw3.glfw3_render(nk.AntiAliasing.ON.value,
-                             MAX_VERTEX_BUFFER, MAX_ELEMENT_BUFFER)
+        return moving
+
+
+    # draw the triangle beneath the GUI
+    def scene(width, height):
+        ms.setToIdentityMatrix(ms.MatrixStack.model)
+        ms.setToIdentityMatrix(ms.MatrixStack.view)
+        ms.setToIdentityMatrix(ms.MatrixStack.projection)
+
+        # set the projection matrix to be perspective
+        ms.perspective(fov=45.0,
+                       aspectRatio=width / height,
+                       nearZ=0.1,
+                       farZ=10000.0)
+
+        # move the camera to the correct position, which means
+        # updating the view stack
+        ms.rotateX(ms.MatrixStack.view,
+                   camera.rotationX)
+        ms.rotateY(ms.MatrixStack.view,
+                   -camera.rotationY)
+        ms.translate(ms.MatrixStack.view,
+                     -camera.x,
+                     -camera.y,
+                     -camera.z)
+
+        # render the models
+        triangle.render()
+
 
-        # done with frame, flush and swap buffers
-        # Swap front and back buffers
-        glfw.swap_buffers(window)
+    # Loop until the user closes the window, sleeping while nothing changes
+    app.run(gui, scene)
 
 
     glfw.terminate()
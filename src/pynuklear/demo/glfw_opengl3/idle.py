@@ -0,0 +1,104 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Checks that nkglfw3.Application stops rendering once the GUI settles:
+# a window and overview() are run until their frames stop changing, the
+# first window is focused, which puts it last in nuklear's window list and
+# so its commands out of order, and once the GUI settles again, idle
+# iterations of the loop must leave renderedFrames as it is.  Leave the
+# mouse and keyboard alone while it runs.
+#
+#     python -m pynuklear.demo.glfw_opengl3.idle
+
+import sys
+import ctypes
+
+import OpenGL.GL as gl
+import glfw
+
+import pynuklear as nk
+import pynuklear.glfw3 as nkglfw3
+from pynuklear.demo.overview import overview
+
+
+def gui(nuklear):
+    if nuklear.begin("Idle", nk.Rect(500.0, 10.0, 230.0, 80.0),
+                     nk.NK_WINDOW_BORDER | nk.NK_WINDOW_TITLE):
+        nuklear.layout_row_dynamic(25.0, 1)
+        nuklear.label("nothing changes", nk.NK_TEXT_LEFT)
+    nuklear.end()
+    overview(nuklear)
+    return False
+
+
+def settle(app, gui, maxFrames=100):
+    """Runs frames until one is not rendered; returns whether one was not."""
+    for i in range(maxFrames):
+        if not app.frame(gui):
+            return True
+    return False
+
+
+def check_idle(app, gui, first="Idle", iterations=20):
+    """Whether idle iterations of app's loop render no frames, once gui,
+    whose first window is titled first, has settled."""
+    if not settle(app, gui):
+        return False
+    # as a click on it would
+    nk.nk_window_set_focus(app.nuklear.ctx, nk.cString(first))
+    if not settle(app, gui):
+        return False
+    settled = app.renderedFrames
+    for i in range(iterations):
+        app.wait()
+        app.frame(gui)
+    return app.renderedFrames == settled and not app.redraw
+
+
+def main():
+    if not glfw.init():
+        sys.exit("glfw.init failed")
+    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
+    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+    glfw.window_hint(glfw.OPENGL_FORWARD_COMPAT, gl.GL_TRUE)
+    window = glfw.create_window(1000, 1000, "pyNuklear idle check", None, None)
+    if not window:
+        glfw.terminate()
+        sys.exit("glfw.create_window failed")
+    glfw.make_context_current(window)
+
+    ctx = nkglfw3.glfw3_init(window, nkglfw3.GLFW3_INSTALL_CALLBACKS)
+    nuklear = nk.NuklearContext(ctx)
+    fontAtlas = ctypes.POINTER(nkglfw3.FontAtlas)()
+    nkglfw3.glfw3_font_stash_begin(ctypes.byref(fontAtlas))
+    nkglfw3.glfw3_font_stash_end()
+
+    # idle iterations return after the timeout rather than blocking
+    app = nkglfw3.Application(window, nuklear, idleTimeout=0.05)
+    idle = check_idle(app, gui)
+    print("%d frames built, %d rendered: %s" % (
+        app.frames, app.renderedFrames, "idle" if idle else "NOT idle"))
+    glfw.terminate()
+    sys.exit(0 if idle else 1)
+
+
+if __name__ == '__main__':
+    main()
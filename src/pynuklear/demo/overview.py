@@ -34,7 +34,7 @@ def overview(nuklear):
     # show overview
     window_flags = 0
 
-    nuklear.set_style_window_header_align(nk.StyleHeaderAlign.RIGHT)
+    nuklear.set_style_window_header_align(nk.NK_HEADER_RIGHT)
 
     global border
     try:
@@ -43,7 +43,7 @@ def overview(nuklear):
         border = True
 
     if(border):
-        window_flags |= nk.PanelFlags.WINDOW_BORDER.value
+        window_flags |= nk.NK_WINDOW_BORDER
 
     global resize
     try:
@@ -52,7 +52,7 @@ def overview(nuklear):
         resize = True
 
     if(resize):
-        window_flags |= nk.PanelFlags.WINDOW_SCALABLE.value
+        window_flags |= nk.NK_WINDOW_SCALABLE
 
     global movable
     try:
@@ -61,7 +61,7 @@ def overview(nuklear):
         movable = True
 
     if(movable):
-        window_flags |= nk.PanelFlags.WINDOW_MOVABLE.value
+        window_flags |= nk.NK_WINDOW_MOVABLE
 
     global no_scrollbar
     try:
@@ -70,7 +70,7 @@ def overview(nuklear):
         no_scrollbar = False
 
     if(no_scrollbar):
-        window_flags |= nk.PanelFlags.WINDOW_NO_SCROLLBAR.value
+        window_flags |= nk.NK_WINDOW_NO_SCROLLBAR
 
     global scale_left
     try:
@@ -79,7 +79,7 @@ def overview(nuklear):
         scale_left = False
 
     if(scale_left):
-        window_flags |= nk.PanelFlags.WINDOW_SCALE_LEFT.value
+        window_flags |= nk.NK_WINDOW_SCALE_LEFT
 
     global minimizable
     try:
@@ -88,7 +88,7 @@ def overview(nuklear):
         minimizable = True
 
     if(minimizable):
-        window_flags |= nk.PanelFlags.WINDOW_MINIMIZABLE.value
+        window_flags |= nk.NK_WINDOW_MINIMIZABLE
 
     if nuklear.begin(title="Overview",
                      bounds=nk.Rect(10, 300, 400, 600),
@@ -123,24 +123,24 @@ def overview(nuklear):
                 show_app_about = False
 
             nuklear.menubar_begin()
-            nuklear.layout_row_begin(format=nk.LayoutFormat.STATIC,
+            nuklear.layout_row_begin(format=nk.NK_STATIC,
                                      row_height=25.0,
                                      columns=5)
             nuklear.layout_row_push(ratio_or_width=45.0)
             if nuklear.menu_begin_label(text="MENU",
-                                        align=nk.TextAlign.TEXT_LEFT,
+                                        align=nk.NK_TEXT_LEFT,
                                         size=nk.Vec2(120.0, 200.0)):
                 nuklear.layout_row_dynamic(height=25.0,
                                            columns=1)
                 if nuklear.menu_item_label(label="Hide",
-                                           align=nk.TextAlign.TEXT_LEFT):
+                                           align=nk.NK_TEXT_LEFT):
                     show_menu = False
                 if nuklear.menu_item_label(label="About",
-                                           align=nk.TextAlign.TEXT_LEFT):
+                                           align=nk.NK_TEXT_LEFT):
                     show_app_about = True
                 (modified, mprog) = nuklear.progress(cur=mprog,
                                                      max=100,
-                                                     is_modifyable=nk.Modify.MODIFIABLE)
+                                                     is_modifyable=nk.NK_MODIFIABLE)
                 (modified, mslider) = nuklear.slider_int(minV=0,
                                                          value=mslider,
                                                          maxV=16,
@@ -151,7 +151,7 @@ def overview(nuklear):
                 nuklear.menu_end()
             nuklear.layout_row_push(ratio_or_width=60.0)
             if nuklear.menu_begin_label(text="Advanced",
-                                        align=nk.TextAlign.TEXT_LEFT,
+                                        align=nk.NK_TEXT_LEFT,
                                         size=nk.Vec2(200, 600)):
                 MENU_NONE, MENU_FILE, MENU_EDIT, MENU_VIEW, MENU_CHART = (
                     0, 1, 2, 3, 4)
@@ -162,61 +162,61 @@ def overview(nuklear):
                 except Exception:
                     menu_state = MENU_NONE
 
-                state = nk.CollapseStates.MAXIMIZED if menu_state == MENU_FILE else nk.CollapseStates.MINIMIZED
+                state = nk.NK_MAXIMIZED if menu_state == MENU_FILE else nk.NK_MINIMIZED
                 (fileSelected, state) = nuklear.tree_state_push(
-                    nk.TreeType.TREE_TAB, "FILE", state)
+                    nk.NK_TREE_TAB, "FILE", state)
                 if fileSelected:
                     menu_state = MENU_FILE
                     nuklear.menu_item_label(label="New",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Open",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Save",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Close",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Exit",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.tree_pop()
 
-                state = nk.CollapseStates.MAXIMIZED if menu_state == MENU_EDIT else nk.CollapseStates.MINIMIZED
+                state = nk.NK_MAXIMIZED if menu_state == MENU_EDIT else nk.NK_MINIMIZED
                 (editSelected, state) = nuklear.tree_state_push(
-                    nk.TreeType.TREE_TAB, "EDIT", state)
+                    nk.NK_TREE_TAB, "EDIT", state)
                 if editSelected:
                     menu_state = MENU_EDIT
                     nuklear.menu_item_label(label="Copy",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Delete",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Cut",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Paste",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.tree_pop()
 
-                state = nk.CollapseStates.MAXIMIZED if menu_state == MENU_VIEW else nk.CollapseStates.MINIMIZED
+                state = nk.NK_MAXIMIZED if menu_state == MENU_VIEW else nk.NK_MINIMIZED
                 (viewSelected, state) = nuklear.tree_state_push(
-                    nk.TreeType.TREE_TAB, "VIEW", state)
+                    nk.NK_TREE_TAB, "VIEW", state)
                 if viewSelected:
                     menu_state = MENU_VIEW
                     nuklear.menu_item_label(label="About",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Options",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.menu_item_label(label="Customize",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                     nuklear.tree_pop()
 
-                state = nk.CollapseStates.MAXIMIZED if menu_state == MENU_CHART else nk.CollapseStates.MINIMIZED
+                state = nk.NK_MAXIMIZED if menu_state == MENU_CHART else nk.NK_MINIMIZED
                 (chartSelected, state) = nuklear.tree_state_push(
-                    nk.TreeType.TREE_TAB, "CHART", state)
+                    nk.NK_TREE_TAB, "CHART", state)
                 if chartSelected:
                     menu_state = MENU_CHART
                     values = [26.0, 13.0, 30.0, 15.0, 25.0,
                               10.0, 20.0, 40.0, 12.0, 8.0, 22.0, 28.0]
                     nuklear.layout_row_dynamic(height=150.0,
                                                columns=1)
-                    nuklear.chart_begin(chart_type=nk.ChartType.CHART_COLUMN,
+                    nuklear.chart_begin(chart_type=nk.NK_CHART_COLUMN,
                                         count=len(values),
                                         minV=0.0,
                                         maxV=50.0)
@@ -229,7 +229,7 @@ def overview(nuklear):
             nuklear.layout_row_push(70.0)
             (modified, mprog) = nuklear.progress(cur=mprog,
                                                  max=100,
-                                                 is_modifyable=nk.Modify.MODIFIABLE)
+                                                 is_modifyable=nk.NK_MODIFIABLE)
             (modified, mslider) = nuklear.slider_int(minV=0,
                                                      value=mslider,
                                                      maxV=16,
@@ -240,24 +240,24 @@ def overview(nuklear):
             nuklear.menubar_end()
 
             if show_app_about:
-                if nuklear.popup_begin(theType=nk.PopupType.POPUP_STATIC,
+                if nuklear.popup_begin(theType=nk.NK_POPUP_STATIC,
                                        title="About",
-                                       flags=nk.PanelFlags.WINDOW_CLOSABLE,
+                                       flags=nk.NK_WINDOW_CLOSABLE,
                                        rect=nk.Rect(20, 100, 400, 200)):
                     nuklear.layout_row_dynamic(height=20.0,
                                                columns=1)
                     nuklear.label(text="pyNuklear",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     nuklear.label(text="By William Emerison Six",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     nuklear.label(text="pyNuklear is MIT-licensed.",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     nuklear.label(text="based on Nuklear",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     nuklear.label(text="By Micha Mettke",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     nuklear.label(text="nuklear is licensed under the public domain License.",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
 
                     nuklear.popup_end()
                 else:
@@ -285,9 +285,9 @@ def overview(nuklear):
 #                                         id=x) :
 #                     nuklear.tree_pop()
 
-        if nuklear.tree_push(theType=nk.TreeType.TREE_TAB,
+        if nuklear.tree_push(theType=nk.NK_TREE_TAB,
                              title="Window",
-                             state=nk.CollapseStates.MINIMIZED):
+                             state=nk.NK_MINIMIZED):
             nuklear.layout_row_dynamic(height=30.0,
                                        columns=2)
             global titlebar
@@ -313,29 +313,29 @@ def overview(nuklear):
             (modified, scale_left) = nuklear.checkbox_label(text="Scale Left",
                                                             active=scale_left)
             nuklear.tree_pop()
-        if nuklear.tree_push(theType=nk.TreeType.TREE_TAB,
+        if nuklear.tree_push(theType=nk.NK_TREE_TAB,
                              title="Widgets",
-                             state=nk.CollapseStates.MINIMIZED):
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+                             state=nk.NK_MINIMIZED):
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Text",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 nuklear.layout_row_dynamic(height=20.0,
                                            columns=1)
                 nuklear.label(text="Label aligned left",
-                              alignment=nk.TextAlign.TEXT_LEFT)
+                              alignment=nk.NK_TEXT_LEFT)
                 nuklear.label(text="Label aligned centered",
-                              alignment=nk.TextAlign.TEXT_CENTERED)
+                              alignment=nk.NK_TEXT_CENTERED)
                 nuklear.label(text="Label aligned right",
-                              alignment=nk.TextAlign.TEXT_RIGHT)
+                              alignment=nk.NK_TEXT_RIGHT)
                 nuklear.label_colored(text="Blue text",
-                                      align=nk.TextAlign.TEXT_LEFT,
+                                      align=nk.NK_TEXT_LEFT,
                                       color=nk.Color(0, 0, 255, 255))
                 nuklear.label_colored(text="Yellow text",
-                                      align=nk.TextAlign.TEXT_LEFT,
+                                      align=nk.NK_TEXT_LEFT,
                                       color=nk.Color(255, 255, 0, 255))
                 nuklear.text(text="Text without /0",
                              length=15,
-                             alignment=nk.TextAlign.RIGHT)
+                             alignment=nk.NK_TEXT_ALIGN_RIGHT)
                 nuklear.layout_row_static(height=100.0,
                                           item_width=200,
                                           columns=1)
@@ -347,45 +347,45 @@ def overview(nuklear):
                     text="This is another long text to show dynamic window changes on multiline text")
 
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Button",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 nuklear.layout_row_static(height=30,
                                           item_width=100,
                                           columns=3)
                 if nuklear.button_label(title="Button"):
                     print("Button pressed!")
-                nuklear.button_set_behavior(nk.ButtonBehavior.BUTTON_REPEATER)
+                nuklear.button_set_behavior(nk.NK_BUTTON_REPEATER)
                 if nuklear.button_label(title="Repeater"):
                     print("Repeater is being pressed!")
-                nuklear.button_set_behavior(nk.ButtonBehavior.BUTTON_DEFAULT)
+                nuklear.button_set_behavior(nk.NK_BUTTON_DEFAULT)
                 if nuklear.button_color(nk.Color(0, 0, 255, 255)):
                     pass
                 nuklear.layout_row_static(height=25.0,
                                           item_width=25,
                                           columns=8)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_CIRCLE_SOLID)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_CIRCLE_OUTLINE)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_RECT_SOLID)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_RECT_OUTLINE)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_TRIANGLE_UP)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_TRIANGLE_DOWN)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_TRIANGLE_LEFT)
-                nuklear.button_symbol(nk.SymbolType.SYMBOL_TRIANGLE_RIGHT)
+                nuklear.button_symbol(nk.NK_SYMBOL_CIRCLE_SOLID)
+                nuklear.button_symbol(nk.NK_SYMBOL_CIRCLE_OUTLINE)
+                nuklear.button_symbol(nk.NK_SYMBOL_RECT_SOLID)
+                nuklear.button_symbol(nk.NK_SYMBOL_RECT_OUTLINE)
+                nuklear.button_symbol(nk.NK_SYMBOL_TRIANGLE_UP)
+                nuklear.button_symbol(nk.NK_SYMBOL_TRIANGLE_DOWN)
+                nuklear.button_symbol(nk.NK_SYMBOL_TRIANGLE_LEFT)
+                nuklear.button_symbol(nk.NK_SYMBOL_TRIANGLE_RIGHT)
 
                 nuklear.layout_row_static(height=30.0,
                                           item_width=100,
                                           columns=2)
-                nuklear.button_symbol_label(symbol=nk.SymbolType.SYMBOL_TRIANGLE_LEFT,
+                nuklear.button_symbol_label(symbol=nk.NK_SYMBOL_TRIANGLE_LEFT,
                                             label="prev",
-                                            align=nk.TextAlign.TEXT_RIGHT)
-                nuklear.button_symbol_label(symbol=nk.SymbolType.SYMBOL_TRIANGLE_RIGHT,
+                                            align=nk.NK_TEXT_RIGHT)
+                nuklear.button_symbol_label(symbol=nk.NK_SYMBOL_TRIANGLE_RIGHT,
                                             label="next",
-                                            align=nk.TextAlign.TEXT_LEFT)
+                                            align=nk.NK_TEXT_LEFT)
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Basic",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 nuklear.layout_row_static(height=30.0,
                                           item_width=100,
                                           columns=1)
@@ -422,7 +422,7 @@ def overview(nuklear):
 
                 # this class is necessary to prevent garbage collection of the array
                 with nk.LayoutRow(ctx=nuklear.ctx,
-                                  layout_format=nk.LayoutFormat.STATIC,
+                                  layout_format=nk.NK_STATIC,
                                   height=30.0,
                                   ratio=[120.0, 150.0]) as lr:
                     global basicSlider
@@ -431,7 +431,7 @@ def overview(nuklear):
                     except Exception:
                         basicSlider = 5
                     nuklear.label(text=str.format("Slider Int: {}", basicSlider),
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     (modified, basicSlider) = nuklear.slider_int(minV=0,
                                                                  value=basicSlider,
                                                                  maxV=10,
@@ -442,7 +442,7 @@ def overview(nuklear):
                     except Exception:
                         floatSlider = 2.5
                     nuklear.label(text=str.format("Slider Float: {}", floatSlider),
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     (modified, floatSlider) = nuklear.slider_float(minV=0.0,
                                                                    value=floatSlider,
                                                                    maxV=5.0,
@@ -455,13 +455,13 @@ def overview(nuklear):
                         progFloat = 40
 
                     nuklear.label(text="Progressbar: ",
-                                  alignment=nk.TextAlign.TEXT_LEFT);
+                                  alignment=nk.NK_TEXT_LEFT);
                     (modified, progFloat) = nuklear.progress(cur=progFloat,
                                                              max=100,
-                                                             is_modifyable=nk.Modify.MODIFIABLE)
+                                                             is_modifyable=nk.NK_MODIFIABLE)
 
                 with nk.LayoutRow(ctx=nuklear.ctx,
-                                  layout_format=nk.LayoutFormat.STATIC,
+                                  layout_format=nk.NK_STATIC,
                                   height=25.0,
                                   ratio=[120.0, 150.0]) as lr:
                     global basicFloat
@@ -471,7 +471,7 @@ def overview(nuklear):
                         basicFloat = 2.0
 
                     nuklear.label(text="Property float:",
-                                  alignment=nk.TextAlign.TEXT_LEFT);
+                                  alignment=nk.NK_TEXT_LEFT);
                     basicFloat = nuklear.property_float(name="Float:",
                                                         minV=0.0,
                                                         val=basicFloat,
@@ -484,7 +484,7 @@ def overview(nuklear):
                     except Exception:
                         basicInt = 10
                     nuklear.label(text="Property int:",
-                                  alignment=nk.TextAlign.TEXT_LEFT);
+                                  alignment=nk.NK_TEXT_LEFT);
                     basicInt = nuklear.property_int(name="Int:",
                                                     minV=0,
                                                     val=basicInt,
@@ -493,7 +493,7 @@ def overview(nuklear):
                                                     inc_per_pixel=1);
                 # TODO -- I don't think I need to port this
                 # nuklear.label(text="Property neg:",
-                #               alignment= nk.TextAlign.TEXT_LEFT);
+                #               alignment= nk.NK_TEXT_LEFT);
                 # nuklear.property_int("Neg:", -10, &property_neg, 10, 1, 1);
 
                 # TODO - do this later
@@ -509,12 +509,12 @@ def overview(nuklear):
                 # nk_property_int(ctx, "#max:", range_int_min, &range_int_max, INT_MAX, 1, 10);
 
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Selectable",
-                                 state=nk.CollapseStates.MINIMIZED):
-                if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+                                 state=nk.NK_MINIMIZED):
+                if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                      title="List",
-                                     state=nk.CollapseStates.MINIMIZED):
+                                     state=nk.NK_MINIMIZED):
                     nuklear.layout_row_static(height=18.0,
                                               item_width=100,
                                               columns=1)
@@ -526,24 +526,24 @@ def overview(nuklear):
                         selected = [False, False, False, False]
 
                     (wasModified, selected[0]) = nuklear.selectable_label(label="Selectable",
-                                                                          align=nk.TextAlign.TEXT_LEFT,
+                                                                          align=nk.NK_TEXT_LEFT,
                                                                           value=selected[0])
                     (wasModified, selected[1]) = nuklear.selectable_label(label="Selectable",
-                                                                          align=nk.TextAlign.TEXT_LEFT,
+                                                                          align=nk.NK_TEXT_LEFT,
                                                                           value=selected[1])
                     nuklear.label(text="Not Selectable",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     (wasModified, selected[2]) = nuklear.selectable_label(label="Selectable",
-                                                                          align=nk.TextAlign.TEXT_LEFT,
+                                                                          align=nk.NK_TEXT_LEFT,
                                                                           value=selected[2])
                     (wasModified, selected[3]) = nuklear.selectable_label(label="Selectable",
-                                                                          align=nk.TextAlign.TEXT_LEFT,
+                                                                          align=nk.NK_TEXT_LEFT,
                                                                           value=selected[3])
                     nuklear.tree_pop()
 
-                if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+                if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                      title="Grid",
-                                     state=nk.CollapseStates.MINIMIZED):
+                                     state=nk.NK_MINIMIZED):
 
                     global gridSelected
                     try:
@@ -558,7 +558,7 @@ def overview(nuklear):
                                               columns=4)
                     for i in range(16):
                         (wasModified, gridSelected[i]) = nuklear.selectable_label(label="Z",
-                                                                                  align=nk.TextAlign.TEXT_LEFT,
+                                                                                  align=nk.NK_TEXT_LEFT,
                                                                                   value=gridSelected[i])
                         if wasModified:
                             (y, x) = divmod(i, 4)
@@ -573,9 +573,9 @@ def overview(nuklear):
                     nuklear.tree_pop()
 
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Combo",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 global current_weapon
                 global weapons
                 try:
@@ -607,16 +607,16 @@ def overview(nuklear):
                     nuklear.layout_row_dynamic(height=30.0,
                                                columns=2)
                     nuklear.label(text="R:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     comboColor.r = nuklear.slide_int(0, comboColor.r, 255, 5)
                     nuklear.label(text="G:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     comboColor.g = nuklear.slide_int(0, comboColor.g, 255, 5)
                     nuklear.label(text="B:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     comboColor.b = nuklear.slide_int(0, comboColor.b, 255, 5)
                     nuklear.label(text="A:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
+                                  alignment=nk.NK_TEXT_LEFT)
                     comboColor.a = nuklear.slide_int(0, comboColor.a, 255, 5)
 
                     nuklear.combo_end()
@@ -635,11 +635,11 @@ def overview(nuklear):
                 # TODO
                 #                /* date combobox */
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Input",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 with nk.LayoutRow(ctx=nuklear.ctx,
-                                  layout_format=nk.LayoutFormat.STATIC,
+                                  layout_format=nk.NK_STATIC,
                                   height=25.0,
                                   ratio=[120.0, 150.0]) as lr:
 
@@ -657,43 +657,43 @@ def overview(nuklear):
                             textL.append(0)
 
                     nuklear.label(text="Default:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[0]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[0]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[0],
                                                               length=textL[0],
                                                               maxV=64,
                                                               filterF=nk.filter_default)
                     nuklear.label(text="Int:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[1]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[1]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[1],
                                                               length=textL[1],
                                                               maxV=64,
                                                               filterF=nk.filter_decimal)
                     nuklear.label(text="Float:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[2]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[2]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[2],
                                                               length=textL[2],
                                                               maxV=64,
                                                               filterF=nk.filter_float)
                     nuklear.label(text="Hex:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[4]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[4]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[4],
                                                               length=textL[4],
                                                               maxV=64,
                                                               filterF=nk.filter_hex)
                     nuklear.label(text="Octal:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[5]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[5]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[5],
                                                               length=textL[5],
                                                               maxV=64,
                                                               filterF=nk.filter_oct)
                     nuklear.label(text="Binary:",
-                                  alignment=nk.TextAlign.TEXT_LEFT)
-                    (eSFlags, textL[6]) = nuklear.edit_string(flags=nk.EditTypes.SIMPLE,
+                                  alignment=nk.NK_TEXT_LEFT)
+                    (eSFlags, textL[6]) = nuklear.edit_string(flags=nk.NK_EDIT_SIMPLE,
                                                               memory=text[6],
                                                               length=textL[6],
                                                               maxV=64,
@@ -702,13 +702,13 @@ def overview(nuklear):
                 nuklear.tree_pop()
 
             nuklear.tree_pop()
-        if nuklear.tree_push(theType=nk.TreeType.TREE_TAB,
+        if nuklear.tree_push(theType=nk.NK_TREE_TAB,
                              title="Chart",
-                             state=nk.CollapseStates.MINIMIZED):
+                             state=nk.NK_MINIMIZED):
             nuklear.layout_row_dynamic(height=100.0,
                                        columns=1)
             bounds = nuklear.widget_bounds()
-            if nuklear.chart_begin(chart_type=nk.ChartType.CHART_LINES,
+            if nuklear.chart_begin(chart_type=nk.NK_CHART_LINES,
                                    count=32,
                                    minV=-1.0,
                                    maxV=1.0):
@@ -717,7 +717,7 @@ def overview(nuklear):
                 for x in range(32):
                     res = nuklear.chart_push(
                         math.cos(x * (2 * 3.141592654) / numberOfPoints))
-                    if res & nk.ChartEvent.CHART_HOVERING.value:
+                    if res & nk.NK_CHART_HOVERING:
                         hoveredIndex = x
 
                 nuklear.chart_end()
@@ -730,7 +730,7 @@ def overview(nuklear):
             nuklear.layout_row_dynamic(height=100.0,
                                        columns=1)
             bounds = nuklear.widget_bounds()
-            if nuklear.chart_begin(chart_type=nk.ChartType.CHART_COLUMN,
+            if nuklear.chart_begin(chart_type=nk.NK_CHART_COLUMN,
                                    count=32,
                                    minV=0.0,
                                    maxV=1.0):
@@ -739,7 +739,7 @@ def overview(nuklear):
                 for x in range(32):
                     res = nuklear.chart_push(
                         math.fabs(math.sin(x * (2 * 3.141592654) / numberOfPoints)))
-                    if res & nk.ChartEvent.CHART_HOVERING.value:
+                    if res & nk.NK_CHART_HOVERING:
                         hoveredIndex = x
 
                 nuklear.chart_end()
@@ -753,15 +753,15 @@ def overview(nuklear):
                                        columns=1)
             bounds = nuklear.widget_bounds()
             numberOfPoints = 32
-            if nuklear.chart_begin(chart_type=nk.ChartType.CHART_COLUMN,
+            if nuklear.chart_begin(chart_type=nk.NK_CHART_COLUMN,
                                    count=32,
                                    minV=0.0,
                                    maxV=1.0):
-                nuklear.chart_add_slot(chart_type=nk.ChartType.CHART_LINES,
+                nuklear.chart_add_slot(chart_type=nk.NK_CHART_LINES,
                                        count=32,
                                        minV=-1.0,
                                        maxV=1.0)
-                nuklear.chart_add_slot(chart_type=nk.ChartType.CHART_LINES,
+                nuklear.chart_add_slot(chart_type=nk.NK_CHART_LINES,
                                        count=32,
                                        minV=-1.0,
                                        maxV=1.0)
@@ -777,16 +777,16 @@ def overview(nuklear):
             # TODO - mixed colored chart
 
             nuklear.tree_pop()
-        if nuklear.tree_push(theType=nk.TreeType.TREE_TAB,
+        if nuklear.tree_push(theType=nk.NK_TREE_TAB,
                              title="Popup",
-                             state=nk.CollapseStates.MINIMIZED):
+                             state=nk.NK_MINIMIZED):
             # TODO
             nuklear.layout_row_static(height=30.0,
                                       item_width=160,
                                       columns=1)
             bounds = nuklear.widget_bounds()
             nuklear.label(text="Right click me for menu",
-                          alignment=nk.TextAlign.TEXT_LEFT)
+                          alignment=nk.NK_TEXT_LEFT)
 
             if nuklear.contextual_begin(flags=0,
                                         size=nk.Vec2(100, 300),
@@ -797,28 +797,28 @@ def overview(nuklear):
                                                                active=show_menu)
                 (modified, mprog) = nuklear.progress(cur=mprog,
                                                      max=100,
-                                                     is_modifyable=nk.Modify.MODIFIABLE)
+                                                     is_modifyable=nk.NK_MODIFIABLE)
                 (modified, mslider) = nuklear.slider_int(minV=0,
                                                          value=mslider,
                                                          maxV=16,
                                                          step=1)
                 if nuklear.contextual_item_label(text="About",
-                                                 align=nk.TextAlign.TEXT_CENTERED):
+                                                 align=nk.NK_TEXT_CENTERED):
                     show_app_about = True
                 nuklear.contextual_end()
             nuklear.tree_pop()
-        if nuklear.tree_push(theType=nk.TreeType.TREE_TAB,
+        if nuklear.tree_push(theType=nk.NK_TREE_TAB,
                              title="Layout",
-                             state=nk.CollapseStates.MINIMIZED):
+                             state=nk.NK_MINIMIZED):
             # TODO
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Widget",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
 
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="Dynamic fixed column layout with generated position and size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
+                              alignment=nk.NK_TEXT_LEFT)
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=3)
                 nuklear.button_label(title="button")
@@ -828,7 +828,7 @@ def overview(nuklear):
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="static fixed column layout with generated position and size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
+                              alignment=nk.NK_TEXT_LEFT)
                 nuklear.layout_row_static(height=30.0,
                                           item_width=100,
                                           columns=3)
@@ -839,10 +839,10 @@ def overview(nuklear):
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="Dynamic array-based custom column layout with generated position and custom size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
+                              alignment=nk.NK_TEXT_LEFT)
                 # this class is necessary to prevent garbage collection of the array
                 with nk.LayoutRow(ctx=nuklear.ctx,
-                                  layout_format=nk.LayoutFormat.DYNAMIC,
+                                  layout_format=nk.NK_DYNAMIC,
                                   height=30.0,
                                   ratio=[0.2, 0.6, 0.2]) as lr:
 
@@ -853,10 +853,10 @@ def overview(nuklear):
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="Static array-based custom column layout with generated position and custom size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
+                              alignment=nk.NK_TEXT_LEFT)
                 # this class is necessary to prevent garbage collection of the array
                 with nk.LayoutRow(ctx=nuklear.ctx,
-                                  layout_format=nk.LayoutFormat.STATIC,
+                                  layout_format=nk.NK_STATIC,
                                   height=30.0,
                                   ratio=[100.0, 200.0, 50.0]) as lr:
 
@@ -867,8 +867,8 @@ def overview(nuklear):
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="Dynamic immediate mode custom column layout with generated position and custom size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
-                nuklear.layout_row_begin(format=nk.LayoutFormat.DYNAMIC,
+                              alignment=nk.NK_TEXT_LEFT)
+                nuklear.layout_row_begin(format=nk.NK_DYNAMIC,
                                          row_height=30.0,
                                          columns=3)
                 nuklear.layout_row_push(ratio_or_width=0.2)
@@ -881,8 +881,8 @@ def overview(nuklear):
                 nuklear.layout_row_dynamic(height=30.0,
                                            columns=1)
                 nuklear.label(text="Static immediate mode custom column layout with generated position and custom size:",
-                              alignment=nk.TextAlign.TEXT_LEFT)
-                nuklear.layout_row_begin(format=nk.LayoutFormat.STATIC,
+                              alignment=nk.NK_TEXT_LEFT)
+                nuklear.layout_row_begin(format=nk.NK_STATIC,
                                          row_height=30.0,
                                          columns=3)
                 nuklear.layout_row_push(ratio_or_width=100.0)
@@ -895,21 +895,21 @@ def overview(nuklear):
                 # TODO - two more layouts
 
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Group",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 # TODO
                 nuklear.tree_pop()
 
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Notebook",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 nuklear.style_push_window_spacing(vec2=nk.Vec2(x=0.0,
                                                                y=0.0))
                 nuklear.style_push_button_rounding(f=0.0)
 
                 names = ["Lines", "Columns", "Mixed"]
-                nuklear.layout_row_begin(format=nk.LayoutFormat.STATIC,
+                nuklear.layout_row_begin(format=nk.NK_STATIC,
                                          row_height=20.0,
                                          columns=3)
                 global currentTab
@@ -929,7 +929,7 @@ def overview(nuklear):
 
                 nuklear.layout_row_dynamic(height=140.0,
                                            columns=1)
-                if(nuklear.group_begin("Notebook", nk.PanelFlags.WINDOW_BORDER)):
+                if(nuklear.group_begin("Notebook", nk.NK_WINDOW_BORDER)):
                     nuklear.style_pop_vec2()
                     nuklear.layout_row_dynamic(height=100.0,
                                                columns=1)
@@ -937,14 +937,14 @@ def overview(nuklear):
                     if currentTab == 0:
                         numberOfPoints = 32
                         hoveredIndex = -1
-                        if nuklear.chart_begin(chart_type=nk.ChartType.CHART_LINES,
+                        if nuklear.chart_begin(chart_type=nk.NK_CHART_LINES,
                                                count=32,
                                                minV=-1.0,
                                                maxV=1.0):
                             for x in range(32):
                                 res = nuklear.chart_push(
                                     math.cos(x * (2 * 3.141592654) / numberOfPoints))
-                                if res & nk.ChartEvent.CHART_HOVERING.value:
+                                if res & nk.NK_CHART_HOVERING:
                                     hoveredIndex = x
 
                         nuklear.chart_end()
@@ -956,14 +956,14 @@ def overview(nuklear):
                     elif currentTab == 1:
                         numberOfPoints = 32
                         hoveredIndex = -1
-                        if nuklear.chart_begin(chart_type=nk.ChartType.CHART_COLUMN,
+                        if nuklear.chart_begin(chart_type=nk.NK_CHART_COLUMN,
                                                count=32,
                                                minV=0.0,
                                                maxV=1.0):
                             for x in range(32):
                                 res = nuklear.chart_push(
                                     math.fabs(math.sin(x * (2 * 3.141592654) / numberOfPoints)))
-                                if res & nk.ChartEvent.CHART_HOVERING.value:
+                                if res & nk.NK_CHART_HOVERING:
                                     hoveredIndex = x
 
                         nuklear.chart_end()
@@ -974,15 +974,15 @@ def overview(nuklear):
 
                     elif currentTab == 2:
                         numberOfPoints = 32
-                        if nuklear.chart_begin(chart_type=nk.ChartType.CHART_COLUMN,
+                        if nuklear.chart_begin(chart_type=nk.NK_CHART_COLUMN,
                                                count=32,
                                                minV=0.0,
                                                maxV=1.0):
-                            nuklear.chart_add_slot(chart_type=nk.ChartType.CHART_LINES,
+                            nuklear.chart_add_slot(chart_type=nk.NK_CHART_LINES,
                                                    count=32,
                                                    minV=-1.0,
                                                    maxV=1.0)
-                            nuklear.chart_add_slot(chart_type=nk.ChartType.CHART_LINES,
+                            nuklear.chart_add_slot(chart_type=nk.NK_CHART_LINES,
                                                    count=32,
                                                    minV=-1.0,
                                                    maxV=1.0)
@@ -999,19 +999,19 @@ def overview(nuklear):
                 else:
                     nuklear.style_pop_vec2()
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Simple",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 # TODO
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Complex",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 # TODO
                 nuklear.tree_pop()
-            if nuklear.tree_push(theType=nk.TreeType.TREE_NODE,
+            if nuklear.tree_push(theType=nk.NK_TREE_NODE,
                                  title="Splitter",
-                                 state=nk.CollapseStates.MINIMIZED):
+                                 state=nk.NK_MINIMIZED):
                 # TODO
                 nuklear.tree_pop()
 
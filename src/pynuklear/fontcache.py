@@ -0,0 +1,250 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# A disk cache of baked font atlases.  Baking rasterizes and packs every
+# glyph of every font, which with large ranges, e.g. CJK, is much of the
+# start up.  AtlasCache keys a bake by the bytes, size, oversampling,
+# ranges and other settings of the atlas' fonts, and stores the baked image
+# with the glyph tables in one file, which a later run memory maps instead
+# of baking.  On a cold cache the bake runs on a thread, so that the
+# application carries on starting up meanwhile:
+#
+#     cache = fontcache.AtlasCache()
+#     atlas = backend.font_stash_begin()
+#     nk.nk_font_atlas_add_from_file(atlas, b"DroidSans.ttf", 16.0, None)
+#     baked = cache.bake(atlas)
+#     ... the rest of the start up ...
+#     backend.font_stash_end(baked)
+#
+# glfw3.Backend.font_stash_end, glfw3.glfw3_font_stash_end_baked and
+# raster.Rasterizer.font_stash_end take the BakedAtlas.  Fonts must not be
+# added to the atlas once it is baking.
+
+import os
+import mmap
+import struct
+import hashlib
+import tempfile
+import threading
+from ctypes import POINTER, byref, c_int, c_ubyte, sizeof, string_at, addressof
+
+import pynuklear.nuklear as nk
+
+
+MAGIC = b'NKATLAS\0'
+VERSION = 1
+
+# magic, version, key, format, width, height, custom x, y, w, h,
+# glyph_count, font_count, the sizes of a glyph, a baked font and the
+# cursors, and the offset of the image
+HEADER = struct.Struct('<8sI32siiihhhhiiIIIQ')
+
+BYTES_PER_PIXEL = {nk.NK_FONT_ATLAS_ALPHA8: 1, nk.NK_FONT_ATLAS_RGBA32: 4}
+
+
+def defaultDirectory():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pynuklear', 'atlases')
+
+
+def configs(atlas):
+    """The FontConfigs of the atlas, each followed by those merged into it."""
+    config = atlas.config
+    while config:
+        yield config.contents
+        merged = config.contents.n
+        while merged and addressof(merged.contents) != addressof(config.contents):
+            yield merged.contents
+            merged = merged.contents.n
+        config = config.contents.next
+
+
+def ranges(config):
+    """The (first, last) codepoint pairs of the config's range."""
+    pairs = []
+    if config.range:
+        i = 0
+        while config.range[i]:
+            pairs.append((config.range[i], config.range[i + 1]))
+            i += 2
+    return pairs
+
+
+def atlasKey(atlas, format):
+    """The digest that identifies the bake of the atlas' fonts in format."""
+    digest = hashlib.sha256()
+    digest.update(struct.pack('<Iiiii', VERSION, format, sizeof(nk.FontGlyph),
+                              sizeof(nk.BakedFont), sizeof(nk.Cursor)))
+    for config in configs(atlas):
+        digest.update(hashlib.sha256(string_at(config.ttf_blob, config.ttf_size)).digest())
+        digest.update(struct.pack('<fBBBBiffI', config.size, config.merge_mode,
+                                  config.pixel_snap, config.oversample_h,
+                                  config.oversample_v, config.coord_type,
+                                  config.spacing.x, config.spacing.y,
+                                  config.fallback_glyph))
+        for first, last in ranges(config):
+            digest.update(struct.pack('<II', first, last))
+        digest.update(struct.pack('<I', 0))
+    return digest.digest()
+
+
+class AtlasCache:
+    def __init__(self, directory=None):
+        self.directory = directory or defaultDirectory()
+
+    def path(self, key):
+        return os.path.join(self.directory, key.hex() + '.atlas')
+
+    # restores the atlas, a POINTER(FontAtlas) or FontAtlas with its fonts
+    # added, from the cache, or starts baking it on a thread.  Returns the
+    # BakedAtlas to end the font stash with.
+    def bake(self, atlas, format=nk.NK_FONT_ATLAS_RGBA32):
+        if not isinstance(atlas, POINTER(nk.FontAtlas)):
+            atlas = POINTER(nk.FontAtlas)(atlas)
+        # as nk_font_atlas_bake does, so that the key covers it
+        if not atlas.contents.font_num:
+            atlas.contents.default_font = nk.nk_font_atlas_add_default(atlas, 13.0, None)
+        baked = BakedAtlas(self, atlas, format, atlasKey(atlas.contents, format))
+        if not baked.restore():
+            baked.start()
+        return baked
+
+    # writes the bake of the atlas, which is still baked, i.e. before
+    # nk_font_atlas_end, under key.  The cache is only an optimization, so
+    # failing to write it is not an error.
+    def store(self, key, atlas, format, width, height):
+        atlas = atlas.contents
+        fonts = []
+        font = atlas.fonts
+        while font:
+            fonts.append(font.contents.info)
+            font = font.contents.next
+        fontBytes = b''.join(string_at(byref(info), sizeof(info)) for info in fonts)
+        cursorBytes = string_at(byref(atlas.cursors), sizeof(atlas.cursors))
+        glyphBytes = string_at(atlas.glyphs, atlas.glyph_count * sizeof(nk.FontGlyph))
+        tables = HEADER.size + len(cursorBytes) + len(fontBytes) + len(glyphBytes)
+        imageOffset = (tables + 63) & ~63
+        custom = atlas.custom
+        header = HEADER.pack(MAGIC, VERSION, key, format, width, height,
+                             custom.x, custom.y, custom.w, custom.h,
+                             atlas.glyph_count, len(fonts), sizeof(nk.FontGlyph),
+                             sizeof(nk.BakedFont), len(cursorBytes), imageOffset)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    f.write(header + cursorBytes + fontBytes + glyphBytes)
+                    f.write(bytes(imageOffset - tables))
+                    f.write(string_at(atlas.pixel, width * height * BYTES_PER_PIXEL[format]))
+                os.replace(temporary, self.path(key))
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            pass
+
+
+# An atlas being baked or restored by AtlasCache.bake.  wait() returns the
+# baked image, as the address of its pixels with its width and height, for
+# the renderer to upload before nk_font_atlas_end; close() releases it
+# afterwards.  cached tells whether it came from the cache.
+class BakedAtlas:
+    def __init__(self, cache, atlas, format, key):
+        self.cache = cache
+        self.atlas = atlas
+        self.format = format
+        self.key = key
+        self.cached = False
+        self.pixels = None
+        self.width = self.height = 0
+        self.thread = None
+        self.error = None
+        self.map = None
+        self.views = []
+
+    def restore(self):
+        try:
+            with open(self.cache.path(self.key), 'rb') as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return False
+        if not self.restore_map():
+            self.close()
+            return False
+        self.cached = True
+        return True
+
+    def restore_map(self):
+        data = self.map
+        if len(data) < HEADER.size:
+            return False
+        (magic, version, key, format, width, height, x, y, w, h, glyphCount, fontCount,
+         glyphSize, fontSize, cursorSize, imageOffset) = HEADER.unpack_from(data)
+        if (magic != MAGIC or version != VERSION or key != self.key or format != self.format
+                or glyphSize != sizeof(nk.FontGlyph) or fontSize != sizeof(nk.BakedFont)
+                or cursorSize != sizeof(self.atlas.contents.cursors)
+                or len(data) < imageOffset + width * height * BYTES_PER_PIXEL[format]):
+            return False
+        offset = HEADER.size
+        cursors = (nk.Cursor * len(self.atlas.contents.cursors)).from_buffer(data, offset)
+        offset += cursorSize
+        fonts = (nk.BakedFont * fontCount).from_buffer(data, offset)
+        offset += fontCount * fontSize
+        glyphs = (nk.FontGlyph * glyphCount).from_buffer(data, offset)
+        image = (c_ubyte * (width * height * BYTES_PER_PIXEL[format])).from_buffer(data, imageOffset)
+        self.views = [cursors, fonts, glyphs, image]
+        if not nk.nkWrapper_font_atlas_restore(self.atlas, width, height, nk.Recti(x, y, w, h),
+                                               cursors, fonts, fontCount, glyphs, glyphCount):
+            return False
+        self.pixels = addressof(image)
+        self.width, self.height = width, height
+        return True
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name='atlas bake', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            # ctypes releases the GIL while nuklear bakes
+            width, height = c_int(), c_int()
+            pixels = nk.nk_font_atlas_bake(self.atlas, byref(width), byref(height), self.format)
+            if not pixels:
+                raise RuntimeError("nk_font_atlas_bake failed")
+            self.cache.store(self.key, self.atlas, self.format, width.value, height.value)
+            self.pixels = pixels
+            self.width, self.height = width.value, height.value
+        except Exception as error:
+            self.error = error
+
+    def wait(self):
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.error is not None:
+            raise self.error
+        return self.pixels, self.width, self.height
+
+    def close(self):
+        self.views = []
+        if self.map is not None:
+            self.map.close()
+            self.map = None
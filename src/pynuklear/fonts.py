@@ -0,0 +1,129 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Fonts for a FontAtlas, added between a backend's font_stash_begin and
+# font_stash_end.  add_file memory maps the TTF rather than copying it into
+# the atlas, and FontPages bakes the glyphs of large alphabets lazily: the
+# atlas starts with the ranges its fonts are added with, and the code
+# points the UI shows beyond them are baked once it asks for them.
+#
+#     atlas = backend.font_stash_begin()
+#     fonts.add_file(atlas, "DroidSansFallback.ttf", 18.0, ranges=fonts.LATIN)
+#     backend.font_stash_end(format=nk.NK_FONT_ATLAS_ALPHA8, lazyPages=True)
+#
+# glfw3.Application bakes the pages between frames; glfw3.font_pages_update
+# and raster.Rasterizer.update_font_pages do so for other loops.
+
+import os
+from ctypes import POINTER, byref, c_int, cast
+
+import pynuklear.nuklear as nk
+
+
+# (first, last) code point pairs
+LATIN = ((0x0020, 0x00FF),)
+
+_rangeArrays = {}
+
+
+def glyphRanges(pairs):
+    """The zero terminated nk_rune array of the (first, last) pairs.
+
+    nuklear keeps a pointer to the ranges of a font, not a copy, so the
+    arrays are kept for the life of the process."""
+    pairs = tuple((int(first), int(last)) for first, last in pairs)
+    array = _rangeArrays.get(pairs)
+    if array is None:
+        runes = [codepoint for pair in pairs for codepoint in pair] + [0]
+        array = _rangeArrays[pairs] = (nk.nk_rune * len(runes))(*runes)
+    return array
+
+
+def fontConfig(height, ranges=None, merge=False, **fields):
+    """A FontConfig of nk_font_config(height) with the glyph ranges, merged
+    into the last font added if merge, and other FontConfig fields, e.g.
+    oversample_h=1."""
+    config = nk.nk_font_config(height)
+    if ranges is not None:
+        config.range = cast(glyphRanges(ranges), POINTER(nk.nk_rune))
+    config.merge_mode = bool(merge)
+    for name, value in fields.items():
+        setattr(config, name, value)
+    return config
+
+
+def _atlasPointer(atlas):
+    if isinstance(atlas, POINTER(nk.FontAtlas)):
+        return atlas
+    return POINTER(nk.FontAtlas)(atlas)
+
+
+def add_file(atlas, path, height, ranges=None, merge=False, **fields):
+    """Adds the TTF file at path, memory mapped, to atlas, a POINTER(FontAtlas)
+    or FontAtlas.  Returns the POINTER(Font), which is NULL for a merged
+    font."""
+    path = os.fsencode(path)
+    # for the error nk_font_atlas_add_mapped does not tell
+    with open(path, 'rb'):
+        pass
+    config = fontConfig(height, ranges, merge, **fields)
+    font = nk.nk_font_atlas_add_mapped(_atlasPointer(atlas), path, height, byref(config))
+    if not font and not merge:
+        raise RuntimeError("nk_font_atlas_add_mapped failed for %r" % path)
+    return font
+
+
+def add_memory(atlas, data, height, ranges=None, merge=False, **fields):
+    """Adds the TTF in data, a bytes-like object, to atlas, which copies it."""
+    data = bytes(data)
+    config = fontConfig(height, ranges, merge, **fields)
+    font = nk.nk_font_atlas_add_from_memory(_atlasPointer(atlas), data, len(data),
+                                            height, byref(config))
+    if not font and not merge:
+        raise RuntimeError("nk_font_atlas_add_from_memory failed")
+    return font
+
+
+# The lazily baked glyph pages of a baked and ended atlas, which must keep
+# its TTFs, i.e. not be cleaned up.  Its fonts note the code points they
+# are asked for and lack; bake() bakes the atlas again with them, returning
+# the image as fontcache.BakedAtlas.wait does, for the renderer to upload
+# into the font texture before nk_font_atlas_end.  free() it after
+# clearing the atlas.
+class FontPages:
+    def __init__(self, atlas):
+        self.pages = nk.nk_font_pages_create(_atlasPointer(atlas))
+        if not self.pages:
+            raise ValueError("the atlas has no baked fonts")
+
+    def pending(self):
+        return nk.nk_font_pages_pending(self.pages)
+
+    def bake(self, format=nk.NK_FONT_ATLAS_RGBA32):
+        width, height = c_int(), c_int()
+        pixels = nk.nk_font_pages_bake(self.pages, byref(width), byref(height), format)
+        if not pixels:
+            raise RuntimeError("nk_font_pages_bake failed")
+        return pixels, width.value, height.value
+
+    def free(self):
+        if self.pages:
+            nk.nk_font_pages_free(self.pages)
+            self.pages = None
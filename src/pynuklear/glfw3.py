@@ -20,6 +20,7 @@
 
 
 import os
+import time
 import ctypes.util
 from ctypes import (Structure, POINTER, CFUNCTYPE, byref, c_char_p, c_int, c_short,
                     c_uint, c_double, c_float, c_ushort, c_byte, c_ubyte)
@@ -33,136 +34,405 @@ GLFW3_DEFAULT = 0
 GLFW3_INSTALL_CALLBACKS = 1
 
 
+# the prototypes of the backend procedures are installed by nuklear_h
 glfw3_init = nk._nuklear.nk_glfw3_init
-glfw3_init.restype = POINTER(nk.Context)
-glfw3_init.arglist = [POINTER(glfw._GLFWwindow), c_int]
 
 
-class FontAtlas(Structure):
-    pass
+# One backend instance per window: its own nuklear context, OpenGL
+# objects and input, so that one process drives several windows.  The
+# glfw3_* functions act on the current instance, which make_current
+# selects together with its window's OpenGL context; glfw3_init sets up
+# the first instance.  An instance made with share uses the fonts and
+# atlas texture of share, which must be baked already; its window must
+# share OpenGL objects with share's, i.e. be created with share's window
+# as glfw.create_window's share argument.
+#
+#     tools = nkglfw3.Backend(toolWindow)
+#     atlas = tools.font_stash_begin()
+#     tools.font_stash_end()
+#     viewer = nkglfw3.Backend(viewerWindow, share=tools)
+#     apps = [nkglfw3.Application(toolWindow, tools.nuklear, backend=tools),
+#             nkglfw3.Application(viewerWindow, viewer.nuklear, backend=viewer)]
+#     while ...:
+#         glfw.poll_events()
+#         for app, gui in zip(apps, guis):
+#             app.frame(gui)
+class Backend:
+    def __init__(self, window, init_state=GLFW3_INSTALL_CALLBACKS, share=None):
+        self.window = window
+        self.share = share
+        self.instance = nk._nuklear.nk_glfw3_create(window, init_state,
+                                                    share.instance if share else None)
+        if not self.instance:
+            raise MemoryError("nk_glfw3_create failed")
+        self.ctx = nk._nuklear.nk_glfw3_context(self.instance)
+        self.nuklear = nk.NuklearContext(self.ctx)
+
+    def make_current(self):
+        nk._nuklear.nk_glfw3_make_current(self.instance)
+
+    # returns the POINTER(FontAtlas) to add fonts to
+    def font_stash_begin(self):
+        self.make_current()
+        atlas = POINTER(FontAtlas)()
+        glfw3_font_stash_begin(byref(atlas))
+        return atlas
+
+    # baked, a fontcache.BakedAtlas of the atlas, saves baking it here, in
+    # its format.  NK_FONT_ATLAS_ALPHA8 makes a single channel texture, and
+    # lazyPages bakes the glyphs the fonts lack once the UI asks for them,
+    # see fonts.FontPages
+    def font_stash_end(self, baked=None, format=nk.NK_FONT_ATLAS_RGBA32, lazyPages=False):
+        self.make_current()
+        if baked is None:
+            glfw3_font_stash_end_format(format)
+        else:
+            glfw3_font_stash_end_baked(baked)
+        if lazyPages and not font_pages_enable():
+            raise RuntimeError("nk_font_pages_create failed")
 
+    def destroy(self):
+        if self.instance:
+            nk._nuklear.nk_glfw3_destroy(self.instance)
+            self.instance = None
 
+
+FontAtlas = nk.FontAtlas
+
+
+# takes a ctypes.byref() of a POINTER(FontAtlas), which receives the atlas
 glfw3_font_stash_begin = nk._nuklear.nk_glfw3_font_stash_begin
-glfw3_font_stash_begin.arglist = [POINTER(POINTER(FontAtlas))]
 
 glfw3_font_stash_end = nk._nuklear.nk_glfw3_font_stash_end
 
+# bakes the atlas as a NK_FONT_ATLAS_ALPHA8 or NK_FONT_ATLAS_RGBA32
+# texture; ALPHA8 is uploaded as a swizzled GL_R8 one, in a quarter of the
+# memory
+glfw3_font_stash_end_format = nk._nuklear.nk_glfw3_font_stash_end_format
+
+
+# ends the font stash with a fontcache.BakedAtlas of its atlas, waiting
+# for its bake, instead of baking the atlas here
+def glfw3_font_stash_end_baked(baked):
+    pixels, width, height = baked.wait()
+    nk._nuklear.nk_glfw3_font_stash_end_image(pixels, width, height, baked.format)
+    baked.close()
+
+
+# sets up lazily baked glyph pages for the current instance's atlas, once
+# its font stash has ended; returns whether they are
+def font_pages_enable():
+    return nk._nuklear.nk_glfw3_font_pages_enable() != 0
+
+
+# bakes the atlas again if the frames built since asked for code points it
+# lacks, and uploads it; returns whether it did, i.e. whether the next
+# frame should be built.  Call it between frames, after rendering.
+def font_pages_update():
+    return nk._nuklear.nk_glfw3_font_pages_update() != 0
+
 glfw3_new_frame = nk._nuklear.nk_glfw3_new_frame
 
 
 glfw3_render_prime = nk._nuklear.nk_glfw3_render
-glfw3_render_prime.arglist = [c_int, c_int, c_int]
+
+glfw3_render_if_changed = nk._nuklear.nk_glfw3_render_if_changed
+
+
+# whether the frame built since the last glfw3_render differs from the one
+# rendered last, comparing the nuklear commands and the framebuffer size.
+# Call it once the frame is built.  An application which draws nothing but
+# the GUI can skip clearing, rendering and swapping buffers when it is
+# False, e.g.
+#
+#     if nkglfw3.frame_changed():
+#         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+#         nkglfw3.glfw3_render(nk.NK_ANTI_ALIASING_ON)
+#         glfw.swap_buffers(window)
+#     else:
+#         nkglfw3.glfw3_render(nk.NK_ANTI_ALIASING_ON, skip_unchanged=True)
+def frame_changed():
+    return nk._nuklear.nk_glfw3_frame_changed() != 0
+
+
+# the timings and counters of the last glfw3_render, a nk.Glfw3Stats.
+# gpu_time is -1 until the gpu timer has measured a frame.
+def render_stats():
+    return nk._nuklear.nk_glfw3_get_stats().contents
+
+
+# measure the GPU's time of the draw pass with GL_TIME_ELAPSED queries.
+# A query is read a frame late, so that it never stalls the pipeline.
+def gpu_timer(enable=True):
+    nk._nuklear.nk_glfw3_gpu_timer(1 if enable else 0)
+
+
+# how glfw3_render streams the vertices and elements to the GPU, one of
+# nk.NK_GLFW3_STREAM_*.  NK_GLFW3_STREAM_PERSISTENT, the default where
+# ARB_buffer_storage is available, writes them straight into persistently
+# mapped buffers; NK_GLFW3_STREAM_UNSYNCHRONIZED, the default otherwise,
+# maps a region of the buffers per frame; both cycle through regions
+# guarded by fences.  NK_GLFW3_STREAM_ORPHAN reallocates the buffers
+# every frame.  Returns the strategy in use.
+def set_stream(strategy):
+    return nk._nuklear.nk_glfw3_set_stream(strategy)
+
+
+# records the last render's stages and counters into a nk.FrameStats
+def record_render_stats(stats):
+    rendered = render_stats()
+    stats.record('state', rendered.state_time)
+    stats.record('convert', rendered.convert_time)
+    stats.record('draw', rendered.draw_time)
+    if rendered.gpu_time >= 0:
+        stats.record('gpu', rendered.gpu_time)
+    stats.count('vertices', rendered.vertices)
+    stats.count('elements', rendered.elements)
+    stats.count('draw_commands', rendered.draw_commands)
+    stats.count('batches', rendered.batches)
+    stats.count('texture_binds', rendered.texture_binds)
+    stats.count('scissor_changes', rendered.scissor_changes)
+    stats.count('command_bytes', rendered.command_bytes)
+    stats.count('streamed_bytes', rendered.streamed_bytes)
+
+
+# the OpenGL state glfw3_render restores, nk.NK_GLFW3_STATE_* flags.
+# NK_GLFW3_STATE_DEFAULT, the blend, cull face, depth test, scissor and
+# viewport state, is protected initially.  Protect only the state the
+# application relies on, to save the queries, or add
+# NK_GLFW3_STATE_SHADOWED so that nothing is queried per frame: the state
+# current when protect_state is called is restored after every frame, and
+# an application which changes it later updates shadow_state() to match,
+# e.g.
+#
+#     gl.glViewport(0, 0, width, height)
+#     nkglfw3.protect_state(nk.NK_GLFW3_STATE_VIEWPORT | nk.NK_GLFW3_STATE_SHADOWED)
+#     ...
+#     nkglfw3.shadow_state().viewport[:] = [0, 0, width, height]
+def protect_state(state):
+    nk._nuklear.nk_glfw3_protect_state(state)
 
 
-# wrapper around nukear's render, as it doesn't protect the opengl state
-def glfw3_render(antialiasing, vertex_buffer_size=512 * 1024, element_buffer=128 * 1024):
-    # save the opengl state
-    last_blend_src = gl.glGetIntegerv(gl.GL_BLEND_SRC)
-    last_blend_dst = gl.glGetIntegerv(gl.GL_BLEND_DST)
-    last_blend_equation_rgb = gl.glGetIntegerv(gl.GL_BLEND_EQUATION_RGB)
-    last_blend_equation_alpha = gl.glGetIntegerv(gl.GL_BLEND_EQUATION_ALPHA)
-    last_viewport = gl.glGetIntegerv(gl.GL_VIEWPORT)
-    last_scissor_box = gl.glGetIntegerv(gl.GL_SCISSOR_BOX)
+def protected_state():
+    return nk._nuklear.nk_glfw3_protected_state()
 
-    last_enable_blend = gl.glIsEnabled(gl.GL_BLEND)
-    last_enable_cull_face = gl.glIsEnabled(gl.GL_CULL_FACE)
-    last_enable_depth_test = gl.glIsEnabled(gl.GL_DEPTH_TEST)
-    last_enable_scissor_test = gl.glIsEnabled(gl.GL_SCISSOR_TEST)
 
-    # render nuklear
+# the nk.Glfw3GlState restored in shadowed mode
+def shadow_state():
+    return nk._nuklear.nk_glfw3_shadow_state().contents
+
+
+# renders the frame, restoring the protected OpenGL state.  With
+# skip_unchanged, an unchanged frame is neither converted nor drawn, only
+# its commands are dropped.  Returns whether it rendered.  stats, a
+# nk.FrameStats, receives the render's stages and counters.
+def glfw3_render(antialiasing, vertex_buffer_size=512 * 1024, element_buffer=128 * 1024,
+                 skip_unchanged=False, stats=None):
+    if skip_unchanged and not frame_changed():
+        glfw3_render_if_changed(antialiasing, vertex_buffer_size, element_buffer)
+        return False
+
     glfw3_render_prime(antialiasing, vertex_buffer_size, element_buffer)
+    if stats is not None:
+        record_render_stats(stats)
+    return True
+
 
-    # restore the opengl state
-    gl.glBlendEquationSeparate(last_blend_equation_rgb,
-                               last_blend_equation_alpha)
-    gl.glBlendFunc(last_blend_src,
-                   last_blend_dst)
-    if last_enable_blend:
-        gl.glEnable(gl.GL_BLEND)
-    else:
-        gl.glDisable(gl.GL_BLEND)
-    if last_enable_cull_face:
-        gl.glEnable(gl.GL_CULL_FACE)
-    else:
-        gl.glDisable(gl.GL_CULL_FACE)
-    if last_enable_depth_test:
-        gl.glEnable(gl.GL_DEPTH_TEST)
-    else:
-        gl.glDisable(gl.GL_DEPTH_TEST)
-    if last_enable_scissor_test:
-        gl.glEnable(gl.GL_SCISSOR_TEST)
-    else:
-        gl.glDisable(gl.GL_SCISSOR_TEST)
-    gl.glViewport(last_viewport[0],
-                  last_viewport[1],
-                  last_viewport[2],
-                  last_viewport[3])
-    gl.glScissor(last_scissor_box[0],
-                 last_scissor_box[1],
-                 last_scissor_box[2],
-                 last_scissor_box[3])
-
-
-# wrapper around nukear's render, as it doesn't protect the opengl state
+# glfw3_render, also protecting the program, texture and buffer bindings
+# from now on
 def glfw3_render_gl2(antialiasing, vertex_buffer_size=512 * 1024, element_buffer=128 * 1024):
-    # save the opengl state
-    last_program = gl.glGetIntegerv(gl.GL_CURRENT_PROGRAM)
-    last_texture = gl.glGetIntegerv(gl.GL_TEXTURE_BINDING_2D)
-    last_active_texture = gl.glGetIntegerv(gl.GL_ACTIVE_TEXTURE)
-    last_array_buffer = gl.glGetIntegerv(gl.GL_ARRAY_BUFFER_BINDING)
-    last_element_array_buffer = gl.glGetIntegerv(
-        gl.GL_ELEMENT_ARRAY_BUFFER_BINDING)
-    last_vertex_array = gl.glGetIntegerv(gl.GL_VERTEX_ARRAY_BINDING)
-    last_blend_src = gl.glGetIntegerv(gl.GL_BLEND_SRC)
-    last_blend_dst = gl.glGetIntegerv(gl.GL_BLEND_DST)
-    last_blend_equation_rgb = gl.glGetIntegerv(gl.GL_BLEND_EQUATION_RGB)
-    last_blend_equation_alpha = gl.glGetIntegerv(gl.GL_BLEND_EQUATION_ALPHA)
-    last_viewport = gl.glGetIntegerv(gl.GL_VIEWPORT)
-    last_scissor_box = gl.glGetIntegerv(gl.GL_SCISSOR_BOX)
-
-    last_enable_blend = gl.glIsEnabled(gl.GL_BLEND)
-    last_enable_cull_face = gl.glIsEnabled(gl.GL_CULL_FACE)
-    last_enable_depth_test = gl.glIsEnabled(gl.GL_DEPTH_TEST)
-    last_enable_scissor_test = gl.glIsEnabled(gl.GL_SCISSOR_TEST)
-
-    # render nuklear
-    glfw3_render_prime(antialiasing, vertex_buffer_size, element_buffer)
+    state = protected_state()
+    if state & nk.NK_GLFW3_STATE_ALL != nk.NK_GLFW3_STATE_ALL:
+        protect_state(state | nk.NK_GLFW3_STATE_ALL)
+    return glfw3_render(antialiasing, vertex_buffer_size, element_buffer)
+
+
+# draws the current instance's frames on a native thread, which takes the
+# window's OpenGL context, so that Python builds the next frame while the
+# last one is converted, drawn and swapped; ctypes releases the GIL for the
+# native calls.  glfw3_submit hands a frame over.  While the thread runs,
+# do not call OpenGL nor glfw3_render, the font stashes, set_stream,
+# protect_state or gpu_timer, and read render_stats a frame late.
+# Returns whether the thread runs, which it does not on Windows.
+def render_thread_start():
+    return nk._nuklear.nk_glfw3_render_thread_start() != 0
+
+
+# draws the queued frame, joins the render thread and makes the window's
+# OpenGL context current again
+def render_thread_stop():
+    nk._nuklear.nk_glfw3_render_thread_stop()
+
+
+# queues a copy of the built frame for the render thread, waiting only
+# while the previous one is still queued, and clears the context.  Without
+# a render thread it clears the framebuffer to clearColor, renders and
+# swaps buffers itself.  stats, a nk.FrameStats, receives the stages and
+# counters of the last frame the thread drew.
+def glfw3_submit(antialiasing, vertex_buffer_size=512 * 1024, element_buffer=128 * 1024,
+                 clearColor=(0.0, 0.0, 0.0, 1.0), stats=None):
+    nk._nuklear.nk_glfw3_submit(antialiasing, vertex_buffer_size, element_buffer,
+                                nk.ColorF(*clearColor))
+    if stats is not None:
+        record_render_stats(stats)
+
+
+# An application loop which sleeps in glfw.wait_events while nothing
+# changes, instead of polling and rendering continuously.
+#
+#     app = nkglfw3.Application(window, nuklear)
+#     app.run(gui)
+#
+# gui(nuklear) builds the frame and returns True while it is animating, in
+# which case frames are rendered at up to maxFps.  Otherwise the loop
+# renders until the GUI settles, i.e. until a frame's commands equal the
+# last rendered ones, and then blocks until input arrives, request_redraw()
+# is called (from any thread) or idleTimeout seconds pass, if it is set.
+# An unfocused window is limited to unfocusedFps and a minimized one is not
+# rendered at all.  The window's refresh callback is taken, to redraw the
+# window when the system asks for it.
+#
+# scene(width, height), if given, draws beneath the GUI, and every woken
+# frame is rendered.  Without it the GUI is all there is, so frames whose
+# commands did not change are neither rendered nor swapped.
+#
+# With a Backend, every frame makes it current first, so that one loop can
+# call frame on the Applications of several windows.
+#
+# The glyphs of lazy font pages (Backend.font_stash_end) that a frame asks
+# for are baked after it is rendered, and another frame is built with them.
+#
+# With renderThread, frames are drawn by render_thread_start's thread while
+# the next one is built; scene and lazy font pages are not supported then,
+# since they would use OpenGL on the building thread.  stop() ends the
+# thread.
+class Application:
+    def __init__(self, window, nuklear, maxFps=60.0, unfocusedFps=10.0,
+                 idleTimeout=None, antialiasing=nk.NK_ANTI_ALIASING_ON,
+                 vertex_buffer_size=512 * 1024, element_buffer=128 * 1024,
+                 backend=None, renderThread=False):
+        self.window = window
+        self.nuklear = nuklear
+        self.backend = backend
+        self.maxFps = maxFps
+        self.unfocusedFps = unfocusedFps
+        self.idleTimeout = idleTimeout
+        self.antialiasing = antialiasing
+        self.vertex_buffer_size = vertex_buffer_size
+        self.element_buffer = element_buffer
+        self.clearColor = (0.0, 0.0, 0.0, 1.0)
+        self.frames = 0
+        self.renderedFrames = 0
+        self.lastFrameTime = 0.0
+        self.redraw = True
+        self.damaged = True
+        self.animating = False
+        self.renderThread = False
+        if renderThread:
+            if backend is not None:
+                backend.make_current()
+            self.renderThread = render_thread_start()
+
+        def on_refresh(window):
+            self.damaged = True
+        self._on_refresh = on_refresh
+        glfw.set_window_refresh_callback(window, on_refresh)
+
+    # wake the loop for another frame; safe to call from other threads
+    def request_redraw(self):
+        self.redraw = True
+        glfw.post_empty_event()
+
+    def frame_interval(self):
+        if not glfw.get_window_attrib(self.window, glfw.FOCUSED):
+            return 1.0 / self.unfocusedFps if self.unfocusedFps else 0.0
+        return 1.0 / self.maxFps if self.maxFps else 0.0
+
+    # block until the next frame is due, processing the events meanwhile
+    def wait(self):
+        window = self.window
+        while glfw.get_window_attrib(window, glfw.ICONIFIED):
+            if glfw.window_should_close(window):
+                return
+            glfw.wait_events()
+
+        if not (self.animating or self.redraw or self.damaged):
+            if self.idleTimeout is None:
+                glfw.wait_events()
+            else:
+                glfw.wait_events_timeout(self.idleTimeout)
+        else:
+            glfw.poll_events()
+
+        # cap the frame rate, while still taking input as it comes
+        due = self.lastFrameTime + self.frame_interval()
+        now = glfw.get_time()
+        while now < due and not glfw.window_should_close(window):
+            glfw.wait_events_timeout(due - now)
+            now = glfw.get_time()
+        self.lastFrameTime = now
+
+    def frame(self, gui, scene=None):
+        if scene is not None and self.renderThread:
+            raise ValueError("scene is not supported with renderThread")
+        stats = self.nuklear.stats
+        start = time.perf_counter()
+        if self.backend is not None:
+            self.backend.make_current()
+        glfw3_new_frame()
+        self.redraw = False
+        built = time.perf_counter()
+        self.animating = bool(gui(self.nuklear))
+        self.frames += 1
+        if stats is not None:
+            stats.record('new_frame', built - start)
+            stats.record('ui', time.perf_counter() - built)
+
+        changed = frame_changed()
+        if changed:
+            # nuklear reacts to some input only on the next frame
+            self.redraw = True
+        elif scene is None and not self.damaged:
+            glfw3_render(self.antialiasing, self.vertex_buffer_size,
+                         self.element_buffer, skip_unchanged=True)
+            if stats is not None:
+                stats.record('frame', time.perf_counter() - start)
+            return False
+
+        if self.renderThread:
+            glfw3_submit(self.antialiasing, self.vertex_buffer_size,
+                         self.element_buffer, self.clearColor, stats=stats)
+        else:
+            width, height = glfw.get_framebuffer_size(self.window)
+            gl.glViewport(0, 0, width, height)
+            gl.glClearColor(*self.clearColor)
+            gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+            if scene is not None:
+                scene(width, height)
+            glfw3_render(self.antialiasing, self.vertex_buffer_size,
+                         self.element_buffer, stats=stats)
+            glfw.swap_buffers(self.window)
+            if font_pages_update():
+                self.nuklear.forget_text_widths()
+                self.redraw = True
+        if stats is not None:
+            stats.record('frame', time.perf_counter() - start)
+        self.damaged = False
+        self.renderedFrames += 1
+        return True
+
+    def run(self, gui, scene=None):
+        while not glfw.window_should_close(self.window):
+            self.wait()
+            if glfw.window_should_close(self.window):
+                break
+            self.frame(gui, scene)
+        self.stop()
 
-    # restore the opengl state
-    gl.glUseProgram(last_program)
-    gl.glActiveTexture(last_active_texture)
-    gl.glBindTexture(gl.GL_TEXTURE_2D,
-                     last_texture)
-    gl.glBindVertexArray(last_vertex_array)
-    gl.glBindBuffer(gl.GL_ARRAY_BUFFER,
-                    last_array_buffer)
-    gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER,
-                    last_element_array_buffer)
-    gl.glBlendEquationSeparate(last_blend_equation_rgb,
-                               last_blend_equation_alpha)
-    gl.glBlendFunc(last_blend_src,
-                   last_blend_dst)
-    if last_enable_blend:
-        gl.glEnable(gl.GL_BLEND)
-    else:
-        gl.glDisable(gl.GL_BLEND)
-    if last_enable_cull_face:
-        gl.glEnable(gl.GL_CULL_FACE)
-    else:
-        gl.glDisable(gl.GL_CULL_FACE)
-    if last_enable_depth_test:
-        gl.glEnable(gl.GL_DEPTH_TEST)
-    else:
-        gl.glDisable(gl.GL_DEPTH_TEST)
-    if last_enable_scissor_test:
-        gl.glEnable(gl.GL_SCISSOR_TEST)
-    else:
-        gl.glDisable(gl.GL_SCISSOR_TEST)
-    gl.glViewport(last_viewport[0],
-                  last_viewport[1],
-                  last_viewport[2],
-                  last_viewport[3])
-    gl.glScissor(last_scissor_box[0],
-                 last_scissor_box[1],
-                 last_scissor_box[2],
-                 last_scissor_box[3])
+    # ends the render thread, if there is one, after it draws the last frame
+    def stop(self):
+        if self.renderThread:
+            if self.backend is not None:
+                self.backend.make_current()
+            render_thread_stop()
+            self.renderThread = False
@@ -23,208 +23,179 @@ import sys
 import ctypes.util
 from ctypes import (Structure, POINTER, CFUNCTYPE, byref, c_char_p, c_int, c_short,
                     c_uint, c_double, c_float, c_ushort, c_byte, c_ubyte)
-import inspect
-from enum import Enum
-
-import pynuklearc
-_nuklear = ctypes.CDLL(inspect.getfile(pynuklearc))
+import time
+from array import array
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from enum import IntEnum, IntFlag
 
+import numpy as np
 
+import pynuklearc
 
-# nuklear needs to uniquely identify widgets, and one
-# way to do so is to inspect the function caller's frame info
-# such as filename and line number.
+# nuklear_h is generated from nuklear.h by tools/generate_bindings.py.  It
+# loads pynuklearc and installs argtypes and restype on every nk_* procedure,
+# and it defines the structures (Context, Rect, Vec2, Color, Image, ...) and
+# the NK_* constants.  All of it is re-exported here, so procedures that have
+# no NuklearContext method yet can still be called directly, e.g.
 #
-# since callerFrameInfo is a procedure called from an method called
-# from a c-wrapper procedure, we need the frame info
-# from the caller which is three back.
-def callerFrameInfo():
-    previous_frame = inspect.currentframe().f_back.f_back.f_back
-    return inspect.getframeinfo(previous_frame)
-
-
-class Context(Structure):
-    pass
-
-
-class Command(Structure):
-    pass
-
-
-class DrawCommand(Structure):
-    pass
-
-
-class Color(Structure):
-    _fields_ = [('r',  c_ubyte),
-                ('g',  c_ubyte),
-                ('b',  c_ubyte),
-                ('a',  c_ubyte)]
-
-    def __init__(self, r, g, b, a):
-        self.r = r
-        self.g = g
-        self.b = b
-        self.a = a
-
-
-class ColorF(Structure):
-    _fields_ = [('r',  c_float),
-                ('g',  c_float),
-                ('b',  c_float),
-                ('a',  c_float)]
-
-    def __init__(self, r, g, b, a):
-        self.r = r
-        self.g = g
-        self.b = b
-        self.a = a
-
-
-class Vec2(Structure):
-    _fields_ = [('x',  c_float),
-                ('y',  c_float)]
-
-    def __init__(self, x, y):
-        self.x = ctypes.c_float(x)
-        self.y = ctypes.c_float(y)
-
-
-class Vec2i(Structure):
-    _fields_ = [('x',  c_short),
-                ('y',  c_short)]
-
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-
-class Rect(Structure):
-    _fields_ = [('x',  c_float),
-                ('y',  c_float),
-                ('w',  c_float),
-                ('h',  c_float)]
+#     nk.nk_plot(nuklear.ctx, nk.NK_CHART_LINES, values, len(values), 0)
+from .nuklear_h import *
+from .nuklear_h import _nuklear
+from . import nuklear_h
 
-    def __init__(self, x, y, w, h):
-        self.x = x
-        self.y = y
-        self.w = w
-        self.h = h
 
 
-class Recti(Structure):
-    _fields_ = [('x',  c_short),
-                ('y',  c_short),
-                ('w',  c_short),
-                ('h',  c_short)]
-
-    def __init__(self, x, y, w, h):
-        self.x = x
-        self.y = y
-        self.w = w
-        self.h = h
-
-
-Handle = POINTER(ctypes.c_void_p)
-
-
-class Image(Structure):
-    _fields_ = [('handle', Handle),
-                ('w',  c_short),
-                ('h',  c_short),
-                ('region',  c_int)]
-
-    def __init__(self, handle, w, h, region):
-        self.handle = handle
-        self.w = w
-        self.h = h
-        self.region = region
-
-
-class Cursor(Structure):
-    _fields_ = [('img', Image),
-                ('size',  Vec2),
-                ('offset', Vec2)]
-
-    def __init__(self, image, size, offset):
-        self.image = image
-        self.size = size
-        self.offset = offset
-
-
-class Scroll(Structure):
-    _fields_ = [('x', c_int),
-                ('y',  c_int)]
-
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-
-class Heading(Enum):
+# nuklear needs to uniquely identify tree nodes, and the wrappers do so by
+# the filename and line number of the code that pushes them.  callSite
+# looks at the raw frame, without reading the source, and caches the key
+# for nk_tree_push_hashed per code object and line number.
+#
+# depth counts the frames above callSite's caller, so callSite() is the
+# line that calls it and callSite(1) is the line that called that procedure.
+_callSites = {}
+
+def callSite(depth=0):
+    frame = sys._getframe(depth + 1)
+    site = (frame.f_code, frame.f_lineno)
+    try:
+        return _callSites[site]
+    except KeyError:
+        key = str.encode('%s:%d' % (site[0].co_filename, site[1]))
+        _callSites[site] = key
+        return key
+
+
+# Most UI strings are the same every frame, so instead of calling
+# str.encode for each of them, the wrappers share one bounded cache of
+# their UTF-8 encodings.  The least recently used strings are evicted
+# once maxsize is reached.  hits and misses count the lookups, to check
+# that maxsize fits the UI.
+class StringCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.strings = OrderedDict()
+
+    def encode(self, s):
+        try:
+            encoded = self.strings[s]
+        except KeyError:
+            self.misses += 1
+            encoded = self.strings[s] = str.encode(s)
+            if len(self.strings) > self.maxsize:
+                self.strings.popitem(last=False)
+            return encoded
+        self.hits += 1
+        self.strings.move_to_end(s)
+        return encoded
+
+    def clear(self):
+        self.strings.clear()
+        self.hits = 0
+        self.misses = 0
+
+stringCache = StringCache()
+
+
+# text for the procedures which take a NUL terminated const char*.
+# str goes through stringCache, bytes are passed as they are, and
+# anything else with the buffer protocol (memoryview, bytearray) is copied,
+# since it is not NUL terminated.
+def cString(text):
+    if isinstance(text, str):
+        return stringCache.encode(text)
+    if isinstance(text, bytes):
+        return text
+    return memoryview(text).tobytes()
+
+
+# text and its length in bytes, for the nk_*_text procedures, which take
+# an explicit length so that nuklear doesn't need to call strlen.  Writable
+# buffers are passed without copying.
+def textBuffer(text):
+    if isinstance(text, str):
+        text = stringCache.encode(text)
+    elif not isinstance(text, bytes):
+        view = memoryview(text)
+        if view.readonly:
+            text = view.tobytes()
+        else:
+            return (ctypes.c_char * view.nbytes).from_buffer(view), view.nbytes
+    return text, len(text)
+
+
+# The enums are IntEnum and the flags IntFlag, so their members are ints and
+# are passed to nuklear as they are.  Every wrapper also takes plain ints.
+# Looking up a member and OR-ing IntFlags both run Python code, so in the
+# frame loop prefer the NK_* ints from nuklear_h, e.g.
+#
+#     flags = nk.NK_WINDOW_BORDER | nk.NK_WINDOW_MOVABLE | nk.NK_WINDOW_TITLE
+class Heading(IntEnum):
     UP = 0
     RIGHT = 1
     DOWN = 2
     LEFT = 3
 
 
-class ButtonBehavior(Enum):
+class ButtonBehavior(IntEnum):
     BUTTON_DEFAULT = 0
     BUTTON_REPEATER = 1
 
 
-class Modify(Enum):
+class Modify(IntEnum):
     FIXED = 0
     MODIFIABLE = 1
 
 
-class Orientation(Enum):
+class Orientation(IntEnum):
     VERTICAL = 0
     HORIZONTAL = 1
 
 
-class CollapseStates(Enum):
+class CollapseStates(IntEnum):
     MINIMIZED = 0
     MAXIMIZED = 1
 
 
-class ShowStates(Enum):
+class ShowStates(IntEnum):
     HIDDEN = 0
     SHOWN = 1
 
 
-class ChartType(Enum):
+class ChartType(IntEnum):
     CHART_LINES = 0
     CHART_COLUMN = 1
     CHART_MAX = 2
 
 
-class ChartEvent(Enum):
+class ChartEvent(IntFlag):
     CHART_HOVERING = 1
     CHART_CLICKED = 2
 
 
-class ColorFormat(Enum):
+class ColorFormat(IntEnum):
     RGB = 0
     RGBA = 1
 
 
-class PopupType(Enum):
+class PopupType(IntEnum):
     POPUP_STATIC = 0
     POPUP_DYNAMIC = 1
 
 
-class LayoutFormat(Enum):
+class LayoutFormat(IntEnum):
     DYNAMIC = 0
     STATIC = 1
 
 
-class TreeType(Enum):
+class TreeType(IntEnum):
     TREE_NODE = 0
     TREE_TAB = 1
 
 
-class SymbolType(Enum):
+class SymbolType(IntEnum):
     SYMBOL_NONE = 0
     SYMBOL_X = 1
     SYMBOL_UNDERSCORE = 2
@@ -247,7 +218,6 @@ class SymbolType(Enum):
 # int nk_init(struct nk_context*, struct nk_allocator*, const struct nk_user_font*);
 # int nk_init_custom(struct nk_context*, struct nk_buffer *cmds, struct nk_buffer *pool, const struct nk_user_font*);
 clear = _nuklear.nk_clear
-clear.arglist = [POINTER(Context)]
 # void nk_free(struct nk_context*);
 # void nk_set_user_data(struct nk_context*, nk_handle handle);
 
@@ -256,7 +226,7 @@ clear.arglist = [POINTER(Context)]
 # Keys
 
 
-class Keys(Enum):
+class Keys(IntEnum):
     NONE = 0
     SHIFT = 1
     CTRL = 2
@@ -292,7 +262,7 @@ class Keys(Enum):
 # Buttons
 
 
-class Buttons(Enum):
+class Buttons(IntEnum):
     LEFT = 0
     MIDDLE = 1
     RIGHT = 2
@@ -301,47 +271,37 @@ class Buttons(Enum):
 
 
 input_begin = _nuklear.nk_input_begin
-input_begin.arglist = [POINTER(Context)]
 
 input_motion = _nuklear.nk_input_motion
-input_motion.arglist = [POINTER(Context), c_int, c_int]
 
 input_key = _nuklear.nk_input_key
-input_key.arglist = [POINTER(Context), c_int, c_int]
 
 input_button = _nuklear.nk_input_button
-input_button.arglist = [POINTER(Context), c_int, c_int, c_int, c_int]
 
 input_scroll = _nuklear.nk_input_scroll
-input_scroll.arglist = [POINTER(Context), Vec2]
 
-# input_char = _nuklear.nk_input_char
-# input_char.arglist = [POINTER(Context), c_char]
+input_char = _nuklear.nk_input_char
 
+input_glyph = _nuklear.nk_input_glyph
 
-# input_glyph = _nuklear.nk_input_glyph
-# input_glyph.arglist = [POINTER(Context), Glyph]
-
-# input_unicode = _nuklear.nk_input_unicode
-# input_unicode.arglist = [POINTER(Context, Rune)]
+input_unicode = _nuklear.nk_input_unicode
 
 input_end = _nuklear.nk_input_end
-input_end.arglist = [POINTER(Context)]
 
 # Drawing
 
 
-class AntiAliasing(Enum):
+class AntiAliasing(IntEnum):
     OFF = 0
     ON = 1
 
 
-class ConvertResult(Enum):
+class ConvertResult(IntFlag):
     SUCCESS = 0
     INVALID_PARAM = 1
-    COMMAND_BUFFER_FULL = 1 << 0
-    VERTEX_BUFFER_FULL = 1 << 1
-    ELEMENT_BUFFER_FULL = 1 << 2
+    COMMAND_BUFFER_FULL = 1 << 1
+    VERTEX_BUFFER_FULL = 1 << 2
+    ELEMENT_BUFFER_FULL = 1 << 3
 
 
 # const struct nk_command* nk__begin(struct nk_context*);
@@ -354,7 +314,7 @@ class ConvertResult(Enum):
 
 # Window
 
-class PanelFlags(Enum):
+class PanelFlags(IntFlag):
     WINDOW_BORDER = 1 << 0
     WINDOW_MOVABLE = 1 << 1
     WINDOW_SCALABLE = 1 << 2
@@ -370,37 +330,60 @@ class PanelFlags(Enum):
 
 # because average programmers who are English speakers like Subject-Verb-Object
 # word ordering, create an object that holds the nuklear context.
+#
+# ctx.fast is a pynuklearc.FastContext for the same nk_context.  It implements
+# the most frequently used widget, layout and window procedures natively,
+# without ctypes, so prefer it for UIs that build thousands of widgets per frame.
+# Like the methods below, it takes ints for flags and enums, e.g.
+#
+#     nuklear.fast.label("Hello", nk.NK_TEXT_LEFT)
+#
+# For its tree nodes, callSite() gives the same per line key as tree_push:
+#
+#     hash = nk.callSite()
+#     nuklear.fast.tree_push_hashed(nk.NK_TREE_NODE, "Node", nk.NK_MINIMIZED, hash, 0)
 class NuklearContext:
     def __init__(self,ctx):
         self.ctx = ctx
+        self.fast = pynuklearc.FastContext(ctypes.cast(ctx, ctypes.c_void_p).value)
+        # title -> MemoWindow, see memo_window
+        self.memoWindows = {}
+        # see commands
+        self.commandList = None
+        # the DefaultFont of a context made by create
+        self.ownedFont = None
+        # a FrameStats, if the frames are measured
+        self.stats = None
+        # the preallocated memory of the context, see init_memory
+        self.fixedMemory = None
+        # (font address, height) -> TextMeasure, see measure, and the
+        # address of the context's current font
+        self.textMeasures = {}
+        self.styleFont = ctypes.c_void_p.from_address(
+            ctypes.addressof(ctx.contents) + Context.style.offset + Style.font.offset)
 
 
 
 __begin__ = _nuklear.nk_begin
-__begin__.arglist = [POINTER(Context), c_char_p, Rect, c_uint]
-__begin__.restype = c_int
 
 def _begin(self, title, bounds, flags):
-    return __begin__(self.ctx, str.encode(title), bounds, flags)
+    return __begin__(self.ctx, cString(title), bounds, flags)
 NuklearContext.begin = _begin
 
 
 __begin_titled__ = _nuklear.nk_begin_titled
-__begin_titled__.arglist = [POINTER(Context), c_char_p, c_char_p, Rect, c_int]
-__begin_titled__.restype = c_int
 
 # if two windows are going to have the same title, you need to provide
 # a unique string "name" so that nuklear can identify it
 def _begin_titled(self, name, title, bounds, flags):
     return __begin_titled__(self.ctx,
-                            str.encode(name),
-                            str.encode(title),
+                            cString(name),
+                            cString(title),
                             bounds,
                             flags)
 NuklearContext.begin_titled = _begin_titled
 
 __end__            = _nuklear.nk_end
-__end__.arglist    = [POINTER(Context)]
 
 def _end(self):
     __end__(self.ctx)
@@ -410,76 +393,44 @@ NuklearContext.end = _end
 # struct nk_window *nk_window_find(POINTER(Context), c_char_p name);
 
 __window_get_bounds__ = _nuklear.nk_window_get_bounds
-__window_get_bounds__.arglist = [POINTER(Context)]
-__window_get_bounds__.restype = Rect
 
 
 
 __window_get_position__ = _nuklear.nk_window_get_position
-__window_get_position__.arglist = [POINTER(Context)]
-__window_get_position__.restype = Vec2
 
 __window_get_size__ = _nuklear.nk_window_get_size
-__window_get_size__.arglist = [POINTER(Context)]
-__window_get_size__.restype = Vec2
 
 __window_get_width__ = _nuklear.nk_window_get_width
-__window_get_width__.arglist = [POINTER(Context)]
-__window_get_width__.restype = c_float
 
 __window_get_height__ = _nuklear.nk_window_get_height
-__window_get_height__.arglist = [POINTER(Context)]
-__window_get_height__.restype = c_float
 
 # struct nk_panel* nk_window_get_panel(POINTER(Context));
 
 __nk_window_get_content_region__ = _nuklear.nk_window_get_content_region
-__nk_window_get_content_region__.arglist = [POINTER(Context)]
-__nk_window_get_content_region__.restype = Rect
 
 __nk_window_get_content_region_min__ = _nuklear.nk_window_get_content_region_min
-__nk_window_get_content_region_min__.arglist = [POINTER(Context)]
-__nk_window_get_content_region_min__.restype = Vec2
 
 __nk_window_get_content_region_max__ = _nuklear.nk_window_get_content_region_max
-__nk_window_get_content_region_max__.arglist = [POINTER(Context)]
-__nk_window_get_content_region_max__.restype = Vec2
 
 # Vec2 nk_window_get_content_region_size(POINTER(Context));
 # struct nk_command_buffer* nk_window_get_canvas(POINTER(Context));
 
 __window_has_focus__ = _nuklear.nk_window_has_focus
-__window_has_focus__.arglist = [POINTER(Context)]
-__window_has_focus__.restype = c_int
 
 __window_is_collapsed__ = _nuklear.nk_window_is_collapsed
-__window_is_collapsed__.arglist = [POINTER(Context), c_char_p]
-__window_is_collapsed__.restype = c_int
 
 __window_is_closed__ = _nuklear.nk_window_is_closed
-__window_is_closed__.arglist = [POINTER(Context), c_char_p]
-__window_is_closed__.restype = c_int
 
 __window_is_hidden__ = _nuklear.nk_window_is_hidden
-__window_is_hidden__.arglist = [POINTER(Context), c_char_p]
-__window_is_hidden__.restype = c_int
 
 __window_is_active__ = _nuklear.nk_window_is_active
-__window_is_active__.arglist = [POINTER(Context), c_char_p]
-__window_is_active__.restype = c_int
 
 __window_is_hovered__ = _nuklear.nk_window_is_hovered
-__window_is_hovered__.arglist = [POINTER(Context)]
-__window_is_hovered__.restype = c_int
 
 __window_is_any_hovered__ = _nuklear.nk_window_is_any_hovered
-__window_is_any_hovered__.arglist = [POINTER(Context)]
-__window_is_any_hovered__.restype = c_int
 
 
 __item_is_any_active__ = _nuklear.nk_item_is_any_active
-__item_is_any_active__.arglist = [POINTER(Context)]
-__item_is_any_active__.restype = c_int
 
 def _item_is_any_active(self):
     '''returns if any window or widgets is currently hovered or active'''
@@ -487,145 +438,103 @@ def _item_is_any_active(self):
 NuklearContext.item_is_any_active = _item_is_any_active
 
 __window_set_bounds__ = _nuklear.nk_window_set_bounds
-__window_set_bounds__.arglist = [POINTER(Context), c_char_p, Rect]
 
 __window_set_position__ = _nuklear.nk_window_set_position
-__window_set_position__.arglist = [POINTER(Context), c_char_p, Vec2]
 
 __window_set_size__ = _nuklear.nk_window_set_size
-__window_set_size__.arglist = [POINTER(Context), c_char_p, Vec2]
 
 __window_set_focus__ = _nuklear.nk_window_set_focus
-__window_set_focus__.arglist = [POINTER(Context), c_char_p]
 
 __window_close__ = _nuklear.nk_window_close
-__window_close__.arglist = [POINTER(Context), c_char_p]
 
 __window_collapse__ = _nuklear.nk_window_collapse
-__window_collapse__.arglist = [POINTER(Context), c_char_p, c_int]
 
 __window_collapse_if__ = _nuklear.nk_window_collapse_if
-__window_collapse_if__.arglist = [POINTER(Context), c_char_p, c_int, c_int]
 
 __window_show__ = _nuklear.nk_window_show
-__window_show__.arglist = [POINTER(Context), c_char_p, c_int]
 
 def _window_show(self, name, show_state):
-    __window_show__(self.ctx, name, show_state)
+    __window_show__(self.ctx, cString(name), show_state)
 NuklearContext.window_show = _window_show
 
 __window_show_if__ = _nuklear.nk_window_show_if
-__window_show_if__.arglist = [POINTER(Context), c_char_p, c_int, c_int]
 
 # Layout
 __layout_set_min_row_height__ = _nuklear.nk_layout_set_min_row_height
-__layout_set_min_row_height__.arglist = [POINTER(Context), c_float]
 
 __layout_reset_min_row_height__ = _nuklear.nk_layout_reset_min_row_height
-__layout_reset_min_row_height__.arglist = [POINTER(Context)]
 
 __layout_widget_bounds__ = _nuklear.nk_layout_widget_bounds
-__layout_widget_bounds__.arglist = [POINTER(Context)]
-__layout_widget_bounds__.restype = Rect
 
 def _layout_widget_bounds(self):
     return __layout_widget_bounds__(self.ctx)
 NuklearContext.layout_widget_bounds = _layout_widget_bounds
 
 __layout_ratio_from_pixel__ = _nuklear.nk_layout_ratio_from_pixel
-__layout_ratio_from_pixel__.arglist = [POINTER(Context), c_float]
-__layout_ratio_from_pixel__.restype = c_float
 
 __layout_row_dynamic__ = _nuklear.nk_layout_row_dynamic
-__layout_row_dynamic__.arglist = [POINTER(Context), c_float, c_int]
 
 def _layout_row_dynamic(self,height,columns):
-    __layout_row_dynamic__(self.ctx,ctypes.c_float(height), columns)
+    __layout_row_dynamic__(self.ctx, height, columns)
 NuklearContext.layout_row_dynamic = _layout_row_dynamic
 
 
 __layout_row_static__ = _nuklear.nk_layout_row_static
-__layout_row_static__.arglist = [POINTER(Context), c_float, c_int, c_int]
 
 def _layout_row_static(self,height,item_width,columns):
-    __layout_row_static__(self.ctx,ctypes.c_float(height), item_width,columns)
+    __layout_row_static__(self.ctx, height, item_width, columns)
 NuklearContext.layout_row_static = _layout_row_static
 
 
 __layout_row_begin__ = _nuklear.nk_layout_row_begin
-__layout_row_begin__.arglist = [POINTER(Context), c_int, c_float, c_int]
 
 def _layout_row_begin(self, format, row_height, columns):
-    __layout_row_begin__(self.ctx,ctypes.c_int(format.value), ctypes.c_float(row_height), ctypes.c_int(columns))
+    __layout_row_begin__(self.ctx, format, row_height, columns)
 NuklearContext.layout_row_begin = _layout_row_begin
 
 __layout_row_push__ = _nuklear.nk_layout_row_push
-__layout_row_push__.arglist = [POINTER(Context), c_float]
 
 def _layout_row_push(self, ratio_or_width):
-    __layout_row_push__(self.ctx, ctypes.c_float(ratio_or_width))
+    __layout_row_push__(self.ctx, ratio_or_width)
 NuklearContext.layout_row_push = _layout_row_push
 
 __layout_row_end__ = _nuklear.nk_layout_row_end
-__layout_row_end__.arglist = [POINTER(Context)]
 
 __layout_row__ = _nuklear.nk_layout_row
-__layout_row__.arglist = [
-    POINTER(Context), c_int, c_float, c_int, POINTER(c_float)]
 
 __layout_row_template_begin__ = _nuklear.nk_layout_row_template_begin
-__layout_row_template_begin__.arglist = [POINTER(Context), c_float]
 
 __layout_row_template_push_dynamic__ = _nuklear.nk_layout_row_template_push_dynamic
-__layout_row_template_push_dynamic__.arglist = [POINTER(Context)]
 
 __layout_row_template_push_variable__ = _nuklear.nk_layout_row_template_push_variable
-__layout_row_template_push_variable__.arglist = [POINTER(Context), c_float]
 
 __layout_row_template_push_static__ = _nuklear.nk_layout_row_template_push_static
-__layout_row_template_push_static__.arglist = [POINTER(Context), c_float]
 
 __layout_row_template_end__ = _nuklear.nk_layout_row_template_end
-__layout_row_template_end__.arglist = [POINTER(Context)]
 
 __layout_space_begin__ = _nuklear.nk_layout_space_begin
-__layout_space_begin__.arglist = [POINTER(Context), c_int, c_float, c_int]
 
 __layout_space_push__ = _nuklear.nk_layout_space_push
-__layout_space_push__.arglist = [POINTER(Context), Rect]
 
 __layout_space_end__ = _nuklear.nk_layout_space_end
-__layout_space_end__.arglist = [POINTER(Context)]
 
 __layout_space_bounds__ = _nuklear.nk_layout_space_bounds
-__layout_space_bounds__.arglist = [POINTER(Context)]
-__layout_space_bounds__.restype = Rect
 
 __layout_space_to_screen__ = _nuklear.nk_layout_space_to_screen
-__layout_space_to_screen__.arglist = [POINTER(Context), Vec2]
-__layout_space_to_screen__.restype = Vec2
 
 __layout_space_to_local__ = _nuklear.nk_layout_space_to_local
-__layout_space_to_local__.arglist = [POINTER(Context), Vec2]
-__layout_space_to_local__.restype = Vec2
 
 __layout_space_rect_to_screen__ = _nuklear.nk_layout_space_rect_to_screen
-__layout_space_rect_to_screen__.arglist = [POINTER(Context), Rect]
-__layout_space_rect_to_screen__.restype = Rect
 
 __layout_space_rect_to_local__ = _nuklear.nk_layout_space_rect_to_local
-__layout_space_rect_to_local__.arglist = [POINTER(Context), Rect]
-__layout_space_rect_to_local__.restype = Rect
 
 
 # Group
 
 __group_begin__ = _nuklear.nk_group_begin
-__group_begin__.arglist = [POINTER(Context), c_char_p, c_int]
-__group_begin__.restype = c_int
 
 def _group_begin(self, title, flags):
-    return __group_begin__(self.ctx, str.encode(title), flags.value)
+    return __group_begin__(self.ctx, cString(title), flags)
 NuklearContext.group_begin = _group_begin
 
 # int nk_group_scrolled_offset_begin(struct nk_context*, nk_uint *x_offset, nk_uint *y_offset, const char*, nk_flags);
@@ -633,7 +542,6 @@ NuklearContext.group_begin = _group_begin
 # void nk_group_scrolled_end(struct nk_context*);
 
 __group_end__ = _nuklear.nk_group_end
-__group_end__.arglist = [POINTER(Context)]
 
 def _group_end(self):
     return __group_end__(self.ctx)
@@ -646,25 +554,20 @@ NuklearContext.group_end = _group_end
 
 # Tree
 __tree_push_hashed__ = _nuklear.nk_tree_push_hashed
-__tree_push_hashed__.arglist = [
-    POINTER(Context), c_int, c_char_p, c_int, c_char_p, c_int, c_int]
-__tree_push_hashed__.restype = c_int
 
 
 def __tree_push__(ctx, theType, title, state):
-    (filename, line_number,
-     function_name, lines, index) = callerFrameInfo()
-    return __tree_push_hashed__(ctx, theType, str.encode(title), state, filename, len(filename), line_number)
+    hash = callSite(2)
+    return __tree_push_hashed__(ctx, theType, cString(title), state, hash, len(hash), 0)
 
 
 def _tree_push(self, theType, title, state):
-    return __tree_push__(self.ctx, theType.value, title, state.value)
+    return __tree_push__(self.ctx, theType, title, state)
 NuklearContext.tree_push = _tree_push
 
 def __tree_push_id__(ctx, theType, title, state, id):
-    (filename, line_number,
-     function_name, lines, index) = callerFrameInfo()
-    return __tree_push_hashed__(ctx, theType, str.encode(title), state, filename, len(filename), id)
+    hash = callSite(2)
+    return __tree_push_hashed__(ctx, theType, cString(title), state, hash, len(hash), id)
 
 def _tree_push_id(self, theType, title, state, id):
     return __tree_push_id__(self.ctx, theType, title, state, id)
@@ -674,23 +577,19 @@ NuklearContext.tree_push_id = _tree_push_id
 # int nk_tree_image_push_hashed(struct nk_context*, enum nk_tree_type, struct nk_image, const char *title, enum nk_collapse_states initial_state, const char *hash, int len,int seed);
 
 __tree_pop__ = _nuklear.nk_tree_pop
-__tree_pop__.arglist = [POINTER(Context)]
 
 def _tree_pop(self):
     __tree_pop__(self.ctx)
 NuklearContext.tree_pop = _tree_pop
 
 __tree_state_push__ = _nuklear.nk_tree_state_push
-__tree_state_push__.arglist = [
-    POINTER(Context), c_int, c_char_p, POINTER(c_int)]
-__tree_state_push__.restype = c_int
 
 def _tree_state_push(self, tree_type, title, state):
-    v = ctypes.c_int(state.value)
+    v = ctypes.c_int(state)
 
     return (__tree_state_push__(self.ctx,
-                                tree_type.value,
-                                str.encode(title),
+                                tree_type,
+                                cString(title),
                                 ctypes.byref(v)),
             v.value)
 NuklearContext.tree_state_push = _tree_state_push
@@ -702,19 +601,19 @@ NuklearContext.tree_state_push = _tree_state_push
 
 # Widget
 
-class WidgetLayoutStates(Enum):
+class WidgetLayoutStates(IntEnum):
     INVALID = 0
     VALID = 1
     ROM = 2
 
 
-class WidgetStates(Enum):
-    MODIFIED = 1 << 0
-    INACTIVE = 1 << 1
-    ENTERED = 1 << 2
-    HOVER = 1 << 3
-    ACTIVED = 1 << 4
-    LEFT = 1 << 5
+class WidgetStates(IntFlag):
+    MODIFIED = 1 << 1
+    INACTIVE = 1 << 2
+    ENTERED = 1 << 3
+    HOVER = 1 << 4
+    ACTIVED = 1 << 5
+    LEFT = 1 << 6
     HOVERED = HOVER | MODIFIED
     ACTIVE = ACTIVED | MODIFIED
 
@@ -722,8 +621,6 @@ class WidgetStates(Enum):
 # enum nk_widget_layout_states nk_widget(struct nk_rect*, const struct nk_context*);
 # enum nk_widget_layout_states nk_widget_fitting(struct nk_rect*, struct nk_context*, struct nk_vec2);
 __widget_bounds__ = _nuklear.nk_widget_bounds
-__widget_bounds__.arglist = [POINTER(Context)]
-__widget_bounds__.restype = Rect
 
 def _widget_bounds(self):
     return __widget_bounds__(self.ctx)
@@ -732,16 +629,12 @@ NuklearContext.widget_bounds = _widget_bounds
 # struct nk_vec2 nk_widget_position(struct nk_context*);
 # struct nk_vec2 nk_widget_size(struct nk_context*);
 __widget_width__ = _nuklear.nk_widget_width
-__widget_width__.arglist = [POINTER(Context)]
-__widget_width__.restype = c_float
 
 def _widget_width(self):
     return __widget_width__(self.ctx)
 NuklearContext.widget_width = _widget_width
 
 __widget_height__ = _nuklear.nk_widget_height
-__widget_height__.arglist = [POINTER(Context)]
-__widget_height__.restype = c_float
 # int nk_widget_is_hovered(struct nk_context*);
 # int nk_widget_is_mouse_clicked(struct nk_context*, enum nk_buttons);
 # int nk_widget_has_mouse_click_down(struct nk_context*, enum nk_buttons, int down);
@@ -750,7 +643,7 @@ __widget_height__.restype = c_float
 
 # Text
 
-class TextAlign(Enum):
+class TextAlign(IntFlag):
     LEFT = 0x01
     CENTERED = 0x02
     RIGHT = 0x04
@@ -764,35 +657,40 @@ class TextAlign(Enum):
 
 
 __text__ = _nuklear.nk_text
-__text__.arglist = [POINTER(Context), c_char_p, c_int, c_int]
 
+# length counts bytes of the encoded text; None means all of it
 def _text(self, text, length, alignment):
-    __text__(self.ctx,str.encode(text),length, alignment.value)
+    data, size = textBuffer(text)
+    __text__(self.ctx, data, size if length is None else length, alignment)
 NuklearContext.text = _text
 
-# void nk_text_colored(struct nk_context*, const char*, int, nk_flags, struct nk_color);
-# void nk_text_wrap(struct nk_context*, const char*, int);
+__text_colored__ = _nuklear.nk_text_colored
+__text_wrap__ = _nuklear.nk_text_wrap
+
 # void nk_text_wrap_colored(struct nk_context*, const char*, int, struct nk_color);
 
+# the label procedures below call the nk_*_text variants with the length
+# from textBuffer, so that nuklear skips the strlen
+
 __label__ = _nuklear.nk_label
-__label__.arglist = [POINTER(Context), c_char_p, c_uint]
 
 def _label(self, text, alignment):
-    __label__(self.ctx, str.encode(text), alignment.value)
+    data, length = textBuffer(text)
+    __text__(self.ctx, data, length, alignment)
 NuklearContext.label = _label
 
 __label_colored__ = _nuklear.nk_label_colored
-__label_colored__.arglist = [POINTER(Context), c_char_p, c_int, Color]
 
 def _label_colored(self, text, align, color):
-    __label_colored__(self.ctx,str.encode(text),align.value,color)
+    data, length = textBuffer(text)
+    __text_colored__(self.ctx, data, length, align, color)
 NuklearContext.label_colored = _label_colored
 
 __label_wrap__ = _nuklear.nk_label_wrap
-__label_wrap__.arglist = [POINTER(Context), c_char_p]
 
 def _label_wrap(self, text):
-    __label_wrap__(self.ctx,str.encode(text))
+    data, length = textBuffer(text)
+    __text_wrap__(self.ctx, data, length)
 NuklearContext.label_wrap = _label_wrap
 
 # void nk_label_colored_wrap(struct nk_context*, const char*, struct nk_color);
@@ -817,45 +715,39 @@ NuklearContext.label_wrap = _label_wrap
 
 # Button
 
-# int nk_button_text(struct nk_context*, const char *title, int len);
 __button_label__ = _nuklear.nk_button_label
-__button_label__.arglist = [POINTER(Context), c_char_p]
-__button_label__.restype = c_int
+__button_text__ = _nuklear.nk_button_text
 
 def _button_label(self, title, active=False):
     if active:
-        return __button_label__(self.ctx, str.encode(title))
+        data, length = textBuffer(title)
+        return __button_text__(self.ctx, data, length)
     else:
-        return __button_label_active__(self.ctx, str.encode(title))
+        return __button_label_active__(self.ctx, cString(title))
 NuklearContext.button_label = _button_label
 
 __button_color__ = _nuklear.nk_button_color
-__button_color__.arglist = [POINTER(Context), Color]
-__button_color__.restype = c_int
 
 def _button_color(self,color):
     return __button_color__(self.ctx,color)
 NuklearContext.button_color = _button_color
 
 __button_symbol__ = _nuklear.nk_button_symbol
-__button_symbol__.arglist = [POINTER(Context), c_int]
-__button_symbol__.restype = c_int
 
 def _button_symbol(self, symbol):
-    return __button_symbol__(self.ctx, symbol.value)
+    return __button_symbol__(self.ctx, symbol)
 NuklearContext.button_symbol = _button_symbol
 
 # int nk_button_image(struct nk_context*, struct nk_image img);
 
 __button_symbol_label__ = _nuklear.nk_button_symbol_label
-__button_symbol_label__.arglist = [POINTER(Context), c_int, c_char_p, c_int]
-__button_symbol_label__.restype = c_int
+__button_symbol_text__ = _nuklear.nk_button_symbol_text
 
 def _button_symbol_label(self,symbol,label,align):
-    return __button_symbol_label__(self.ctx, symbol.value, str.encode(label), align.value)
+    data, length = textBuffer(label)
+    return __button_symbol_text__(self.ctx, symbol, data, length, align)
 NuklearContext.button_symbol_label = _button_symbol_label
 
-# int nk_button_symbol_text(struct nk_context*, enum nk_symbol_type, const char*, int, nk_flags alignment);
 # int nk_button_image_label(struct nk_context*, struct nk_image img, const char*, nk_flags text_alignment);
 # int nk_button_image_text(struct nk_context*, struct nk_image img, const char*, int, nk_flags alignment);
 # int nk_button_text_styled(struct nk_context*, const struct nk_style_button*, const char *title, int len);
@@ -869,10 +761,9 @@ NuklearContext.button_symbol_label = _button_symbol_label
 
 
 __button_set_behavior__ = _nuklear.nk_button_set_behavior
-__button_set_behavior__.arglist = [POINTER(Context), c_int]
 
 def _button_set_behavior(self, behavior):
-    __button_set_behavior__(self.ctx, behavior.value)
+    __button_set_behavior__(self.ctx, behavior)
 NuklearContext.button_set_behavior = _button_set_behavior
 
 # int nk_button_push_behavior(struct nk_context*, enum nk_button_behavior);
@@ -886,16 +777,15 @@ NuklearContext.button_set_behavior = _button_set_behavior
 # unsigned nk_check_flags_text(struct nk_context*, const char*, int, unsigned int flags, unsigned int value);
 
 __checkbox_label__ = _nuklear.nk_checkbox_label
-__checkbox_label__.arglist = [POINTER(Context), c_char_p, POINTER(c_int)]
-__checkbox_label__.restype = c_int
+__checkbox_text__ = _nuklear.nk_checkbox_text
 
 def _checkbox_label(self, text, active):
     a = ctypes.c_int(active)
-    wasModified = __checkbox_label__(self.ctx,str.encode(text),ctypes.byref(a))
+    data, length = textBuffer(text)
+    wasModified = __checkbox_text__(self.ctx, data, length, ctypes.byref(a))
     return (wasModified, a.value)
 NuklearContext.checkbox_label = _checkbox_label
 
-# int nk_checkbox_text(struct nk_context*, const char*, int, int *active);
 # int nk_checkbox_flags_label(struct nk_context*, const char*, unsigned int *flags, unsigned int value);
 # int nk_checkbox_flags_text(struct nk_context*, const char*, int, unsigned int *flags, unsigned int value);
 
@@ -906,23 +796,21 @@ NuklearContext.checkbox_label = _checkbox_label
 # int nk_radio_text(struct nk_context*, const char*, int, int *active);
 
 __option_label__ = _nuklear.nk_option_label
-__option_label__.arglist = [POINTER(Context), c_char_p, c_int]
-__option_label__.restype = c_int
+__option_text__ = _nuklear.nk_option_text
 
 def _option_label(self, label, active):
-    return __option_label__(self.ctx, str.encode(label), active)
+    data, length = textBuffer(label)
+    return __option_text__(self.ctx, data, length, active)
 NuklearContext.option_label = _option_label
 
-# int nk_option_text(struct nk_context*, const char*, int, int active);
 
 __selectable_label__ = _nuklear.nk_selectable_label
-__selectable_label__.arglist = [
-    POINTER(Context), c_char_p, c_int, POINTER(c_int)]
-__selectable_label__.restype = c_int
+__selectable_text__ = _nuklear.nk_selectable_text
 
 def _selectable_label(self, label, align, value):
     a = ctypes.c_int(value)
-    wasModified = __selectable_label__(self.ctx, str.encode(label), align.value, ctypes.byref(a))
+    data, length = textBuffer(label)
+    wasModified = __selectable_text__(self.ctx, data, length, align, ctypes.byref(a))
     return (wasModified, a.value)
 NuklearContext.selectable_label = _selectable_label
 
@@ -943,28 +831,20 @@ NuklearContext.selectable_label = _selectable_label
 
 
 __slide_int__ = _nuklear.nk_slide_int
-__slide_int__.arglist = [POINTER(Context), c_int, c_int, c_int, c_int]
-__slide_int__.restype = c_int
 
 def _slide_int(self, minV, val, maxV, step):
-    return __slide_int__(self.ctx, c_int(minV), c_int(val), c_int(maxV), c_int(step))
+    return __slide_int__(self.ctx, minV, val, maxV, step)
 NuklearContext.slide_int = _slide_int
 
 __slider_float__ = _nuklear.nk_slider_float
-__slider_float__.arglist = [
-    POINTER(Context), c_float, POINTER(c_float), c_float, c_float]
-__slider_float__.restype = c_int
 
 def _slider_float(self, minV, value, maxV, step):
     v = ctypes.c_float(value)
-    wasModified = __slider_float__(self.ctx, c_float(minV), ctypes.byref(v), c_float(maxV), c_float(step))
+    wasModified = __slider_float__(self.ctx, minV, ctypes.byref(v), maxV, step)
     return (wasModified,v.value)
 NuklearContext.slider_float = _slider_float
 
 __slider_int__ = _nuklear.nk_slider_int
-__slider_int__.arglist = [
-    POINTER(Context), c_int, POINTER(c_int), c_int, c_int]
-__slider_int__.restype = c_int
 
 def _slider_int(self, minV, value, maxV, step):
     v = ctypes.c_int(value)
@@ -973,12 +853,10 @@ def _slider_int(self, minV, value, maxV, step):
 NuklearContext.slider_int = _slider_int
 
 __progress__ = _nuklear.nk_progress
-__progress__.arglist = [POINTER(Context), POINTER(c_int), c_int, c_int]
-__progress__.restype = c_int
 
 def _progress(self, cur, max, is_modifyable):
-    v = ctypes.c_int(cur)
-    wasModified = __progress__(self.ctx, ctypes.byref(v), max, is_modifyable.value)
+    v = nk_size(cur)
+    wasModified = __progress__(self.ctx, ctypes.byref(v), max, is_modifyable)
     return (wasModified, v.value)
 NuklearContext.progress = _progress
 
@@ -988,11 +866,9 @@ NuklearContext.progress = _progress
 
 # ColorPicker#
 __color_picker__ = _nuklear.nk_color_picker
-__color_picker__.arglist = [POINTER(Context), ColorF, c_int]
-__color_picker__.restype = ColorF
 
 def _color_picker(self, color, format):
-    return __color_picker__(self.ctx, color, format.value)
+    return __color_picker__(self.ctx, color, format)
 NuklearContext.color_picker = _color_picker
 
 # int nk_color_pick(struct nk_context*, struct nk_colorf*, enum nk_color_format);
@@ -1001,74 +877,65 @@ NuklearContext.color_picker = _color_picker
 # Properties
 
 __property_int__ = _nuklear.nk_property_int
-__property_int__.arglist = [
-    POINTER(Context), c_char_p, c_int, c_int, c_int, c_int, c_float]
 
 def _property_int(self, name, minV, val, maxV, step, inc_per_pixel):
     v = ctypes.c_int(val)
     __property_int__(self.ctx,
-                     str.encode(name),
+                     cString(name),
                      minV,
                      ctypes.byref(v),
                      maxV,
                      step,
-                     c_float(inc_per_pixel))
+                     inc_per_pixel)
     return v.value
 NuklearContext.property_int = _property_int
 
 __property_float__ = _nuklear.nk_property_float
-__property_float__.arglist = [POINTER(Context), c_char_p, c_float, POINTER(c_float), c_float, c_float, c_float]
 
 def _property_float(self, name, minV, val, maxV, step, inc_per_pixel):
     v = ctypes.c_float(val)
     __property_float__(self.ctx,
-                       str.encode(name),
-                       c_float(minV),
+                       cString(name),
+                       minV,
                        ctypes.byref(v),
-                       c_float(maxV),
-                       c_float(step),
-                       c_float(inc_per_pixel))
+                       maxV,
+                       step,
+                       inc_per_pixel)
     return v.value
 NuklearContext.property_float = _property_float
 
 # void nk_property_double(struct nk_context*, const char *name, double min, double *val, double max, double step, float inc_per_pixel);
 
 __propertyi__ = _nuklear.nk_propertyi
-__propertyi__.arglist = [
-    POINTER(Context), c_char_p, c_int, c_int, c_int, c_int, c_float]
-__propertyi__.restype = c_int
 
 def _propertyi(self, name, minVal, val, maxVal, step, inc_per_pixel):
     return __propertyi__(self.ctx,
-                         str.encode(name),
+                         cString(name),
                          minVal,
                          val,
                          maxVal,
                          step,
-                         ctypes.c_float(inc_per_pixel))
+                         inc_per_pixel)
 NuklearContext.propertyi = _propertyi
 
 __propertyf__ = _nuklear.nk_propertyf
-__propertyf__.arglist = [
-    POINTER(Context), c_char_p, c_float, c_float, c_float, c_float, c_float]
-__propertyf__.restype = c_float
 
 def _propertyf(self, name, minVal, val, maxVal, step, inc_per_pixel):
     return __propertyf__(self.ctx,
-                         str.encode(name),
-                         c_float(minVal),
-                         c_float(val),
-                         c_float(maxVal),
-                         c_float(step),
-                         c_float(inc_per_pixel))
+                         cString(name),
+                         minVal,
+                         val,
+                         maxVal,
+                         step,
+                         inc_per_pixel)
 NuklearContext.propertyf = _propertyf
 
 # double nk_propertyd(struct nk_context*, const char *name, double min, double val, double max, double step, float inc_per_pixel);
 
 
 # TextEdit
-class EditFlags(Enum):
-    DEFAULT = 0,
+class EditFlags(IntFlag):
+    DEFAULT = 0
     READ_ONLY = 1 << 0
     AUTO_SELECT = 1 << 1
     SIG_ENTER = 1 << 2
@@ -1083,14 +950,14 @@ class EditFlags(Enum):
     GOTO_END_ON_ACTIVATE = 1 << 11
 
 
-class EditTypes(Enum):
+class EditTypes(IntFlag):
     SIMPLE = EditFlags.ALWAYS_INSERT_MODE
-    FIELD = SIMPLE.value | EditFlags.SELECTABLE.value | EditFlags.CLIPBOARD.value
-    BOX = EditFlags.ALWAYS_INSERT_MODE.value | EditFlags.SELECTABLE.value | EditFlags.MULTILINE.value | EditFlags.ALLOW_TAB.value | EditFlags.CLIPBOARD.value
-    EDITOR = EditFlags.SELECTABLE.value | EditFlags.MULTILINE.value | EditFlags.ALLOW_TAB.value | EditFlags.CLIPBOARD.value
+    FIELD = SIMPLE | EditFlags.SELECTABLE | EditFlags.CLIPBOARD
+    BOX = EditFlags.ALWAYS_INSERT_MODE | EditFlags.SELECTABLE | EditFlags.MULTILINE | EditFlags.ALLOW_TAB | EditFlags.CLIPBOARD
+    EDITOR = EditFlags.SELECTABLE | EditFlags.MULTILINE | EditFlags.ALLOW_TAB | EditFlags.CLIPBOARD
 
 
-class EditEvents(Enum):
+class EditEvents(IntFlag):
     ACTIVE = 1 << 0
     INACTIVE = 1 << 1
     ACTIVATED = 1 << 2
@@ -1108,18 +975,15 @@ filter_binary = _nuklear.nk_filter_binary
 
 
 __edit_string__ = _nuklear.nk_edit_string
-__edit_string__.arglist = [
-    POINTER(Context), c_int, c_char_p, POINTER(c_int), c_int, ctypes.c_void_p]
-__edit_string__.restype = c_int
 
 
 def _edit_string(self, flags, memory, length, maxV, filterF):
     l = ctypes.c_int(length)
     return (__edit_string__(self.ctx,
-                            c_int(flags.value.value),
+                            flags,
                             memory,
                             ctypes.byref(l),
-                            c_int(maxV),
+                            maxV,
                             filterF),
             l.value)
 NuklearContext.edit_string = _edit_string
@@ -1131,43 +995,35 @@ NuklearContext.edit_string = _edit_string
 
 # Chart
 __chart_begin__ = _nuklear.nk_chart_begin
-__chart_begin__.arglist = [POINTER(Context), c_int, c_int, c_float, c_float]
-__chart_begin__.restype = c_int
 
 def _chart_begin(self,chart_type,count,minV,maxV):
-    return __chart_begin__(self.ctx,chart_type.value,count,c_float(minV),c_float(maxV))
+    return __chart_begin__(self.ctx, chart_type, count, minV, maxV)
 NuklearContext.chart_begin = _chart_begin
 
 # int nk_chart_begin_colored(struct nk_context*, enum nk_chart_type, struct nk_color, struct nk_color active, int num, float min, float max);
 
 __chart_add_slot__ = _nuklear.nk_chart_add_slot
-__chart_add_slot__.arglist = [POINTER(Context), c_int, c_int, c_float, c_float]
 
 def _chart_add_slot(self, chart_type, count, minV, maxV):
-    __chart_add_slot__(self.ctx, c_int(chart_type.value), c_int(count), c_float(minV), c_float(maxV))
+    __chart_add_slot__(self.ctx, chart_type, count, minV, maxV)
 NuklearContext.chart_add_slot = _chart_add_slot
 
 # void nk_chart_add_slot_colored(struct nk_context *ctx, const enum nk_chart_type, struct nk_color, struct nk_color active, int count, float min_value, float max_value);
 
 __chart_push__ = _nuklear.nk_chart_push
-__chart_push__.arglist = [POINTER(Context), float]
-__chart_push__.restype = c_int
 
 def _chart_push(self,value):
-    return __chart_push__(self.ctx,c_float(value))
+    return __chart_push__(self.ctx, value)
 NuklearContext.chart_push = _chart_push
 
 
 __chart_push_slot__ = _nuklear.nk_chart_push_slot
-__chart_push_slot__.arglist = [POINTER(Context), c_float, c_int]
-__chart_push_slot__.restype = c_int
 
 def _chart_push_slot(self, val, slot):
-    return __chart_push_slot__(self.ctx, c_float(val), c_int(slot))
+    return __chart_push_slot__(self.ctx, val, slot)
 NuklearContext.chart_push_slot = _chart_push_slot
 
 __chart_end__ = _nuklear.nk_chart_end
-__chart_end__.arglist = [POINTER(Context)]
 
 def _chart_end(self):
     __chart_end__(self.ctx)
@@ -1180,18 +1036,15 @@ NuklearContext.chart_end = _chart_end
 # Popup
 
 __popup_begin__ = _nuklear.nk_popup_begin
-__popup_begin__.arglist = [POINTER(Context), c_int, c_char_p, c_int, Rect]
-__popup_begin__.restype = c_int
 
 def _popup_begin(self, theType, title, flags, rect):
-    return __popup_begin__(self.ctx, theType.value, str.encode(title), flags.value, rect)
+    return __popup_begin__(self.ctx, theType, cString(title), flags, rect)
 NuklearContext.popup_begin = _popup_begin
 
 
 # void nk_popup_close(struct nk_context*);
 
 __popup_end__ = _nuklear.nk_popup_end
-__popup_end__.arglist = [POINTER(Context)]
 
 def _popup_end(self):
     __popup_end__(self.ctx)
@@ -1202,16 +1055,13 @@ NuklearContext.popup_end = _popup_end
 
 # ComboBox
 __combo__ = _nuklear.nk_combo
-__combo__.arglist = [POINTER(Context), POINTER(
-    POINTER(c_char_p)), c_int, c_int, c_int, Vec2]
-__combo__.restype = c_int
 
 def _combo(self, items, selected, item_height, size):
     count = len(items)
 
     ctypesList = []
     for x in range(count):
-        ctypesList.append(str.encode(items[x]))
+        ctypesList.append(cString(items[x]))
     arr = (ctypes.c_char_p * len(ctypesList)) (*ctypesList)
 
     return __combo__(self.ctx, arr, count, selected, item_height, size)
@@ -1230,8 +1080,6 @@ NuklearContext.combo = _combo
 # int nk_combo_begin_text(struct nk_context*, const char *selected, int, struct nk_vec2 size);
 # int nk_combo_begin_label(struct nk_context*, const char *selected, struct nk_vec2 size);
 __combo_begin_color__ = _nuklear.nk_combo_begin_color
-__combo_begin_color__.arglist = [POINTER(Context), Color, Vec2]
-__combo_begin_color__.restype = c_int
 
 def _combo_begin_color(self, color, size):
     return __combo_begin_color__(self.ctx, color, size)
@@ -1251,7 +1099,6 @@ NuklearContext.combo_begin_color = _combo_begin_color
 # int nk_combo_item_symbol_text(struct nk_context*, enum nk_symbol_type, const char*, int, nk_flags alignment);
 # void nk_combo_close(struct nk_context*);
 __combo_end__ = _nuklear.nk_combo_end
-__combo_end__.arglist = [POINTER(Context)]
 
 def _combo_end(self):
     __combo_end__(self.ctx)
@@ -1259,20 +1106,17 @@ NuklearContext.combo_end = _combo_end
 
 # Contextual
 __contextual_begin__ = _nuklear.nk_contextual_begin
-__contextual_begin__.arglist = [POINTER(Context), c_int, Vec2, Rect]
-__contextual_begin__.restype = c_int
 
 def _contextual_begin(self,flags, size, triggerBounds):
     return __contextual_begin__(self.ctx,flags, size, triggerBounds)
 NuklearContext.contextual_begin = _contextual_begin
 
-# int nk_contextual_item_text(struct nk_context*, const char*, int,nk_flags align);
 __contextual_item_label__ = _nuklear.nk_contextual_item_label
-__contextual_item_label__.arglist = [POINTER(Context), c_char_p, c_int]
-__contextual_item_label__.restype = c_int
+__contextual_item_text__ = _nuklear.nk_contextual_item_text
 
 def _contextual_item_label(self, text, align):
-    return __contextual_item_label__(self.ctx, str.encode(text), align.value)
+    data, length = textBuffer(text)
+    return __contextual_item_text__(self.ctx, data, length, align)
 NuklearContext.contextual_item_label = _contextual_item_label
 
 
@@ -1282,7 +1126,6 @@ NuklearContext.contextual_item_label = _contextual_item_label
 # int nk_contextual_item_symbol_text(struct nk_context*, enum nk_symbol_type, const char*, int, nk_flags alignment);
 # void nk_contextual_close(struct nk_context*);
 __contextual_end__ = _nuklear.nk_contextual_end
-__contextual_end__.arglist = [POINTER(Context)]
 
 def _contextual_end(self):
     __contextual_end__(self.ctx)
@@ -1290,10 +1133,9 @@ NuklearContext.contextual_end = _contextual_end
 
 # Tooltip
 __tooltip__ = _nuklear.nk_tooltip
-__tooltip__.arglist = [POINTER(Context), c_char_p]
 
 def _tooltip(self, text):
-    __tooltip__(self.ctx, str.encode(text))
+    __tooltip__(self.ctx, cString(text))
 NuklearContext.tooltip = _tooltip
 
 # int nk_tooltip_begin(struct nk_context*, float width);
@@ -1302,27 +1144,23 @@ NuklearContext.tooltip = _tooltip
 
 # Menu
 __menubar_begin__ = _nuklear.nk_menubar_begin
-__menubar_begin__.arglist = [POINTER(Context)]
 
 def _menubar_begin(self):
     __menubar_begin__(self.ctx)
 NuklearContext.menubar_begin = _menubar_begin
 
 __menubar_end__ = _nuklear.nk_menubar_end
-__menubar_end__.arglist = [POINTER(Context)]
 
 def _menubar_end(self):
     __menubar_end__(self.ctx)
 NuklearContext.menubar_end = _menubar_end
 
-# int nk_menu_begin_text(struct nk_context*, const char* title, int title_len, nk_flags align, struct nk_vec2 size);
-
 __menu_begin_label__ = _nuklear.nk_menu_begin_label
-__menu_begin_label__.arglist = [POINTER(Context), c_char_p, c_int, Vec2]
-__menu_begin_label__.restype = c_int
+__menu_begin_text__ = _nuklear.nk_menu_begin_text
 
 def _menu_begin_label(self,text,align,size):
-    return __menu_begin_label__(self.ctx,str.encode(text),align.value,size)
+    data, length = textBuffer(text)
+    return __menu_begin_text__(self.ctx, data, length, align, size)
 NuklearContext.menu_begin_label = _menu_begin_label
 
 # int nk_menu_begin_image(struct nk_context*, const char*, struct nk_image, struct nk_vec2 size);
@@ -1331,14 +1169,12 @@ NuklearContext.menu_begin_label = _menu_begin_label
 # int nk_menu_begin_symbol(struct nk_context*, const char*, enum nk_symbol_type, struct nk_vec2 size);
 # int nk_menu_begin_symbol_text(struct nk_context*, const char*, int,nk_flags align,enum nk_symbol_type, struct nk_vec2 size);
 # int nk_menu_begin_symbol_label(struct nk_context*, const char*, nk_flags align,enum nk_symbol_type, struct nk_vec2 size);
-# int nk_menu_item_text(struct nk_context*, const char*, int,nk_flags align);
-
 __menu_item_label__ = _nuklear.nk_menu_item_label
-__menu_item_label__.arglist = [POINTER(Context), c_char_p, c_int]
-__menu_item_label__.restype = c_int
+__menu_item_text__ = _nuklear.nk_menu_item_text
 
 def _menu_item_label(self, label, align):
-    return __menu_item_label__(self.ctx,str.encode(label), align.value)
+    data, length = textBuffer(label)
+    return __menu_item_text__(self.ctx, data, length, align)
 NuklearContext.menu_item_label = _menu_item_label
 
 # int nk_menu_item_image_label(struct nk_context*, struct nk_image, const char*, nk_flags alignment);
@@ -1348,7 +1184,6 @@ NuklearContext.menu_item_label = _menu_item_label
 # void nk_menu_close(struct nk_context*);
 
 __menu_end__ = _nuklear.nk_menu_end
-__menu_end__.arglist = [POINTER(Context)]
 
 def _menu_end(self):
     __menu_end__(self.ctx)
@@ -1357,7 +1192,7 @@ NuklearContext.menu_end = _menu_end
 
 # Style
 
-class StyleColors(Enum):
+class StyleColors(IntEnum):
     TEXT = 0
     WINDOW = 1
     HEADER = 2
@@ -1389,7 +1224,7 @@ class StyleColors(Enum):
     COUNT = 28
 
 
-class StyleCursor(Enum):
+class StyleCursor(IntEnum):
     ARROW = 0
     TEXT = 1
     MOVE = 2
@@ -1417,48 +1252,36 @@ class StyleCursor(Enum):
 # int nk_style_push_color(struct nk_context*, struct nk_color*, struct nk_color);
 
 __style_pop_font__ = _nuklear.nk_style_pop_font
-__style_pop_font__.arglist = [POINTER(Context)]
-__style_pop_font__.restype = c_int
 
 def _style_pop_font(self):
     return __style_pop_font__(self.ctx)
 NuklearContext.style_pop_font = _style_pop_font
 
 __style_pop_float__ = _nuklear.nk_style_pop_float
-__style_pop_float__.arglist = [POINTER(Context)]
-__style_pop_float__.restype = c_int
 
 def _style_pop_float(self):
     return __style_pop_float__(self.ctx)
 NuklearContext.style_pop_float = _style_pop_float
 
 __style_pop_vec2__ = _nuklear.nk_style_pop_vec2
-__style_pop_vec2__.arglist = [POINTER(Context)]
-__style_pop_vec2__.restype = c_int
 
 def _style_pop_vec2(self):
     return __style_pop_vec2__(self.ctx)
 NuklearContext.style_pop_vec2 = _style_pop_vec2
 
 __style_pop_style_item__ = _nuklear.nk_style_pop_style_item
-__style_pop_style_item__.arglist = [POINTER(Context)]
-__style_pop_style_item__.restype = c_int
 
 def _style_pop_style_item(self):
     return __style_pop_style_item__(self.ctx)
 NuklearContext.style_pop_style_item = _style_pop_style_item
 
 __style_pop_flags__ = _nuklear.nk_style_pop_flags
-__style_pop_flags__.arglist = [POINTER(Context)]
-__style_pop_flags__.restype = c_int
 
 def _style_pop_flags(self):
     return __style_pop_flags__(self.ctx)
 NuklearContext.style_pop_flags = _style_pop_flags
 
 __style_pop_color__ = _nuklear.nk_style_pop_color
-__style_pop_color__.arglist = [POINTER(Context)]
-__style_pop_color__.restype = c_int
 
 def _style_pop_color(self):
     return __style_pop_color__(self.ctx)
@@ -1474,11 +1297,9 @@ NuklearContext.style_pop_color = _style_pop_color
 # struct nk_color nk_rgb_f(float r, float g, float b);
 # struct nk_color nk_rgb_fv(const float *rgb);
 __rgb_cf__ = _nuklear.nk_rgb_cf
-__rgb_cf__.arglist = [ColorF]
-__rgb_cf__.restype = Color
 
 def _rgb_cf(self,colorf):
-    return __rgb_cf__(self.ctx, colorf)
+    return __rgb_cf__(colorf)
 NuklearContext.rgb_cf = _rgb_cf
 
 # struct nk_color nk_rgb_hex(const char *rgb);
@@ -1575,12 +1396,12 @@ NuklearContext.rgb_cf = _rgb_cf
 # Font
 
 
-class FontCoordType(Enum):
+class FontCoordType(IntEnum):
     UV = 0
     PIXEL = 1
 
 
-class FontAtlasFormat(Enum):
+class FontAtlasFormat(IntEnum):
     ALPHA8 = 0
     RGBA32 = 1
 
@@ -1610,12 +1431,12 @@ class FontAtlasFormat(Enum):
 # Memory Buffer
 
 
-class AllocationType(Enum):
+class AllocationType(IntEnum):
     FIXED = 0
     DYNAMIC = 1
 
 
-class BufferAllocationType(Enum):
+class BufferAllocationType(IntEnum):
     FRONT = 0
     BACK = 1
     MAX = 2
@@ -1671,12 +1492,12 @@ class BufferAllocationType(Enum):
 # Text Editor
 
 
-class TextEditType(Enum):
+class TextEditType(IntEnum):
     SINGLE_LINE = 0
     MULTI_LINE = 1
 
 
-class TextEditMode(Enum):
+class TextEditMode(IntEnum):
     VIEW = 0
     INSERT = 1
     REPLACE = 2
@@ -1703,7 +1524,7 @@ class TextEditMode(Enum):
 # void nk_textedit_redo(struct nk_text_edit*);
 
 # Drawing
-class CommandType(Enum):
+class CommandType(IntEnum):
     NOP = 0
     SCISSOR = 1
     LINE = 2
@@ -1725,7 +1546,7 @@ class CommandType(Enum):
     CUSTOM = 18
 
 
-class CommandScissor(Enum):
+class CommandScissor(IntEnum):
     OFF = 0
     ON = 1
 
@@ -1801,12 +1622,12 @@ class CommandScissor(Enum):
 # Draw List
 
 # typedef nk_ushort nk_draw_index;
-class DrawListStroke(Enum):
+class DrawListStroke(IntEnum):
     STROKE_OPEN = 0
     STROKE_CLOSED = 1
 
 
-class DrawVertexLayoutAttribute(Enum):
+class DrawVertexLayoutAttribute(IntEnum):
     POSITION = 0
     COLOR = 1
     TEXCOORD = 2
@@ -1845,7 +1666,7 @@ class DrawVertexLayoutAttribute(Enum):
 
 # GUI
 
-class StyleItemType(Enum):
+class StyleItemType(IntEnum):
     COLOR = 0
     IMAGE = 1
 
@@ -1855,12 +1676,12 @@ class StyleItemType(Enum):
 # };
 
 
-class StyleHeaderAlign(Enum):
+class StyleHeaderAlign(IntEnum):
     LEFT = 0
     RIGHT = 1
 
 
-class PanelType(Enum):
+class PanelType(IntFlag):
     WINDOW = 1 << 0
     GROUP = 1 << 1
     POPUP = 1 << 2
@@ -1870,13 +1691,13 @@ class PanelType(Enum):
     TOOLTIP = 1 << 7
 
 
-class PanelSet(Enum):
-    NONBLOCK = PanelType.CONTEXTUAL.value | PanelType.COMBO.value | PanelType.MENU.value | PanelType.TOOLTIP.value
-    POPUP = NONBLOCK | PanelType.POPUP.value
-    SUB = POPUP | PanelType.GROUP.value
+class PanelSet(IntFlag):
+    NONBLOCK = PanelType.CONTEXTUAL | PanelType.COMBO | PanelType.MENU | PanelType.TOOLTIP
+    POPUP = NONBLOCK | PanelType.POPUP
+    SUB = POPUP | PanelType.GROUP
 
 
-class PanelRowLayoutType(Enum):
+class PanelRowLayoutType(IntEnum):
     DYNAMIC_FIXED = 0
     DYNAMIC_ROW = 1
     DYNAMIC_FREE = 2
@@ -1897,7 +1718,7 @@ class PanelRowLayoutType(Enum):
 WINDOW_PRIVATE = 1 << 11
 WINDOW_DYNAMIC = WINDOW_PRIVATE
 WINDOW_ROM = 1 << 12
-WINDOW_NOT_INTERACTIVE = WINDOW_ROM | PanelFlags.WINDOW_NO_INPUT.value
+WINDOW_NOT_INTERACTIVE = WINDOW_ROM | PanelFlags.WINDOW_NO_INPUT
 WINDOW_HIDDEN = 1 << 13
 WINDOW_CLOSED = 1 << 14
 WINDOW_MINIMIZED = 1 << 15
@@ -1918,51 +1739,39 @@ WINDOW_REMOVE_ROM = 1 << 16
 # because I don't want to recreate all of the nuklear data structures,
 # I have made some wrapper procedures
 __set_style_window_header_align__ = _nuklear.nkWrapper_context_set_style_window_header_align
-__set_style_window_header_align__.arglist = [POINTER(Context), c_int]
-__set_style_window_header_align__.restype = c_int
 
 
 def _set_style_window_header_align(self, header_align):
-    __set_style_window_header_align__(self.ctx, header_align.value)
+    __set_style_window_header_align__(self.ctx, header_align)
 NuklearContext.set_style_window_header_align = _set_style_window_header_align
 
 __input_is_mouse_hovering_rect__ = _nuklear.nkWrapper_input_is_mouse_hovering_rect
-__input_is_mouse_hovering_rect__.arglist = [POINTER(Context), Rect]
-__input_is_mouse_hovering_rect__.restype = c_int
 
 def _input_is_mouse_hovering_rect(self, bounds):
     return __input_is_mouse_hovering_rect__(self.ctx, bounds)
 NuklearContext.input_is_mouse_hovering_rect = _input_is_mouse_hovering_rect
 
 __style_push_window_spacing__ = _nuklear.nkWrapper_style_push_window_spacing
-__style_push_window_spacing__.arglist = [POINTER(Context), Vec2]
-__style_push_window_spacing__.restype = c_int
 
 def _style_push_window_spacing(self, vec2):
     return __style_push_window_spacing__(self.ctx, vec2)
 NuklearContext.style_push_window_spacing = _style_push_window_spacing
 
 __style_push_button_rounding__ = _nuklear.nkWrapper_style_push_button_rounding
-__style_push_button_rounding__.arglist = [POINTER(Context), c_float]
-__style_push_button_rounding__.restype = c_int
 
 def _style_push_button_rounding(self, f):
-    return __style_push_button_rounding__(self.ctx,ctypes.c_float(f))
+    return __style_push_button_rounding__(self.ctx, f)
 NuklearContext.style_push_button_rounding = _style_push_button_rounding
 
 __get_text_width__ = _nuklear.nkWrapper_get_text_width
-__get_text_width__.arglist = [POINTER(Context), c_char_p]
-__get_text_width__.restype = c_float
 
 def _get_text_width(self, s):
-    return __get_text_width__(self.ctx, str.encode(s))
+    return __get_text_width__(self.ctx, cString(s))
 NuklearContext.get_text_width = _get_text_width
 
 
 
 __button_label_active__ = _nuklear.nkWrapper_button_label_active
-__button_label_active__.arglist = [POINTER(Context), c_char_p]
-__button_label_active__.restype = c_int
 
 # class to protect the ratio array from garbage collection
 class LayoutRow():
@@ -1973,8 +1782,7 @@ class LayoutRow():
             self.ctypesList.append(ctypes.c_float(ratio[x]))
         # protect self.arr from garbage collection until exit
         self.arr = (ctypes.c_float * len(ratio))(*self.ctypesList)
-        __layout_row__(self.ctx, c_int(layout_format.value), ctypes.c_float(
-            height), c_int(len(self.ctypesList)), self.arr)
+        __layout_row__(self.ctx, layout_format, height, len(self.ctypesList), self.arr)
 
     def __enter__(self):
         pass
@@ -1982,3 +1790,991 @@ class LayoutRow():
     def __exit__(self, type, value, traceback):
         # now self.arr can be garbage collected
         pass
+
+
+# Display lists
+#
+# A DisplayList records widget ops into arrays, without calling nuklear,
+# and NuklearContext.run builds all of them in a single call, interpreted
+# natively by FastContext.run.  The list may be recorded once and run every
+# frame, which suits panels that are mostly static.
+#
+#     panel = nuklear.record()
+#     panel.begin("Settings", nk.Rect(10, 10, 300, 200), nk.NK_WINDOW_TITLE)
+#     panel.layout_row_dynamic(30, 1)
+#     apply = panel.button_label("Apply")
+#     volume = panel.slider_float(0.0, 0.5, 1.0, 0.1)
+#     panel.end()
+#     ...
+#     nuklear.run(panel)
+#     if panel[apply]:
+#         setVolume(panel[volume])
+#
+# Widgets which report something return the index of their slot in
+# results, and panel[slot] reads it after run:  whether a button was
+# clicked, or a window, group or tree node is open, or the current value
+# of a stateful widget.  Stateful widgets keep their value in the slot
+# between runs, and panel.changed(slot) tells if the last run modified it.
+# Ops inside a closed window, group or tree node are skipped.
+class DisplayList:
+    # opcodes, in the order of enum fc_opcode in nuklearFastContext.h
+    (BEGIN, END, LAYOUT_ROW_DYNAMIC, LAYOUT_ROW_STATIC, SPACING,
+     LABEL, LABEL_COLORED, LABEL_WRAP, BUTTON_LABEL, CHECKBOX_LABEL,
+     OPTION_LABEL, SELECTABLE_LABEL, SLIDER_FLOAT, SLIDER_INT, PROGRESS,
+     PROPERTY_INT, PROPERTY_FLOAT, GROUP_BEGIN, GROUP_END, TREE_PUSH,
+     TREE_POP) = range(21)
+
+    def __init__(self):
+        self.ops = array('i')
+        self.floats = array('f')
+        self.strings = []
+        self.results = array('d')
+
+    def clear(self):
+        del self.ops[:]
+        del self.floats[:]
+        del self.strings[:]
+        del self.results[:]
+
+    def __getitem__(self, slot):
+        return self.results[slot]
+
+    def __setitem__(self, slot, value):
+        self.results[slot] = value
+
+    def changed(self, slot):
+        return self.results[slot + 1] != 0
+
+    def _slot(self, *initial):
+        slot = len(self.results)
+        self.results.extend(initial)
+        return slot
+
+    def begin(self, title, bounds, flags):
+        slot = self._slot(0)
+        self.ops.extend((DisplayList.BEGIN, flags, slot))
+        self.floats.extend((bounds.x, bounds.y, bounds.w, bounds.h))
+        self.strings.append(title)
+        return slot
+
+    def end(self):
+        self.ops.append(DisplayList.END)
+
+    def layout_row_dynamic(self, height, columns):
+        self.ops.extend((DisplayList.LAYOUT_ROW_DYNAMIC, columns))
+        self.floats.append(height)
+
+    def layout_row_static(self, height, item_width, columns):
+        self.ops.extend((DisplayList.LAYOUT_ROW_STATIC, item_width, columns))
+        self.floats.append(height)
+
+    def spacing(self, columns):
+        self.ops.extend((DisplayList.SPACING, columns))
+
+    def label(self, text, alignment):
+        self.ops.extend((DisplayList.LABEL, alignment))
+        self.strings.append(text)
+
+    def label_colored(self, text, align, color):
+        self.ops.extend((DisplayList.LABEL_COLORED, align, color.r, color.g, color.b, color.a))
+        self.strings.append(text)
+
+    def label_wrap(self, text):
+        self.ops.append(DisplayList.LABEL_WRAP)
+        self.strings.append(text)
+
+    def button_label(self, title):
+        slot = self._slot(0)
+        self.ops.extend((DisplayList.BUTTON_LABEL, slot))
+        self.strings.append(title)
+        return slot
+
+    def checkbox_label(self, text, active):
+        slot = self._slot(active, 0)
+        self.ops.extend((DisplayList.CHECKBOX_LABEL, slot))
+        self.strings.append(text)
+        return slot
+
+    def option_label(self, label, active):
+        slot = self._slot(active, 0)
+        self.ops.extend((DisplayList.OPTION_LABEL, slot))
+        self.strings.append(label)
+        return slot
+
+    def selectable_label(self, label, align, value):
+        slot = self._slot(value, 0)
+        self.ops.extend((DisplayList.SELECTABLE_LABEL, align, slot))
+        self.strings.append(label)
+        return slot
+
+    def slider_float(self, minV, val, maxV, step):
+        slot = self._slot(val, 0)
+        self.ops.extend((DisplayList.SLIDER_FLOAT, slot))
+        self.floats.extend((minV, maxV, step))
+        return slot
+
+    def slider_int(self, minV, val, maxV, step):
+        slot = self._slot(val, 0)
+        self.ops.extend((DisplayList.SLIDER_INT, minV, maxV, step, slot))
+        return slot
+
+    def progress(self, cur, max, is_modifyable):
+        slot = self._slot(cur, 0)
+        self.ops.extend((DisplayList.PROGRESS, max, is_modifyable, slot))
+        return slot
+
+    def property_int(self, name, minV, val, maxV, step, inc_per_pixel):
+        slot = self._slot(val, 0)
+        self.ops.extend((DisplayList.PROPERTY_INT, minV, maxV, step, slot))
+        self.floats.append(inc_per_pixel)
+        self.strings.append(name)
+        return slot
+
+    def property_float(self, name, minV, val, maxV, step, inc_per_pixel):
+        slot = self._slot(val, 0)
+        self.ops.extend((DisplayList.PROPERTY_FLOAT, slot))
+        self.floats.extend((minV, maxV, step, inc_per_pixel))
+        self.strings.append(name)
+        return slot
+
+    def group_begin(self, title, flags):
+        slot = self._slot(0)
+        self.ops.extend((DisplayList.GROUP_BEGIN, flags, slot))
+        self.strings.append(title)
+        return slot
+
+    def group_end(self):
+        self.ops.append(DisplayList.GROUP_END)
+
+    # like NuklearContext.tree_push_id, the node is identified by the line
+    # which records it and id, which tells apart nodes recorded in a loop
+    def tree_push(self, theType, title, state, id=0):
+        slot = self._slot(0)
+        self.ops.extend((DisplayList.TREE_PUSH, theType, state, id, slot))
+        self.strings.append(title)
+        self.strings.append(callSite(1))
+        return slot
+
+    def tree_pop(self):
+        self.ops.append(DisplayList.TREE_POP)
+
+
+def _record(self):
+    return DisplayList()
+NuklearContext.record = _record
+
+def _run(self, displayList):
+    self.fast.run(displayList.ops, displayList.floats, displayList.strings, displayList.results)
+NuklearContext.run = _run
+
+
+# Memoized windows
+#
+# memo_window records body(panel) into a DisplayList for the window, and
+# records it again only when key, bounds or flags differ from the last
+# frame.  Otherwise the recorded list is just run, so the Python body does
+# not run at all.  Input, hovering and moving the window keep working,
+# since the widgets themselves still run natively every frame.
+#
+# memo_window returns the MemoWindow, whose value is what body returned
+# when it was last recorded, typically the slots of its widgets.  The
+# caller reads the results from its panel and changes key when what the
+# window shows has changed.  Recording again keeps the state nuklear holds
+# for the window, e.g. which tree nodes are open, as long as each node is
+# recorded at the same line with the same id:
+#
+#     def settings(panel):
+#         panel.layout_row_dynamic(30, 1)
+#         panel.label("volume %d" % volume, nk.NK_TEXT_LEFT)
+#         return panel.slider_int(0, volume, 100, 1)
+#
+#     window = nuklear.memo_window("Settings", bounds, flags, volume, settings)
+#     volume = int(window.panel[window.value])
+class MemoWindow:
+    def __init__(self):
+        self.panel = DisplayList()
+        self.value = None
+        self.inputs = None
+        self.hits = 0
+        self.misses = 0
+
+    def hitRate(self):
+        frames = self.hits + self.misses
+        return self.hits / frames if frames else 0.0
+
+
+def _memo_window(self, title, bounds, flags, key, body):
+    window = self.memoWindows.get(title)
+    if window is None:
+        window = self.memoWindows[title] = MemoWindow()
+    inputs = (key, bounds.x, bounds.y, bounds.w, bounds.h, flags)
+    if inputs == window.inputs:
+        window.hits += 1
+    else:
+        window.misses += 1
+        panel = window.panel
+        panel.clear()
+        panel.begin(title, bounds, flags)
+        window.value = body(panel)
+        panel.end()
+        window.inputs = inputs
+    self.run(window.panel)
+    return window
+NuklearContext.memo_window = _memo_window
+
+# title -> (hits, misses, hit rate) of every memoized window
+def _memo_window_stats(self):
+    return {title: (window.hits, window.misses, window.hitRate())
+            for title, window in self.memoWindows.items()}
+NuklearContext.memo_window_stats = _memo_window_stats
+
+
+# Commands
+#
+# A CommandList views the draw commands of the frame being built, the ones
+# nk__begin and nk__next walk, in place in the context's memory.  update()
+# lists them natively into a types and an offsets array, so listing costs
+# no Python object per command; commands become objects only on request.
+#
+#     commands = nuklear.commands()
+#     texts = commands.fields(nk.NK_COMMAND_TEXT)    # one copy, no objects
+#     texts['x'], texts['y'], texts['foreground']['r']
+#     for i in commands.indices(nk.NK_COMMAND_TEXT):
+#         print(commands.text(i))
+#
+# The views are valid until the context's memory is cleared or grows, i.e.
+# until nk_clear, nk_glfw3_render or the next frame.
+
+def ctypesDtype(ctype):
+    """The numpy dtype laid out like a ctypes type, pointers as uintp."""
+    if issubclass(ctype, Structure):
+        fields = [(name, getattr(ctype, name).offset, ctypesDtype(field))
+                  for name, field, *bits in ctype._fields_]
+        return np.dtype({'names': [name for name, offset, dtype in fields],
+                         'formats': [dtype for name, offset, dtype in fields],
+                         'offsets': [offset for name, offset, dtype in fields],
+                         'itemsize': ctypes.sizeof(ctype)})
+    if issubclass(ctype, ctypes.Array):
+        return np.dtype((ctypesDtype(ctype._type_), (ctype._length_,)))
+    if issubclass(ctype, (ctypes._Pointer, ctypes._CFuncPtr, c_char_p, ctypes.c_void_p)):
+        return np.dtype(np.uintp)
+    if issubclass(ctype, ctypes.Union):
+        return np.dtype((np.void, ctypes.sizeof(ctype)))
+    return np.dtype(ctype)
+
+
+class CommandList:
+    # CommandType -> the structure of its commands
+    structures = {CommandType.NOP: nuklear_h.Command,
+                  CommandType.SCISSOR: nuklear_h.CommandScissor,
+                  CommandType.LINE: nuklear_h.CommandLine,
+                  CommandType.CURVE: nuklear_h.CommandCurve,
+                  CommandType.RECT: nuklear_h.CommandRect,
+                  CommandType.RECT_FILLED: nuklear_h.CommandRectFilled,
+                  CommandType.RECT_MULTI_COLOR: nuklear_h.CommandRectMultiColor,
+                  CommandType.CIRCLE: nuklear_h.CommandCircle,
+                  CommandType.CIRCLE_FILLED: nuklear_h.CommandCircleFilled,
+                  CommandType.ARC: nuklear_h.CommandArc,
+                  CommandType.ARC_FILLED: nuklear_h.CommandArcFilled,
+                  CommandType.TRIANGLE: nuklear_h.CommandTriangle,
+                  CommandType.TRIANGLE_FILLED: nuklear_h.CommandTriangleFilled,
+                  CommandType.POLYGON: nuklear_h.CommandPolygon,
+                  CommandType.POLYGON_FILLED: nuklear_h.CommandPolygonFilled,
+                  CommandType.POLYLINE: nuklear_h.CommandPolyline,
+                  CommandType.TEXT: nuklear_h.CommandText,
+                  CommandType.IMAGE: nuklear_h.CommandImage,
+                  CommandType.CUSTOM: nuklear_h.CommandCustom}
+    dtypes = {commandType: ctypesDtype(structure)
+              for commandType, structure in structures.items()}
+
+    def __init__(self, ctx, capacity=256):
+        self.ctx = ctx
+        self._types = np.empty(capacity, np.intc)
+        self._offsets = np.empty(capacity, np.uintp)
+        self.count = 0
+        self.address = 0
+        self.memory = np.empty(0, np.uint8)
+        self.types = self._types[:0]
+        self.offsets = self._offsets[:0]
+
+    def update(self):
+        while True:
+            count = nkWrapper_command_list(self.ctx,
+                                           self._types.ctypes.data_as(POINTER(c_int)),
+                                           self._offsets.ctypes.data_as(POINTER(nk_size)),
+                                           len(self._types))
+            if count <= len(self._types):
+                break
+            self._types = np.empty(count * 2, np.intc)
+            self._offsets = np.empty(count * 2, np.uintp)
+        self.count = count
+        self.types = self._types[:count]
+        self.offsets = self._offsets[:count]
+        memory = self.ctx.contents.memory
+        self.address = memory.memory.ptr or 0
+        if self.address and memory.allocated:
+            self.memory = np.ctypeslib.as_array(
+                (c_ubyte * memory.allocated).from_address(self.address))
+        else:
+            self.memory = np.empty(0, np.uint8)
+        return self
+
+    def __len__(self):
+        return self.count
+
+    def indices(self, commandType):
+        return np.flatnonzero(self.types == commandType)
+
+    def view(self, i):
+        """Command i as a numpy record viewing the context's memory."""
+        dtype = self.dtypes[self.types[i]]
+        offset = int(self.offsets[i])
+        return self.memory[offset:offset + dtype.itemsize].view(dtype)[0]
+
+    def fields(self, commandType):
+        """All the commands of a type, copied into one structured array."""
+        dtype = self.dtypes[commandType]
+        offsets = self.offsets[self.types == commandType]
+        gather = offsets[:, None] + np.arange(dtype.itemsize, dtype=np.uintp)
+        return self.memory[gather].view(dtype).reshape(len(offsets))
+
+    def command(self, i):
+        """Command i as its ctypes structure, over the context's memory."""
+        structure = self.structures[self.types[i]]
+        return structure.from_address(self.address + int(self.offsets[i]))
+
+    def __iter__(self):
+        return (self.command(i) for i in range(self.count))
+
+    def text(self, i):
+        offset = int(self.offsets[i]) + nuklear_h.CommandText.string.offset
+        length = self.view(i)['length']
+        return self.memory[offset:offset + length].tobytes()
+
+    def points(self, i):
+        """The points of a polygon or polyline command, as an (n, 2) view."""
+        structure = self.structures[self.types[i]]
+        offset = int(self.offsets[i]) + structure.points.offset
+        count = self.view(i)['point_count']
+        return self.memory[offset:offset + 4 * count].view(np.int16).reshape(count, 2)
+
+
+def _commands(self):
+    if self.commandList is None:
+        self.commandList = CommandList(self.ctx)
+    return self.commandList.update()
+NuklearContext.commands = _commands
+
+
+# Vertex output
+#
+# A Converter runs nk_convert into numpy arrays instead of mapped OpenGL
+# buffers, and exposes nuklear's tessellation as zero-copy views:
+#
+#     converter = nk.Converter()
+#     converter.convert(nuklear.ctx)
+#     converter.vertices['position'], converter.vertices['uv'],
+#     converter.vertices['color'], converter.elements
+#     offset = 0
+#     for command in converter.commands:
+#         draw(command['texture'], command['clip_rect'],
+#              converter.elements[offset:offset + command['elem_count']])
+#         offset += command['elem_count']
+#
+# The vertices are laid out like nk_glfw_vertex of the OpenGL3 backend.
+# Writable vertex and element buffers may be passed in, e.g. to convert
+# into memory shared with a renderer, in which case they are not grown and
+# the NK_CONVERT_*_FULL flags of the result tell when they were too small;
+# arrays owned by the Converter are grown until the frame fits.  The views
+# are valid until the next convert.
+
+class Converter:
+    # nk_glfw_vertex
+    vertexDtype = np.dtype([('position', np.float32, (2,)),
+                            ('uv', np.float32, (2,)),
+                            ('color', np.uint8, (4,))])
+    # nk_draw_command; texture is the handle's id and texture_ptr its ptr
+    drawCommandDtype = np.dtype({'names': ['elem_count', 'clip_rect', 'texture', 'texture_ptr'],
+                                 'formats': [np.uintc, (np.float32, (4,)), np.intc, np.uintp],
+                                 'offsets': [DrawCommand.elem_count.offset,
+                                             DrawCommand.clip_rect.offset,
+                                             DrawCommand.texture.offset,
+                                             DrawCommand.texture.offset],
+                                 'itemsize': ctypes.sizeof(DrawCommand)})
+    # 16 or 32 bit, as pynuklearc is built with NK_UINT_DRAW_INDEX or not
+    elementDtype = np.dtype(nk_draw_index)
+
+    def __init__(self, vertices=None, elements=None, null=None,
+                 antialiasing=NK_ANTI_ALIASING_ON, vertexCapacity=64 * 1024,
+                 elementCapacity=16 * 1024):
+        self.ownsVertices = vertices is None
+        self.ownsElements = elements is None
+        # nk_convert writes into them
+        for name, memory in (('vertices', vertices), ('elements', elements)):
+            if memory is not None and memoryview(memory).readonly:
+                raise TypeError("%s must be a writable buffer" % name)
+        if vertices is None:
+            vertices = np.empty(vertexCapacity * self.vertexDtype.itemsize, np.uint8)
+        if elements is None:
+            elements = np.empty(elementCapacity * self.elementDtype.itemsize, np.uint8)
+        self.vertexMemory = np.frombuffer(vertices, np.uint8)
+        self.elementMemory = np.frombuffer(elements, np.uint8)
+
+        self.layout = (DrawVertexLayoutElement * 4)(
+            (NK_VERTEX_POSITION, NK_FORMAT_FLOAT, 0),
+            (NK_VERTEX_TEXCOORD, NK_FORMAT_FLOAT, self.vertexDtype.fields['uv'][1]),
+            (NK_VERTEX_COLOR, NK_FORMAT_R8G8B8A8, self.vertexDtype.fields['color'][1]),
+            (NK_VERTEX_ATTRIBUTE_COUNT, NK_FORMAT_COUNT, 0))
+        self.config = ConvertConfig()
+        self.config.vertex_layout = self.layout
+        self.config.vertex_size = self.vertexDtype.itemsize
+        self.config.vertex_alignment = 4
+        if null is not None:
+            self.config.null = null
+        self.config.circle_segment_count = 22
+        self.config.curve_segment_count = 22
+        self.config.arc_segment_count = 22
+        self.config.global_alpha = 1.0
+        self.config.shape_AA = antialiasing
+        self.config.line_AA = antialiasing
+
+        self.cmds = Buffer()
+        nk_buffer_init_default(byref(self.cmds))
+        self.vbuf = Buffer()
+        self.ebuf = Buffer()
+        self.result = NK_CONVERT_SUCCESS
+        self.vertices = np.empty(0, self.vertexDtype)
+        self.elements = np.empty(0, self.elementDtype)
+        self.commands = np.empty(0, self.drawCommandDtype)
+
+    def convert(self, ctx):
+        while True:
+            nk_buffer_clear(byref(self.cmds))
+            nk_buffer_init_fixed(byref(self.vbuf), self.vertexMemory.ctypes.data,
+                                 len(self.vertexMemory))
+            nk_buffer_init_fixed(byref(self.ebuf), self.elementMemory.ctypes.data,
+                                 len(self.elementMemory))
+            result = nk_convert(ctx, byref(self.cmds), byref(self.vbuf),
+                                byref(self.ebuf), byref(self.config))
+            grow = False
+            if result & NK_CONVERT_VERTEX_BUFFER_FULL and self.ownsVertices:
+                self.vertexMemory = np.empty(len(self.vertexMemory) * 2, np.uint8)
+                grow = True
+            if result & NK_CONVERT_ELEMENT_BUFFER_FULL and self.ownsElements:
+                self.elementMemory = np.empty(len(self.elementMemory) * 2, np.uint8)
+                grow = True
+            if not grow:
+                break
+        self.result = result
+
+        drawList = ctx.contents.draw_list
+        self.vertices = self.vertexMemory[:drawList.vertex_count * self.vertexDtype.itemsize] \
+                            .view(self.vertexDtype)
+        self.elements = self.elementMemory[:drawList.element_count * self.elementDtype.itemsize] \
+                            .view(self.elementDtype)
+
+        # the draw commands are pushed onto the back of cmds, each below
+        # the previous one, so they are viewed in reverse
+        count = drawList.cmd_count
+        if count and self.cmds.memory.ptr:
+            size = self.cmds.memory.size
+            memory = np.ctypeslib.as_array((c_ubyte * size).from_address(self.cmds.memory.ptr))
+            end = size - drawList.cmd_offset + self.drawCommandDtype.itemsize
+            start = end - count * self.drawCommandDtype.itemsize
+            self.commands = memory[start:end].view(self.drawCommandDtype)[::-1]
+        else:
+            self.commands = np.empty(0, self.drawCommandDtype)
+        return result
+
+    def free(self):
+        nk_buffer_free(byref(self.cmds))
+
+
+def _convert(self, converter):
+    return converter.convert(self.ctx)
+NuklearContext.convert = _convert
+
+
+# Window-less contexts
+#
+# NuklearContext.create makes a context owned by no window and no backend,
+# e.g. for tests and worker processes, and the input_* methods feed it
+# events from Python.  Input goes between input_begin and input_end, before
+# the frame is built, and the frame is cleared once it is used:
+#
+#     nuklear = nk.NuklearContext.create()
+#     nuklear.input_begin()
+#     nuklear.input_motion(100, 40)
+#     nuklear.input_button(nk.NK_BUTTON_LEFT, 100, 40, True)
+#     nuklear.input_end()
+#     overview(nuklear)
+#     nuklear.clear()
+#     ...
+#     nuklear.free()
+#
+# Without a font, nuklear's default font is baked on the CPU.  To render
+# the frames, pass the font of the renderer's atlas instead, e.g. the one
+# Rasterizer.font_stash_end of pynuklear.raster returns.
+#
+# By default the context allocates its memory as it needs it.  memory, a
+# size in bytes or a writable buffer such as a bytearray or a numpy array,
+# makes it keep its commands, windows and tables in that one block instead
+# (nk_init_fixed), so that nothing is allocated per frame.  commands and
+# pool give the command buffer and the pool of windows, panels and tables a
+# block each (nk_init_custom); either may be None to allocate as needed.
+# The commands that do not fit a fixed command buffer are dropped, but
+# nuklear crashes when it runs out of pool elements, and in the single
+# block of memory the commands use them up.  create raises ValueError for
+# a memory smaller than MIN_FIXED_MEMORY, room for two windows with their
+# panels and 4 KiB of commands, but a larger UI needs more, so size the
+# memory with margin.  init_memory does the same to an existing context,
+# e.g. a glfw3 backend's.  MemoryUsage tells how much a UI needs.
+#
+#     nuklear = nk.NuklearContext.create(memory=256 * 1024)
+
+class DefaultFont:
+    def __init__(self, height=13.0):
+        self.atlas = FontAtlas()
+        nk_font_atlas_init_default(byref(self.atlas))
+        nk_font_atlas_begin(byref(self.atlas))
+        self.font = nk_font_atlas_add_default(byref(self.atlas), height, None)
+        width, height = c_int(), c_int()
+        nk_font_atlas_bake(byref(self.atlas), byref(width), byref(height),
+                           NK_FONT_ATLAS_ALPHA8)
+        nk_font_atlas_end(byref(self.atlas), nk_handle_id(0), None)
+
+    def free(self):
+        nk_font_atlas_clear(byref(self.atlas))
+
+
+# the smallest memory of create: the elements of two windows and their
+# panels, and nuklear's initial command buffer size
+MIN_FIXED_MEMORY = 4 * ctypes.sizeof(PageElement) + 4 * 1024
+
+# a ctypes array over memory, a size in bytes or a writable buffer
+def memoryBlock(memory):
+    if isinstance(memory, int):
+        return (ctypes.c_ubyte * memory)()
+    view = memoryview(memory).cast('B')
+    return (ctypes.c_ubyte * view.nbytes).from_buffer(view)
+
+
+# initializes ctx with the memory of create, returning the arrays it keeps
+# pointers into
+def _initContext(ctx, font, memory=None, commands=None, pool=None):
+    if memory is not None:
+        if commands is not None or pool is not None:
+            raise ValueError("memory excludes commands and pool")
+        block = memoryBlock(memory)
+        if len(block) < MIN_FIXED_MEMORY:
+            raise ValueError("memory needs at least %d bytes" % MIN_FIXED_MEMORY)
+        if not nk_init_fixed(ctx, block, len(block), font):
+            raise ValueError("nk_init_fixed failed")
+        return [block]
+    if commands is None and pool is None:
+        nk_init_default(ctx, font)
+        return None
+
+    blocks = []
+    commandBuffer, poolBuffer = Buffer(), Buffer()
+    if commands is None:
+        nk_buffer_init_default(byref(commandBuffer))
+    else:
+        blocks.append(memoryBlock(commands))
+        nk_buffer_init_fixed(byref(commandBuffer), blocks[-1], len(blocks[-1]))
+    if pool is None:
+        # only its allocator is used, which nk_init_custom copies
+        nk_buffer_init_default(byref(poolBuffer))
+    else:
+        blocks.append(memoryBlock(pool))
+        if len(blocks[-1]) < ctypes.sizeof(Page):
+            raise ValueError("pool needs at least %d bytes" % ctypes.sizeof(Page))
+        nk_buffer_init_fixed(byref(poolBuffer), blocks[-1], len(blocks[-1]))
+    initialized = nk_init_custom(ctx, byref(commandBuffer), byref(poolBuffer), font)
+    if pool is None:
+        nk_buffer_free(byref(poolBuffer))
+    if not initialized:
+        raise ValueError("nk_init_custom failed")
+    return blocks
+
+
+def _create(cls, font=None, memory=None, commands=None, pool=None):
+    ownedFont = None
+    if font is None:
+        ownedFont = DefaultFont()
+        font = ownedFont.font
+    # a POINTER(Font) is used by its handle, the nk_user_font nuklear uses
+    if isinstance(font, POINTER(Font)):
+        font = ctypes.pointer(font.contents.handle)
+    ctx = ctypes.pointer(Context())
+    try:
+        blocks = _initContext(ctx, font, memory, commands, pool)
+    except ValueError:
+        if ownedFont is not None:
+            ownedFont.free()
+        raise
+    nuklear = cls(ctx)
+    nuklear.ownedFont = ownedFont
+    nuklear.fixedMemory = blocks
+    return nuklear
+NuklearContext.create = classmethod(_create)
+
+# frees the context's memory and initializes it again with the memory of
+# create, keeping its font and clipboard.  The windows and
+# their state are lost, so call it before the first frame.
+def _init_memory(self, memory=None, commands=None, pool=None):
+    context = self.ctx.contents
+    font = ctypes.cast(context.style.font, ctypes.c_void_p).value
+    clip = Clipboard.from_buffer_copy(context.clip)
+    nk_free(self.ctx)
+    blocks = _initContext(self.ctx, ctypes.cast(font, POINTER(UserFont)),
+                          memory, commands, pool)
+    context.clip = clip
+    self.fixedMemory = blocks
+NuklearContext.init_memory = _init_memory
+
+def _free(self):
+    nk_free(self.ctx)
+    self.fixedMemory = None
+    if self.ownedFont is not None:
+        self.ownedFont.free()
+        self.ownedFont = None
+NuklearContext.free = _free
+
+# the nk.MemoryStatus of the command buffer, see nk_buffer_info
+def _memory_status(self):
+    status = MemoryStatus()
+    nk_buffer_info(byref(status), byref(self.ctx.contents.memory))
+    return status
+NuklearContext.memory_status = _memory_status
+
+def _clear(self):
+    nk_clear(self.ctx)
+NuklearContext.clear = _clear
+
+def _input_begin(self):
+    nk_input_begin(self.ctx)
+NuklearContext.input_begin = _input_begin
+
+def _input_end(self):
+    nk_input_end(self.ctx)
+NuklearContext.input_end = _input_end
+
+def _input_motion(self, x, y):
+    nk_input_motion(self.ctx, int(x), int(y))
+NuklearContext.input_motion = _input_motion
+
+# button is a Buttons, e.g. nk.NK_BUTTON_LEFT, and down whether it is
+# pressed or released at x, y
+def _input_button(self, button, x, y, down):
+    nk_input_button(self.ctx, button, int(x), int(y), 1 if down else 0)
+NuklearContext.input_button = _input_button
+
+def _input_scroll(self, x, y):
+    nk_input_scroll(self.ctx, Vec2(x, y))
+NuklearContext.input_scroll = _input_scroll
+
+# key is a Keys, e.g. nk.NK_KEY_ENTER
+def _input_key(self, key, down):
+    nk_input_key(self.ctx, key, 1 if down else 0)
+NuklearContext.input_key = _input_key
+
+def _input_unicode(self, codepoint):
+    nk_input_unicode(self.ctx, codepoint)
+NuklearContext.input_unicode = _input_unicode
+
+# types text, as the characters a keyboard sends
+def _input_text(self, text):
+    for character in text:
+        nk_input_unicode(self.ctx, ord(character))
+NuklearContext.input_text = _input_text
+
+
+# Frame statistics
+#
+# A FrameStats keeps the time of the stages of the last frames, in seconds,
+# and the counters of the last frame.  It is opt-in: a backend records into
+# the stats of the context, if there are any, e.g. glfw3.Application and
+# glfw3_render record
+#
+#   new_frame   nk_glfw3_new_frame, i.e. the input
+#   ui          building the frame in Python
+#   state       saving and restoring the OpenGL state in glfw3_render
+#   convert     nk_convert, into the mapped buffers
+#   draw        issuing the draw calls
+#   gpu         the GPU's time for the draw pass, with glfw3.gpu_timer
+#   frame       the whole frame
+#
+# and the counters vertices, elements, draw_commands, batches,
+# texture_binds, scissor_changes, command_bytes and streamed_bytes.  Other
+# stages are timed with stage():
+#
+#     nuklear.stats = nk.FrameStats()
+#     with nuklear.stats.stage('ui'):
+#         overview(nuklear)
+#     p50, p95, p99 = nuklear.stats.percentiles('ui')
+#     nuklear.stats.overlay(nuklear)
+
+class FrameStats:
+    STAGES = ['new_frame', 'ui', 'state', 'convert', 'draw', 'gpu', 'frame']
+    COUNTERS = ['vertices', 'elements', 'draw_commands', 'batches', 'texture_binds',
+                'scissor_changes', 'command_bytes', 'streamed_bytes']
+
+    def __init__(self, frames=240):
+        self.frames = frames
+        self.times = {}
+        self.counters = {}
+
+    def record(self, stage, seconds):
+        times = self.times.get(stage)
+        if times is None:
+            times = self.times[stage] = deque(maxlen=self.frames)
+        times.append(seconds)
+
+    def count(self, counter, value):
+        self.counters[counter] = value
+
+    @contextmanager
+    def stage(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def percentiles(self, stage, quantiles=(0.5, 0.95, 0.99)):
+        """The quantiles of the stage's recent times, in seconds."""
+        times = sorted(self.times.get(stage, ()))
+        if not times:
+            return tuple(0.0 for q in quantiles)
+        return tuple(times[min(len(times) - 1, int(q * len(times)))] for q in quantiles)
+
+    def stages(self):
+        return ([stage for stage in self.STAGES if stage in self.times]
+                + sorted(stage for stage in self.times if stage not in self.STAGES))
+
+    def overlay(self, nuklear, bounds=None, title="Frame stats"):
+        """Draws a window of the percentiles, in ms, and the counters."""
+        if bounds is None:
+            bounds = Rect(10, 10, 330, 60 + 20 * (len(self.times) + len(self.counters)))
+        flags = (NK_WINDOW_BORDER | NK_WINDOW_MOVABLE | NK_WINDOW_TITLE
+                 | NK_WINDOW_MINIMIZABLE | NK_WINDOW_NO_SCROLLBAR)
+        if nuklear.begin(title, bounds, flags):
+            nuklear.layout_row_dynamic(16, 4)
+            for text in ("ms", "p50", "p95", "p99"):
+                nuklear.label(text, NK_TEXT_RIGHT)
+            for stage in self.stages():
+                nuklear.label(stage, NK_TEXT_LEFT)
+                for seconds in self.percentiles(stage):
+                    nuklear.label("%.3f" % (seconds * 1000), NK_TEXT_RIGHT)
+            nuklear.layout_row_dynamic(16, 2)
+            for counter, value in self.counters.items():
+                nuklear.label(counter, NK_TEXT_LEFT)
+                nuklear.label(str(value), NK_TEXT_RIGHT)
+        nuklear.end()
+
+
+# Memory usage
+#
+# A MemoryUsage samples the command buffer and the pool of windows, panels
+# and tables of a context once a frame is built, before it is cleared, and
+# keeps the high-water marks and how often they grew, to size the memory of
+# NuklearContext.create and init_memory:
+#
+#     usage = nk.MemoryUsage()
+#     overview(nuklear)
+#     usage.sample(nuklear)
+#     nuklear.clear()
+#     ...
+#     print(usage.commands.peak, usage.pool.peak)
+#
+# A context of nk_init_fixed, i.e. create(memory=...), takes the pool's
+# elements from the back of its one block, so commands.size is the whole
+# block, and commands.needed counts the pool too.
+
+class BufferUsage:
+    def __init__(self):
+        # bytes the buffer holds
+        self.size = 0
+        # bytes in use
+        self.allocated = 0
+        # bytes the frame asked for, more than size if it did not fit
+        self.needed = 0
+        # the largest needed sampled
+        self.peak = 0
+        # times the buffer grew; nuklear doubles a command buffer that
+        # is full, so for it these are the doublings
+        self.grows = 0
+
+    def update(self, size, allocated, needed):
+        self.size = size
+        self.allocated = allocated
+        self.needed = needed
+        self.peak = max(self.peak, needed)
+
+
+class MemoryUsage:
+    # NK_BUFFER_DEFAULT_INITIAL_SIZE, the size a dynamic buffer starts at
+    INITIAL_SIZE = 4 * 1024
+
+    def __init__(self):
+        self.commands = BufferUsage()
+        self.pool = BufferUsage()
+
+    def sample(self, nuklear):
+        context = nuklear.ctx.contents
+        status = nuklear.memory_status()
+        size = self.commands.size
+        if not size and context.memory.type == NK_BUFFER_DYNAMIC:
+            size = self.INITIAL_SIZE
+        while size and size < status.size:
+            size *= 2
+            self.commands.grows += 1
+        self.commands.update(status.size, status.allocated, status.needed)
+
+        free = 0
+        element = context.freelist
+        while element:
+            free += 1
+            element = element.contents.next
+        elementSize = ctypes.sizeof(PageElement)
+        if context.use_pool:
+            pages = elements = 0
+            page = context.pool.pages
+            while page:
+                pages += 1
+                elements += page.contents.size
+                page = page.contents.next
+            capacity = pages * context.pool.capacity
+            # a dynamic pool grows a page at a time after its first, and a
+            # fixed one never
+            if context.pool.type == NK_BUFFER_DYNAMIC:
+                self.pool.grows = max(0, pages - 1)
+        else:
+            capacity = elements = (context.memory.memory.size - context.memory.size) // elementSize
+        used = (elements - free) * elementSize
+        self.pool.update(capacity * elementSize, used, used)
+
+
+# Text measurement
+#
+# nuklear measures a text with its font's width callback, which decodes it
+# and looks up each glyph, and measures labels again every frame.  A
+# TextMeasure keeps the advance of each code point of a font, asked of the
+# font the first time the code point is measured, and adds them up, which
+# is what nk_font's width does, since it sums the glyph advances without
+# kerning.  Like nuklear, it stops at the first code point nuklear does not
+# decode, i.e. U+FFFD, or at NUL.  measure memoizes the widths of the texts
+# it measured, and measure_many measures a list of texts at once into a
+# numpy array, e.g. to size the columns of a table:
+#
+#     widths = nuklear.measure_many(cells)
+#     columnWidth = widths.max() + 2 * padding
+#
+# NuklearContext.measure and measure_many measure in the context's current
+# font.  Unlike get_text_width they add no button padding.  The widths go
+# stale when the font's glyphs change, e.g. when its lazy glyph pages are
+# baked; forget_text_widths() drops them, which glfw3.Application does
+# itself.  They are only valid for fonts whose widths are the sums of the
+# code points' advances, such as nk_font; measure the texts of other user
+# fonts, e.g. kerning ones, with get_text_width.
+
+class TextMeasure:
+    # the texts memoized before the memo starts over
+    MEMO_SIZE = 4096
+
+    def __init__(self, font):
+        # a POINTER(UserFont)
+        self.font = font
+        self.forget()
+
+    def forget(self):
+        # by code point, NaN where not asked yet
+        self.advances = np.full(256, np.nan, np.float32)
+        self.widths = {}
+
+    def _codepoints(self, text):
+        return np.frombuffer(text.encode('utf-32-le'), np.uint32)
+
+    def _stops(self, codepoints):
+        return (codepoints == NK_UTF_INVALID) | (codepoints == 0)
+
+    def _learn(self, codepoints):
+        if not len(codepoints):
+            return
+        top = int(codepoints.max())
+        if top >= len(self.advances):
+            size = len(self.advances)
+            while size <= top:
+                size *= 2
+            advances = np.full(size, np.nan, np.float32)
+            advances[:len(self.advances)] = self.advances
+            self.advances = advances
+        unknown = codepoints[np.isnan(self.advances[codepoints])]
+        if len(unknown):
+            unknown = np.unique(unknown)
+            advances = np.empty(len(unknown), np.float32)
+            nkWrapper_font_advances(self.font, unknown.ctypes.data_as(POINTER(nk_rune)),
+                                    len(unknown), advances.ctypes.data_as(POINTER(c_float)))
+            self.advances[unknown] = advances
+
+    def measure(self, text):
+        width = self.widths.get(text)
+        if width is None:
+            codepoints = self._codepoints(text)
+            stops = self._stops(codepoints)
+            if stops.any():
+                codepoints = codepoints[:int(stops.argmax())]
+            self._learn(codepoints)
+            width = float(self.advances[codepoints].sum(dtype=np.float64))
+            if len(self.widths) >= self.MEMO_SIZE:
+                self.widths.clear()
+            self.widths[text] = width
+        return width
+
+    def measure_many(self, texts):
+        texts = texts if isinstance(texts, list) else list(texts)
+        lengths = np.fromiter(map(len, texts), np.intp, len(texts))
+        codepoints = self._codepoints(''.join(texts))
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        stops = self._stops(codepoints)
+        if stops.any():
+            # the code points of a text from its first stop on count as 0
+            counts = np.cumsum(stops)
+            before = np.concatenate(([0], counts))[starts]
+            measured = counts == np.repeat(before, lengths)
+            codepoints = np.where(measured, codepoints, 0)
+            self._learn(codepoints[measured])
+            advances = np.where(measured, self.advances[codepoints], 0)
+        else:
+            self._learn(codepoints)
+            advances = self.advances[codepoints]
+        # the width of a text is the difference of the running sums at its ends
+        sums = np.zeros(len(codepoints) + 1)
+        np.cumsum(advances, dtype=np.float64, out=sums[1:])
+        return sums[ends] - sums[starts]
+
+
+def _text_measure(self):
+    address = self.styleFont.value
+    key = (address, c_float.from_address(address + UserFont.height.offset).value)
+    measure = self.textMeasures.get(key)
+    if measure is None:
+        measure = self.textMeasures[key] = TextMeasure(ctypes.cast(address, POINTER(UserFont)))
+    return measure
+NuklearContext.text_measure = _text_measure
+
+# the width of text in the current font
+def _measure(self, text):
+    return self.text_measure().measure(text)
+NuklearContext.measure = _measure
+
+# a numpy array of the widths of the texts in the current font
+def _measure_many(self, texts):
+    return self.text_measure().measure_many(texts)
+NuklearContext.measure_many = _measure_many
+
+def _forget_text_widths(self):
+    self.textMeasures.clear()
+NuklearContext.forget_text_widths = _forget_text_widths
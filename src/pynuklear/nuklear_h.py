@@ -0,0 +1,4164 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# GENERATED FILE, DO NOT EDIT.
+#
+# Produced by tools/generate_bindings.py from
+#     contrib/nuklear/nuklear.h
+#     contrib/nuklear/nuklear_fonts.h
+#     contrib/nuklear/nuklear_glfw_gl3.h
+#     contrib/nuklear/nuklear_raster.h
+#     contrib/nuklear/nuklearWrappers.h
+# built with
+#     NK_INCLUDE_DEFAULT_ALLOCATOR
+#     NK_INCLUDE_DEFAULT_FONT
+#     NK_INCLUDE_FIXED_TYPES
+#     NK_INCLUDE_FONT_BAKING
+#     NK_INCLUDE_STANDARD_IO
+#     NK_INCLUDE_STANDARD_VARARGS
+#     NK_INCLUDE_VERTEX_BUFFER_OUTPUT
+#     NK_UINT_DRAW_INDEX
+#
+# Every procedure below has its argtypes and restype installed, so ctypes
+# converts arguments without guessing and structures, floats and doubles are
+# passed and returned by value correctly.  Procedures keep their C names;
+# nuklear.py builds the Pythonic NuklearContext methods on top of them.
+
+import inspect
+from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, Union, sizeof,
+                    c_byte, c_char, c_char_p, c_double, c_float, c_int,
+                    c_int8, c_int16, c_int32, c_int64, c_long, c_longlong,
+                    c_short, c_size_t, c_ssize_t, c_ubyte, c_uint, c_uint8,
+                    c_uint16, c_uint32, c_uint64, c_ulong, c_ulonglong,
+                    c_ushort, c_void_p)
+
+import pynuklearc
+_nuklear = CDLL(inspect.getfile(pynuklearc))
+
+
+# constants
+
+NK_UNDEFINED = -1.0
+NK_UTF_INVALID = 65533
+NK_UTF_SIZE = 4
+NK_INPUT_MAX = 16
+NK_MAX_NUMBER_BUFFER = 64
+NK_SCROLLBAR_HIDING_TIMEOUT = 4.0
+NK_TEXTEDIT_UNDOSTATECOUNT = 99
+NK_TEXTEDIT_UNDOCHARCOUNT = 999
+NK_MAX_LAYOUT_ROW_TEMPLATE_COLUMNS = 16
+NK_CHART_MAX_SLOT = 4
+NK_WINDOW_MAX_NAME = 64
+NK_BUTTON_BEHAVIOR_STACK_SIZE = 8
+NK_FONT_STACK_SIZE = 8
+NK_STYLE_ITEM_STACK_SIZE = 16
+NK_FLOAT_STACK_SIZE = 32
+NK_VECTOR_STACK_SIZE = 16
+NK_FLAGS_STACK_SIZE = 32
+NK_COLOR_STACK_SIZE = 32
+NK_PI = 3.141592654
+NK_MAX_FLOAT_PRECISION = 2
+NK_FONT_PAGE_SIZE = 256
+nk_false = 0
+nk_true = 1
+NK_UP = 0
+NK_RIGHT = 1
+NK_DOWN = 2
+NK_LEFT = 3
+NK_BUTTON_DEFAULT = 0
+NK_BUTTON_REPEATER = 1
+NK_FIXED = 0
+NK_MODIFIABLE = 1
+NK_VERTICAL = 0
+NK_HORIZONTAL = 1
+NK_MINIMIZED = 0
+NK_MAXIMIZED = 1
+NK_HIDDEN = 0
+NK_SHOWN = 1
+NK_CHART_LINES = 0
+NK_CHART_COLUMN = 1
+NK_CHART_MAX = 2
+NK_CHART_HOVERING = 1
+NK_CHART_CLICKED = 2
+NK_RGB = 0
+NK_RGBA = 1
+NK_POPUP_STATIC = 0
+NK_POPUP_DYNAMIC = 1
+NK_DYNAMIC = 0
+NK_STATIC = 1
+NK_TREE_NODE = 0
+NK_TREE_TAB = 1
+NK_SYMBOL_NONE = 0
+NK_SYMBOL_X = 1
+NK_SYMBOL_UNDERSCORE = 2
+NK_SYMBOL_CIRCLE_SOLID = 3
+NK_SYMBOL_CIRCLE_OUTLINE = 4
+NK_SYMBOL_RECT_SOLID = 5
+NK_SYMBOL_RECT_OUTLINE = 6
+NK_SYMBOL_TRIANGLE_UP = 7
+NK_SYMBOL_TRIANGLE_DOWN = 8
+NK_SYMBOL_TRIANGLE_LEFT = 9
+NK_SYMBOL_TRIANGLE_RIGHT = 10
+NK_SYMBOL_PLUS = 11
+NK_SYMBOL_MINUS = 12
+NK_SYMBOL_MAX = 13
+NK_KEY_NONE = 0
+NK_KEY_SHIFT = 1
+NK_KEY_CTRL = 2
+NK_KEY_DEL = 3
+NK_KEY_ENTER = 4
+NK_KEY_TAB = 5
+NK_KEY_BACKSPACE = 6
+NK_KEY_COPY = 7
+NK_KEY_CUT = 8
+NK_KEY_PASTE = 9
+NK_KEY_UP = 10
+NK_KEY_DOWN = 11
+NK_KEY_LEFT = 12
+NK_KEY_RIGHT = 13
+NK_KEY_TEXT_INSERT_MODE = 14
+NK_KEY_TEXT_REPLACE_MODE = 15
+NK_KEY_TEXT_RESET_MODE = 16
+NK_KEY_TEXT_LINE_START = 17
+NK_KEY_TEXT_LINE_END = 18
+NK_KEY_TEXT_START = 19
+NK_KEY_TEXT_END = 20
+NK_KEY_TEXT_UNDO = 21
+NK_KEY_TEXT_REDO = 22
+NK_KEY_TEXT_SELECT_ALL = 23
+NK_KEY_TEXT_WORD_LEFT = 24
+NK_KEY_TEXT_WORD_RIGHT = 25
+NK_KEY_SCROLL_START = 26
+NK_KEY_SCROLL_END = 27
+NK_KEY_SCROLL_DOWN = 28
+NK_KEY_SCROLL_UP = 29
+NK_KEY_MAX = 30
+NK_BUTTON_LEFT = 0
+NK_BUTTON_MIDDLE = 1
+NK_BUTTON_RIGHT = 2
+NK_BUTTON_DOUBLE = 3
+NK_BUTTON_MAX = 4
+NK_ANTI_ALIASING_OFF = 0
+NK_ANTI_ALIASING_ON = 1
+NK_CONVERT_SUCCESS = 0
+NK_CONVERT_INVALID_PARAM = 1
+NK_CONVERT_COMMAND_BUFFER_FULL = 2
+NK_CONVERT_VERTEX_BUFFER_FULL = 4
+NK_CONVERT_ELEMENT_BUFFER_FULL = 8
+NK_WINDOW_BORDER = 1
+NK_WINDOW_MOVABLE = 2
+NK_WINDOW_SCALABLE = 4
+NK_WINDOW_CLOSABLE = 8
+NK_WINDOW_MINIMIZABLE = 16
+NK_WINDOW_NO_SCROLLBAR = 32
+NK_WINDOW_TITLE = 64
+NK_WINDOW_SCROLL_AUTO_HIDE = 128
+NK_WINDOW_BACKGROUND = 256
+NK_WINDOW_SCALE_LEFT = 512
+NK_WINDOW_NO_INPUT = 1024
+NK_WIDGET_INVALID = 0
+NK_WIDGET_VALID = 1
+NK_WIDGET_ROM = 2
+NK_WIDGET_STATE_MODIFIED = 2
+NK_WIDGET_STATE_INACTIVE = 4
+NK_WIDGET_STATE_ENTERED = 8
+NK_WIDGET_STATE_HOVER = 16
+NK_WIDGET_STATE_ACTIVED = 32
+NK_WIDGET_STATE_LEFT = 64
+NK_WIDGET_STATE_HOVERED = 18
+NK_WIDGET_STATE_ACTIVE = 34
+NK_TEXT_ALIGN_LEFT = 1
+NK_TEXT_ALIGN_CENTERED = 2
+NK_TEXT_ALIGN_RIGHT = 4
+NK_TEXT_ALIGN_TOP = 8
+NK_TEXT_ALIGN_MIDDLE = 16
+NK_TEXT_ALIGN_BOTTOM = 32
+NK_TEXT_LEFT = 17
+NK_TEXT_CENTERED = 18
+NK_TEXT_RIGHT = 20
+NK_EDIT_DEFAULT = 0
+NK_EDIT_READ_ONLY = 1
+NK_EDIT_AUTO_SELECT = 2
+NK_EDIT_SIG_ENTER = 4
+NK_EDIT_ALLOW_TAB = 8
+NK_EDIT_NO_CURSOR = 16
+NK_EDIT_SELECTABLE = 32
+NK_EDIT_CLIPBOARD = 64
+NK_EDIT_CTRL_ENTER_NEWLINE = 128
+NK_EDIT_NO_HORIZONTAL_SCROLL = 256
+NK_EDIT_ALWAYS_INSERT_MODE = 512
+NK_EDIT_MULTILINE = 1024
+NK_EDIT_GOTO_END_ON_ACTIVATE = 2048
+NK_EDIT_SIMPLE = 512
+NK_EDIT_FIELD = 608
+NK_EDIT_BOX = 1640
+NK_EDIT_EDITOR = 1128
+NK_EDIT_ACTIVE = 1
+NK_EDIT_INACTIVE = 2
+NK_EDIT_ACTIVATED = 4
+NK_EDIT_DEACTIVATED = 8
+NK_EDIT_COMMITED = 16
+NK_COLOR_TEXT = 0
+NK_COLOR_WINDOW = 1
+NK_COLOR_HEADER = 2
+NK_COLOR_BORDER = 3
+NK_COLOR_BUTTON = 4
+NK_COLOR_BUTTON_HOVER = 5
+NK_COLOR_BUTTON_ACTIVE = 6
+NK_COLOR_TOGGLE = 7
+NK_COLOR_TOGGLE_HOVER = 8
+NK_COLOR_TOGGLE_CURSOR = 9
+NK_COLOR_SELECT = 10
+NK_COLOR_SELECT_ACTIVE = 11
+NK_COLOR_SLIDER = 12
+NK_COLOR_SLIDER_CURSOR = 13
+NK_COLOR_SLIDER_CURSOR_HOVER = 14
+NK_COLOR_SLIDER_CURSOR_ACTIVE = 15
+NK_COLOR_PROPERTY = 16
+NK_COLOR_EDIT = 17
+NK_COLOR_EDIT_CURSOR = 18
+NK_COLOR_COMBO = 19
+NK_COLOR_CHART = 20
+NK_COLOR_CHART_COLOR = 21
+NK_COLOR_CHART_COLOR_HIGHLIGHT = 22
+NK_COLOR_SCROLLBAR = 23
+NK_COLOR_SCROLLBAR_CURSOR = 24
+NK_COLOR_SCROLLBAR_CURSOR_HOVER = 25
+NK_COLOR_SCROLLBAR_CURSOR_ACTIVE = 26
+NK_COLOR_TAB_HEADER = 27
+NK_COLOR_COUNT = 28
+NK_CURSOR_ARROW = 0
+NK_CURSOR_TEXT = 1
+NK_CURSOR_MOVE = 2
+NK_CURSOR_RESIZE_VERTICAL = 3
+NK_CURSOR_RESIZE_HORIZONTAL = 4
+NK_CURSOR_RESIZE_TOP_LEFT_DOWN_RIGHT = 5
+NK_CURSOR_RESIZE_TOP_RIGHT_DOWN_LEFT = 6
+NK_CURSOR_COUNT = 7
+NK_COORD_UV = 0
+NK_COORD_PIXEL = 1
+NK_FONT_ATLAS_ALPHA8 = 0
+NK_FONT_ATLAS_RGBA32 = 1
+NK_BUFFER_FIXED = 0
+NK_BUFFER_DYNAMIC = 1
+NK_BUFFER_FRONT = 0
+NK_BUFFER_BACK = 1
+NK_BUFFER_MAX = 2
+NK_TEXT_EDIT_SINGLE_LINE = 0
+NK_TEXT_EDIT_MULTI_LINE = 1
+NK_TEXT_EDIT_MODE_VIEW = 0
+NK_TEXT_EDIT_MODE_INSERT = 1
+NK_TEXT_EDIT_MODE_REPLACE = 2
+NK_COMMAND_NOP = 0
+NK_COMMAND_SCISSOR = 1
+NK_COMMAND_LINE = 2
+NK_COMMAND_CURVE = 3
+NK_COMMAND_RECT = 4
+NK_COMMAND_RECT_FILLED = 5
+NK_COMMAND_RECT_MULTI_COLOR = 6
+NK_COMMAND_CIRCLE = 7
+NK_COMMAND_CIRCLE_FILLED = 8
+NK_COMMAND_ARC = 9
+NK_COMMAND_ARC_FILLED = 10
+NK_COMMAND_TRIANGLE = 11
+NK_COMMAND_TRIANGLE_FILLED = 12
+NK_COMMAND_POLYGON = 13
+NK_COMMAND_POLYGON_FILLED = 14
+NK_COMMAND_POLYLINE = 15
+NK_COMMAND_TEXT = 16
+NK_COMMAND_IMAGE = 17
+NK_COMMAND_CUSTOM = 18
+NK_CLIPPING_OFF = 0
+NK_CLIPPING_ON = 1
+NK_STROKE_OPEN = 0
+NK_STROKE_CLOSED = 1
+NK_VERTEX_POSITION = 0
+NK_VERTEX_COLOR = 1
+NK_VERTEX_TEXCOORD = 2
+NK_VERTEX_ATTRIBUTE_COUNT = 3
+NK_FORMAT_SCHAR = 0
+NK_FORMAT_SSHORT = 1
+NK_FORMAT_SINT = 2
+NK_FORMAT_UCHAR = 3
+NK_FORMAT_USHORT = 4
+NK_FORMAT_UINT = 5
+NK_FORMAT_FLOAT = 6
+NK_FORMAT_DOUBLE = 7
+NK_FORMAT_COLOR_BEGIN = 8
+NK_FORMAT_R8G8B8 = 8
+NK_FORMAT_R16G15B16 = 9
+NK_FORMAT_R32G32B32 = 10
+NK_FORMAT_R8G8B8A8 = 11
+NK_FORMAT_B8G8R8A8 = 12
+NK_FORMAT_R16G15B16A16 = 13
+NK_FORMAT_R32G32B32A32 = 14
+NK_FORMAT_R32G32B32A32_FLOAT = 15
+NK_FORMAT_R32G32B32A32_DOUBLE = 16
+NK_FORMAT_RGB32 = 17
+NK_FORMAT_RGBA32 = 18
+NK_FORMAT_COLOR_END = 18
+NK_FORMAT_COUNT = 19
+NK_STYLE_ITEM_COLOR = 0
+NK_STYLE_ITEM_IMAGE = 1
+NK_HEADER_LEFT = 0
+NK_HEADER_RIGHT = 1
+NK_PANEL_NONE = 0
+NK_PANEL_WINDOW = 1
+NK_PANEL_GROUP = 2
+NK_PANEL_POPUP = 4
+NK_PANEL_CONTEXTUAL = 16
+NK_PANEL_COMBO = 32
+NK_PANEL_MENU = 64
+NK_PANEL_TOOLTIP = 128
+NK_PANEL_SET_NONBLOCK = 240
+NK_PANEL_SET_POPUP = 244
+NK_PANEL_SET_SUB = 246
+NK_LAYOUT_DYNAMIC_FIXED = 0
+NK_LAYOUT_DYNAMIC_ROW = 1
+NK_LAYOUT_DYNAMIC_FREE = 2
+NK_LAYOUT_DYNAMIC = 3
+NK_LAYOUT_STATIC_FIXED = 4
+NK_LAYOUT_STATIC_ROW = 5
+NK_LAYOUT_STATIC_FREE = 6
+NK_LAYOUT_STATIC = 7
+NK_LAYOUT_TEMPLATE = 8
+NK_LAYOUT_COUNT = 9
+NK_WINDOW_PRIVATE = 2048
+NK_WINDOW_DYNAMIC = 2048
+NK_WINDOW_ROM = 4096
+NK_WINDOW_NOT_INTERACTIVE = 5120
+NK_WINDOW_HIDDEN = 8192
+NK_WINDOW_CLOSED = 16384
+NK_WINDOW_MINIMIZED = 32768
+NK_WINDOW_REMOVE_ROM = 65536
+NK_GLFW3_DEFAULT = 0
+NK_GLFW3_INSTALL_CALLBACKS = 1
+NK_GLFW3_STATE_BLEND = 1
+NK_GLFW3_STATE_CULL_FACE = 2
+NK_GLFW3_STATE_DEPTH_TEST = 4
+NK_GLFW3_STATE_SCISSOR = 8
+NK_GLFW3_STATE_VIEWPORT = 16
+NK_GLFW3_STATE_PROGRAM = 32
+NK_GLFW3_STATE_TEXTURE = 64
+NK_GLFW3_STATE_BUFFERS = 128
+NK_GLFW3_STATE_SHADOWED = 256
+NK_GLFW3_STATE_DEFAULT = 31
+NK_GLFW3_STATE_ALL = 255
+NK_GLFW3_STREAM_ORPHAN = 0
+NK_GLFW3_STREAM_UNSYNCHRONIZED = 1
+NK_GLFW3_STREAM_PERSISTENT = 2
+
+
+# scalar types
+
+nk_char = c_int8
+nk_uchar = c_uint8
+nk_byte = c_uint8
+nk_short = c_int16
+nk_ushort = c_uint16
+nk_int = c_int32
+nk_uint = c_uint32
+nk_size = c_size_t
+nk_ptr = c_size_t
+nk_hash = nk_uint
+nk_flags = nk_uint
+nk_rune = nk_uint
+nk_draw_index = nk_uint
+nk_glyph = (c_char * 4)
+
+
+# structures and unions, see _fields_ below
+
+
+class Buffer(Structure):
+    pass
+
+
+class Allocator(Structure):
+    pass
+
+
+class CommandBuffer(Structure):
+    pass
+
+
+class DrawCommand(Structure):
+    pass
+
+
+class ConvertConfig(Structure):
+    pass
+
+
+class StyleItem(Structure):
+    pass
+
+
+class TextEdit(Structure):
+    pass
+
+
+class DrawList(Structure):
+    pass
+
+
+class UserFont(Structure):
+    pass
+
+
+class Panel(Structure):
+    pass
+
+
+class Context(Structure):
+    pass
+
+
+class DrawVertexLayoutElement(Structure):
+    pass
+
+
+class StyleButton(Structure):
+    pass
+
+
+class StyleToggle(Structure):
+    pass
+
+
+class StyleSelectable(Structure):
+    pass
+
+
+class StyleSlide(Structure):
+    pass
+
+
+class StyleProgress(Structure):
+    pass
+
+
+class StyleScrollbar(Structure):
+    pass
+
+
+class StyleEdit(Structure):
+    pass
+
+
+class StyleProperty(Structure):
+    pass
+
+
+class StyleChart(Structure):
+    pass
+
+
+class StyleCombo(Structure):
+    pass
+
+
+class StyleTab(Structure):
+    pass
+
+
+class StyleWindowHeader(Structure):
+    pass
+
+
+class StyleWindow(Structure):
+    pass
+
+
+class Color(Structure):
+    pass
+
+
+class ColorF(Structure):
+    pass
+
+
+class Vec2(Structure):
+    pass
+
+
+class Vec2i(Structure):
+    pass
+
+
+class Rect(Structure):
+    pass
+
+
+class Recti(Structure):
+    pass
+
+
+class Handle(Union):
+    pass
+
+
+class Image(Structure):
+    pass
+
+
+class Cursor(Structure):
+    pass
+
+
+class Scroll(Structure):
+    pass
+
+
+class DrawNullTexture(Structure):
+    pass
+
+
+class Command(Structure):
+    pass
+
+
+class Window(Structure):
+    pass
+
+
+class ListView(Structure):
+    pass
+
+
+class UserFontGlyph(Structure):
+    pass
+
+
+class Font(Structure):
+    pass
+
+
+class BakedFont(Structure):
+    pass
+
+
+class FontConfig(Structure):
+    pass
+
+
+class FontGlyph(Structure):
+    pass
+
+
+class FontAtlas(Structure):
+    pass
+
+
+class MemoryStatus(Structure):
+    pass
+
+
+class BufferMarker(Structure):
+    pass
+
+
+class Memory(Structure):
+    pass
+
+
+class Str(Structure):
+    pass
+
+
+class Clipboard(Structure):
+    pass
+
+
+class TextUndoRecord(Structure):
+    pass
+
+
+class TextUndoState(Structure):
+    pass
+
+
+class CommandScissor(Structure):
+    pass
+
+
+class CommandLine(Structure):
+    pass
+
+
+class CommandCurve(Structure):
+    pass
+
+
+class CommandRect(Structure):
+    pass
+
+
+class CommandRectFilled(Structure):
+    pass
+
+
+class CommandRectMultiColor(Structure):
+    pass
+
+
+class CommandTriangle(Structure):
+    pass
+
+
+class CommandTriangleFilled(Structure):
+    pass
+
+
+class CommandCircle(Structure):
+    pass
+
+
+class CommandCircleFilled(Structure):
+    pass
+
+
+class CommandArc(Structure):
+    pass
+
+
+class CommandArcFilled(Structure):
+    pass
+
+
+class CommandPolygon(Structure):
+    pass
+
+
+class CommandPolygonFilled(Structure):
+    pass
+
+
+class CommandPolyline(Structure):
+    pass
+
+
+class CommandImage(Structure):
+    pass
+
+
+class CommandCustom(Structure):
+    pass
+
+
+class CommandText(Structure):
+    pass
+
+
+class MouseButton(Structure):
+    pass
+
+
+class Mouse(Structure):
+    pass
+
+
+class Key(Structure):
+    pass
+
+
+class Keyboard(Structure):
+    pass
+
+
+class Input(Structure):
+    pass
+
+
+class StyleItemData(Union):
+    pass
+
+
+class StyleText(Structure):
+    pass
+
+
+class StyleSlider(Structure):
+    pass
+
+
+class Style(Structure):
+    pass
+
+
+class ChartSlot(Structure):
+    pass
+
+
+class Chart(Structure):
+    pass
+
+
+class RowLayout(Structure):
+    pass
+
+
+class PopupBuffer(Structure):
+    pass
+
+
+class MenuState(Structure):
+    pass
+
+
+class Table(Structure):
+    pass
+
+
+class PopupState(Structure):
+    pass
+
+
+class EditState(Structure):
+    pass
+
+
+class PropertyState(Structure):
+    pass
+
+
+class ConfigStackStyleItemElement(Structure):
+    pass
+
+
+class ConfigStackFloatElement(Structure):
+    pass
+
+
+class ConfigStackVec2Element(Structure):
+    pass
+
+
+class ConfigStackFlagsElement(Structure):
+    pass
+
+
+class ConfigStackColorElement(Structure):
+    pass
+
+
+class ConfigStackUserFontElement(Structure):
+    pass
+
+
+class ConfigStackButtonBehaviorElement(Structure):
+    pass
+
+
+class ConfigStackStyleItem(Structure):
+    pass
+
+
+class ConfigStackFloat(Structure):
+    pass
+
+
+class ConfigStackVec2(Structure):
+    pass
+
+
+class ConfigStackFlags(Structure):
+    pass
+
+
+class ConfigStackColor(Structure):
+    pass
+
+
+class ConfigStackUserFont(Structure):
+    pass
+
+
+class ConfigStackButtonBehavior(Structure):
+    pass
+
+
+class ConfigurationStacks(Structure):
+    pass
+
+
+class PageData(Union):
+    pass
+
+
+class PageElement(Structure):
+    pass
+
+
+class Page(Structure):
+    pass
+
+
+class Pool(Structure):
+    pass
+
+
+class FontPages(Structure):
+    pass
+
+
+class Glfw(Structure):
+    pass
+
+
+class Glfw3GlState(Structure):
+    pass
+
+
+class Glfw3Stats(Structure):
+    pass
+
+
+class RasterVertex(Structure):
+    pass
+
+
+class RasterImage(Structure):
+    pass
+
+
+
+# callback types, for building structures such as UserFont
+
+nk_plugin_alloc = CFUNCTYPE(c_void_p, Handle, c_void_p, nk_size)
+nk_plugin_free = CFUNCTYPE(None, Handle, c_void_p)
+nk_plugin_filter = CFUNCTYPE(c_int, POINTER(TextEdit), nk_rune)
+nk_plugin_paste = CFUNCTYPE(None, Handle, POINTER(TextEdit))
+nk_plugin_copy = CFUNCTYPE(None, Handle, POINTER(c_char), c_int)
+nk_text_width_f = CFUNCTYPE(c_float, Handle, c_float, POINTER(c_char), c_int)
+nk_query_font_glyph_f = CFUNCTYPE(None, Handle, c_float, POINTER(UserFontGlyph), nk_rune, nk_rune)
+nk_command_custom_callback = CFUNCTYPE(None, c_void_p, c_short, c_short, c_ushort, c_ushort, Handle)
+
+
+# layouts, ordered so that members are complete before use
+
+BufferMarker._fields_ = [('active', c_int),
+                         ('offset', nk_size)]
+
+Handle._fields_ = [('ptr', c_void_p),
+                   ('id', c_int)]
+
+Allocator._fields_ = [('userdata', Handle),
+                      ('alloc', nk_plugin_alloc),
+                      ('free', nk_plugin_free)]
+
+Memory._fields_ = [('ptr', c_void_p),
+                   ('size', nk_size)]
+
+Buffer._fields_ = [('marker', (BufferMarker * 2)),
+                   ('pool', Allocator),
+                   ('type', c_int),
+                   ('memory', Memory),
+                   ('grow_factor', c_float),
+                   ('allocated', nk_size),
+                   ('needed', nk_size),
+                   ('calls', nk_size),
+                   ('size', nk_size)]
+
+Rect._fields_ = [('x', c_float),
+                 ('y', c_float),
+                 ('w', c_float),
+                 ('h', c_float)]
+
+CommandBuffer._fields_ = [('base', POINTER(Buffer)),
+                          ('clip', Rect),
+                          ('use_clipping', c_int),
+                          ('userdata', Handle),
+                          ('begin', nk_size),
+                          ('end', nk_size),
+                          ('last', nk_size)]
+
+DrawCommand._fields_ = [('elem_count', c_uint),
+                        ('clip_rect', Rect),
+                        ('texture', Handle)]
+
+Vec2._fields_ = [('x', c_float),
+                 ('y', c_float)]
+
+DrawNullTexture._fields_ = [('texture', Handle),
+                            ('uv', Vec2)]
+
+ConvertConfig._fields_ = [('global_alpha', c_float),
+                          ('line_AA', c_int),
+                          ('shape_AA', c_int),
+                          ('circle_segment_count', c_uint),
+                          ('arc_segment_count', c_uint),
+                          ('curve_segment_count', c_uint),
+                          ('null', DrawNullTexture),
+                          ('vertex_layout', POINTER(DrawVertexLayoutElement)),
+                          ('vertex_size', nk_size),
+                          ('vertex_alignment', nk_size)]
+
+Image._fields_ = [('handle', Handle),
+                  ('w', c_ushort),
+                  ('h', c_ushort),
+                  ('region', (c_ushort * 4))]
+
+Color._fields_ = [('r', nk_byte),
+                  ('g', nk_byte),
+                  ('b', nk_byte),
+                  ('a', nk_byte)]
+
+StyleItemData._fields_ = [('image', Image),
+                          ('color', Color)]
+
+StyleItem._fields_ = [('type', c_int),
+                      ('data', StyleItemData)]
+
+Clipboard._fields_ = [('userdata', Handle),
+                      ('paste', nk_plugin_paste),
+                      ('copy', nk_plugin_copy)]
+
+Str._fields_ = [('buffer', Buffer),
+                ('len', c_int)]
+
+TextUndoRecord._fields_ = [('where', c_int),
+                           ('insert_length', c_short),
+                           ('delete_length', c_short),
+                           ('char_storage', c_short)]
+
+TextUndoState._fields_ = [('undo_rec', (TextUndoRecord * 99)),
+                          ('undo_char', (nk_rune * 999)),
+                          ('undo_point', c_short),
+                          ('redo_point', c_short),
+                          ('undo_char_point', c_short),
+                          ('redo_char_point', c_short)]
+
+TextEdit._fields_ = [('clip', Clipboard),
+                     ('string', Str),
+                     ('filter', nk_plugin_filter),
+                     ('scrollbar', Vec2),
+                     ('cursor', c_int),
+                     ('select_start', c_int),
+                     ('select_end', c_int),
+                     ('mode', c_ubyte),
+                     ('cursor_at_end_of_line', c_ubyte),
+                     ('initialized', c_ubyte),
+                     ('has_preferred_x', c_ubyte),
+                     ('single_line', c_ubyte),
+                     ('active', c_ubyte),
+                     ('padding1', c_ubyte),
+                     ('preferred_x', c_float),
+                     ('undo', TextUndoState)]
+
+DrawList._fields_ = [('clip_rect', Rect),
+                     ('circle_vtx', (Vec2 * 12)),
+                     ('config', ConvertConfig),
+                     ('buffer', POINTER(Buffer)),
+                     ('vertices', POINTER(Buffer)),
+                     ('elements', POINTER(Buffer)),
+                     ('element_count', c_uint),
+                     ('vertex_count', c_uint),
+                     ('cmd_count', c_uint),
+                     ('cmd_offset', nk_size),
+                     ('path_count', c_uint),
+                     ('path_offset', c_uint),
+                     ('line_AA', c_int),
+                     ('shape_AA', c_int)]
+
+UserFont._fields_ = [('userdata', Handle),
+                     ('height', c_float),
+                     ('width', nk_text_width_f),
+                     ('query', nk_query_font_glyph_f),
+                     ('texture', Handle)]
+
+Scroll._fields_ = [('x', nk_uint),
+                   ('y', nk_uint)]
+
+MenuState._fields_ = [('x', c_float),
+                      ('y', c_float),
+                      ('w', c_float),
+                      ('h', c_float),
+                      ('offset', Scroll)]
+
+RowLayout._fields_ = [('type', c_int),
+                      ('index', c_int),
+                      ('height', c_float),
+                      ('min_height', c_float),
+                      ('columns', c_int),
+                      ('ratio', POINTER(c_float)),
+                      ('item_width', c_float),
+                      ('item_height', c_float),
+                      ('item_offset', c_float),
+                      ('filled', c_float),
+                      ('item', Rect),
+                      ('tree_depth', c_int),
+                      ('templates', (c_float * 16))]
+
+ChartSlot._fields_ = [('type', c_int),
+                      ('color', Color),
+                      ('highlight', Color),
+                      ('min', c_float),
+                      ('max', c_float),
+                      ('range', c_float),
+                      ('count', c_int),
+                      ('last', Vec2),
+                      ('index', c_int)]
+
+Chart._fields_ = [('slot', c_int),
+                  ('x', c_float),
+                  ('y', c_float),
+                  ('w', c_float),
+                  ('h', c_float),
+                  ('slots', (ChartSlot * 4))]
+
+Panel._fields_ = [('type', c_int),
+                  ('flags', nk_flags),
+                  ('bounds', Rect),
+                  ('offset_x', POINTER(nk_uint)),
+                  ('offset_y', POINTER(nk_uint)),
+                  ('at_x', c_float),
+                  ('at_y', c_float),
+                  ('max_x', c_float),
+                  ('footer_height', c_float),
+                  ('header_height', c_float),
+                  ('border', c_float),
+                  ('has_scrolling', c_uint),
+                  ('clip', Rect),
+                  ('menu', MenuState),
+                  ('row', RowLayout),
+                  ('chart', Chart),
+                  ('buffer', POINTER(CommandBuffer)),
+                  ('parent', POINTER(Panel))]
+
+Key._fields_ = [('down', c_int),
+                ('clicked', c_uint)]
+
+Keyboard._fields_ = [('keys', (Key * 30)),
+                     ('text', (c_char * 16)),
+                     ('text_len', c_int)]
+
+MouseButton._fields_ = [('down', c_int),
+                        ('clicked', c_uint),
+                        ('clicked_pos', Vec2)]
+
+Mouse._fields_ = [('buttons', (MouseButton * 4)),
+                  ('pos', Vec2),
+                  ('prev', Vec2),
+                  ('delta', Vec2),
+                  ('scroll_delta', Vec2),
+                  ('grab', c_ubyte),
+                  ('grabbed', c_ubyte),
+                  ('ungrab', c_ubyte)]
+
+Input._fields_ = [('keyboard', Keyboard),
+                  ('mouse', Mouse)]
+
+StyleText._fields_ = [('color', Color),
+                      ('padding', Vec2)]
+
+StyleButton._fields_ = [('normal', StyleItem),
+                        ('hover', StyleItem),
+                        ('active', StyleItem),
+                        ('border_color', Color),
+                        ('text_background', Color),
+                        ('text_normal', Color),
+                        ('text_hover', Color),
+                        ('text_active', Color),
+                        ('text_alignment', nk_flags),
+                        ('border', c_float),
+                        ('rounding', c_float),
+                        ('padding', Vec2),
+                        ('image_padding', Vec2),
+                        ('touch_padding', Vec2),
+                        ('userdata', Handle),
+                        ('draw_begin', c_void_p),
+                        ('draw_end', c_void_p)]
+
+StyleToggle._fields_ = [('normal', StyleItem),
+                        ('hover', StyleItem),
+                        ('active', StyleItem),
+                        ('border_color', Color),
+                        ('cursor_normal', StyleItem),
+                        ('cursor_hover', StyleItem),
+                        ('text_normal', Color),
+                        ('text_hover', Color),
+                        ('text_active', Color),
+                        ('text_background', Color),
+                        ('text_alignment', nk_flags),
+                        ('padding', Vec2),
+                        ('touch_padding', Vec2),
+                        ('spacing', c_float),
+                        ('border', c_float),
+                        ('userdata', Handle),
+                        ('draw_begin', c_void_p),
+                        ('draw_end', c_void_p)]
+
+StyleSelectable._fields_ = [('normal', StyleItem),
+                            ('hover', StyleItem),
+                            ('pressed', StyleItem),
+                            ('normal_active', StyleItem),
+                            ('hover_active', StyleItem),
+                            ('pressed_active', StyleItem),
+                            ('text_normal', Color),
+                            ('text_hover', Color),
+                            ('text_pressed', Color),
+                            ('text_normal_active', Color),
+                            ('text_hover_active', Color),
+                            ('text_pressed_active', Color),
+                            ('text_background', Color),
+                            ('text_alignment', nk_flags),
+                            ('rounding', c_float),
+                            ('padding', Vec2),
+                            ('touch_padding', Vec2),
+                            ('image_padding', Vec2),
+                            ('userdata', Handle),
+                            ('draw_begin', c_void_p),
+                            ('draw_end', c_void_p)]
+
+StyleSlider._fields_ = [('normal', StyleItem),
+                        ('hover', StyleItem),
+                        ('active', StyleItem),
+                        ('border_color', Color),
+                        ('bar_normal', Color),
+                        ('bar_hover', Color),
+                        ('bar_active', Color),
+                        ('bar_filled', Color),
+                        ('cursor_normal', StyleItem),
+                        ('cursor_hover', StyleItem),
+                        ('cursor_active', StyleItem),
+                        ('border', c_float),
+                        ('rounding', c_float),
+                        ('bar_height', c_float),
+                        ('padding', Vec2),
+                        ('spacing', Vec2),
+                        ('cursor_size', Vec2),
+                        ('show_buttons', c_int),
+                        ('inc_button', StyleButton),
+                        ('dec_button', StyleButton),
+                        ('inc_symbol', c_int),
+                        ('dec_symbol', c_int),
+                        ('userdata', Handle),
+                        ('draw_begin', c_void_p),
+                        ('draw_end', c_void_p)]
+
+StyleProgress._fields_ = [('normal', StyleItem),
+                          ('hover', StyleItem),
+                          ('active', StyleItem),
+                          ('border_color', Color),
+                          ('cursor_normal', StyleItem),
+                          ('cursor_hover', StyleItem),
+                          ('cursor_active', StyleItem),
+                          ('cursor_border_color', Color),
+                          ('rounding', c_float),
+                          ('border', c_float),
+                          ('cursor_border', c_float),
+                          ('cursor_rounding', c_float),
+                          ('padding', Vec2),
+                          ('userdata', Handle),
+                          ('draw_begin', c_void_p),
+                          ('draw_end', c_void_p)]
+
+StyleScrollbar._fields_ = [('normal', StyleItem),
+                           ('hover', StyleItem),
+                           ('active', StyleItem),
+                           ('border_color', Color),
+                           ('cursor_normal', StyleItem),
+                           ('cursor_hover', StyleItem),
+                           ('cursor_active', StyleItem),
+                           ('cursor_border_color', Color),
+                           ('border', c_float),
+                           ('rounding', c_float),
+                           ('border_cursor', c_float),
+                           ('rounding_cursor', c_float),
+                           ('padding', Vec2),
+                           ('show_buttons', c_int),
+                           ('inc_button', StyleButton),
+                           ('dec_button', StyleButton),
+                           ('inc_symbol', c_int),
+                           ('dec_symbol', c_int),
+                           ('userdata', Handle),
+                           ('draw_begin', c_void_p),
+                           ('draw_end', c_void_p)]
+
+StyleEdit._fields_ = [('normal', StyleItem),
+                      ('hover', StyleItem),
+                      ('active', StyleItem),
+                      ('border_color', Color),
+                      ('scrollbar', StyleScrollbar),
+                      ('cursor_normal', Color),
+                      ('cursor_hover', Color),
+                      ('cursor_text_normal', Color),
+                      ('cursor_text_hover', Color),
+                      ('text_normal', Color),
+                      ('text_hover', Color),
+                      ('text_active', Color),
+                      ('selected_normal', Color),
+                      ('selected_hover', Color),
+                      ('selected_text_normal', Color),
+                      ('selected_text_hover', Color),
+                      ('border', c_float),
+                      ('rounding', c_float),
+                      ('cursor_size', c_float),
+                      ('scrollbar_size', Vec2),
+                      ('padding', Vec2),
+                      ('row_padding', c_float)]
+
+StyleProperty._fields_ = [('normal', StyleItem),
+                          ('hover', StyleItem),
+                          ('active', StyleItem),
+                          ('border_color', Color),
+                          ('label_normal', Color),
+                          ('label_hover', Color),
+                          ('label_active', Color),
+                          ('sym_left', c_int),
+                          ('sym_right', c_int),
+                          ('border', c_float),
+                          ('rounding', c_float),
+                          ('padding', Vec2),
+                          ('edit', StyleEdit),
+                          ('inc_button', StyleButton),
+                          ('dec_button', StyleButton),
+                          ('userdata', Handle),
+                          ('draw_begin', c_void_p),
+                          ('draw_end', c_void_p)]
+
+StyleChart._fields_ = [('background', StyleItem),
+                       ('border_color', Color),
+                       ('selected_color', Color),
+                       ('color', Color),
+                       ('border', c_float),
+                       ('rounding', c_float),
+                       ('padding', Vec2)]
+
+StyleTab._fields_ = [('background', StyleItem),
+                     ('border_color', Color),
+                     ('text', Color),
+                     ('tab_maximize_button', StyleButton),
+                     ('tab_minimize_button', StyleButton),
+                     ('node_maximize_button', StyleButton),
+                     ('node_minimize_button', StyleButton),
+                     ('sym_minimize', c_int),
+                     ('sym_maximize', c_int),
+                     ('border', c_float),
+                     ('rounding', c_float),
+                     ('indent', c_float),
+                     ('padding', Vec2),
+                     ('spacing', Vec2)]
+
+StyleCombo._fields_ = [('normal', StyleItem),
+                       ('hover', StyleItem),
+                       ('active', StyleItem),
+                       ('border_color', Color),
+                       ('label_normal', Color),
+                       ('label_hover', Color),
+                       ('label_active', Color),
+                       ('symbol_normal', Color),
+                       ('symbol_hover', Color),
+                       ('symbol_active', Color),
+                       ('button', StyleButton),
+                       ('sym_normal', c_int),
+                       ('sym_hover', c_int),
+                       ('sym_active', c_int),
+                       ('border', c_float),
+                       ('rounding', c_float),
+                       ('content_padding', Vec2),
+                       ('button_padding', Vec2),
+                       ('spacing', Vec2)]
+
+StyleWindowHeader._fields_ = [('normal', StyleItem),
+                              ('hover', StyleItem),
+                              ('active', StyleItem),
+                              ('close_button', StyleButton),
+                              ('minimize_button', StyleButton),
+                              ('close_symbol', c_int),
+                              ('minimize_symbol', c_int),
+                              ('maximize_symbol', c_int),
+                              ('label_normal', Color),
+                              ('label_hover', Color),
+                              ('label_active', Color),
+                              ('align', c_int),
+                              ('padding', Vec2),
+                              ('label_padding', Vec2),
+                              ('spacing', Vec2)]
+
+StyleWindow._fields_ = [('header', StyleWindowHeader),
+                        ('fixed_background', StyleItem),
+                        ('background', Color),
+                        ('border_color', Color),
+                        ('popup_border_color', Color),
+                        ('combo_border_color', Color),
+                        ('contextual_border_color', Color),
+                        ('menu_border_color', Color),
+                        ('group_border_color', Color),
+                        ('tooltip_border_color', Color),
+                        ('scaler', StyleItem),
+                        ('border', c_float),
+                        ('combo_border', c_float),
+                        ('contextual_border', c_float),
+                        ('menu_border', c_float),
+                        ('group_border', c_float),
+                        ('tooltip_border', c_float),
+                        ('popup_border', c_float),
+                        ('min_row_height_padding', c_float),
+                        ('rounding', c_float),
+                        ('spacing', Vec2),
+                        ('scrollbar_size', Vec2),
+                        ('min_size', Vec2),
+                        ('padding', Vec2),
+                        ('group_padding', Vec2),
+                        ('popup_padding', Vec2),
+                        ('combo_padding', Vec2),
+                        ('contextual_padding', Vec2),
+                        ('menu_padding', Vec2),
+                        ('tooltip_padding', Vec2)]
+
+Style._fields_ = [('font', POINTER(UserFont)),
+                  ('cursors', (POINTER(Cursor) * 7)),
+                  ('cursor_active', POINTER(Cursor)),
+                  ('cursor_last', POINTER(Cursor)),
+                  ('cursor_visible', c_int),
+                  ('text', StyleText),
+                  ('button', StyleButton),
+                  ('contextual_button', StyleButton),
+                  ('menu_button', StyleButton),
+                  ('option', StyleToggle),
+                  ('checkbox', StyleToggle),
+                  ('selectable', StyleSelectable),
+                  ('slider', StyleSlider),
+                  ('progress', StyleProgress),
+                  ('property', StyleProperty),
+                  ('edit', StyleEdit),
+                  ('chart', StyleChart),
+                  ('scrollh', StyleScrollbar),
+                  ('scrollv', StyleScrollbar),
+                  ('tab', StyleTab),
+                  ('combo', StyleCombo),
+                  ('window', StyleWindow)]
+
+ConfigStackStyleItemElement._fields_ = [('address', POINTER(StyleItem)),
+                                        ('old_value', StyleItem)]
+
+ConfigStackStyleItem._fields_ = [('head', c_int),
+                                 ('elements', (ConfigStackStyleItemElement * 16))]
+
+ConfigStackFloatElement._fields_ = [('address', POINTER(c_float)),
+                                    ('old_value', c_float)]
+
+ConfigStackFloat._fields_ = [('head', c_int),
+                             ('elements', (ConfigStackFloatElement * 32))]
+
+ConfigStackVec2Element._fields_ = [('address', POINTER(Vec2)),
+                                   ('old_value', Vec2)]
+
+ConfigStackVec2._fields_ = [('head', c_int),
+                            ('elements', (ConfigStackVec2Element * 16))]
+
+ConfigStackFlagsElement._fields_ = [('address', POINTER(nk_flags)),
+                                    ('old_value', nk_flags)]
+
+ConfigStackFlags._fields_ = [('head', c_int),
+                             ('elements', (ConfigStackFlagsElement * 32))]
+
+ConfigStackColorElement._fields_ = [('address', POINTER(Color)),
+                                    ('old_value', Color)]
+
+ConfigStackColor._fields_ = [('head', c_int),
+                             ('elements', (ConfigStackColorElement * 32))]
+
+ConfigStackUserFontElement._fields_ = [('address', POINTER(POINTER(UserFont))),
+                                       ('old_value', POINTER(UserFont))]
+
+ConfigStackUserFont._fields_ = [('head', c_int),
+                                ('elements', (ConfigStackUserFontElement * 8))]
+
+ConfigStackButtonBehaviorElement._fields_ = [('address', POINTER(c_int)),
+                                             ('old_value', c_int)]
+
+ConfigStackButtonBehavior._fields_ = [('head', c_int),
+                                      ('elements', (ConfigStackButtonBehaviorElement * 8))]
+
+ConfigurationStacks._fields_ = [('style_items', ConfigStackStyleItem),
+                                ('floats', ConfigStackFloat),
+                                ('vectors', ConfigStackVec2),
+                                ('flags', ConfigStackFlags),
+                                ('colors', ConfigStackColor),
+                                ('fonts', ConfigStackUserFont),
+                                ('button_behaviors', ConfigStackButtonBehavior)]
+
+Pool._fields_ = [('alloc', Allocator),
+                 ('type', c_int),
+                 ('page_count', c_uint),
+                 ('pages', POINTER(Page)),
+                 ('freelist', POINTER(PageElement)),
+                 ('capacity', c_uint),
+                 ('size', nk_size),
+                 ('cap', nk_size)]
+
+Context._fields_ = [('input', Input),
+                    ('style', Style),
+                    ('memory', Buffer),
+                    ('clip', Clipboard),
+                    ('last_widget_state', nk_flags),
+                    ('button_behavior', c_int),
+                    ('stacks', ConfigurationStacks),
+                    ('delta_time_seconds', c_float),
+                    ('draw_list', DrawList),
+                    ('text_edit', TextEdit),
+                    ('overlay', CommandBuffer),
+                    ('build', c_int),
+                    ('use_pool', c_int),
+                    ('pool', Pool),
+                    ('begin', POINTER(Window)),
+                    ('end', POINTER(Window)),
+                    ('active', POINTER(Window)),
+                    ('current', POINTER(Window)),
+                    ('freelist', POINTER(PageElement)),
+                    ('count', c_uint),
+                    ('seq', c_uint)]
+
+DrawVertexLayoutElement._fields_ = [('attribute', c_int),
+                                    ('format', c_int),
+                                    ('offset', nk_size)]
+
+ColorF._fields_ = [('r', c_float),
+                   ('g', c_float),
+                   ('b', c_float),
+                   ('a', c_float)]
+
+Vec2i._fields_ = [('x', c_short),
+                  ('y', c_short)]
+
+Recti._fields_ = [('x', c_short),
+                  ('y', c_short),
+                  ('w', c_short),
+                  ('h', c_short)]
+
+Cursor._fields_ = [('img', Image),
+                   ('size', Vec2),
+                   ('offset', Vec2)]
+
+Command._fields_ = [('type', c_int),
+                    ('next', nk_size)]
+
+PropertyState._fields_ = [('active', c_int),
+                          ('prev', c_int),
+                          ('buffer', (c_char * 64)),
+                          ('length', c_int),
+                          ('cursor', c_int),
+                          ('select_start', c_int),
+                          ('select_end', c_int),
+                          ('name', nk_hash),
+                          ('seq', c_uint),
+                          ('old', c_uint),
+                          ('state', c_int)]
+
+PopupBuffer._fields_ = [('begin', nk_size),
+                        ('parent', nk_size),
+                        ('last', nk_size),
+                        ('end', nk_size),
+                        ('active', c_int)]
+
+PopupState._fields_ = [('win', POINTER(Window)),
+                       ('type', c_int),
+                       ('buf', PopupBuffer),
+                       ('name', nk_hash),
+                       ('active', c_int),
+                       ('combo_count', c_uint),
+                       ('con_count', c_uint),
+                       ('con_old', c_uint),
+                       ('active_con', c_uint),
+                       ('header', Rect)]
+
+EditState._fields_ = [('name', nk_hash),
+                      ('seq', c_uint),
+                      ('old', c_uint),
+                      ('active', c_int),
+                      ('prev', c_int),
+                      ('cursor', c_int),
+                      ('sel_start', c_int),
+                      ('sel_end', c_int),
+                      ('scrollbar', Scroll),
+                      ('mode', c_ubyte),
+                      ('single_line', c_ubyte)]
+
+Window._fields_ = [('seq', c_uint),
+                   ('name', nk_hash),
+                   ('name_string', (c_char * 64)),
+                   ('flags', nk_flags),
+                   ('bounds', Rect),
+                   ('scrollbar', Scroll),
+                   ('buffer', CommandBuffer),
+                   ('layout', POINTER(Panel)),
+                   ('scrollbar_hiding_timer', c_float),
+                   ('property', PropertyState),
+                   ('popup', PopupState),
+                   ('edit', EditState),
+                   ('scrolled', c_uint),
+                   ('tables', POINTER(Table)),
+                   ('table_count', c_uint),
+                   ('next', POINTER(Window)),
+                   ('prev', POINTER(Window)),
+                   ('parent', POINTER(Window))]
+
+ListView._fields_ = [('begin', c_int),
+                     ('end', c_int),
+                     ('count', c_int),
+                     ('total_height', c_int),
+                     ('ctx', POINTER(Context)),
+                     ('scroll_pointer', POINTER(nk_uint)),
+                     ('scroll_value', nk_uint)]
+
+UserFontGlyph._fields_ = [('uv', (Vec2 * 2)),
+                          ('offset', Vec2),
+                          ('width', c_float),
+                          ('height', c_float),
+                          ('xadvance', c_float)]
+
+BakedFont._fields_ = [('height', c_float),
+                      ('ascent', c_float),
+                      ('descent', c_float),
+                      ('glyph_offset', nk_rune),
+                      ('glyph_count', nk_rune),
+                      ('ranges', POINTER(nk_rune))]
+
+Font._fields_ = [('next', POINTER(Font)),
+                 ('handle', UserFont),
+                 ('info', BakedFont),
+                 ('scale', c_float),
+                 ('glyphs', POINTER(FontGlyph)),
+                 ('fallback', POINTER(FontGlyph)),
+                 ('fallback_codepoint', nk_rune),
+                 ('texture', Handle),
+                 ('config', POINTER(FontConfig))]
+
+FontConfig._fields_ = [('next', POINTER(FontConfig)),
+                       ('ttf_blob', c_void_p),
+                       ('ttf_size', nk_size),
+                       ('ttf_data_owned_by_atlas', c_ubyte),
+                       ('merge_mode', c_ubyte),
+                       ('pixel_snap', c_ubyte),
+                       ('oversample_v', c_ubyte),
+                       ('oversample_h', c_ubyte),
+                       ('padding', (c_ubyte * 3)),
+                       ('size', c_float),
+                       ('coord_type', c_int),
+                       ('spacing', Vec2),
+                       ('range', POINTER(nk_rune)),
+                       ('font', POINTER(BakedFont)),
+                       ('fallback_glyph', nk_rune),
+                       ('n', POINTER(FontConfig)),
+                       ('p', POINTER(FontConfig))]
+
+FontGlyph._fields_ = [('codepoint', nk_rune),
+                      ('xadvance', c_float),
+                      ('x0', c_float),
+                      ('y0', c_float),
+                      ('x1', c_float),
+                      ('y1', c_float),
+                      ('w', c_float),
+                      ('h', c_float),
+                      ('u0', c_float),
+                      ('v0', c_float),
+                      ('u1', c_float),
+                      ('v1', c_float)]
+
+FontAtlas._fields_ = [('pixel', c_void_p),
+                      ('tex_width', c_int),
+                      ('tex_height', c_int),
+                      ('permanent', Allocator),
+                      ('temporary', Allocator),
+                      ('custom', Recti),
+                      ('cursors', (Cursor * 7)),
+                      ('glyph_count', c_int),
+                      ('glyphs', POINTER(FontGlyph)),
+                      ('default_font', POINTER(Font)),
+                      ('fonts', POINTER(Font)),
+                      ('config', POINTER(FontConfig)),
+                      ('font_num', c_int)]
+
+MemoryStatus._fields_ = [('memory', c_void_p),
+                         ('type', c_uint),
+                         ('size', nk_size),
+                         ('allocated', nk_size),
+                         ('needed', nk_size),
+                         ('calls', nk_size)]
+
+CommandScissor._fields_ = [('header', Command),
+                           ('x', c_short),
+                           ('y', c_short),
+                           ('w', c_ushort),
+                           ('h', c_ushort)]
+
+CommandLine._fields_ = [('header', Command),
+                        ('line_thickness', c_ushort),
+                        ('begin', Vec2i),
+                        ('end', Vec2i),
+                        ('color', Color)]
+
+CommandCurve._fields_ = [('header', Command),
+                         ('line_thickness', c_ushort),
+                         ('begin', Vec2i),
+                         ('end', Vec2i),
+                         ('ctrl', (Vec2i * 2)),
+                         ('color', Color)]
+
+CommandRect._fields_ = [('header', Command),
+                        ('rounding', c_ushort),
+                        ('line_thickness', c_ushort),
+                        ('x', c_short),
+                        ('y', c_short),
+                        ('w', c_ushort),
+                        ('h', c_ushort),
+                        ('color', Color)]
+
+CommandRectFilled._fields_ = [('header', Command),
+                              ('rounding', c_ushort),
+                              ('x', c_short),
+                              ('y', c_short),
+                              ('w', c_ushort),
+                              ('h', c_ushort),
+                              ('color', Color)]
+
+CommandRectMultiColor._fields_ = [('header', Command),
+                                  ('x', c_short),
+                                  ('y', c_short),
+                                  ('w', c_ushort),
+                                  ('h', c_ushort),
+                                  ('left', Color),
+                                  ('top', Color),
+                                  ('bottom', Color),
+                                  ('right', Color)]
+
+CommandTriangle._fields_ = [('header', Command),
+                            ('line_thickness', c_ushort),
+                            ('a', Vec2i),
+                            ('b', Vec2i),
+                            ('c', Vec2i),
+                            ('color', Color)]
+
+CommandTriangleFilled._fields_ = [('header', Command),
+                                  ('a', Vec2i),
+                                  ('b', Vec2i),
+                                  ('c', Vec2i),
+                                  ('color', Color)]
+
+CommandCircle._fields_ = [('header', Command),
+                          ('x', c_short),
+                          ('y', c_short),
+                          ('line_thickness', c_ushort),
+                          ('w', c_ushort),
+                          ('h', c_ushort),
+                          ('color', Color)]
+
+CommandCircleFilled._fields_ = [('header', Command),
+                                ('x', c_short),
+                                ('y', c_short),
+                                ('w', c_ushort),
+                                ('h', c_ushort),
+                                ('color', Color)]
+
+CommandArc._fields_ = [('header', Command),
+                       ('cx', c_short),
+                       ('cy', c_short),
+                       ('r', c_ushort),
+                       ('line_thickness', c_ushort),
+                       ('a', (c_float * 2)),
+                       ('color', Color)]
+
+CommandArcFilled._fields_ = [('header', Command),
+                             ('cx', c_short),
+                             ('cy', c_short),
+                             ('r', c_ushort),
+                             ('a', (c_float * 2)),
+                             ('color', Color)]
+
+CommandPolygon._fields_ = [('header', Command),
+                           ('color', Color),
+                           ('line_thickness', c_ushort),
+                           ('point_count', c_ushort),
+                           ('points', (Vec2i * 1))]
+
+CommandPolygonFilled._fields_ = [('header', Command),
+                                 ('color', Color),
+                                 ('point_count', c_ushort),
+                                 ('points', (Vec2i * 1))]
+
+CommandPolyline._fields_ = [('header', Command),
+                            ('color', Color),
+                            ('line_thickness', c_ushort),
+                            ('point_count', c_ushort),
+                            ('points', (Vec2i * 1))]
+
+CommandImage._fields_ = [('header', Command),
+                         ('x', c_short),
+                         ('y', c_short),
+                         ('w', c_ushort),
+                         ('h', c_ushort),
+                         ('img', Image),
+                         ('col', Color)]
+
+CommandCustom._fields_ = [('header', Command),
+                          ('x', c_short),
+                          ('y', c_short),
+                          ('w', c_ushort),
+                          ('h', c_ushort),
+                          ('callback_data', Handle),
+                          ('callback', nk_command_custom_callback)]
+
+CommandText._fields_ = [('header', Command),
+                        ('font', POINTER(UserFont)),
+                        ('background', Color),
+                        ('foreground', Color),
+                        ('x', c_short),
+                        ('y', c_short),
+                        ('w', c_ushort),
+                        ('h', c_ushort),
+                        ('height', c_float),
+                        ('length', c_int),
+                        ('string', (c_char * 1))]
+
+Table._fields_ = [('seq', c_uint),
+                  ('size', c_uint),
+                  ('keys', (nk_hash * ((((sizeof(Panel)) if ((sizeof(Window)) < (sizeof(Panel))) else (sizeof(Window))) // sizeof(nk_uint)) // 2))),
+                  ('values', (nk_uint * ((((sizeof(Panel)) if ((sizeof(Window)) < (sizeof(Panel))) else (sizeof(Window))) // sizeof(nk_uint)) // 2))),
+                  ('next', POINTER(Table)),
+                  ('prev', POINTER(Table))]
+
+PageData._fields_ = [('tbl', Table),
+                     ('pan', Panel),
+                     ('win', Window)]
+
+PageElement._fields_ = [('data', PageData),
+                        ('next', POINTER(PageElement)),
+                        ('prev', POINTER(PageElement))]
+
+Page._fields_ = [('size', c_uint),
+                 ('next', POINTER(Page)),
+                 ('win', (PageElement * 1))]
+
+Glfw3GlState._fields_ = [('blend', c_int),
+                         ('cull_face', c_int),
+                         ('depth_test', c_int),
+                         ('scissor_test', c_int),
+                         ('blend_src_rgb', c_int),
+                         ('blend_dst_rgb', c_int),
+                         ('blend_src_alpha', c_int),
+                         ('blend_dst_alpha', c_int),
+                         ('blend_equation_rgb', c_int),
+                         ('blend_equation_alpha', c_int),
+                         ('viewport', (c_int * 4)),
+                         ('scissor_box', (c_int * 4)),
+                         ('program', c_int),
+                         ('active_texture', c_int),
+                         ('texture', c_int),
+                         ('vertex_array', c_int),
+                         ('array_buffer', c_int)]
+
+Glfw3Stats._fields_ = [('convert_time', c_double),
+                       ('draw_time', c_double),
+                       ('gpu_time', c_double),
+                       ('state_time', c_double),
+                       ('vertices', c_uint),
+                       ('elements', c_uint),
+                       ('draw_commands', c_uint),
+                       ('batches', c_uint),
+                       ('texture_binds', c_uint),
+                       ('scissor_changes', c_uint),
+                       ('command_bytes', nk_size),
+                       ('streamed_bytes', nk_size)]
+
+RasterVertex._fields_ = [('position', (c_float * 2)),
+                         ('uv', (c_float * 2)),
+                         ('col', (nk_byte * 4))]
+
+RasterImage._fields_ = [('pixels', POINTER(nk_byte)),
+                        ('width', c_int),
+                        ('height', c_int),
+                        ('stride', c_int)]
+
+# opaque, only usable through pointers:
+#   StyleSlide (no definition)
+#   FontPages (no definition)
+#   Glfw (no definition)
+
+
+# procedures
+
+nk_init_default = _nuklear.nk_init_default
+nk_init_default.argtypes = [POINTER(Context), POINTER(UserFont)]
+nk_init_default.restype = c_int
+
+nk_init_fixed = _nuklear.nk_init_fixed
+nk_init_fixed.argtypes = [POINTER(Context), c_void_p, nk_size,
+                          POINTER(UserFont)]
+nk_init_fixed.restype = c_int
+
+nk_init = _nuklear.nk_init
+nk_init.argtypes = [POINTER(Context), POINTER(Allocator), POINTER(UserFont)]
+nk_init.restype = c_int
+
+nk_init_custom = _nuklear.nk_init_custom
+nk_init_custom.argtypes = [POINTER(Context), POINTER(Buffer), POINTER(Buffer),
+                           POINTER(UserFont)]
+nk_init_custom.restype = c_int
+
+nk_clear = _nuklear.nk_clear
+nk_clear.argtypes = [POINTER(Context)]
+nk_clear.restype = None
+
+nk_free = _nuklear.nk_free
+nk_free.argtypes = [POINTER(Context)]
+nk_free.restype = None
+
+nk_input_begin = _nuklear.nk_input_begin
+nk_input_begin.argtypes = [POINTER(Context)]
+nk_input_begin.restype = None
+
+nk_input_motion = _nuklear.nk_input_motion
+nk_input_motion.argtypes = [POINTER(Context), c_int, c_int]
+nk_input_motion.restype = None
+
+nk_input_key = _nuklear.nk_input_key
+nk_input_key.argtypes = [POINTER(Context), c_int, c_int]
+nk_input_key.restype = None
+
+nk_input_button = _nuklear.nk_input_button
+nk_input_button.argtypes = [POINTER(Context), c_int, c_int, c_int, c_int]
+nk_input_button.restype = None
+
+nk_input_scroll = _nuklear.nk_input_scroll
+nk_input_scroll.argtypes = [POINTER(Context), Vec2]
+nk_input_scroll.restype = None
+
+nk_input_char = _nuklear.nk_input_char
+nk_input_char.argtypes = [POINTER(Context), c_char]
+nk_input_char.restype = None
+
+nk_input_glyph = _nuklear.nk_input_glyph
+nk_input_glyph.argtypes = [POINTER(Context), c_char_p]
+nk_input_glyph.restype = None
+
+nk_input_unicode = _nuklear.nk_input_unicode
+nk_input_unicode.argtypes = [POINTER(Context), nk_rune]
+nk_input_unicode.restype = None
+
+nk_input_end = _nuklear.nk_input_end
+nk_input_end.argtypes = [POINTER(Context)]
+nk_input_end.restype = None
+
+nk__begin = _nuklear.nk__begin
+nk__begin.argtypes = [POINTER(Context)]
+nk__begin.restype = POINTER(Command)
+
+nk__next = _nuklear.nk__next
+nk__next.argtypes = [POINTER(Context), POINTER(Command)]
+nk__next.restype = POINTER(Command)
+
+nk_convert = _nuklear.nk_convert
+nk_convert.argtypes = [POINTER(Context), POINTER(Buffer), POINTER(Buffer),
+                       POINTER(Buffer), POINTER(ConvertConfig)]
+nk_convert.restype = nk_flags
+
+nk__draw_begin = _nuklear.nk__draw_begin
+nk__draw_begin.argtypes = [POINTER(Context), POINTER(Buffer)]
+nk__draw_begin.restype = POINTER(DrawCommand)
+
+nk__draw_end = _nuklear.nk__draw_end
+nk__draw_end.argtypes = [POINTER(Context), POINTER(Buffer)]
+nk__draw_end.restype = POINTER(DrawCommand)
+
+nk__draw_next = _nuklear.nk__draw_next
+nk__draw_next.argtypes = [POINTER(DrawCommand), POINTER(Buffer),
+                          POINTER(Context)]
+nk__draw_next.restype = POINTER(DrawCommand)
+
+nk_begin = _nuklear.nk_begin
+nk_begin.argtypes = [POINTER(Context), c_char_p, Rect, nk_flags]
+nk_begin.restype = c_int
+
+nk_begin_titled = _nuklear.nk_begin_titled
+nk_begin_titled.argtypes = [POINTER(Context), c_char_p, c_char_p, Rect,
+                            nk_flags]
+nk_begin_titled.restype = c_int
+
+nk_end = _nuklear.nk_end
+nk_end.argtypes = [POINTER(Context)]
+nk_end.restype = None
+
+nk_window_find = _nuklear.nk_window_find
+nk_window_find.argtypes = [POINTER(Context), c_char_p]
+nk_window_find.restype = POINTER(Window)
+
+nk_window_get_bounds = _nuklear.nk_window_get_bounds
+nk_window_get_bounds.argtypes = [POINTER(Context)]
+nk_window_get_bounds.restype = Rect
+
+nk_window_get_position = _nuklear.nk_window_get_position
+nk_window_get_position.argtypes = [POINTER(Context)]
+nk_window_get_position.restype = Vec2
+
+nk_window_get_size = _nuklear.nk_window_get_size
+nk_window_get_size.argtypes = [POINTER(Context)]
+nk_window_get_size.restype = Vec2
+
+nk_window_get_width = _nuklear.nk_window_get_width
+nk_window_get_width.argtypes = [POINTER(Context)]
+nk_window_get_width.restype = c_float
+
+nk_window_get_height = _nuklear.nk_window_get_height
+nk_window_get_height.argtypes = [POINTER(Context)]
+nk_window_get_height.restype = c_float
+
+nk_window_get_panel = _nuklear.nk_window_get_panel
+nk_window_get_panel.argtypes = [POINTER(Context)]
+nk_window_get_panel.restype = POINTER(Panel)
+
+nk_window_get_content_region = _nuklear.nk_window_get_content_region
+nk_window_get_content_region.argtypes = [POINTER(Context)]
+nk_window_get_content_region.restype = Rect
+
+nk_window_get_content_region_min = _nuklear.nk_window_get_content_region_min
+nk_window_get_content_region_min.argtypes = [POINTER(Context)]
+nk_window_get_content_region_min.restype = Vec2
+
+nk_window_get_content_region_max = _nuklear.nk_window_get_content_region_max
+nk_window_get_content_region_max.argtypes = [POINTER(Context)]
+nk_window_get_content_region_max.restype = Vec2
+
+nk_window_get_content_region_size = _nuklear.nk_window_get_content_region_size
+nk_window_get_content_region_size.argtypes = [POINTER(Context)]
+nk_window_get_content_region_size.restype = Vec2
+
+nk_window_get_canvas = _nuklear.nk_window_get_canvas
+nk_window_get_canvas.argtypes = [POINTER(Context)]
+nk_window_get_canvas.restype = POINTER(CommandBuffer)
+
+nk_window_has_focus = _nuklear.nk_window_has_focus
+nk_window_has_focus.argtypes = [POINTER(Context)]
+nk_window_has_focus.restype = c_int
+
+nk_window_is_hovered = _nuklear.nk_window_is_hovered
+nk_window_is_hovered.argtypes = [POINTER(Context)]
+nk_window_is_hovered.restype = c_int
+
+nk_window_is_collapsed = _nuklear.nk_window_is_collapsed
+nk_window_is_collapsed.argtypes = [POINTER(Context), c_char_p]
+nk_window_is_collapsed.restype = c_int
+
+nk_window_is_closed = _nuklear.nk_window_is_closed
+nk_window_is_closed.argtypes = [POINTER(Context), c_char_p]
+nk_window_is_closed.restype = c_int
+
+nk_window_is_hidden = _nuklear.nk_window_is_hidden
+nk_window_is_hidden.argtypes = [POINTER(Context), c_char_p]
+nk_window_is_hidden.restype = c_int
+
+nk_window_is_active = _nuklear.nk_window_is_active
+nk_window_is_active.argtypes = [POINTER(Context), c_char_p]
+nk_window_is_active.restype = c_int
+
+nk_window_is_any_hovered = _nuklear.nk_window_is_any_hovered
+nk_window_is_any_hovered.argtypes = [POINTER(Context)]
+nk_window_is_any_hovered.restype = c_int
+
+nk_item_is_any_active = _nuklear.nk_item_is_any_active
+nk_item_is_any_active.argtypes = [POINTER(Context)]
+nk_item_is_any_active.restype = c_int
+
+nk_window_set_bounds = _nuklear.nk_window_set_bounds
+nk_window_set_bounds.argtypes = [POINTER(Context), c_char_p, Rect]
+nk_window_set_bounds.restype = None
+
+nk_window_set_position = _nuklear.nk_window_set_position
+nk_window_set_position.argtypes = [POINTER(Context), c_char_p, Vec2]
+nk_window_set_position.restype = None
+
+nk_window_set_size = _nuklear.nk_window_set_size
+nk_window_set_size.argtypes = [POINTER(Context), c_char_p, Vec2]
+nk_window_set_size.restype = None
+
+nk_window_set_focus = _nuklear.nk_window_set_focus
+nk_window_set_focus.argtypes = [POINTER(Context), c_char_p]
+nk_window_set_focus.restype = None
+
+nk_window_close = _nuklear.nk_window_close
+nk_window_close.argtypes = [POINTER(Context), c_char_p]
+nk_window_close.restype = None
+
+nk_window_collapse = _nuklear.nk_window_collapse
+nk_window_collapse.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_window_collapse.restype = None
+
+nk_window_collapse_if = _nuklear.nk_window_collapse_if
+nk_window_collapse_if.argtypes = [POINTER(Context), c_char_p, c_int, c_int]
+nk_window_collapse_if.restype = None
+
+nk_window_show = _nuklear.nk_window_show
+nk_window_show.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_window_show.restype = None
+
+nk_window_show_if = _nuklear.nk_window_show_if
+nk_window_show_if.argtypes = [POINTER(Context), c_char_p, c_int, c_int]
+nk_window_show_if.restype = None
+
+nk_layout_set_min_row_height = _nuklear.nk_layout_set_min_row_height
+nk_layout_set_min_row_height.argtypes = [POINTER(Context), c_float]
+nk_layout_set_min_row_height.restype = None
+
+nk_layout_reset_min_row_height = _nuklear.nk_layout_reset_min_row_height
+nk_layout_reset_min_row_height.argtypes = [POINTER(Context)]
+nk_layout_reset_min_row_height.restype = None
+
+nk_layout_widget_bounds = _nuklear.nk_layout_widget_bounds
+nk_layout_widget_bounds.argtypes = [POINTER(Context)]
+nk_layout_widget_bounds.restype = Rect
+
+nk_layout_ratio_from_pixel = _nuklear.nk_layout_ratio_from_pixel
+nk_layout_ratio_from_pixel.argtypes = [POINTER(Context), c_float]
+nk_layout_ratio_from_pixel.restype = c_float
+
+nk_layout_row_dynamic = _nuklear.nk_layout_row_dynamic
+nk_layout_row_dynamic.argtypes = [POINTER(Context), c_float, c_int]
+nk_layout_row_dynamic.restype = None
+
+nk_layout_row_static = _nuklear.nk_layout_row_static
+nk_layout_row_static.argtypes = [POINTER(Context), c_float, c_int, c_int]
+nk_layout_row_static.restype = None
+
+nk_layout_row_begin = _nuklear.nk_layout_row_begin
+nk_layout_row_begin.argtypes = [POINTER(Context), c_int, c_float, c_int]
+nk_layout_row_begin.restype = None
+
+nk_layout_row_push = _nuklear.nk_layout_row_push
+nk_layout_row_push.argtypes = [POINTER(Context), c_float]
+nk_layout_row_push.restype = None
+
+nk_layout_row_end = _nuklear.nk_layout_row_end
+nk_layout_row_end.argtypes = [POINTER(Context)]
+nk_layout_row_end.restype = None
+
+nk_layout_row = _nuklear.nk_layout_row
+nk_layout_row.argtypes = [POINTER(Context), c_int, c_float, c_int,
+                          POINTER(c_float)]
+nk_layout_row.restype = None
+
+nk_layout_row_template_begin = _nuklear.nk_layout_row_template_begin
+nk_layout_row_template_begin.argtypes = [POINTER(Context), c_float]
+nk_layout_row_template_begin.restype = None
+
+nk_layout_row_template_push_dynamic = _nuklear.nk_layout_row_template_push_dynamic
+nk_layout_row_template_push_dynamic.argtypes = [POINTER(Context)]
+nk_layout_row_template_push_dynamic.restype = None
+
+nk_layout_row_template_push_variable = _nuklear.nk_layout_row_template_push_variable
+nk_layout_row_template_push_variable.argtypes = [POINTER(Context), c_float]
+nk_layout_row_template_push_variable.restype = None
+
+nk_layout_row_template_push_static = _nuklear.nk_layout_row_template_push_static
+nk_layout_row_template_push_static.argtypes = [POINTER(Context), c_float]
+nk_layout_row_template_push_static.restype = None
+
+nk_layout_row_template_end = _nuklear.nk_layout_row_template_end
+nk_layout_row_template_end.argtypes = [POINTER(Context)]
+nk_layout_row_template_end.restype = None
+
+nk_layout_space_begin = _nuklear.nk_layout_space_begin
+nk_layout_space_begin.argtypes = [POINTER(Context), c_int, c_float, c_int]
+nk_layout_space_begin.restype = None
+
+nk_layout_space_push = _nuklear.nk_layout_space_push
+nk_layout_space_push.argtypes = [POINTER(Context), Rect]
+nk_layout_space_push.restype = None
+
+nk_layout_space_end = _nuklear.nk_layout_space_end
+nk_layout_space_end.argtypes = [POINTER(Context)]
+nk_layout_space_end.restype = None
+
+nk_layout_space_bounds = _nuklear.nk_layout_space_bounds
+nk_layout_space_bounds.argtypes = [POINTER(Context)]
+nk_layout_space_bounds.restype = Rect
+
+nk_layout_space_to_screen = _nuklear.nk_layout_space_to_screen
+nk_layout_space_to_screen.argtypes = [POINTER(Context), Vec2]
+nk_layout_space_to_screen.restype = Vec2
+
+nk_layout_space_to_local = _nuklear.nk_layout_space_to_local
+nk_layout_space_to_local.argtypes = [POINTER(Context), Vec2]
+nk_layout_space_to_local.restype = Vec2
+
+nk_layout_space_rect_to_screen = _nuklear.nk_layout_space_rect_to_screen
+nk_layout_space_rect_to_screen.argtypes = [POINTER(Context), Rect]
+nk_layout_space_rect_to_screen.restype = Rect
+
+nk_layout_space_rect_to_local = _nuklear.nk_layout_space_rect_to_local
+nk_layout_space_rect_to_local.argtypes = [POINTER(Context), Rect]
+nk_layout_space_rect_to_local.restype = Rect
+
+nk_group_begin = _nuklear.nk_group_begin
+nk_group_begin.argtypes = [POINTER(Context), c_char_p, nk_flags]
+nk_group_begin.restype = c_int
+
+nk_group_begin_titled = _nuklear.nk_group_begin_titled
+nk_group_begin_titled.argtypes = [POINTER(Context), c_char_p, c_char_p,
+                                  nk_flags]
+nk_group_begin_titled.restype = c_int
+
+nk_group_end = _nuklear.nk_group_end
+nk_group_end.argtypes = [POINTER(Context)]
+nk_group_end.restype = None
+
+nk_group_scrolled_offset_begin = _nuklear.nk_group_scrolled_offset_begin
+nk_group_scrolled_offset_begin.argtypes = [POINTER(Context), POINTER(nk_uint),
+                                           POINTER(nk_uint), c_char_p,
+                                           nk_flags]
+nk_group_scrolled_offset_begin.restype = c_int
+
+nk_group_scrolled_begin = _nuklear.nk_group_scrolled_begin
+nk_group_scrolled_begin.argtypes = [POINTER(Context), POINTER(Scroll),
+                                    c_char_p, nk_flags]
+nk_group_scrolled_begin.restype = c_int
+
+nk_group_scrolled_end = _nuklear.nk_group_scrolled_end
+nk_group_scrolled_end.argtypes = [POINTER(Context)]
+nk_group_scrolled_end.restype = None
+
+nk_tree_push_hashed = _nuklear.nk_tree_push_hashed
+nk_tree_push_hashed.argtypes = [POINTER(Context), c_int, c_char_p, c_int,
+                                c_char_p, c_int, c_int]
+nk_tree_push_hashed.restype = c_int
+
+nk_tree_image_push_hashed = _nuklear.nk_tree_image_push_hashed
+nk_tree_image_push_hashed.argtypes = [POINTER(Context), c_int, Image,
+                                      c_char_p, c_int, c_char_p, c_int, c_int]
+nk_tree_image_push_hashed.restype = c_int
+
+nk_tree_pop = _nuklear.nk_tree_pop
+nk_tree_pop.argtypes = [POINTER(Context)]
+nk_tree_pop.restype = None
+
+nk_tree_state_push = _nuklear.nk_tree_state_push
+nk_tree_state_push.argtypes = [POINTER(Context), c_int, c_char_p,
+                               POINTER(c_int)]
+nk_tree_state_push.restype = c_int
+
+nk_tree_state_image_push = _nuklear.nk_tree_state_image_push
+nk_tree_state_image_push.argtypes = [POINTER(Context), c_int, Image, c_char_p,
+                                     POINTER(c_int)]
+nk_tree_state_image_push.restype = c_int
+
+nk_tree_state_pop = _nuklear.nk_tree_state_pop
+nk_tree_state_pop.argtypes = [POINTER(Context)]
+nk_tree_state_pop.restype = None
+
+nk_tree_element_push_hashed = _nuklear.nk_tree_element_push_hashed
+nk_tree_element_push_hashed.argtypes = [POINTER(Context), c_int, c_char_p,
+                                        c_int, POINTER(c_int), c_char_p,
+                                        c_int, c_int]
+nk_tree_element_push_hashed.restype = c_int
+
+nk_tree_element_image_push_hashed = _nuklear.nk_tree_element_image_push_hashed
+nk_tree_element_image_push_hashed.argtypes = [POINTER(Context), c_int, Image,
+                                              c_char_p, c_int, POINTER(c_int),
+                                              c_char_p, c_int, c_int]
+nk_tree_element_image_push_hashed.restype = c_int
+
+nk_tree_element_pop = _nuklear.nk_tree_element_pop
+nk_tree_element_pop.argtypes = [POINTER(Context)]
+nk_tree_element_pop.restype = None
+
+nk_list_view_begin = _nuklear.nk_list_view_begin
+nk_list_view_begin.argtypes = [POINTER(Context), POINTER(ListView), c_char_p,
+                               nk_flags, c_int, c_int]
+nk_list_view_begin.restype = c_int
+
+nk_list_view_end = _nuklear.nk_list_view_end
+nk_list_view_end.argtypes = [POINTER(ListView)]
+nk_list_view_end.restype = None
+
+nk_widget = _nuklear.nk_widget
+nk_widget.argtypes = [POINTER(Rect), POINTER(Context)]
+nk_widget.restype = c_int
+
+nk_widget_fitting = _nuklear.nk_widget_fitting
+nk_widget_fitting.argtypes = [POINTER(Rect), POINTER(Context), Vec2]
+nk_widget_fitting.restype = c_int
+
+nk_widget_bounds = _nuklear.nk_widget_bounds
+nk_widget_bounds.argtypes = [POINTER(Context)]
+nk_widget_bounds.restype = Rect
+
+nk_widget_position = _nuklear.nk_widget_position
+nk_widget_position.argtypes = [POINTER(Context)]
+nk_widget_position.restype = Vec2
+
+nk_widget_size = _nuklear.nk_widget_size
+nk_widget_size.argtypes = [POINTER(Context)]
+nk_widget_size.restype = Vec2
+
+nk_widget_width = _nuklear.nk_widget_width
+nk_widget_width.argtypes = [POINTER(Context)]
+nk_widget_width.restype = c_float
+
+nk_widget_height = _nuklear.nk_widget_height
+nk_widget_height.argtypes = [POINTER(Context)]
+nk_widget_height.restype = c_float
+
+nk_widget_is_hovered = _nuklear.nk_widget_is_hovered
+nk_widget_is_hovered.argtypes = [POINTER(Context)]
+nk_widget_is_hovered.restype = c_int
+
+nk_widget_is_mouse_clicked = _nuklear.nk_widget_is_mouse_clicked
+nk_widget_is_mouse_clicked.argtypes = [POINTER(Context), c_int]
+nk_widget_is_mouse_clicked.restype = c_int
+
+nk_widget_has_mouse_click_down = _nuklear.nk_widget_has_mouse_click_down
+nk_widget_has_mouse_click_down.argtypes = [POINTER(Context), c_int, c_int]
+nk_widget_has_mouse_click_down.restype = c_int
+
+nk_spacing = _nuklear.nk_spacing
+nk_spacing.argtypes = [POINTER(Context), c_int]
+nk_spacing.restype = None
+
+nk_text = _nuklear.nk_text
+nk_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags]
+nk_text.restype = None
+
+nk_text_colored = _nuklear.nk_text_colored
+nk_text_colored.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags, Color]
+nk_text_colored.restype = None
+
+nk_text_wrap = _nuklear.nk_text_wrap
+nk_text_wrap.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_text_wrap.restype = None
+
+nk_text_wrap_colored = _nuklear.nk_text_wrap_colored
+nk_text_wrap_colored.argtypes = [POINTER(Context), c_char_p, c_int, Color]
+nk_text_wrap_colored.restype = None
+
+nk_label = _nuklear.nk_label
+nk_label.argtypes = [POINTER(Context), c_char_p, nk_flags]
+nk_label.restype = None
+
+nk_label_colored = _nuklear.nk_label_colored
+nk_label_colored.argtypes = [POINTER(Context), c_char_p, nk_flags, Color]
+nk_label_colored.restype = None
+
+nk_label_wrap = _nuklear.nk_label_wrap
+nk_label_wrap.argtypes = [POINTER(Context), c_char_p]
+nk_label_wrap.restype = None
+
+nk_label_colored_wrap = _nuklear.nk_label_colored_wrap
+nk_label_colored_wrap.argtypes = [POINTER(Context), c_char_p, Color]
+nk_label_colored_wrap.restype = None
+
+nk_image = _nuklear.nk_image
+nk_image.argtypes = [POINTER(Context), Image]
+nk_image.restype = None
+
+nk_image_color = _nuklear.nk_image_color
+nk_image_color.argtypes = [POINTER(Context), Image, Color]
+nk_image_color.restype = None
+
+nk_value_bool = _nuklear.nk_value_bool
+nk_value_bool.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_value_bool.restype = None
+
+nk_value_int = _nuklear.nk_value_int
+nk_value_int.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_value_int.restype = None
+
+nk_value_uint = _nuklear.nk_value_uint
+nk_value_uint.argtypes = [POINTER(Context), c_char_p, c_uint]
+nk_value_uint.restype = None
+
+nk_value_float = _nuklear.nk_value_float
+nk_value_float.argtypes = [POINTER(Context), c_char_p, c_float]
+nk_value_float.restype = None
+
+nk_value_color_byte = _nuklear.nk_value_color_byte
+nk_value_color_byte.argtypes = [POINTER(Context), c_char_p, Color]
+nk_value_color_byte.restype = None
+
+nk_value_color_float = _nuklear.nk_value_color_float
+nk_value_color_float.argtypes = [POINTER(Context), c_char_p, Color]
+nk_value_color_float.restype = None
+
+nk_value_color_hex = _nuklear.nk_value_color_hex
+nk_value_color_hex.argtypes = [POINTER(Context), c_char_p, Color]
+nk_value_color_hex.restype = None
+
+nk_button_text = _nuklear.nk_button_text
+nk_button_text.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_button_text.restype = c_int
+
+nk_button_label = _nuklear.nk_button_label
+nk_button_label.argtypes = [POINTER(Context), c_char_p]
+nk_button_label.restype = c_int
+
+nk_button_color = _nuklear.nk_button_color
+nk_button_color.argtypes = [POINTER(Context), Color]
+nk_button_color.restype = c_int
+
+nk_button_symbol = _nuklear.nk_button_symbol
+nk_button_symbol.argtypes = [POINTER(Context), c_int]
+nk_button_symbol.restype = c_int
+
+nk_button_image = _nuklear.nk_button_image
+nk_button_image.argtypes = [POINTER(Context), Image]
+nk_button_image.restype = c_int
+
+nk_button_symbol_label = _nuklear.nk_button_symbol_label
+nk_button_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p, nk_flags]
+nk_button_symbol_label.restype = c_int
+
+nk_button_symbol_text = _nuklear.nk_button_symbol_text
+nk_button_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p, c_int,
+                                  nk_flags]
+nk_button_symbol_text.restype = c_int
+
+nk_button_image_label = _nuklear.nk_button_image_label
+nk_button_image_label.argtypes = [POINTER(Context), Image, c_char_p, nk_flags]
+nk_button_image_label.restype = c_int
+
+nk_button_image_text = _nuklear.nk_button_image_text
+nk_button_image_text.argtypes = [POINTER(Context), Image, c_char_p, c_int,
+                                 nk_flags]
+nk_button_image_text.restype = c_int
+
+nk_button_text_styled = _nuklear.nk_button_text_styled
+nk_button_text_styled.argtypes = [POINTER(Context), POINTER(StyleButton),
+                                  c_char_p, c_int]
+nk_button_text_styled.restype = c_int
+
+nk_button_label_styled = _nuklear.nk_button_label_styled
+nk_button_label_styled.argtypes = [POINTER(Context), POINTER(StyleButton),
+                                   c_char_p]
+nk_button_label_styled.restype = c_int
+
+nk_button_symbol_styled = _nuklear.nk_button_symbol_styled
+nk_button_symbol_styled.argtypes = [POINTER(Context), POINTER(StyleButton),
+                                    c_int]
+nk_button_symbol_styled.restype = c_int
+
+nk_button_image_styled = _nuklear.nk_button_image_styled
+nk_button_image_styled.argtypes = [POINTER(Context), POINTER(StyleButton),
+                                   Image]
+nk_button_image_styled.restype = c_int
+
+nk_button_symbol_text_styled = _nuklear.nk_button_symbol_text_styled
+nk_button_symbol_text_styled.argtypes = [POINTER(Context),
+                                         POINTER(StyleButton), c_int,
+                                         c_char_p, c_int, nk_flags]
+nk_button_symbol_text_styled.restype = c_int
+
+nk_button_symbol_label_styled = _nuklear.nk_button_symbol_label_styled
+nk_button_symbol_label_styled.argtypes = [POINTER(Context),
+                                          POINTER(StyleButton), c_int,
+                                          c_char_p, nk_flags]
+nk_button_symbol_label_styled.restype = c_int
+
+nk_button_image_label_styled = _nuklear.nk_button_image_label_styled
+nk_button_image_label_styled.argtypes = [POINTER(Context),
+                                         POINTER(StyleButton), Image,
+                                         c_char_p, nk_flags]
+nk_button_image_label_styled.restype = c_int
+
+nk_button_image_text_styled = _nuklear.nk_button_image_text_styled
+nk_button_image_text_styled.argtypes = [POINTER(Context),
+                                        POINTER(StyleButton), Image, c_char_p,
+                                        c_int, nk_flags]
+nk_button_image_text_styled.restype = c_int
+
+nk_button_set_behavior = _nuklear.nk_button_set_behavior
+nk_button_set_behavior.argtypes = [POINTER(Context), c_int]
+nk_button_set_behavior.restype = None
+
+nk_button_push_behavior = _nuklear.nk_button_push_behavior
+nk_button_push_behavior.argtypes = [POINTER(Context), c_int]
+nk_button_push_behavior.restype = c_int
+
+nk_button_pop_behavior = _nuklear.nk_button_pop_behavior
+nk_button_pop_behavior.argtypes = [POINTER(Context)]
+nk_button_pop_behavior.restype = c_int
+
+nk_check_label = _nuklear.nk_check_label
+nk_check_label.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_check_label.restype = c_int
+
+nk_check_text = _nuklear.nk_check_text
+nk_check_text.argtypes = [POINTER(Context), c_char_p, c_int, c_int]
+nk_check_text.restype = c_int
+
+nk_check_flags_label = _nuklear.nk_check_flags_label
+nk_check_flags_label.argtypes = [POINTER(Context), c_char_p, c_uint, c_uint]
+nk_check_flags_label.restype = c_uint
+
+nk_check_flags_text = _nuklear.nk_check_flags_text
+nk_check_flags_text.argtypes = [POINTER(Context), c_char_p, c_int, c_uint,
+                                c_uint]
+nk_check_flags_text.restype = c_uint
+
+nk_checkbox_label = _nuklear.nk_checkbox_label
+nk_checkbox_label.argtypes = [POINTER(Context), c_char_p, POINTER(c_int)]
+nk_checkbox_label.restype = c_int
+
+nk_checkbox_text = _nuklear.nk_checkbox_text
+nk_checkbox_text.argtypes = [POINTER(Context), c_char_p, c_int, POINTER(c_int)]
+nk_checkbox_text.restype = c_int
+
+nk_checkbox_flags_label = _nuklear.nk_checkbox_flags_label
+nk_checkbox_flags_label.argtypes = [POINTER(Context), c_char_p,
+                                    POINTER(c_uint), c_uint]
+nk_checkbox_flags_label.restype = c_int
+
+nk_checkbox_flags_text = _nuklear.nk_checkbox_flags_text
+nk_checkbox_flags_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                   POINTER(c_uint), c_uint]
+nk_checkbox_flags_text.restype = c_int
+
+nk_radio_label = _nuklear.nk_radio_label
+nk_radio_label.argtypes = [POINTER(Context), c_char_p, POINTER(c_int)]
+nk_radio_label.restype = c_int
+
+nk_radio_text = _nuklear.nk_radio_text
+nk_radio_text.argtypes = [POINTER(Context), c_char_p, c_int, POINTER(c_int)]
+nk_radio_text.restype = c_int
+
+nk_option_label = _nuklear.nk_option_label
+nk_option_label.argtypes = [POINTER(Context), c_char_p, c_int]
+nk_option_label.restype = c_int
+
+nk_option_text = _nuklear.nk_option_text
+nk_option_text.argtypes = [POINTER(Context), c_char_p, c_int, c_int]
+nk_option_text.restype = c_int
+
+nk_selectable_label = _nuklear.nk_selectable_label
+nk_selectable_label.argtypes = [POINTER(Context), c_char_p, nk_flags,
+                                POINTER(c_int)]
+nk_selectable_label.restype = c_int
+
+nk_selectable_text = _nuklear.nk_selectable_text
+nk_selectable_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags,
+                               POINTER(c_int)]
+nk_selectable_text.restype = c_int
+
+nk_selectable_image_label = _nuklear.nk_selectable_image_label
+nk_selectable_image_label.argtypes = [POINTER(Context), Image, c_char_p,
+                                      nk_flags, POINTER(c_int)]
+nk_selectable_image_label.restype = c_int
+
+nk_selectable_image_text = _nuklear.nk_selectable_image_text
+nk_selectable_image_text.argtypes = [POINTER(Context), Image, c_char_p, c_int,
+                                     nk_flags, POINTER(c_int)]
+nk_selectable_image_text.restype = c_int
+
+nk_selectable_symbol_label = _nuklear.nk_selectable_symbol_label
+nk_selectable_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p,
+                                       nk_flags, POINTER(c_int)]
+nk_selectable_symbol_label.restype = c_int
+
+nk_selectable_symbol_text = _nuklear.nk_selectable_symbol_text
+nk_selectable_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p,
+                                      c_int, nk_flags, POINTER(c_int)]
+nk_selectable_symbol_text.restype = c_int
+
+nk_select_label = _nuklear.nk_select_label
+nk_select_label.argtypes = [POINTER(Context), c_char_p, nk_flags, c_int]
+nk_select_label.restype = c_int
+
+nk_select_text = _nuklear.nk_select_text
+nk_select_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags, c_int]
+nk_select_text.restype = c_int
+
+nk_select_image_label = _nuklear.nk_select_image_label
+nk_select_image_label.argtypes = [POINTER(Context), Image, c_char_p, nk_flags,
+                                  c_int]
+nk_select_image_label.restype = c_int
+
+nk_select_image_text = _nuklear.nk_select_image_text
+nk_select_image_text.argtypes = [POINTER(Context), Image, c_char_p, c_int,
+                                 nk_flags, c_int]
+nk_select_image_text.restype = c_int
+
+nk_select_symbol_label = _nuklear.nk_select_symbol_label
+nk_select_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p,
+                                   nk_flags, c_int]
+nk_select_symbol_label.restype = c_int
+
+nk_select_symbol_text = _nuklear.nk_select_symbol_text
+nk_select_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p, c_int,
+                                  nk_flags, c_int]
+nk_select_symbol_text.restype = c_int
+
+nk_slide_float = _nuklear.nk_slide_float
+nk_slide_float.argtypes = [POINTER(Context), c_float, c_float, c_float,
+                           c_float]
+nk_slide_float.restype = c_float
+
+nk_slide_int = _nuklear.nk_slide_int
+nk_slide_int.argtypes = [POINTER(Context), c_int, c_int, c_int, c_int]
+nk_slide_int.restype = c_int
+
+nk_slider_float = _nuklear.nk_slider_float
+nk_slider_float.argtypes = [POINTER(Context), c_float, POINTER(c_float),
+                            c_float, c_float]
+nk_slider_float.restype = c_int
+
+nk_slider_int = _nuklear.nk_slider_int
+nk_slider_int.argtypes = [POINTER(Context), c_int, POINTER(c_int), c_int,
+                          c_int]
+nk_slider_int.restype = c_int
+
+nk_progress = _nuklear.nk_progress
+nk_progress.argtypes = [POINTER(Context), POINTER(nk_size), nk_size, c_int]
+nk_progress.restype = c_int
+
+nk_prog = _nuklear.nk_prog
+nk_prog.argtypes = [POINTER(Context), nk_size, nk_size, c_int]
+nk_prog.restype = nk_size
+
+nk_color_picker = _nuklear.nk_color_picker
+nk_color_picker.argtypes = [POINTER(Context), ColorF, c_int]
+nk_color_picker.restype = ColorF
+
+nk_color_pick = _nuklear.nk_color_pick
+nk_color_pick.argtypes = [POINTER(Context), POINTER(ColorF), c_int]
+nk_color_pick.restype = c_int
+
+nk_property_int = _nuklear.nk_property_int
+nk_property_int.argtypes = [POINTER(Context), c_char_p, c_int, POINTER(c_int),
+                            c_int, c_int, c_float]
+nk_property_int.restype = None
+
+nk_property_float = _nuklear.nk_property_float
+nk_property_float.argtypes = [POINTER(Context), c_char_p, c_float,
+                              POINTER(c_float), c_float, c_float, c_float]
+nk_property_float.restype = None
+
+nk_property_double = _nuklear.nk_property_double
+nk_property_double.argtypes = [POINTER(Context), c_char_p, c_double,
+                               POINTER(c_double), c_double, c_double, c_float]
+nk_property_double.restype = None
+
+nk_propertyi = _nuklear.nk_propertyi
+nk_propertyi.argtypes = [POINTER(Context), c_char_p, c_int, c_int, c_int,
+                         c_int, c_float]
+nk_propertyi.restype = c_int
+
+nk_propertyf = _nuklear.nk_propertyf
+nk_propertyf.argtypes = [POINTER(Context), c_char_p, c_float, c_float,
+                         c_float, c_float, c_float]
+nk_propertyf.restype = c_float
+
+nk_propertyd = _nuklear.nk_propertyd
+nk_propertyd.argtypes = [POINTER(Context), c_char_p, c_double, c_double,
+                         c_double, c_double, c_float]
+nk_propertyd.restype = c_double
+
+nk_edit_string = _nuklear.nk_edit_string
+nk_edit_string.argtypes = [POINTER(Context), nk_flags, POINTER(c_char),
+                           POINTER(c_int), c_int, c_void_p]
+nk_edit_string.restype = nk_flags
+
+nk_edit_string_zero_terminated = _nuklear.nk_edit_string_zero_terminated
+nk_edit_string_zero_terminated.argtypes = [POINTER(Context), nk_flags,
+                                           POINTER(c_char), c_int, c_void_p]
+nk_edit_string_zero_terminated.restype = nk_flags
+
+nk_edit_buffer = _nuklear.nk_edit_buffer
+nk_edit_buffer.argtypes = [POINTER(Context), nk_flags, POINTER(TextEdit),
+                           c_void_p]
+nk_edit_buffer.restype = nk_flags
+
+nk_edit_focus = _nuklear.nk_edit_focus
+nk_edit_focus.argtypes = [POINTER(Context), nk_flags]
+nk_edit_focus.restype = None
+
+nk_edit_unfocus = _nuklear.nk_edit_unfocus
+nk_edit_unfocus.argtypes = [POINTER(Context)]
+nk_edit_unfocus.restype = None
+
+nk_chart_begin = _nuklear.nk_chart_begin
+nk_chart_begin.argtypes = [POINTER(Context), c_int, c_int, c_float, c_float]
+nk_chart_begin.restype = c_int
+
+nk_chart_begin_colored = _nuklear.nk_chart_begin_colored
+nk_chart_begin_colored.argtypes = [POINTER(Context), c_int, Color, Color,
+                                   c_int, c_float, c_float]
+nk_chart_begin_colored.restype = c_int
+
+nk_chart_add_slot = _nuklear.nk_chart_add_slot
+nk_chart_add_slot.argtypes = [POINTER(Context), c_int, c_int, c_float, c_float]
+nk_chart_add_slot.restype = None
+
+nk_chart_add_slot_colored = _nuklear.nk_chart_add_slot_colored
+nk_chart_add_slot_colored.argtypes = [POINTER(Context), c_int, Color, Color,
+                                      c_int, c_float, c_float]
+nk_chart_add_slot_colored.restype = None
+
+nk_chart_push = _nuklear.nk_chart_push
+nk_chart_push.argtypes = [POINTER(Context), c_float]
+nk_chart_push.restype = nk_flags
+
+nk_chart_push_slot = _nuklear.nk_chart_push_slot
+nk_chart_push_slot.argtypes = [POINTER(Context), c_float, c_int]
+nk_chart_push_slot.restype = nk_flags
+
+nk_chart_end = _nuklear.nk_chart_end
+nk_chart_end.argtypes = [POINTER(Context)]
+nk_chart_end.restype = None
+
+nk_plot = _nuklear.nk_plot
+nk_plot.argtypes = [POINTER(Context), c_int, POINTER(c_float), c_int, c_int]
+nk_plot.restype = None
+
+nk_plot_function = _nuklear.nk_plot_function
+nk_plot_function.argtypes = [POINTER(Context), c_int, c_void_p, c_void_p,
+                             c_int, c_int]
+nk_plot_function.restype = None
+
+nk_popup_begin = _nuklear.nk_popup_begin
+nk_popup_begin.argtypes = [POINTER(Context), c_int, c_char_p, nk_flags, Rect]
+nk_popup_begin.restype = c_int
+
+nk_popup_close = _nuklear.nk_popup_close
+nk_popup_close.argtypes = [POINTER(Context)]
+nk_popup_close.restype = None
+
+nk_popup_end = _nuklear.nk_popup_end
+nk_popup_end.argtypes = [POINTER(Context)]
+nk_popup_end.restype = None
+
+nk_combo = _nuklear.nk_combo
+nk_combo.argtypes = [POINTER(Context), POINTER(c_char_p), c_int, c_int, c_int,
+                     Vec2]
+nk_combo.restype = c_int
+
+nk_combo_separator = _nuklear.nk_combo_separator
+nk_combo_separator.argtypes = [POINTER(Context), c_char_p, c_int, c_int,
+                               c_int, c_int, Vec2]
+nk_combo_separator.restype = c_int
+
+nk_combo_string = _nuklear.nk_combo_string
+nk_combo_string.argtypes = [POINTER(Context), c_char_p, c_int, c_int, c_int,
+                            Vec2]
+nk_combo_string.restype = c_int
+
+nk_combo_callback = _nuklear.nk_combo_callback
+nk_combo_callback.argtypes = [POINTER(Context), c_void_p, c_void_p, c_int,
+                              c_int, c_int, Vec2]
+nk_combo_callback.restype = c_int
+
+nk_combobox = _nuklear.nk_combobox
+nk_combobox.argtypes = [POINTER(Context), POINTER(c_char_p), c_int,
+                        POINTER(c_int), c_int, Vec2]
+nk_combobox.restype = None
+
+nk_combobox_string = _nuklear.nk_combobox_string
+nk_combobox_string.argtypes = [POINTER(Context), c_char_p, POINTER(c_int),
+                               c_int, c_int, Vec2]
+nk_combobox_string.restype = None
+
+nk_combobox_separator = _nuklear.nk_combobox_separator
+nk_combobox_separator.argtypes = [POINTER(Context), c_char_p, c_int,
+                                  POINTER(c_int), c_int, c_int, Vec2]
+nk_combobox_separator.restype = None
+
+nk_combobox_callback = _nuklear.nk_combobox_callback
+nk_combobox_callback.argtypes = [POINTER(Context), c_void_p, c_void_p,
+                                 POINTER(c_int), c_int, c_int, Vec2]
+nk_combobox_callback.restype = None
+
+nk_combo_begin_text = _nuklear.nk_combo_begin_text
+nk_combo_begin_text.argtypes = [POINTER(Context), c_char_p, c_int, Vec2]
+nk_combo_begin_text.restype = c_int
+
+nk_combo_begin_label = _nuklear.nk_combo_begin_label
+nk_combo_begin_label.argtypes = [POINTER(Context), c_char_p, Vec2]
+nk_combo_begin_label.restype = c_int
+
+nk_combo_begin_color = _nuklear.nk_combo_begin_color
+nk_combo_begin_color.argtypes = [POINTER(Context), Color, Vec2]
+nk_combo_begin_color.restype = c_int
+
+nk_combo_begin_symbol = _nuklear.nk_combo_begin_symbol
+nk_combo_begin_symbol.argtypes = [POINTER(Context), c_int, Vec2]
+nk_combo_begin_symbol.restype = c_int
+
+nk_combo_begin_symbol_label = _nuklear.nk_combo_begin_symbol_label
+nk_combo_begin_symbol_label.argtypes = [POINTER(Context), c_char_p, c_int,
+                                        Vec2]
+nk_combo_begin_symbol_label.restype = c_int
+
+nk_combo_begin_symbol_text = _nuklear.nk_combo_begin_symbol_text
+nk_combo_begin_symbol_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                       c_int, Vec2]
+nk_combo_begin_symbol_text.restype = c_int
+
+nk_combo_begin_image = _nuklear.nk_combo_begin_image
+nk_combo_begin_image.argtypes = [POINTER(Context), Image, Vec2]
+nk_combo_begin_image.restype = c_int
+
+nk_combo_begin_image_label = _nuklear.nk_combo_begin_image_label
+nk_combo_begin_image_label.argtypes = [POINTER(Context), c_char_p, Image, Vec2]
+nk_combo_begin_image_label.restype = c_int
+
+nk_combo_begin_image_text = _nuklear.nk_combo_begin_image_text
+nk_combo_begin_image_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                      Image, Vec2]
+nk_combo_begin_image_text.restype = c_int
+
+nk_combo_item_label = _nuklear.nk_combo_item_label
+nk_combo_item_label.argtypes = [POINTER(Context), c_char_p, nk_flags]
+nk_combo_item_label.restype = c_int
+
+nk_combo_item_text = _nuklear.nk_combo_item_text
+nk_combo_item_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags]
+nk_combo_item_text.restype = c_int
+
+nk_combo_item_image_label = _nuklear.nk_combo_item_image_label
+nk_combo_item_image_label.argtypes = [POINTER(Context), Image, c_char_p,
+                                      nk_flags]
+nk_combo_item_image_label.restype = c_int
+
+nk_combo_item_image_text = _nuklear.nk_combo_item_image_text
+nk_combo_item_image_text.argtypes = [POINTER(Context), Image, c_char_p, c_int,
+                                     nk_flags]
+nk_combo_item_image_text.restype = c_int
+
+nk_combo_item_symbol_label = _nuklear.nk_combo_item_symbol_label
+nk_combo_item_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p,
+                                       nk_flags]
+nk_combo_item_symbol_label.restype = c_int
+
+nk_combo_item_symbol_text = _nuklear.nk_combo_item_symbol_text
+nk_combo_item_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p,
+                                      c_int, nk_flags]
+nk_combo_item_symbol_text.restype = c_int
+
+nk_combo_close = _nuklear.nk_combo_close
+nk_combo_close.argtypes = [POINTER(Context)]
+nk_combo_close.restype = None
+
+nk_combo_end = _nuklear.nk_combo_end
+nk_combo_end.argtypes = [POINTER(Context)]
+nk_combo_end.restype = None
+
+nk_contextual_begin = _nuklear.nk_contextual_begin
+nk_contextual_begin.argtypes = [POINTER(Context), nk_flags, Vec2, Rect]
+nk_contextual_begin.restype = c_int
+
+nk_contextual_item_text = _nuklear.nk_contextual_item_text
+nk_contextual_item_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                    nk_flags]
+nk_contextual_item_text.restype = c_int
+
+nk_contextual_item_label = _nuklear.nk_contextual_item_label
+nk_contextual_item_label.argtypes = [POINTER(Context), c_char_p, nk_flags]
+nk_contextual_item_label.restype = c_int
+
+nk_contextual_item_image_label = _nuklear.nk_contextual_item_image_label
+nk_contextual_item_image_label.argtypes = [POINTER(Context), Image, c_char_p,
+                                           nk_flags]
+nk_contextual_item_image_label.restype = c_int
+
+nk_contextual_item_image_text = _nuklear.nk_contextual_item_image_text
+nk_contextual_item_image_text.argtypes = [POINTER(Context), Image, c_char_p,
+                                          c_int, nk_flags]
+nk_contextual_item_image_text.restype = c_int
+
+nk_contextual_item_symbol_label = _nuklear.nk_contextual_item_symbol_label
+nk_contextual_item_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p,
+                                            nk_flags]
+nk_contextual_item_symbol_label.restype = c_int
+
+nk_contextual_item_symbol_text = _nuklear.nk_contextual_item_symbol_text
+nk_contextual_item_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p,
+                                           c_int, nk_flags]
+nk_contextual_item_symbol_text.restype = c_int
+
+nk_contextual_close = _nuklear.nk_contextual_close
+nk_contextual_close.argtypes = [POINTER(Context)]
+nk_contextual_close.restype = None
+
+nk_contextual_end = _nuklear.nk_contextual_end
+nk_contextual_end.argtypes = [POINTER(Context)]
+nk_contextual_end.restype = None
+
+nk_tooltip = _nuklear.nk_tooltip
+nk_tooltip.argtypes = [POINTER(Context), c_char_p]
+nk_tooltip.restype = None
+
+nk_tooltip_begin = _nuklear.nk_tooltip_begin
+nk_tooltip_begin.argtypes = [POINTER(Context), c_float]
+nk_tooltip_begin.restype = c_int
+
+nk_tooltip_end = _nuklear.nk_tooltip_end
+nk_tooltip_end.argtypes = [POINTER(Context)]
+nk_tooltip_end.restype = None
+
+nk_menubar_begin = _nuklear.nk_menubar_begin
+nk_menubar_begin.argtypes = [POINTER(Context)]
+nk_menubar_begin.restype = None
+
+nk_menubar_end = _nuklear.nk_menubar_end
+nk_menubar_end.argtypes = [POINTER(Context)]
+nk_menubar_end.restype = None
+
+nk_menu_begin_text = _nuklear.nk_menu_begin_text
+nk_menu_begin_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags,
+                               Vec2]
+nk_menu_begin_text.restype = c_int
+
+nk_menu_begin_label = _nuklear.nk_menu_begin_label
+nk_menu_begin_label.argtypes = [POINTER(Context), c_char_p, nk_flags, Vec2]
+nk_menu_begin_label.restype = c_int
+
+nk_menu_begin_image = _nuklear.nk_menu_begin_image
+nk_menu_begin_image.argtypes = [POINTER(Context), c_char_p, Image, Vec2]
+nk_menu_begin_image.restype = c_int
+
+nk_menu_begin_image_text = _nuklear.nk_menu_begin_image_text
+nk_menu_begin_image_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                     nk_flags, Image, Vec2]
+nk_menu_begin_image_text.restype = c_int
+
+nk_menu_begin_image_label = _nuklear.nk_menu_begin_image_label
+nk_menu_begin_image_label.argtypes = [POINTER(Context), c_char_p, nk_flags,
+                                      Image, Vec2]
+nk_menu_begin_image_label.restype = c_int
+
+nk_menu_begin_symbol = _nuklear.nk_menu_begin_symbol
+nk_menu_begin_symbol.argtypes = [POINTER(Context), c_char_p, c_int, Vec2]
+nk_menu_begin_symbol.restype = c_int
+
+nk_menu_begin_symbol_text = _nuklear.nk_menu_begin_symbol_text
+nk_menu_begin_symbol_text.argtypes = [POINTER(Context), c_char_p, c_int,
+                                      nk_flags, c_int, Vec2]
+nk_menu_begin_symbol_text.restype = c_int
+
+nk_menu_begin_symbol_label = _nuklear.nk_menu_begin_symbol_label
+nk_menu_begin_symbol_label.argtypes = [POINTER(Context), c_char_p, nk_flags,
+                                       c_int, Vec2]
+nk_menu_begin_symbol_label.restype = c_int
+
+nk_menu_item_text = _nuklear.nk_menu_item_text
+nk_menu_item_text.argtypes = [POINTER(Context), c_char_p, c_int, nk_flags]
+nk_menu_item_text.restype = c_int
+
+nk_menu_item_label = _nuklear.nk_menu_item_label
+nk_menu_item_label.argtypes = [POINTER(Context), c_char_p, nk_flags]
+nk_menu_item_label.restype = c_int
+
+nk_menu_item_image_label = _nuklear.nk_menu_item_image_label
+nk_menu_item_image_label.argtypes = [POINTER(Context), Image, c_char_p,
+                                     nk_flags]
+nk_menu_item_image_label.restype = c_int
+
+nk_menu_item_image_text = _nuklear.nk_menu_item_image_text
+nk_menu_item_image_text.argtypes = [POINTER(Context), Image, c_char_p, c_int,
+                                    nk_flags]
+nk_menu_item_image_text.restype = c_int
+
+nk_menu_item_symbol_text = _nuklear.nk_menu_item_symbol_text
+nk_menu_item_symbol_text.argtypes = [POINTER(Context), c_int, c_char_p, c_int,
+                                     nk_flags]
+nk_menu_item_symbol_text.restype = c_int
+
+nk_menu_item_symbol_label = _nuklear.nk_menu_item_symbol_label
+nk_menu_item_symbol_label.argtypes = [POINTER(Context), c_int, c_char_p,
+                                      nk_flags]
+nk_menu_item_symbol_label.restype = c_int
+
+nk_menu_close = _nuklear.nk_menu_close
+nk_menu_close.argtypes = [POINTER(Context)]
+nk_menu_close.restype = None
+
+nk_menu_end = _nuklear.nk_menu_end
+nk_menu_end.argtypes = [POINTER(Context)]
+nk_menu_end.restype = None
+
+nk_style_default = _nuklear.nk_style_default
+nk_style_default.argtypes = [POINTER(Context)]
+nk_style_default.restype = None
+
+nk_style_from_table = _nuklear.nk_style_from_table
+nk_style_from_table.argtypes = [POINTER(Context), POINTER(Color)]
+nk_style_from_table.restype = None
+
+nk_style_load_cursor = _nuklear.nk_style_load_cursor
+nk_style_load_cursor.argtypes = [POINTER(Context), c_int, POINTER(Cursor)]
+nk_style_load_cursor.restype = None
+
+nk_style_load_all_cursors = _nuklear.nk_style_load_all_cursors
+nk_style_load_all_cursors.argtypes = [POINTER(Context), POINTER(Cursor)]
+nk_style_load_all_cursors.restype = None
+
+nk_style_get_color_by_name = _nuklear.nk_style_get_color_by_name
+nk_style_get_color_by_name.argtypes = [c_int]
+nk_style_get_color_by_name.restype = c_char_p
+
+nk_style_set_font = _nuklear.nk_style_set_font
+nk_style_set_font.argtypes = [POINTER(Context), POINTER(UserFont)]
+nk_style_set_font.restype = None
+
+nk_style_set_cursor = _nuklear.nk_style_set_cursor
+nk_style_set_cursor.argtypes = [POINTER(Context), c_int]
+nk_style_set_cursor.restype = c_int
+
+nk_style_show_cursor = _nuklear.nk_style_show_cursor
+nk_style_show_cursor.argtypes = [POINTER(Context)]
+nk_style_show_cursor.restype = None
+
+nk_style_hide_cursor = _nuklear.nk_style_hide_cursor
+nk_style_hide_cursor.argtypes = [POINTER(Context)]
+nk_style_hide_cursor.restype = None
+
+nk_style_push_font = _nuklear.nk_style_push_font
+nk_style_push_font.argtypes = [POINTER(Context), POINTER(UserFont)]
+nk_style_push_font.restype = c_int
+
+nk_style_push_float = _nuklear.nk_style_push_float
+nk_style_push_float.argtypes = [POINTER(Context), POINTER(c_float), c_float]
+nk_style_push_float.restype = c_int
+
+nk_style_push_vec2 = _nuklear.nk_style_push_vec2
+nk_style_push_vec2.argtypes = [POINTER(Context), POINTER(Vec2), Vec2]
+nk_style_push_vec2.restype = c_int
+
+nk_style_push_style_item = _nuklear.nk_style_push_style_item
+nk_style_push_style_item.argtypes = [POINTER(Context), POINTER(StyleItem),
+                                     StyleItem]
+nk_style_push_style_item.restype = c_int
+
+nk_style_push_flags = _nuklear.nk_style_push_flags
+nk_style_push_flags.argtypes = [POINTER(Context), POINTER(nk_flags), nk_flags]
+nk_style_push_flags.restype = c_int
+
+nk_style_push_color = _nuklear.nk_style_push_color
+nk_style_push_color.argtypes = [POINTER(Context), POINTER(Color), Color]
+nk_style_push_color.restype = c_int
+
+nk_style_pop_font = _nuklear.nk_style_pop_font
+nk_style_pop_font.argtypes = [POINTER(Context)]
+nk_style_pop_font.restype = c_int
+
+nk_style_pop_float = _nuklear.nk_style_pop_float
+nk_style_pop_float.argtypes = [POINTER(Context)]
+nk_style_pop_float.restype = c_int
+
+nk_style_pop_vec2 = _nuklear.nk_style_pop_vec2
+nk_style_pop_vec2.argtypes = [POINTER(Context)]
+nk_style_pop_vec2.restype = c_int
+
+nk_style_pop_style_item = _nuklear.nk_style_pop_style_item
+nk_style_pop_style_item.argtypes = [POINTER(Context)]
+nk_style_pop_style_item.restype = c_int
+
+nk_style_pop_flags = _nuklear.nk_style_pop_flags
+nk_style_pop_flags.argtypes = [POINTER(Context)]
+nk_style_pop_flags.restype = c_int
+
+nk_style_pop_color = _nuklear.nk_style_pop_color
+nk_style_pop_color.argtypes = [POINTER(Context)]
+nk_style_pop_color.restype = c_int
+
+nk_rgb = _nuklear.nk_rgb
+nk_rgb.argtypes = [c_int, c_int, c_int]
+nk_rgb.restype = Color
+
+nk_rgb_iv = _nuklear.nk_rgb_iv
+nk_rgb_iv.argtypes = [POINTER(c_int)]
+nk_rgb_iv.restype = Color
+
+nk_rgb_bv = _nuklear.nk_rgb_bv
+nk_rgb_bv.argtypes = [POINTER(nk_byte)]
+nk_rgb_bv.restype = Color
+
+nk_rgb_f = _nuklear.nk_rgb_f
+nk_rgb_f.argtypes = [c_float, c_float, c_float]
+nk_rgb_f.restype = Color
+
+nk_rgb_fv = _nuklear.nk_rgb_fv
+nk_rgb_fv.argtypes = [POINTER(c_float)]
+nk_rgb_fv.restype = Color
+
+nk_rgb_cf = _nuklear.nk_rgb_cf
+nk_rgb_cf.argtypes = [ColorF]
+nk_rgb_cf.restype = Color
+
+nk_rgb_hex = _nuklear.nk_rgb_hex
+nk_rgb_hex.argtypes = [c_char_p]
+nk_rgb_hex.restype = Color
+
+nk_rgba = _nuklear.nk_rgba
+nk_rgba.argtypes = [c_int, c_int, c_int, c_int]
+nk_rgba.restype = Color
+
+nk_rgba_u32 = _nuklear.nk_rgba_u32
+nk_rgba_u32.argtypes = [nk_uint]
+nk_rgba_u32.restype = Color
+
+nk_rgba_iv = _nuklear.nk_rgba_iv
+nk_rgba_iv.argtypes = [POINTER(c_int)]
+nk_rgba_iv.restype = Color
+
+nk_rgba_bv = _nuklear.nk_rgba_bv
+nk_rgba_bv.argtypes = [POINTER(nk_byte)]
+nk_rgba_bv.restype = Color
+
+nk_rgba_f = _nuklear.nk_rgba_f
+nk_rgba_f.argtypes = [c_float, c_float, c_float, c_float]
+nk_rgba_f.restype = Color
+
+nk_rgba_fv = _nuklear.nk_rgba_fv
+nk_rgba_fv.argtypes = [POINTER(c_float)]
+nk_rgba_fv.restype = Color
+
+nk_rgba_cf = _nuklear.nk_rgba_cf
+nk_rgba_cf.argtypes = [ColorF]
+nk_rgba_cf.restype = Color
+
+nk_rgba_hex = _nuklear.nk_rgba_hex
+nk_rgba_hex.argtypes = [c_char_p]
+nk_rgba_hex.restype = Color
+
+nk_hsva_colorf = _nuklear.nk_hsva_colorf
+nk_hsva_colorf.argtypes = [c_float, c_float, c_float, c_float]
+nk_hsva_colorf.restype = ColorF
+
+nk_hsva_colorfv = _nuklear.nk_hsva_colorfv
+nk_hsva_colorfv.argtypes = [POINTER(c_float)]
+nk_hsva_colorfv.restype = ColorF
+
+nk_colorf_hsva_f = _nuklear.nk_colorf_hsva_f
+nk_colorf_hsva_f.argtypes = [POINTER(c_float), POINTER(c_float),
+                             POINTER(c_float), POINTER(c_float), ColorF]
+nk_colorf_hsva_f.restype = None
+
+nk_colorf_hsva_fv = _nuklear.nk_colorf_hsva_fv
+nk_colorf_hsva_fv.argtypes = [POINTER(c_float), ColorF]
+nk_colorf_hsva_fv.restype = None
+
+nk_hsv = _nuklear.nk_hsv
+nk_hsv.argtypes = [c_int, c_int, c_int]
+nk_hsv.restype = Color
+
+nk_hsv_iv = _nuklear.nk_hsv_iv
+nk_hsv_iv.argtypes = [POINTER(c_int)]
+nk_hsv_iv.restype = Color
+
+nk_hsv_bv = _nuklear.nk_hsv_bv
+nk_hsv_bv.argtypes = [POINTER(nk_byte)]
+nk_hsv_bv.restype = Color
+
+nk_hsv_f = _nuklear.nk_hsv_f
+nk_hsv_f.argtypes = [c_float, c_float, c_float]
+nk_hsv_f.restype = Color
+
+nk_hsv_fv = _nuklear.nk_hsv_fv
+nk_hsv_fv.argtypes = [POINTER(c_float)]
+nk_hsv_fv.restype = Color
+
+nk_hsva = _nuklear.nk_hsva
+nk_hsva.argtypes = [c_int, c_int, c_int, c_int]
+nk_hsva.restype = Color
+
+nk_hsva_iv = _nuklear.nk_hsva_iv
+nk_hsva_iv.argtypes = [POINTER(c_int)]
+nk_hsva_iv.restype = Color
+
+nk_hsva_bv = _nuklear.nk_hsva_bv
+nk_hsva_bv.argtypes = [POINTER(nk_byte)]
+nk_hsva_bv.restype = Color
+
+nk_hsva_f = _nuklear.nk_hsva_f
+nk_hsva_f.argtypes = [c_float, c_float, c_float, c_float]
+nk_hsva_f.restype = Color
+
+nk_hsva_fv = _nuklear.nk_hsva_fv
+nk_hsva_fv.argtypes = [POINTER(c_float)]
+nk_hsva_fv.restype = Color
+
+nk_color_f = _nuklear.nk_color_f
+nk_color_f.argtypes = [POINTER(c_float), POINTER(c_float), POINTER(c_float),
+                       POINTER(c_float), Color]
+nk_color_f.restype = None
+
+nk_color_fv = _nuklear.nk_color_fv
+nk_color_fv.argtypes = [POINTER(c_float), Color]
+nk_color_fv.restype = None
+
+nk_color_cf = _nuklear.nk_color_cf
+nk_color_cf.argtypes = [Color]
+nk_color_cf.restype = ColorF
+
+nk_color_d = _nuklear.nk_color_d
+nk_color_d.argtypes = [POINTER(c_double), POINTER(c_double),
+                       POINTER(c_double), POINTER(c_double), Color]
+nk_color_d.restype = None
+
+nk_color_dv = _nuklear.nk_color_dv
+nk_color_dv.argtypes = [POINTER(c_double), Color]
+nk_color_dv.restype = None
+
+nk_color_u32 = _nuklear.nk_color_u32
+nk_color_u32.argtypes = [Color]
+nk_color_u32.restype = nk_uint
+
+nk_color_hex_rgba = _nuklear.nk_color_hex_rgba
+nk_color_hex_rgba.argtypes = [POINTER(c_char), Color]
+nk_color_hex_rgba.restype = None
+
+nk_color_hex_rgb = _nuklear.nk_color_hex_rgb
+nk_color_hex_rgb.argtypes = [POINTER(c_char), Color]
+nk_color_hex_rgb.restype = None
+
+nk_color_hsv_i = _nuklear.nk_color_hsv_i
+nk_color_hsv_i.argtypes = [POINTER(c_int), POINTER(c_int), POINTER(c_int),
+                           Color]
+nk_color_hsv_i.restype = None
+
+nk_color_hsv_b = _nuklear.nk_color_hsv_b
+nk_color_hsv_b.argtypes = [POINTER(nk_byte), POINTER(nk_byte),
+                           POINTER(nk_byte), Color]
+nk_color_hsv_b.restype = None
+
+nk_color_hsv_iv = _nuklear.nk_color_hsv_iv
+nk_color_hsv_iv.argtypes = [POINTER(c_int), Color]
+nk_color_hsv_iv.restype = None
+
+nk_color_hsv_bv = _nuklear.nk_color_hsv_bv
+nk_color_hsv_bv.argtypes = [POINTER(nk_byte), Color]
+nk_color_hsv_bv.restype = None
+
+nk_color_hsv_f = _nuklear.nk_color_hsv_f
+nk_color_hsv_f.argtypes = [POINTER(c_float), POINTER(c_float),
+                           POINTER(c_float), Color]
+nk_color_hsv_f.restype = None
+
+nk_color_hsv_fv = _nuklear.nk_color_hsv_fv
+nk_color_hsv_fv.argtypes = [POINTER(c_float), Color]
+nk_color_hsv_fv.restype = None
+
+nk_color_hsva_i = _nuklear.nk_color_hsva_i
+nk_color_hsva_i.argtypes = [POINTER(c_int), POINTER(c_int), POINTER(c_int),
+                            POINTER(c_int), Color]
+nk_color_hsva_i.restype = None
+
+nk_color_hsva_b = _nuklear.nk_color_hsva_b
+nk_color_hsva_b.argtypes = [POINTER(nk_byte), POINTER(nk_byte),
+                            POINTER(nk_byte), POINTER(nk_byte), Color]
+nk_color_hsva_b.restype = None
+
+nk_color_hsva_iv = _nuklear.nk_color_hsva_iv
+nk_color_hsva_iv.argtypes = [POINTER(c_int), Color]
+nk_color_hsva_iv.restype = None
+
+nk_color_hsva_bv = _nuklear.nk_color_hsva_bv
+nk_color_hsva_bv.argtypes = [POINTER(nk_byte), Color]
+nk_color_hsva_bv.restype = None
+
+nk_color_hsva_f = _nuklear.nk_color_hsva_f
+nk_color_hsva_f.argtypes = [POINTER(c_float), POINTER(c_float),
+                            POINTER(c_float), POINTER(c_float), Color]
+nk_color_hsva_f.restype = None
+
+nk_color_hsva_fv = _nuklear.nk_color_hsva_fv
+nk_color_hsva_fv.argtypes = [POINTER(c_float), Color]
+nk_color_hsva_fv.restype = None
+
+nk_handle_ptr = _nuklear.nk_handle_ptr
+nk_handle_ptr.argtypes = [c_void_p]
+nk_handle_ptr.restype = Handle
+
+nk_handle_id = _nuklear.nk_handle_id
+nk_handle_id.argtypes = [c_int]
+nk_handle_id.restype = Handle
+
+nk_image_handle = _nuklear.nk_image_handle
+nk_image_handle.argtypes = [Handle]
+nk_image_handle.restype = Image
+
+nk_image_ptr = _nuklear.nk_image_ptr
+nk_image_ptr.argtypes = [c_void_p]
+nk_image_ptr.restype = Image
+
+nk_image_id = _nuklear.nk_image_id
+nk_image_id.argtypes = [c_int]
+nk_image_id.restype = Image
+
+nk_image_is_subimage = _nuklear.nk_image_is_subimage
+nk_image_is_subimage.argtypes = [POINTER(Image)]
+nk_image_is_subimage.restype = c_int
+
+nk_subimage_ptr = _nuklear.nk_subimage_ptr
+nk_subimage_ptr.argtypes = [c_void_p, c_ushort, c_ushort, Rect]
+nk_subimage_ptr.restype = Image
+
+nk_subimage_id = _nuklear.nk_subimage_id
+nk_subimage_id.argtypes = [c_int, c_ushort, c_ushort, Rect]
+nk_subimage_id.restype = Image
+
+nk_subimage_handle = _nuklear.nk_subimage_handle
+nk_subimage_handle.argtypes = [Handle, c_ushort, c_ushort, Rect]
+nk_subimage_handle.restype = Image
+
+nk_murmur_hash = _nuklear.nk_murmur_hash
+nk_murmur_hash.argtypes = [c_void_p, c_int, nk_hash]
+nk_murmur_hash.restype = nk_hash
+
+nk_triangle_from_direction = _nuklear.nk_triangle_from_direction
+nk_triangle_from_direction.argtypes = [POINTER(Vec2), Rect, c_float, c_float,
+                                       c_int]
+nk_triangle_from_direction.restype = None
+
+nk_vec2 = _nuklear.nk_vec2
+nk_vec2.argtypes = [c_float, c_float]
+nk_vec2.restype = Vec2
+
+nk_vec2i = _nuklear.nk_vec2i
+nk_vec2i.argtypes = [c_int, c_int]
+nk_vec2i.restype = Vec2
+
+nk_vec2v = _nuklear.nk_vec2v
+nk_vec2v.argtypes = [POINTER(c_float)]
+nk_vec2v.restype = Vec2
+
+nk_vec2iv = _nuklear.nk_vec2iv
+nk_vec2iv.argtypes = [POINTER(c_int)]
+nk_vec2iv.restype = Vec2
+
+nk_get_null_rect = _nuklear.nk_get_null_rect
+nk_get_null_rect.argtypes = []
+nk_get_null_rect.restype = Rect
+
+nk_rect = _nuklear.nk_rect
+nk_rect.argtypes = [c_float, c_float, c_float, c_float]
+nk_rect.restype = Rect
+
+nk_recti = _nuklear.nk_recti
+nk_recti.argtypes = [c_int, c_int, c_int, c_int]
+nk_recti.restype = Rect
+
+nk_recta = _nuklear.nk_recta
+nk_recta.argtypes = [Vec2, Vec2]
+nk_recta.restype = Rect
+
+nk_rectv = _nuklear.nk_rectv
+nk_rectv.argtypes = [POINTER(c_float)]
+nk_rectv.restype = Rect
+
+nk_rectiv = _nuklear.nk_rectiv
+nk_rectiv.argtypes = [POINTER(c_int)]
+nk_rectiv.restype = Rect
+
+nk_rect_pos = _nuklear.nk_rect_pos
+nk_rect_pos.argtypes = [Rect]
+nk_rect_pos.restype = Vec2
+
+nk_rect_size = _nuklear.nk_rect_size
+nk_rect_size.argtypes = [Rect]
+nk_rect_size.restype = Vec2
+
+nk_strlen = _nuklear.nk_strlen
+nk_strlen.argtypes = [c_char_p]
+nk_strlen.restype = c_int
+
+nk_stricmp = _nuklear.nk_stricmp
+nk_stricmp.argtypes = [c_char_p, c_char_p]
+nk_stricmp.restype = c_int
+
+nk_stricmpn = _nuklear.nk_stricmpn
+nk_stricmpn.argtypes = [c_char_p, c_char_p, c_int]
+nk_stricmpn.restype = c_int
+
+nk_strtoi = _nuklear.nk_strtoi
+nk_strtoi.argtypes = [c_char_p, POINTER(c_char_p)]
+nk_strtoi.restype = c_int
+
+nk_strtof = _nuklear.nk_strtof
+nk_strtof.argtypes = [c_char_p, POINTER(c_char_p)]
+nk_strtof.restype = c_float
+
+nk_strtod = _nuklear.nk_strtod
+nk_strtod.argtypes = [c_char_p, POINTER(c_char_p)]
+nk_strtod.restype = c_double
+
+nk_strfilter = _nuklear.nk_strfilter
+nk_strfilter.argtypes = [c_char_p, c_char_p]
+nk_strfilter.restype = c_int
+
+nk_strmatch_fuzzy_string = _nuklear.nk_strmatch_fuzzy_string
+nk_strmatch_fuzzy_string.argtypes = [POINTER(c_char), POINTER(c_char),
+                                     POINTER(c_int)]
+nk_strmatch_fuzzy_string.restype = c_int
+
+nk_strmatch_fuzzy_text = _nuklear.nk_strmatch_fuzzy_text
+nk_strmatch_fuzzy_text.argtypes = [c_char_p, c_int, c_char_p, POINTER(c_int)]
+nk_strmatch_fuzzy_text.restype = c_int
+
+nk_utf_decode = _nuklear.nk_utf_decode
+nk_utf_decode.argtypes = [c_char_p, POINTER(nk_rune), c_int]
+nk_utf_decode.restype = c_int
+
+nk_utf_encode = _nuklear.nk_utf_encode
+nk_utf_encode.argtypes = [nk_rune, POINTER(c_char), c_int]
+nk_utf_encode.restype = c_int
+
+nk_utf_len = _nuklear.nk_utf_len
+nk_utf_len.argtypes = [c_char_p, c_int]
+nk_utf_len.restype = c_int
+
+nk_utf_at = _nuklear.nk_utf_at
+nk_utf_at.argtypes = [c_char_p, c_int, c_int, POINTER(nk_rune), POINTER(c_int)]
+nk_utf_at.restype = c_char_p
+
+nk_font_default_glyph_ranges = _nuklear.nk_font_default_glyph_ranges
+nk_font_default_glyph_ranges.argtypes = []
+nk_font_default_glyph_ranges.restype = POINTER(nk_rune)
+
+nk_font_chinese_glyph_ranges = _nuklear.nk_font_chinese_glyph_ranges
+nk_font_chinese_glyph_ranges.argtypes = []
+nk_font_chinese_glyph_ranges.restype = POINTER(nk_rune)
+
+nk_font_cyrillic_glyph_ranges = _nuklear.nk_font_cyrillic_glyph_ranges
+nk_font_cyrillic_glyph_ranges.argtypes = []
+nk_font_cyrillic_glyph_ranges.restype = POINTER(nk_rune)
+
+nk_font_korean_glyph_ranges = _nuklear.nk_font_korean_glyph_ranges
+nk_font_korean_glyph_ranges.argtypes = []
+nk_font_korean_glyph_ranges.restype = POINTER(nk_rune)
+
+nk_font_atlas_init_default = _nuklear.nk_font_atlas_init_default
+nk_font_atlas_init_default.argtypes = [POINTER(FontAtlas)]
+nk_font_atlas_init_default.restype = None
+
+nk_font_atlas_init = _nuklear.nk_font_atlas_init
+nk_font_atlas_init.argtypes = [POINTER(FontAtlas), POINTER(Allocator)]
+nk_font_atlas_init.restype = None
+
+nk_font_atlas_init_custom = _nuklear.nk_font_atlas_init_custom
+nk_font_atlas_init_custom.argtypes = [POINTER(FontAtlas), POINTER(Allocator),
+                                      POINTER(Allocator)]
+nk_font_atlas_init_custom.restype = None
+
+nk_font_atlas_begin = _nuklear.nk_font_atlas_begin
+nk_font_atlas_begin.argtypes = [POINTER(FontAtlas)]
+nk_font_atlas_begin.restype = None
+
+nk_font_config = _nuklear.nk_font_config
+nk_font_config.argtypes = [c_float]
+nk_font_config.restype = FontConfig
+
+nk_font_atlas_add = _nuklear.nk_font_atlas_add
+nk_font_atlas_add.argtypes = [POINTER(FontAtlas), POINTER(FontConfig)]
+nk_font_atlas_add.restype = POINTER(Font)
+
+nk_font_atlas_add_default = _nuklear.nk_font_atlas_add_default
+nk_font_atlas_add_default.argtypes = [POINTER(FontAtlas), c_float,
+                                      POINTER(FontConfig)]
+nk_font_atlas_add_default.restype = POINTER(Font)
+
+nk_font_atlas_add_from_memory = _nuklear.nk_font_atlas_add_from_memory
+nk_font_atlas_add_from_memory.argtypes = [POINTER(FontAtlas), c_void_p,
+                                          nk_size, c_float,
+                                          POINTER(FontConfig)]
+nk_font_atlas_add_from_memory.restype = POINTER(Font)
+
+nk_font_atlas_add_from_file = _nuklear.nk_font_atlas_add_from_file
+nk_font_atlas_add_from_file.argtypes = [POINTER(FontAtlas), c_char_p, c_float,
+                                        POINTER(FontConfig)]
+nk_font_atlas_add_from_file.restype = POINTER(Font)
+
+nk_font_atlas_add_compressed = _nuklear.nk_font_atlas_add_compressed
+nk_font_atlas_add_compressed.argtypes = [POINTER(FontAtlas), c_void_p,
+                                         nk_size, c_float, POINTER(FontConfig)]
+nk_font_atlas_add_compressed.restype = POINTER(Font)
+
+nk_font_atlas_add_compressed_base85 = _nuklear.nk_font_atlas_add_compressed_base85
+nk_font_atlas_add_compressed_base85.argtypes = [POINTER(FontAtlas), c_char_p,
+                                                c_float, POINTER(FontConfig)]
+nk_font_atlas_add_compressed_base85.restype = POINTER(Font)
+
+nk_font_atlas_bake = _nuklear.nk_font_atlas_bake
+nk_font_atlas_bake.argtypes = [POINTER(FontAtlas), POINTER(c_int),
+                               POINTER(c_int), c_int]
+nk_font_atlas_bake.restype = c_void_p
+
+nk_font_atlas_end = _nuklear.nk_font_atlas_end
+nk_font_atlas_end.argtypes = [POINTER(FontAtlas), Handle,
+                              POINTER(DrawNullTexture)]
+nk_font_atlas_end.restype = None
+
+nk_font_find_glyph = _nuklear.nk_font_find_glyph
+nk_font_find_glyph.argtypes = [POINTER(Font), nk_rune]
+nk_font_find_glyph.restype = POINTER(FontGlyph)
+
+nk_font_atlas_cleanup = _nuklear.nk_font_atlas_cleanup
+nk_font_atlas_cleanup.argtypes = [POINTER(FontAtlas)]
+nk_font_atlas_cleanup.restype = None
+
+nk_font_atlas_clear = _nuklear.nk_font_atlas_clear
+nk_font_atlas_clear.argtypes = [POINTER(FontAtlas)]
+nk_font_atlas_clear.restype = None
+
+nk_buffer_init_default = _nuklear.nk_buffer_init_default
+nk_buffer_init_default.argtypes = [POINTER(Buffer)]
+nk_buffer_init_default.restype = None
+
+nk_buffer_init = _nuklear.nk_buffer_init
+nk_buffer_init.argtypes = [POINTER(Buffer), POINTER(Allocator), nk_size]
+nk_buffer_init.restype = None
+
+nk_buffer_init_fixed = _nuklear.nk_buffer_init_fixed
+nk_buffer_init_fixed.argtypes = [POINTER(Buffer), c_void_p, nk_size]
+nk_buffer_init_fixed.restype = None
+
+nk_buffer_info = _nuklear.nk_buffer_info
+nk_buffer_info.argtypes = [POINTER(MemoryStatus), POINTER(Buffer)]
+nk_buffer_info.restype = None
+
+nk_buffer_push = _nuklear.nk_buffer_push
+nk_buffer_push.argtypes = [POINTER(Buffer), c_int, c_void_p, nk_size, nk_size]
+nk_buffer_push.restype = None
+
+nk_buffer_mark = _nuklear.nk_buffer_mark
+nk_buffer_mark.argtypes = [POINTER(Buffer), c_int]
+nk_buffer_mark.restype = None
+
+nk_buffer_reset = _nuklear.nk_buffer_reset
+nk_buffer_reset.argtypes = [POINTER(Buffer), c_int]
+nk_buffer_reset.restype = None
+
+nk_buffer_clear = _nuklear.nk_buffer_clear
+nk_buffer_clear.argtypes = [POINTER(Buffer)]
+nk_buffer_clear.restype = None
+
+nk_buffer_free = _nuklear.nk_buffer_free
+nk_buffer_free.argtypes = [POINTER(Buffer)]
+nk_buffer_free.restype = None
+
+nk_buffer_memory = _nuklear.nk_buffer_memory
+nk_buffer_memory.argtypes = [POINTER(Buffer)]
+nk_buffer_memory.restype = c_void_p
+
+nk_buffer_memory_const = _nuklear.nk_buffer_memory_const
+nk_buffer_memory_const.argtypes = [POINTER(Buffer)]
+nk_buffer_memory_const.restype = c_void_p
+
+nk_buffer_total = _nuklear.nk_buffer_total
+nk_buffer_total.argtypes = [POINTER(Buffer)]
+nk_buffer_total.restype = nk_size
+
+nk_str_init_default = _nuklear.nk_str_init_default
+nk_str_init_default.argtypes = [POINTER(Str)]
+nk_str_init_default.restype = None
+
+nk_str_init = _nuklear.nk_str_init
+nk_str_init.argtypes = [POINTER(Str), POINTER(Allocator), nk_size]
+nk_str_init.restype = None
+
+nk_str_init_fixed = _nuklear.nk_str_init_fixed
+nk_str_init_fixed.argtypes = [POINTER(Str), c_void_p, nk_size]
+nk_str_init_fixed.restype = None
+
+nk_str_clear = _nuklear.nk_str_clear
+nk_str_clear.argtypes = [POINTER(Str)]
+nk_str_clear.restype = None
+
+nk_str_free = _nuklear.nk_str_free
+nk_str_free.argtypes = [POINTER(Str)]
+nk_str_free.restype = None
+
+nk_str_append_text_char = _nuklear.nk_str_append_text_char
+nk_str_append_text_char.argtypes = [POINTER(Str), c_char_p, c_int]
+nk_str_append_text_char.restype = c_int
+
+nk_str_append_str_char = _nuklear.nk_str_append_str_char
+nk_str_append_str_char.argtypes = [POINTER(Str), c_char_p]
+nk_str_append_str_char.restype = c_int
+
+nk_str_append_text_utf8 = _nuklear.nk_str_append_text_utf8
+nk_str_append_text_utf8.argtypes = [POINTER(Str), c_char_p, c_int]
+nk_str_append_text_utf8.restype = c_int
+
+nk_str_append_str_utf8 = _nuklear.nk_str_append_str_utf8
+nk_str_append_str_utf8.argtypes = [POINTER(Str), c_char_p]
+nk_str_append_str_utf8.restype = c_int
+
+nk_str_append_text_runes = _nuklear.nk_str_append_text_runes
+nk_str_append_text_runes.argtypes = [POINTER(Str), POINTER(nk_rune), c_int]
+nk_str_append_text_runes.restype = c_int
+
+nk_str_append_str_runes = _nuklear.nk_str_append_str_runes
+nk_str_append_str_runes.argtypes = [POINTER(Str), POINTER(nk_rune)]
+nk_str_append_str_runes.restype = c_int
+
+nk_str_insert_at_char = _nuklear.nk_str_insert_at_char
+nk_str_insert_at_char.argtypes = [POINTER(Str), c_int, c_char_p, c_int]
+nk_str_insert_at_char.restype = c_int
+
+nk_str_insert_at_rune = _nuklear.nk_str_insert_at_rune
+nk_str_insert_at_rune.argtypes = [POINTER(Str), c_int, c_char_p, c_int]
+nk_str_insert_at_rune.restype = c_int
+
+nk_str_insert_text_char = _nuklear.nk_str_insert_text_char
+nk_str_insert_text_char.argtypes = [POINTER(Str), c_int, c_char_p, c_int]
+nk_str_insert_text_char.restype = c_int
+
+nk_str_insert_str_char = _nuklear.nk_str_insert_str_char
+nk_str_insert_str_char.argtypes = [POINTER(Str), c_int, c_char_p]
+nk_str_insert_str_char.restype = c_int
+
+nk_str_insert_text_utf8 = _nuklear.nk_str_insert_text_utf8
+nk_str_insert_text_utf8.argtypes = [POINTER(Str), c_int, c_char_p, c_int]
+nk_str_insert_text_utf8.restype = c_int
+
+nk_str_insert_str_utf8 = _nuklear.nk_str_insert_str_utf8
+nk_str_insert_str_utf8.argtypes = [POINTER(Str), c_int, c_char_p]
+nk_str_insert_str_utf8.restype = c_int
+
+nk_str_insert_text_runes = _nuklear.nk_str_insert_text_runes
+nk_str_insert_text_runes.argtypes = [POINTER(Str), c_int, POINTER(nk_rune),
+                                     c_int]
+nk_str_insert_text_runes.restype = c_int
+
+nk_str_insert_str_runes = _nuklear.nk_str_insert_str_runes
+nk_str_insert_str_runes.argtypes = [POINTER(Str), c_int, POINTER(nk_rune)]
+nk_str_insert_str_runes.restype = c_int
+
+nk_str_remove_chars = _nuklear.nk_str_remove_chars
+nk_str_remove_chars.argtypes = [POINTER(Str), c_int]
+nk_str_remove_chars.restype = None
+
+nk_str_remove_runes = _nuklear.nk_str_remove_runes
+nk_str_remove_runes.argtypes = [POINTER(Str), c_int]
+nk_str_remove_runes.restype = None
+
+nk_str_delete_chars = _nuklear.nk_str_delete_chars
+nk_str_delete_chars.argtypes = [POINTER(Str), c_int, c_int]
+nk_str_delete_chars.restype = None
+
+nk_str_delete_runes = _nuklear.nk_str_delete_runes
+nk_str_delete_runes.argtypes = [POINTER(Str), c_int, c_int]
+nk_str_delete_runes.restype = None
+
+nk_str_at_char = _nuklear.nk_str_at_char
+nk_str_at_char.argtypes = [POINTER(Str), c_int]
+nk_str_at_char.restype = POINTER(c_char)
+
+nk_str_at_rune = _nuklear.nk_str_at_rune
+nk_str_at_rune.argtypes = [POINTER(Str), c_int, POINTER(nk_rune),
+                           POINTER(c_int)]
+nk_str_at_rune.restype = POINTER(c_char)
+
+nk_str_rune_at = _nuklear.nk_str_rune_at
+nk_str_rune_at.argtypes = [POINTER(Str), c_int]
+nk_str_rune_at.restype = nk_rune
+
+nk_str_at_char_const = _nuklear.nk_str_at_char_const
+nk_str_at_char_const.argtypes = [POINTER(Str), c_int]
+nk_str_at_char_const.restype = c_char_p
+
+nk_str_at_const = _nuklear.nk_str_at_const
+nk_str_at_const.argtypes = [POINTER(Str), c_int, POINTER(nk_rune),
+                            POINTER(c_int)]
+nk_str_at_const.restype = c_char_p
+
+nk_str_get = _nuklear.nk_str_get
+nk_str_get.argtypes = [POINTER(Str)]
+nk_str_get.restype = POINTER(c_char)
+
+nk_str_get_const = _nuklear.nk_str_get_const
+nk_str_get_const.argtypes = [POINTER(Str)]
+nk_str_get_const.restype = c_char_p
+
+nk_str_len = _nuklear.nk_str_len
+nk_str_len.argtypes = [POINTER(Str)]
+nk_str_len.restype = c_int
+
+nk_str_len_char = _nuklear.nk_str_len_char
+nk_str_len_char.argtypes = [POINTER(Str)]
+nk_str_len_char.restype = c_int
+
+nk_filter_default = _nuklear.nk_filter_default
+nk_filter_default.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_default.restype = c_int
+
+nk_filter_ascii = _nuklear.nk_filter_ascii
+nk_filter_ascii.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_ascii.restype = c_int
+
+nk_filter_float = _nuklear.nk_filter_float
+nk_filter_float.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_float.restype = c_int
+
+nk_filter_decimal = _nuklear.nk_filter_decimal
+nk_filter_decimal.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_decimal.restype = c_int
+
+nk_filter_hex = _nuklear.nk_filter_hex
+nk_filter_hex.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_hex.restype = c_int
+
+nk_filter_oct = _nuklear.nk_filter_oct
+nk_filter_oct.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_oct.restype = c_int
+
+nk_filter_binary = _nuklear.nk_filter_binary
+nk_filter_binary.argtypes = [POINTER(TextEdit), nk_rune]
+nk_filter_binary.restype = c_int
+
+nk_textedit_init_default = _nuklear.nk_textedit_init_default
+nk_textedit_init_default.argtypes = [POINTER(TextEdit)]
+nk_textedit_init_default.restype = None
+
+nk_textedit_init = _nuklear.nk_textedit_init
+nk_textedit_init.argtypes = [POINTER(TextEdit), POINTER(Allocator), nk_size]
+nk_textedit_init.restype = None
+
+nk_textedit_init_fixed = _nuklear.nk_textedit_init_fixed
+nk_textedit_init_fixed.argtypes = [POINTER(TextEdit), c_void_p, nk_size]
+nk_textedit_init_fixed.restype = None
+
+nk_textedit_free = _nuklear.nk_textedit_free
+nk_textedit_free.argtypes = [POINTER(TextEdit)]
+nk_textedit_free.restype = None
+
+nk_textedit_text = _nuklear.nk_textedit_text
+nk_textedit_text.argtypes = [POINTER(TextEdit), c_char_p, c_int]
+nk_textedit_text.restype = None
+
+nk_textedit_delete = _nuklear.nk_textedit_delete
+nk_textedit_delete.argtypes = [POINTER(TextEdit), c_int, c_int]
+nk_textedit_delete.restype = None
+
+nk_textedit_delete_selection = _nuklear.nk_textedit_delete_selection
+nk_textedit_delete_selection.argtypes = [POINTER(TextEdit)]
+nk_textedit_delete_selection.restype = None
+
+nk_textedit_select_all = _nuklear.nk_textedit_select_all
+nk_textedit_select_all.argtypes = [POINTER(TextEdit)]
+nk_textedit_select_all.restype = None
+
+nk_textedit_cut = _nuklear.nk_textedit_cut
+nk_textedit_cut.argtypes = [POINTER(TextEdit)]
+nk_textedit_cut.restype = c_int
+
+nk_textedit_paste = _nuklear.nk_textedit_paste
+nk_textedit_paste.argtypes = [POINTER(TextEdit), POINTER(c_char), c_int]
+nk_textedit_paste.restype = c_int
+
+nk_textedit_undo = _nuklear.nk_textedit_undo
+nk_textedit_undo.argtypes = [POINTER(TextEdit)]
+nk_textedit_undo.restype = None
+
+nk_textedit_redo = _nuklear.nk_textedit_redo
+nk_textedit_redo.argtypes = [POINTER(TextEdit)]
+nk_textedit_redo.restype = None
+
+nk_stroke_line = _nuklear.nk_stroke_line
+nk_stroke_line.argtypes = [POINTER(CommandBuffer), c_float, c_float, c_float,
+                           c_float, c_float, Color]
+nk_stroke_line.restype = None
+
+nk_stroke_curve = _nuklear.nk_stroke_curve
+nk_stroke_curve.argtypes = [POINTER(CommandBuffer), c_float, c_float, c_float,
+                            c_float, c_float, c_float, c_float, c_float,
+                            c_float, Color]
+nk_stroke_curve.restype = None
+
+nk_stroke_rect = _nuklear.nk_stroke_rect
+nk_stroke_rect.argtypes = [POINTER(CommandBuffer), Rect, c_float, c_float,
+                           Color]
+nk_stroke_rect.restype = None
+
+nk_stroke_circle = _nuklear.nk_stroke_circle
+nk_stroke_circle.argtypes = [POINTER(CommandBuffer), Rect, c_float, Color]
+nk_stroke_circle.restype = None
+
+nk_stroke_arc = _nuklear.nk_stroke_arc
+nk_stroke_arc.argtypes = [POINTER(CommandBuffer), c_float, c_float, c_float,
+                          c_float, c_float, c_float, Color]
+nk_stroke_arc.restype = None
+
+nk_stroke_triangle = _nuklear.nk_stroke_triangle
+nk_stroke_triangle.argtypes = [POINTER(CommandBuffer), c_float, c_float,
+                               c_float, c_float, c_float, c_float, c_float,
+                               Color]
+nk_stroke_triangle.restype = None
+
+nk_stroke_polyline = _nuklear.nk_stroke_polyline
+nk_stroke_polyline.argtypes = [POINTER(CommandBuffer), POINTER(c_float),
+                               c_int, c_float, Color]
+nk_stroke_polyline.restype = None
+
+nk_stroke_polygon = _nuklear.nk_stroke_polygon
+nk_stroke_polygon.argtypes = [POINTER(CommandBuffer), POINTER(c_float), c_int,
+                              c_float, Color]
+nk_stroke_polygon.restype = None
+
+nk_fill_rect = _nuklear.nk_fill_rect
+nk_fill_rect.argtypes = [POINTER(CommandBuffer), Rect, c_float, Color]
+nk_fill_rect.restype = None
+
+nk_fill_rect_multi_color = _nuklear.nk_fill_rect_multi_color
+nk_fill_rect_multi_color.argtypes = [POINTER(CommandBuffer), Rect, Color,
+                                     Color, Color, Color]
+nk_fill_rect_multi_color.restype = None
+
+nk_fill_circle = _nuklear.nk_fill_circle
+nk_fill_circle.argtypes = [POINTER(CommandBuffer), Rect, Color]
+nk_fill_circle.restype = None
+
+nk_fill_arc = _nuklear.nk_fill_arc
+nk_fill_arc.argtypes = [POINTER(CommandBuffer), c_float, c_float, c_float,
+                        c_float, c_float, Color]
+nk_fill_arc.restype = None
+
+nk_fill_triangle = _nuklear.nk_fill_triangle
+nk_fill_triangle.argtypes = [POINTER(CommandBuffer), c_float, c_float,
+                             c_float, c_float, c_float, c_float, Color]
+nk_fill_triangle.restype = None
+
+nk_fill_polygon = _nuklear.nk_fill_polygon
+nk_fill_polygon.argtypes = [POINTER(CommandBuffer), POINTER(c_float), c_int,
+                            Color]
+nk_fill_polygon.restype = None
+
+nk_draw_image = _nuklear.nk_draw_image
+nk_draw_image.argtypes = [POINTER(CommandBuffer), Rect, POINTER(Image), Color]
+nk_draw_image.restype = None
+
+nk_draw_text = _nuklear.nk_draw_text
+nk_draw_text.argtypes = [POINTER(CommandBuffer), Rect, c_char_p, c_int,
+                         POINTER(UserFont), Color, Color]
+nk_draw_text.restype = None
+
+nk_push_scissor = _nuklear.nk_push_scissor
+nk_push_scissor.argtypes = [POINTER(CommandBuffer), Rect]
+nk_push_scissor.restype = None
+
+nk_push_custom = _nuklear.nk_push_custom
+nk_push_custom.argtypes = [POINTER(CommandBuffer), Rect, c_void_p, Handle]
+nk_push_custom.restype = None
+
+nk_input_has_mouse_click = _nuklear.nk_input_has_mouse_click
+nk_input_has_mouse_click.argtypes = [POINTER(Input), c_int]
+nk_input_has_mouse_click.restype = c_int
+
+nk_input_has_mouse_click_in_rect = _nuklear.nk_input_has_mouse_click_in_rect
+nk_input_has_mouse_click_in_rect.argtypes = [POINTER(Input), c_int, Rect]
+nk_input_has_mouse_click_in_rect.restype = c_int
+
+nk_input_has_mouse_click_down_in_rect = _nuklear.nk_input_has_mouse_click_down_in_rect
+nk_input_has_mouse_click_down_in_rect.argtypes = [POINTER(Input), c_int, Rect,
+                                                  c_int]
+nk_input_has_mouse_click_down_in_rect.restype = c_int
+
+nk_input_is_mouse_click_in_rect = _nuklear.nk_input_is_mouse_click_in_rect
+nk_input_is_mouse_click_in_rect.argtypes = [POINTER(Input), c_int, Rect]
+nk_input_is_mouse_click_in_rect.restype = c_int
+
+nk_input_is_mouse_click_down_in_rect = _nuklear.nk_input_is_mouse_click_down_in_rect
+nk_input_is_mouse_click_down_in_rect.argtypes = [POINTER(Input), c_int, Rect,
+                                                 c_int]
+nk_input_is_mouse_click_down_in_rect.restype = c_int
+
+nk_input_any_mouse_click_in_rect = _nuklear.nk_input_any_mouse_click_in_rect
+nk_input_any_mouse_click_in_rect.argtypes = [POINTER(Input), Rect]
+nk_input_any_mouse_click_in_rect.restype = c_int
+
+nk_input_is_mouse_prev_hovering_rect = _nuklear.nk_input_is_mouse_prev_hovering_rect
+nk_input_is_mouse_prev_hovering_rect.argtypes = [POINTER(Input), Rect]
+nk_input_is_mouse_prev_hovering_rect.restype = c_int
+
+nk_input_is_mouse_hovering_rect = _nuklear.nk_input_is_mouse_hovering_rect
+nk_input_is_mouse_hovering_rect.argtypes = [POINTER(Input), Rect]
+nk_input_is_mouse_hovering_rect.restype = c_int
+
+nk_input_mouse_clicked = _nuklear.nk_input_mouse_clicked
+nk_input_mouse_clicked.argtypes = [POINTER(Input), c_int, Rect]
+nk_input_mouse_clicked.restype = c_int
+
+nk_input_is_mouse_down = _nuklear.nk_input_is_mouse_down
+nk_input_is_mouse_down.argtypes = [POINTER(Input), c_int]
+nk_input_is_mouse_down.restype = c_int
+
+nk_input_is_mouse_pressed = _nuklear.nk_input_is_mouse_pressed
+nk_input_is_mouse_pressed.argtypes = [POINTER(Input), c_int]
+nk_input_is_mouse_pressed.restype = c_int
+
+nk_input_is_mouse_released = _nuklear.nk_input_is_mouse_released
+nk_input_is_mouse_released.argtypes = [POINTER(Input), c_int]
+nk_input_is_mouse_released.restype = c_int
+
+nk_input_is_key_pressed = _nuklear.nk_input_is_key_pressed
+nk_input_is_key_pressed.argtypes = [POINTER(Input), c_int]
+nk_input_is_key_pressed.restype = c_int
+
+nk_input_is_key_released = _nuklear.nk_input_is_key_released
+nk_input_is_key_released.argtypes = [POINTER(Input), c_int]
+nk_input_is_key_released.restype = c_int
+
+nk_input_is_key_down = _nuklear.nk_input_is_key_down
+nk_input_is_key_down.argtypes = [POINTER(Input), c_int]
+nk_input_is_key_down.restype = c_int
+
+nk_draw_list_init = _nuklear.nk_draw_list_init
+nk_draw_list_init.argtypes = [POINTER(DrawList)]
+nk_draw_list_init.restype = None
+
+nk_draw_list_setup = _nuklear.nk_draw_list_setup
+nk_draw_list_setup.argtypes = [POINTER(DrawList), POINTER(ConvertConfig),
+                               POINTER(Buffer), POINTER(Buffer),
+                               POINTER(Buffer), c_int, c_int]
+nk_draw_list_setup.restype = None
+
+nk__draw_list_begin = _nuklear.nk__draw_list_begin
+nk__draw_list_begin.argtypes = [POINTER(DrawList), POINTER(Buffer)]
+nk__draw_list_begin.restype = POINTER(DrawCommand)
+
+nk__draw_list_next = _nuklear.nk__draw_list_next
+nk__draw_list_next.argtypes = [POINTER(DrawCommand), POINTER(Buffer),
+                               POINTER(DrawList)]
+nk__draw_list_next.restype = POINTER(DrawCommand)
+
+nk__draw_list_end = _nuklear.nk__draw_list_end
+nk__draw_list_end.argtypes = [POINTER(DrawList), POINTER(Buffer)]
+nk__draw_list_end.restype = POINTER(DrawCommand)
+
+nk_draw_list_path_clear = _nuklear.nk_draw_list_path_clear
+nk_draw_list_path_clear.argtypes = [POINTER(DrawList)]
+nk_draw_list_path_clear.restype = None
+
+nk_draw_list_path_line_to = _nuklear.nk_draw_list_path_line_to
+nk_draw_list_path_line_to.argtypes = [POINTER(DrawList), Vec2]
+nk_draw_list_path_line_to.restype = None
+
+nk_draw_list_path_arc_to_fast = _nuklear.nk_draw_list_path_arc_to_fast
+nk_draw_list_path_arc_to_fast.argtypes = [POINTER(DrawList), Vec2, c_float,
+                                          c_int, c_int]
+nk_draw_list_path_arc_to_fast.restype = None
+
+nk_draw_list_path_arc_to = _nuklear.nk_draw_list_path_arc_to
+nk_draw_list_path_arc_to.argtypes = [POINTER(DrawList), Vec2, c_float,
+                                     c_float, c_float, c_uint]
+nk_draw_list_path_arc_to.restype = None
+
+nk_draw_list_path_rect_to = _nuklear.nk_draw_list_path_rect_to
+nk_draw_list_path_rect_to.argtypes = [POINTER(DrawList), Vec2, Vec2, c_float]
+nk_draw_list_path_rect_to.restype = None
+
+nk_draw_list_path_curve_to = _nuklear.nk_draw_list_path_curve_to
+nk_draw_list_path_curve_to.argtypes = [POINTER(DrawList), Vec2, Vec2, Vec2,
+                                       c_uint]
+nk_draw_list_path_curve_to.restype = None
+
+nk_draw_list_path_fill = _nuklear.nk_draw_list_path_fill
+nk_draw_list_path_fill.argtypes = [POINTER(DrawList), Color]
+nk_draw_list_path_fill.restype = None
+
+nk_draw_list_path_stroke = _nuklear.nk_draw_list_path_stroke
+nk_draw_list_path_stroke.argtypes = [POINTER(DrawList), Color, c_int, c_float]
+nk_draw_list_path_stroke.restype = None
+
+nk_draw_list_stroke_line = _nuklear.nk_draw_list_stroke_line
+nk_draw_list_stroke_line.argtypes = [POINTER(DrawList), Vec2, Vec2, Color,
+                                     c_float]
+nk_draw_list_stroke_line.restype = None
+
+nk_draw_list_stroke_rect = _nuklear.nk_draw_list_stroke_rect
+nk_draw_list_stroke_rect.argtypes = [POINTER(DrawList), Rect, Color, c_float,
+                                     c_float]
+nk_draw_list_stroke_rect.restype = None
+
+nk_draw_list_stroke_triangle = _nuklear.nk_draw_list_stroke_triangle
+nk_draw_list_stroke_triangle.argtypes = [POINTER(DrawList), Vec2, Vec2, Vec2,
+                                         Color, c_float]
+nk_draw_list_stroke_triangle.restype = None
+
+nk_draw_list_stroke_circle = _nuklear.nk_draw_list_stroke_circle
+nk_draw_list_stroke_circle.argtypes = [POINTER(DrawList), Vec2, c_float,
+                                       Color, c_uint, c_float]
+nk_draw_list_stroke_circle.restype = None
+
+nk_draw_list_stroke_curve = _nuklear.nk_draw_list_stroke_curve
+nk_draw_list_stroke_curve.argtypes = [POINTER(DrawList), Vec2, Vec2, Vec2,
+                                      Vec2, Color, c_uint, c_float]
+nk_draw_list_stroke_curve.restype = None
+
+nk_draw_list_stroke_poly_line = _nuklear.nk_draw_list_stroke_poly_line
+nk_draw_list_stroke_poly_line.argtypes = [POINTER(DrawList), POINTER(Vec2),
+                                          c_uint, Color, c_int, c_float, c_int]
+nk_draw_list_stroke_poly_line.restype = None
+
+nk_draw_list_fill_rect = _nuklear.nk_draw_list_fill_rect
+nk_draw_list_fill_rect.argtypes = [POINTER(DrawList), Rect, Color, c_float]
+nk_draw_list_fill_rect.restype = None
+
+nk_draw_list_fill_rect_multi_color = _nuklear.nk_draw_list_fill_rect_multi_color
+nk_draw_list_fill_rect_multi_color.argtypes = [POINTER(DrawList), Rect, Color,
+                                               Color, Color, Color]
+nk_draw_list_fill_rect_multi_color.restype = None
+
+nk_draw_list_fill_triangle = _nuklear.nk_draw_list_fill_triangle
+nk_draw_list_fill_triangle.argtypes = [POINTER(DrawList), Vec2, Vec2, Vec2,
+                                       Color]
+nk_draw_list_fill_triangle.restype = None
+
+nk_draw_list_fill_circle = _nuklear.nk_draw_list_fill_circle
+nk_draw_list_fill_circle.argtypes = [POINTER(DrawList), Vec2, c_float, Color,
+                                     c_uint]
+nk_draw_list_fill_circle.restype = None
+
+nk_draw_list_fill_poly_convex = _nuklear.nk_draw_list_fill_poly_convex
+nk_draw_list_fill_poly_convex.argtypes = [POINTER(DrawList), POINTER(Vec2),
+                                          c_uint, Color, c_int]
+nk_draw_list_fill_poly_convex.restype = None
+
+nk_draw_list_add_image = _nuklear.nk_draw_list_add_image
+nk_draw_list_add_image.argtypes = [POINTER(DrawList), Image, Rect, Color]
+nk_draw_list_add_image.restype = None
+
+nk_draw_list_add_text = _nuklear.nk_draw_list_add_text
+nk_draw_list_add_text.argtypes = [POINTER(DrawList), POINTER(UserFont), Rect,
+                                  c_char_p, c_int, c_float, Color]
+nk_draw_list_add_text.restype = None
+
+nk_style_item_image = _nuklear.nk_style_item_image
+nk_style_item_image.argtypes = [Image]
+nk_style_item_image.restype = StyleItem
+
+nk_style_item_color = _nuklear.nk_style_item_color
+nk_style_item_color.argtypes = [Color]
+nk_style_item_color.restype = StyleItem
+
+nk_style_item_hide = _nuklear.nk_style_item_hide
+nk_style_item_hide.argtypes = []
+nk_style_item_hide.restype = StyleItem
+
+nk_font_atlas_add_mapped = _nuklear.nk_font_atlas_add_mapped
+nk_font_atlas_add_mapped.argtypes = [POINTER(FontAtlas), c_char_p, c_float,
+                                     POINTER(FontConfig)]
+nk_font_atlas_add_mapped.restype = POINTER(Font)
+
+nk_font_pages_create = _nuklear.nk_font_pages_create
+nk_font_pages_create.argtypes = [POINTER(FontAtlas)]
+nk_font_pages_create.restype = POINTER(FontPages)
+
+nk_font_pages_pending = _nuklear.nk_font_pages_pending
+nk_font_pages_pending.argtypes = [POINTER(FontPages)]
+nk_font_pages_pending.restype = c_int
+
+nk_font_pages_bake = _nuklear.nk_font_pages_bake
+nk_font_pages_bake.argtypes = [POINTER(FontPages), POINTER(c_int),
+                               POINTER(c_int), c_int]
+nk_font_pages_bake.restype = c_void_p
+
+nk_font_pages_free = _nuklear.nk_font_pages_free
+nk_font_pages_free.argtypes = [POINTER(FontPages)]
+nk_font_pages_free.restype = None
+
+nk_glfw3_init = _nuklear.nk_glfw3_init
+nk_glfw3_init.argtypes = [c_void_p, c_int]
+nk_glfw3_init.restype = POINTER(Context)
+
+nk_glfw3_shutdown = _nuklear.nk_glfw3_shutdown
+nk_glfw3_shutdown.argtypes = []
+nk_glfw3_shutdown.restype = None
+
+nk_glfw3_create = _nuklear.nk_glfw3_create
+nk_glfw3_create.argtypes = [c_void_p, c_int, POINTER(Glfw)]
+nk_glfw3_create.restype = POINTER(Glfw)
+
+nk_glfw3_destroy = _nuklear.nk_glfw3_destroy
+nk_glfw3_destroy.argtypes = [POINTER(Glfw)]
+nk_glfw3_destroy.restype = None
+
+nk_glfw3_make_current = _nuklear.nk_glfw3_make_current
+nk_glfw3_make_current.argtypes = [POINTER(Glfw)]
+nk_glfw3_make_current.restype = None
+
+nk_glfw3_current = _nuklear.nk_glfw3_current
+nk_glfw3_current.argtypes = []
+nk_glfw3_current.restype = POINTER(Glfw)
+
+nk_glfw3_context = _nuklear.nk_glfw3_context
+nk_glfw3_context.argtypes = [POINTER(Glfw)]
+nk_glfw3_context.restype = POINTER(Context)
+
+nk_glfw3_font_stash_begin = _nuklear.nk_glfw3_font_stash_begin
+nk_glfw3_font_stash_begin.argtypes = [POINTER(POINTER(FontAtlas))]
+nk_glfw3_font_stash_begin.restype = None
+
+nk_glfw3_font_stash_end = _nuklear.nk_glfw3_font_stash_end
+nk_glfw3_font_stash_end.argtypes = []
+nk_glfw3_font_stash_end.restype = None
+
+nk_glfw3_font_stash_end_format = _nuklear.nk_glfw3_font_stash_end_format
+nk_glfw3_font_stash_end_format.argtypes = [c_int]
+nk_glfw3_font_stash_end_format.restype = None
+
+nk_glfw3_font_stash_end_image = _nuklear.nk_glfw3_font_stash_end_image
+nk_glfw3_font_stash_end_image.argtypes = [c_void_p, c_int, c_int, c_int]
+nk_glfw3_font_stash_end_image.restype = None
+
+nk_glfw3_font_pages_enable = _nuklear.nk_glfw3_font_pages_enable
+nk_glfw3_font_pages_enable.argtypes = []
+nk_glfw3_font_pages_enable.restype = c_int
+
+nk_glfw3_font_pages_update = _nuklear.nk_glfw3_font_pages_update
+nk_glfw3_font_pages_update.argtypes = []
+nk_glfw3_font_pages_update.restype = c_int
+
+nk_glfw3_new_frame = _nuklear.nk_glfw3_new_frame
+nk_glfw3_new_frame.argtypes = []
+nk_glfw3_new_frame.restype = None
+
+nk_glfw3_render = _nuklear.nk_glfw3_render
+nk_glfw3_render.argtypes = [c_int, c_int, c_int]
+nk_glfw3_render.restype = None
+
+nk_glfw3_frame_changed = _nuklear.nk_glfw3_frame_changed
+nk_glfw3_frame_changed.argtypes = []
+nk_glfw3_frame_changed.restype = c_int
+
+nk_glfw3_render_if_changed = _nuklear.nk_glfw3_render_if_changed
+nk_glfw3_render_if_changed.argtypes = [c_int, c_int, c_int]
+nk_glfw3_render_if_changed.restype = c_int
+
+nk_glfw3_protect_state = _nuklear.nk_glfw3_protect_state
+nk_glfw3_protect_state.argtypes = [c_uint]
+nk_glfw3_protect_state.restype = None
+
+nk_glfw3_protected_state = _nuklear.nk_glfw3_protected_state
+nk_glfw3_protected_state.argtypes = []
+nk_glfw3_protected_state.restype = c_uint
+
+nk_glfw3_shadow_state = _nuklear.nk_glfw3_shadow_state
+nk_glfw3_shadow_state.argtypes = []
+nk_glfw3_shadow_state.restype = POINTER(Glfw3GlState)
+
+nk_glfw3_set_stream = _nuklear.nk_glfw3_set_stream
+nk_glfw3_set_stream.argtypes = [c_int]
+nk_glfw3_set_stream.restype = c_int
+
+nk_glfw3_get_stats = _nuklear.nk_glfw3_get_stats
+nk_glfw3_get_stats.argtypes = []
+nk_glfw3_get_stats.restype = POINTER(Glfw3Stats)
+
+nk_glfw3_gpu_timer = _nuklear.nk_glfw3_gpu_timer
+nk_glfw3_gpu_timer.argtypes = [c_int]
+nk_glfw3_gpu_timer.restype = None
+
+nk_glfw3_render_thread_start = _nuklear.nk_glfw3_render_thread_start
+nk_glfw3_render_thread_start.argtypes = []
+nk_glfw3_render_thread_start.restype = c_int
+
+nk_glfw3_render_thread_stop = _nuklear.nk_glfw3_render_thread_stop
+nk_glfw3_render_thread_stop.argtypes = []
+nk_glfw3_render_thread_stop.restype = None
+
+nk_glfw3_submit = _nuklear.nk_glfw3_submit
+nk_glfw3_submit.argtypes = [c_int, c_int, c_int, ColorF]
+nk_glfw3_submit.restype = None
+
+nk_glfw3_device_destroy = _nuklear.nk_glfw3_device_destroy
+nk_glfw3_device_destroy.argtypes = []
+nk_glfw3_device_destroy.restype = None
+
+nk_glfw3_device_create = _nuklear.nk_glfw3_device_create
+nk_glfw3_device_create.argtypes = []
+nk_glfw3_device_create.restype = None
+
+nk_glfw3_char_callback = _nuklear.nk_glfw3_char_callback
+nk_glfw3_char_callback.argtypes = [c_void_p, c_uint]
+nk_glfw3_char_callback.restype = None
+
+nk_gflw3_scroll_callback = _nuklear.nk_gflw3_scroll_callback
+nk_gflw3_scroll_callback.argtypes = [c_void_p, c_double, c_double]
+nk_gflw3_scroll_callback.restype = None
+
+nk_glfw3_mouse_button_callback = _nuklear.nk_glfw3_mouse_button_callback
+nk_glfw3_mouse_button_callback.argtypes = [c_void_p, c_int, c_int, c_int]
+nk_glfw3_mouse_button_callback.restype = None
+
+nk_raster_render = _nuklear.nk_raster_render
+nk_raster_render.argtypes = [POINTER(Context), POINTER(Buffer),
+                             POINTER(RasterVertex), POINTER(nk_draw_index),
+                             POINTER(RasterImage), c_int, POINTER(RasterImage)]
+nk_raster_render.restype = None
+
+nk_raster_clear = _nuklear.nk_raster_clear
+nk_raster_clear.argtypes = [POINTER(RasterImage), Color]
+nk_raster_clear.restype = None
+
+nkWrapper_context_set_style_window_header_align = _nuklear.nkWrapper_context_set_style_window_header_align
+nkWrapper_context_set_style_window_header_align.argtypes = [POINTER(Context),
+                                                            c_int]
+nkWrapper_context_set_style_window_header_align.restype = None
+
+nkWrapper_input_is_mouse_hovering_rect = _nuklear.nkWrapper_input_is_mouse_hovering_rect
+nkWrapper_input_is_mouse_hovering_rect.argtypes = [POINTER(Context), Rect]
+nkWrapper_input_is_mouse_hovering_rect.restype = c_int
+
+nkWrapper_style_push_window_spacing = _nuklear.nkWrapper_style_push_window_spacing
+nkWrapper_style_push_window_spacing.argtypes = [POINTER(Context), Vec2]
+nkWrapper_style_push_window_spacing.restype = c_int
+
+nkWrapper_style_push_button_rounding = _nuklear.nkWrapper_style_push_button_rounding
+nkWrapper_style_push_button_rounding.argtypes = [POINTER(Context), c_float]
+nkWrapper_style_push_button_rounding.restype = c_int
+
+nkWrapper_get_text_width = _nuklear.nkWrapper_get_text_width
+nkWrapper_get_text_width.argtypes = [POINTER(Context), c_char_p]
+nkWrapper_get_text_width.restype = c_float
+
+nkWrapper_font_advances = _nuklear.nkWrapper_font_advances
+nkWrapper_font_advances.argtypes = [POINTER(UserFont), POINTER(nk_rune),
+                                    c_int, POINTER(c_float)]
+nkWrapper_font_advances.restype = None
+
+nkWrapper_button_label_active = _nuklear.nkWrapper_button_label_active
+nkWrapper_button_label_active.argtypes = [POINTER(Context), c_char_p]
+nkWrapper_button_label_active.restype = c_int
+
+nkWrapper_command_list = _nuklear.nkWrapper_command_list
+nkWrapper_command_list.argtypes = [POINTER(Context), POINTER(c_int),
+                                   POINTER(nk_size), c_int]
+nkWrapper_command_list.restype = c_int
+
+nkWrapper_font_atlas_restore = _nuklear.nkWrapper_font_atlas_restore
+nkWrapper_font_atlas_restore.argtypes = [POINTER(FontAtlas), c_int, c_int,
+                                         Recti, POINTER(Cursor),
+                                         POINTER(BakedFont), c_int,
+                                         POINTER(FontGlyph), c_int]
+nkWrapper_font_atlas_restore.restype = c_int
+
+
+# not bound:
+#   nk_labelf (variadic)
+#   nk_labelf_colored (variadic)
+#   nk_labelf_wrap (variadic)
+#   nk_labelf_colored_wrap (variadic)
+#   nk_labelfv (va_list)
+#   nk_labelfv_colored (va_list)
+#   nk_labelfv_wrap (va_list)
+#   nk_labelfv_colored_wrap (va_list)
+#   nk_tooltipf (variadic)
+#   nk_tooltipfv (va_list)
@@ -0,0 +1,176 @@
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# The software rendering backend: nuklear_raster.h rasterizes the converted
+# triangles into a numpy RGBA framebuffer, without a GPU, GLFW or a display,
+# e.g. for screenshots and visual regression tests.
+#
+#     rasterizer = nkraster.Rasterizer(1920, 1080)
+#     atlas = rasterizer.font_stash_begin()
+#     nk.nk_font_atlas_add_default(atlas, 13.0, None)
+#     nuklear = nk.NuklearContext.create(rasterizer.font_stash_end())
+#     ... build the frame ...
+#     rasterizer.render(nuklear.ctx)
+#     rasterizer.write_png("frame.png")
+
+import time
+import zlib
+import struct
+from ctypes import byref, c_int, c_ubyte, POINTER, memmove
+
+import numpy as np
+
+import pynuklear.nuklear as nk
+from pynuklear.fonts import FontPages
+
+
+RasterImage = nk.RasterImage
+
+
+def rasterImage(image):
+    """A RasterImage describing a (height, width, 4) uint8 numpy array."""
+    return RasterImage(image.ctypes.data_as(POINTER(c_ubyte)),
+                       image.shape[1], image.shape[0], image.strides[0])
+
+
+class Rasterizer:
+    def __init__(self, width, height, antialiasing=nk.NK_ANTI_ALIASING_ON):
+        self.framebuffer = np.zeros((height, width, 4), np.uint8)
+        self.target = rasterImage(self.framebuffer)
+        self.converter = nk.Converter(antialiasing=antialiasing)
+        self.clearColor = nk.Color(0, 0, 0, 255)
+        # the images of the textures, by the id of their handle
+        self.textures = []
+        self._textureArray = (RasterImage * 0)()
+        self.atlas = None
+        self.fontTexture = None
+        self.fontPages = None
+
+    def resize(self, width, height):
+        if self.framebuffer.shape[:2] != (height, width):
+            self.framebuffer = np.zeros((height, width, 4), np.uint8)
+            self.target = rasterImage(self.framebuffer)
+
+    # adds a (height, width, 4) uint8 RGBA image, returning its texture id,
+    # for nk.nk_handle_id and nk.nk_image_id
+    def add_texture(self, image):
+        image = np.ascontiguousarray(image, np.uint8)
+        self.textures.append(image)
+        self._updateTextures()
+        return len(self.textures) - 1
+
+    def _updateTextures(self):
+        self._textureArray = (RasterImage * len(self.textures))(
+            *[rasterImage(texture) for texture in self.textures])
+
+    # returns the POINTER(FontAtlas) to add fonts to, as
+    # glfw3_font_stash_begin does
+    def font_stash_begin(self):
+        self.atlas = nk.FontAtlas()
+        nk.nk_font_atlas_init_default(byref(self.atlas))
+        nk.nk_font_atlas_begin(byref(self.atlas))
+        return POINTER(nk.FontAtlas)(self.atlas)
+
+    # bakes the atlas into a texture, and returns its default font, the
+    # first font added if there is no default.  baked, a RGBA32
+    # fontcache.BakedAtlas of the atlas, saves baking it here.  lazyPages
+    # bakes the glyphs the fonts lack once asked for, see update_font_pages.
+    def font_stash_end(self, baked=None, lazyPages=False):
+        if baked is None:
+            width, height = c_int(), c_int()
+            pixels = nk.nk_font_atlas_bake(byref(self.atlas), byref(width), byref(height),
+                                           nk.NK_FONT_ATLAS_RGBA32)
+            width, height = width.value, height.value
+        else:
+            pixels, width, height = baked.wait()
+        image = np.empty((height, width, 4), np.uint8)
+        memmove(image.ctypes.data, pixels, image.nbytes)
+        self.fontTexture = self.add_texture(image)
+        nk.nk_font_atlas_end(byref(self.atlas), nk.nk_handle_id(self.fontTexture),
+                             byref(self.converter.config.null))
+        if baked is not None:
+            baked.close()
+        if lazyPages:
+            self.fontPages = FontPages(self.atlas)
+        return self.atlas.default_font or self.atlas.fonts
+
+    # bakes the atlas again into the font texture if the frames rendered
+    # since asked for glyphs it lacks; returns whether it did, in which case
+    # the next frame lays out their text with them, and the text widths of
+    # NuklearContext.measure are to be forgotten
+    def update_font_pages(self):
+        if self.fontPages is None or not self.fontPages.pending():
+            return False
+        pixels, width, height = self.fontPages.bake(nk.NK_FONT_ATLAS_RGBA32)
+        image = np.empty((height, width, 4), np.uint8)
+        memmove(image.ctypes.data, pixels, image.nbytes)
+        self.textures[self.fontTexture] = image
+        self._updateTextures()
+        nk.nk_font_atlas_end(byref(self.atlas), nk.nk_handle_id(self.fontTexture),
+                             byref(self.converter.config.null))
+        return True
+
+    # converts the frame of ctx, draws it over the clear color and clears
+    # ctx, as glfw3_render does.  Returns the framebuffer.  stats, a
+    # nk.FrameStats, receives the convert and draw times and the counters.
+    def render(self, ctx, stats=None):
+        start = time.perf_counter()
+        self.converter.convert(ctx)
+        converted = time.perf_counter()
+        nk.nk_raster_clear(byref(self.target), self.clearColor)
+        converter = self.converter
+        nk.nk_raster_render(ctx, byref(converter.cmds),
+                            converter.vertexMemory.ctypes.data_as(POINTER(nk.RasterVertex)),
+                            converter.elementMemory.ctypes.data_as(POINTER(nk.nk_draw_index)),
+                            self._textureArray, len(self.textures), byref(self.target))
+        if stats is not None:
+            stats.record('convert', converted - start)
+            stats.record('draw', time.perf_counter() - converted)
+            stats.count('vertices', len(converter.vertices))
+            stats.count('elements', len(converter.elements))
+            stats.count('draw_commands', len(converter.commands))
+            stats.count('command_bytes', ctx.contents.memory.allocated)
+        nk.nk_clear(ctx)
+        return self.framebuffer
+
+    def write_png(self, path):
+        height, width = self.framebuffer.shape[:2]
+        # each row starts with filter type 0
+        rows = np.zeros((height, width * 4 + 1), np.uint8)
+        rows[:, 1:] = self.framebuffer.reshape(height, width * 4)
+
+        def chunk(kind, data):
+            return (struct.pack('>I', len(data)) + kind + data
+                    + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+            f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+            f.write(chunk(b'IEND', b''))
+
+    def free(self):
+        if self.atlas is not None:
+            nk.nk_font_atlas_clear(byref(self.atlas))
+            self.atlas = None
+        if self.fontPages is not None:
+            self.fontPages.free()
+            self.fontPages = None
+        self.converter.free()
@@ -0,0 +1,1236 @@
+#!/usr/bin/env python3
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Generates src/pynuklear/nuklear_h.py, the ctypes declarations of everything
+# that pynuklearc exports: nuklear.h's API, the GLFW backend and the
+# nkWrapper_* helpers.
+#
+# The headers are read the way the C compiler reads them when it builds
+# pynuklearc, i.e. with the NK_INCLUDE_* defines of
+# contrib/nuklear/nuklearGLFWOpenGL3.c, so the generated module matches the
+# extension that setup.py builds.  Only the declarations are used; the
+# *_IMPLEMENTATION sections are skipped.
+#
+# Re-run this whenever nuklear.h, a backend header or the defines change:
+#
+#     python3 tools/generate_bindings.py
+
+import os
+import re
+import argparse
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SOURCE = os.path.join(ROOT, 'contrib', 'nuklear', 'nuklearGLFWOpenGL3.c')
+DEFAULT_OUTPUT = os.path.join(ROOT, 'src', 'pynuklear', 'nuklear_h.py')
+
+# what the compiler predefines on the platforms pyNuklear supports
+PREDEFINED = {'__GNUC__': '4',
+              '__STDC__': '1',
+              '__STDC_VERSION__': '199901L',
+              '__x86_64__': '1'}
+
+BUILTIN_TYPES = {
+    ('void',): None,
+    ('char',): 'c_char',
+    ('signed', 'char'): 'c_byte',
+    ('unsigned', 'char'): 'c_ubyte',
+    ('short',): 'c_short',
+    ('short', 'int'): 'c_short',
+    ('signed', 'short'): 'c_short',
+    ('unsigned', 'short'): 'c_ushort',
+    ('unsigned', 'short', 'int'): 'c_ushort',
+    ('int',): 'c_int',
+    ('signed',): 'c_int',
+    ('signed', 'int'): 'c_int',
+    ('unsigned',): 'c_uint',
+    ('unsigned', 'int'): 'c_uint',
+    ('long',): 'c_long',
+    ('long', 'int'): 'c_long',
+    ('unsigned', 'long'): 'c_ulong',
+    ('long', 'long'): 'c_longlong',
+    ('unsigned', 'long', 'long'): 'c_ulonglong',
+    ('float',): 'c_float',
+    ('double',): 'c_double',
+    ('int8_t',): 'c_int8',
+    ('uint8_t',): 'c_uint8',
+    ('int16_t',): 'c_int16',
+    ('uint16_t',): 'c_uint16',
+    ('int32_t',): 'c_int32',
+    ('uint32_t',): 'c_uint32',
+    ('int64_t',): 'c_int64',
+    ('uint64_t',): 'c_uint64',
+    ('size_t',): 'c_size_t',
+    ('uintptr_t',): 'c_size_t',
+    ('intptr_t',): 'c_ssize_t',
+    ('ptrdiff_t',): 'c_ssize_t',
+}
+
+# struct tags whose Python name is not simply the CamelCased tag
+CLASS_NAMES = {'nk_colorf': 'ColorF'}
+
+QUALIFIERS = {'const', 'volatile', 'register', 'restrict', 'extern',
+              '__restrict', '__inline', '__inline__'}
+
+
+class GeneratorError(Exception):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# lexing and preprocessing
+# ---------------------------------------------------------------------------
+
+TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<id>[A-Za-z_]\w*)
+  | (?P<num>(?:0[xX][0-9A-Fa-f]+|\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)[uUlLfF]*)
+  | (?P<str>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+  | (?P<op>\.\.\.|<<|>>|<=|>=|==|!=|&&|\|\||\#\#|->|[-+*/%&|^~!<>=?:;,.()\[\]{}\#])
+''', re.VERBOSE)
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise GeneratorError('cannot tokenize %r' % text[pos:pos + 40])
+        pos = match.end()
+        if match.lastgroup != 'ws':
+            tokens.append(match.group())
+    return tokens
+
+
+def strip_comments(text):
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in '"\'':
+            j = i + 1
+            while j < n and text[j] != c:
+                j += 2 if text[j] == '\\' else 1
+            out.append(text[i:j + 1])
+            i = j + 1
+        elif text.startswith('/*', i):
+            j = text.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            out.append(' ' + '\n' * text.count('\n', i, j))
+            i = j
+        elif text.startswith('//', i):
+            j = text.find('\n', i)
+            i = n if j < 0 else j
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out)
+
+
+def logical_lines(text):
+    """Yield (line number, line) with backslash continuations joined."""
+    lines = strip_comments(text).split('\n')
+    i = 0
+    while i < len(lines):
+        number = i + 1
+        line = lines[i]
+        while line.endswith('\\') and i + 1 < len(lines):
+            i += 1
+            line = line[:-1] + ' ' + lines[i]
+        yield number, line
+        i += 1
+
+
+class Macro:
+    def __init__(self, body, params=None):
+        self.body = body
+        self.params = params
+
+
+class Preprocessor:
+    def __init__(self, defines):
+        self.macros = {}
+        for name, value in defines.items():
+            self.macros[name] = Macro(tokenize(value))
+        self.tokens = []
+        self.included = set()
+        # object-like macros of the headers, in definition order
+        self.defined = []
+
+    def define(self, text):
+        match = re.match(r'\s*([A-Za-z_]\w*)(\(([^)]*)\))?(.*)$', text)
+        name, has_params, params, body = match.groups()
+        if has_params:
+            params = [p.strip() for p in params.split(',') if p.strip()]
+            self.macros[name] = Macro(tokenize(body), params)
+        else:
+            self.macros[name] = Macro(tokenize(body))
+
+    def is_defined(self, name):
+        # the implementation sections hold no declarations
+        if name.endswith('_IMPLEMENTATION'):
+            return False
+        return name in self.macros
+
+    def condition(self, text):
+        text = re.sub(r'defined\s*\(\s*(\w+)\s*\)|defined\s+(\w+)',
+                      lambda m: '1' if self.is_defined(m.group(1) or m.group(2)) else '0',
+                      text)
+        tokens = self.expand(tokenize(text))
+        tokens = ['0' if re.match(r'[A-Za-z_]', t) else t for t in tokens]
+        return bool(evaluate(tokens, {}))
+
+    def process_file(self, path):
+        path = os.path.abspath(path)
+        if path in self.included:
+            return
+        self.included.add(path)
+        directory = os.path.dirname(path)
+        with open(path) as f:
+            text = f.read()
+        # each entry: (this branch active, some branch already taken)
+        stack = []
+        active = True
+        for number, line in logical_lines(text):
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                directive = stripped[1:].strip()
+                match = re.match(r'(\w+)\s*(.*)$', directive)
+                if not match:
+                    continue
+                keyword, rest = match.groups()
+                if keyword in ('if', 'ifdef', 'ifndef'):
+                    if not active:
+                        stack.append((active, True, False))
+                        continue
+                    if keyword == 'ifdef':
+                        taken = self.is_defined(rest.split()[0])
+                    elif keyword == 'ifndef':
+                        taken = not self.is_defined(rest.split()[0])
+                    else:
+                        taken = self.condition(rest)
+                    stack.append((active, taken, True))
+                    active = taken
+                elif keyword == 'elif':
+                    outer, taken, live = stack[-1]
+                    if live and not taken and self.condition(rest):
+                        stack[-1] = (outer, True, live)
+                        active = True
+                    else:
+                        active = False
+                elif keyword == 'else':
+                    outer, taken, live = stack[-1]
+                    active = live and not taken
+                    stack[-1] = (outer, True, live)
+                elif keyword == 'endif':
+                    active = stack.pop()[0]
+                elif not active:
+                    continue
+                elif keyword == 'define':
+                    self.define(rest)
+                    self.defined.append(rest.split('(')[0].split()[0])
+                elif keyword == 'undef':
+                    self.macros.pop(rest.split()[0], None)
+                elif keyword == 'include':
+                    match = re.match(r'"([^"]+)"', rest)
+                    if match:
+                        local = os.path.join(directory, match.group(1))
+                        if os.path.exists(local):
+                            self.process_file(local)
+                continue
+            if active and stripped:
+                line_tokens = tokenize(line)
+                self.macros['__LINE__'] = Macro([str(number)])
+                self.tokens.extend(self.expand(line_tokens))
+
+    def expand(self, tokens, hidden=frozenset()):
+        out = []
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            macro = self.macros.get(token)
+            if macro is None or token in hidden:
+                out.append(token)
+                i += 1
+                continue
+            if macro.params is None:
+                out.extend(self.expand(macro.body, hidden | {token}))
+                i += 1
+                continue
+            if i + 1 >= len(tokens) or tokens[i + 1] != '(':
+                out.append(token)
+                i += 1
+                continue
+            args, i = collect_arguments(tokens, i + 1)
+            if len(macro.params) == 0 and args == [[]]:
+                args = []
+            if len(args) != len(macro.params):
+                raise GeneratorError('macro %s expects %d arguments' % (token, len(macro.params)))
+            bound = dict(zip(macro.params, args))
+            out.extend(self.expand(self.substitute(macro.body, bound, hidden), hidden | {token}))
+        return out
+
+    def substitute(self, body, bound, hidden):
+        if '##' in body:
+            return paste(body, bound, self, hidden)
+        result = []
+        i = 0
+        while i < len(body):
+            token = body[i]
+            if token == '#' and i + 1 < len(body) and body[i + 1] in bound:
+                result.append('"%s"' % ' '.join(bound[body[i + 1]]))
+                i += 2
+                continue
+            if token in bound:
+                result.extend(self.expand(bound[token], hidden))
+            else:
+                result.append(token)
+            i += 1
+        return result
+
+
+def paste(body, bound, preprocessor, hidden):
+    # pieces: lists of tokens separated by ##, where the last token of a piece
+    # is glued to the first token of the next one
+    pieces = [[]]
+    for token in body:
+        if token == '##':
+            pieces.append([])
+        else:
+            pieces[-1].append(token)
+
+    def replace(tokens, expand_first, expand_last):
+        out = []
+        for index, token in enumerate(tokens):
+            if token in bound:
+                edge = (index == 0 and not expand_first) or \
+                       (index == len(tokens) - 1 and not expand_last)
+                arg = bound[token]
+                out.extend(arg if edge else preprocessor.expand(arg, hidden))
+            else:
+                out.append(token)
+        return out
+
+    result = []
+    for index, piece in enumerate(pieces):
+        piece = replace(piece, index == 0, index == len(pieces) - 1)
+        if result and piece:
+            result[-1] = result[-1] + piece[0]
+            result.extend(piece[1:])
+        else:
+            result.extend(piece)
+    return tokenize(' '.join(result))
+
+
+def collect_arguments(tokens, i):
+    """tokens[i] is '('; return the argument token lists and the index after ')'."""
+    depth = 0
+    args = [[]]
+    i += 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            if depth == 0:
+                return args, i + 1
+            depth -= 1
+        elif token == ',' and depth == 0:
+            args.append([])
+            i += 1
+            continue
+        args[-1].append(token)
+        i += 1
+    raise GeneratorError('unterminated macro arguments')
+
+
+# ---------------------------------------------------------------------------
+# constant expressions
+# ---------------------------------------------------------------------------
+
+class ExpressionParser:
+    """Translates a C constant expression to Python source."""
+
+    BINARY = [['||'], ['&&'], ['|'], ['^'], ['&'], ['==', '!='],
+              ['<', '>', '<=', '>='], ['<<', '>>'], ['+', '-'], ['*', '/', '%']]
+    PYTHON = {'||': 'or', '&&': 'and', '/': '//'}
+
+    def __init__(self, tokens, sizeof=None):
+        self.tokens = tokens
+        self.pos = 0
+        self.sizeof = sizeof
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if expected is not None and token != expected:
+            raise GeneratorError('expected %r, got %r' % (expected, token))
+        self.pos += 1
+        return token
+
+    def parse(self):
+        result = self.ternary()
+        if self.pos != len(self.tokens):
+            raise GeneratorError('trailing tokens in %s' % ' '.join(self.tokens))
+        return result
+
+    def ternary(self):
+        condition = self.binary(0)
+        if self.peek() == '?':
+            self.take()
+            yes = self.ternary()
+            self.take(':')
+            no = self.ternary()
+            return '(%s if %s else %s)' % (yes, condition, no)
+        return condition
+
+    def binary(self, level):
+        if level == len(self.BINARY):
+            return self.unary()
+        left = self.binary(level + 1)
+        while self.peek() in self.BINARY[level]:
+            op = self.take()
+            right = self.binary(level + 1)
+            left = '(%s %s %s)' % (left, self.PYTHON.get(op, op), right)
+        return left
+
+    def unary(self):
+        token = self.peek()
+        if token == '!':
+            self.take()
+            return '(not %s)' % self.unary()
+        if token in ('-', '+', '~'):
+            self.take()
+            return '(%s%s)' % (token, self.unary())
+        if token == 'sizeof':
+            self.take()
+            self.take('(')
+            depth = 0
+            start = self.pos
+            while depth or self.peek() != ')':
+                depth += {'(': 1, ')': -1}.get(self.take(), 0)
+            type_tokens = self.tokens[start:self.pos]
+            self.take(')')
+            if self.sizeof is None:
+                raise GeneratorError('sizeof in constant expression')
+            return 'sizeof(%s)' % self.sizeof(type_tokens)
+        if token == '(':
+            self.take()
+            inner = self.ternary()
+            self.take(')')
+            return inner if parenthesized(inner) else '(%s)' % inner
+        return self.primary()
+
+    def primary(self):
+        token = self.take()
+        if token is None:
+            raise GeneratorError('unexpected end of expression')
+        if token[0] == "'":
+            return str(ord(eval(token)))
+        if re.match(r'[0-9.]', token):
+            literal = token.rstrip('uUlL')
+            if re.search(r'[.eE]', literal) and not literal.lower().startswith('0x'):
+                return repr(float(literal.rstrip('fF')))
+            return str(int(literal, 0) if not re.match(r'0\d', literal) else int(literal, 8))
+        if re.match(r'[A-Za-z_]\w*$', token):
+            return token
+        raise GeneratorError('unexpected %r in expression' % token)
+
+
+def parenthesized(text):
+    if not text.startswith('('):
+        return False
+    depth = 0
+    for index, char in enumerate(text):
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if depth == 0:
+            return index == len(text) - 1
+    return False
+
+
+def evaluate(tokens, names):
+    return eval(ExpressionParser(tokens).parse(), {'__builtins__': {}}, names)
+
+
+# ---------------------------------------------------------------------------
+# declarations
+# ---------------------------------------------------------------------------
+
+def strip_attributes(tokens):
+    out = []
+    i = 0
+    while i < len(tokens):
+        if tokens[i] in ('__attribute__', '__declspec') and i + 1 < len(tokens) and tokens[i + 1] == '(':
+            _, i = collect_arguments(tokens, i + 1)
+            continue
+        out.append(tokens[i])
+        i += 1
+    return out
+
+
+def split_statements(tokens):
+    """Split at top level ';' and after the body of a function definition."""
+    statements = []
+    current = []
+    depth = 0
+    for index, token in enumerate(tokens):
+        current.append(token)
+        if token in ('{', '(', '['):
+            depth += 1
+        elif token in ('}', ')', ']'):
+            depth -= 1
+            if token == '}' and depth == 0:
+                opening = find_body_start(current)
+                if opening > 0 and current[opening - 1] == ')':
+                    statements.append(current)
+                    current = []
+        elif token == ';' and depth == 0:
+            statements.append(current[:-1])
+            current = []
+    if current:
+        statements.append(current)
+    return [s for s in statements if s]
+
+
+def find_body_start(tokens):
+    depth = 0
+    for index in range(len(tokens) - 1, -1, -1):
+        token = tokens[index]
+        if token == '}':
+            depth += 1
+        elif token == '{':
+            depth -= 1
+            if depth == 0:
+                return index
+    return -1
+
+
+def function_pointer_name(tokens):
+    """The name in 'ret (*name)(params)', or None."""
+    depth = 0
+    for index, token in enumerate(tokens[:-2]):
+        if token == '[':
+            depth += 1
+        elif token == ']':
+            depth -= 1
+        elif token == '(' and depth == 0 and tokens[index + 1] == '*':
+            return tokens[index + 2]
+    return None
+
+
+def top_level(tokens):
+    out = []
+    depth = 0
+    for token in tokens:
+        if token in ('(', '[', '{'):
+            depth += 1
+        elif token in (')', ']', '}'):
+            depth -= 1
+        elif depth == 0:
+            out.append(token)
+    return out
+
+
+def outside_braces(tokens):
+    out = []
+    depth = 0
+    for token in tokens:
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+        elif depth == 0:
+            out.append(token)
+    return out
+
+
+def split_commas(tokens):
+    parts = [[]]
+    depth = 0
+    for token in tokens:
+        if token in ('(', '[', '{'):
+            depth += 1
+        elif token in (')', ']', '}'):
+            depth -= 1
+        elif token == ',' and depth == 0:
+            parts.append([])
+            continue
+        parts[-1].append(token)
+    return parts
+
+
+def class_name(tag):
+    if tag in CLASS_NAMES:
+        return CLASS_NAMES[tag]
+    name = tag[3:] if tag.startswith('nk_') else tag
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_') if part)
+
+
+class Record:
+    """A struct or union."""
+
+    def __init__(self, tag, kind):
+        self.tag = tag
+        self.kind = kind
+        self.name = class_name(tag)
+        self.body = None
+        self.fields = None
+        self.error = None
+
+
+class Declarations:
+    def __init__(self):
+        self.constants = []          # (name, python value source)
+        self.constant_values = {}
+        self.typedefs = {}           # name -> (kind, payload)
+        self.typedef_order = []
+        self.records = {}            # tag -> Record
+        self.record_order = []
+        self.enums = set()
+        self.functions = {}          # name -> (restype, argtypes)
+        self.function_order = []
+        self.skipped = []            # (name, reason)
+        self.anonymous = 0
+
+    # -- top level -----------------------------------------------------------
+
+    def parse(self, tokens):
+        for statement in split_statements(strip_attributes(tokens)):
+            try:
+                self.statement(statement)
+            except GeneratorError as error:
+                self.skipped.append((' '.join(statement[:6]), str(error)))
+
+    def statement(self, tokens):
+        if tokens[0] == 'typedef':
+            self.typedef(tokens[1:])
+        elif '(' not in outside_braces(tokens):
+            if tokens[0] in ('struct', 'union', 'enum'):
+                self.aggregate(tokens)
+        else:
+            self.function(tokens)
+
+    def aggregate(self, tokens):
+        """struct/union/enum definitions or forward declarations; returns a type."""
+        kind = tokens[0]
+        if len(tokens) > 1 and tokens[1] != '{':
+            tag = tokens[1]
+            rest = tokens[2:]
+        else:
+            self.anonymous += 1
+            tag = None
+            rest = tokens[1:]
+        body = None
+        if rest and rest[0] == '{':
+            end = matching(rest, 0)
+            body = rest[1:end]
+            rest = rest[end + 1:]
+        if kind == 'enum':
+            if body is not None:
+                self.enum_constants(body)
+            if tag:
+                self.enums.add(tag)
+            return ('enum', tag), rest
+        if tag is None:
+            tag = '_anonymous%d' % self.anonymous
+        record = self.records.get(tag)
+        if record is None:
+            record = self.records[tag] = Record(tag, kind)
+            self.record_order.append(tag)
+        if body is not None:
+            record.body = body
+        return ('record', tag), rest
+
+    def macro_constants(self, preprocessor):
+        """The numeric NK_* defines, e.g. NK_UTF_SIZE."""
+        for name in preprocessor.defined:
+            macro = preprocessor.macros.get(name)
+            if not name.startswith('NK_') or macro is None or \
+                    macro.params is not None or not macro.body:
+                continue
+            try:
+                value = evaluate(preprocessor.expand(macro.body), {})
+            except (GeneratorError, NameError, SyntaxError, TypeError):
+                continue
+            if name not in self.constant_values:
+                self.constants.append((name, value))
+                self.constant_values[name] = value
+
+    def enum_constants(self, body):
+        value = -1
+        for part in split_commas(body):
+            if not part:
+                continue
+            name = part[0]
+            if len(part) > 1:
+                value = self.constant(part[2:])
+            else:
+                value = value + 1
+            self.constants.append((name, value))
+            self.constant_values[name] = value
+
+    def constant(self, tokens):
+        return evaluate(tokens, dict(self.constant_values))
+
+    def typedef(self, tokens):
+        if tokens[0] in ('struct', 'union', 'enum'):
+            base, rest = self.aggregate(tokens)
+        else:
+            base, rest = None, tokens
+        if base is not None and base[0] == 'record' and base[1].startswith('_anonymous'):
+            # name anonymous structures after their typedef
+            declarator = [t for t in rest if re.match(r'[A-Za-z_]', t)]
+            if declarator and '*' not in rest:
+                record = self.records.pop(base[1])
+                self.record_order.remove(base[1])
+                record.tag = declarator[-1]
+                record.name = class_name(record.tag)
+                self.records[record.tag] = record
+                self.record_order.append(record.tag)
+                base = ('record', record.tag)
+        if '(' in rest and base is None:
+            # typedef ret (*name)(params);
+            open_index = rest.index('(')
+            if rest[open_index + 1] == '*':
+                name = rest[open_index + 2]
+                close = matching(rest, open_index)
+                params = rest[close + 2:matching(rest, close + 1)]
+                self.add_typedef(name, ('function', (rest[:open_index], params)))
+                return
+            raise GeneratorError('unsupported typedef')
+        for declarator in split_commas(rest):
+            if base is None:
+                spec, stars, name, dims = self.declarator(declarator, first=True)
+                base_type = ('spec', spec)
+            else:
+                stars, name, dims = self.simple_declarator(declarator)
+                base_type = base
+            if name is None:
+                continue
+            self.add_typedef(name, ('alias', (base_type, stars, dims)))
+
+    def add_typedef(self, name, value):
+        if name not in self.typedefs:
+            self.typedef_order.append(name)
+        self.typedefs[name] = value
+
+    def function(self, tokens):
+        if '{' in tokens:
+            tokens = tokens[:find_body_start(tokens)]
+        open_index = tokens.index('(')
+        name = tokens[open_index - 1]
+        specifiers = tokens[:open_index - 1]
+        if not re.match(r'nk', name) or not specifiers:
+            return
+        if 'static' in specifiers or 'inline' in specifiers or 'typedef' in specifiers:
+            return
+        close = matching(tokens, open_index)
+        params = tokens[open_index + 1:close]
+        if name in self.functions:
+            return
+        try:
+            restype = self.resolve(specifiers, 'return')
+            argtypes = []
+            parts = split_commas(params)
+            if parts == [['void']] or parts == [[]]:
+                parts = []
+            for part in parts:
+                if part == ['...']:
+                    raise GeneratorError('variadic')
+                argtypes.append(self.resolve(part, 'param'))
+        except GeneratorError as error:
+            self.skipped.append((name, str(error)))
+            return
+        self.functions[name] = (restype, argtypes)
+        self.function_order.append(name)
+
+    # -- declarators ---------------------------------------------------------
+
+    def declarator(self, tokens, first):
+        """Split 'spec *name[dim]' into (spec, stars, name, dims)."""
+        tokens = list(tokens)
+        dims = []
+        while tokens and tokens[-1] == ']':
+            open_index = len(tokens) - 1
+            depth = 0
+            while True:
+                if tokens[open_index] == ']':
+                    depth += 1
+                elif tokens[open_index] == '[':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                open_index -= 1
+            dims.insert(0, tokens[open_index + 1:-1])
+            tokens = tokens[:open_index]
+        name = None
+        meaningful = [t for t in tokens if t not in QUALIFIERS]
+        if meaningful and re.match(r'[A-Za-z_]\w*$', tokens[-1]) and \
+                (not first or not self.is_type_only(meaningful)):
+            name = tokens[-1]
+            tokens = tokens[:-1]
+        stars = 0
+        while tokens and tokens[-1] in ('*', 'const'):
+            if tokens[-1] == '*':
+                stars += 1
+            tokens = tokens[:-1]
+        return tokens, stars, name, dims
+
+    def simple_declarator(self, tokens):
+        spec, stars, name, dims = self.declarator(tokens, first=False)
+        stars += spec.count('*')
+        return stars, name, dims
+
+    def is_type_only(self, tokens):
+        """True if tokens (qualifiers removed) name a type without a declarator."""
+        words = [t for t in tokens if t != '*']
+        if not words:
+            return True
+        if words[0] in ('struct', 'union', 'enum'):
+            return len(words) <= 2
+        if tuple(words) in BUILTIN_TYPES:
+            return True
+        if len(words) == 1:
+            return True
+        return False
+
+    # -- type resolution -----------------------------------------------------
+
+    def resolve(self, tokens, usage):
+        """Python source for the ctypes type of a parameter, return or field."""
+        if '(' in tokens:
+            # function pointer
+            return 'c_void_p'
+        spec, stars, name, dims = self.declarator(tokens, first=True)
+        const = 'const' in spec[:max(1, len(spec))]
+        spec = [t for t in spec if t not in QUALIFIERS]
+        stars += spec.count('*')
+        spec = [t for t in spec if t != '*']
+        if usage in ('param', 'callback') and dims:
+            stars += len(dims)
+            dims = []
+        return self.build(spec, stars, dims, usage, const)
+
+    def build(self, spec, stars, dims, usage, const=False):
+        base, by_value = self.base(spec)
+        if base == 'va_list':
+            raise GeneratorError('va_list')
+        if base is None and stars == 0:
+            if dims or usage != 'return':
+                raise GeneratorError('void value')
+            return 'None'
+        if base == '<unknown>':
+            if stars == 0:
+                raise GeneratorError('unknown type %s' % ' '.join(spec))
+            base, stars = 'c_void_p', stars - 1
+        elif base == '<function>':
+            if stars:
+                base, stars = 'c_void_p', stars - 1
+            elif usage in ('param', 'return', 'callback'):
+                base = 'c_void_p'
+            else:
+                base = by_value
+        elif base == '<array>':
+            element, count, element_spec = by_value
+            if usage in ('param', 'callback') and stars == 0:
+                return self.build(element_spec, 1, [], usage, const)
+            base = '(%s * %s)' % (element, count)
+        elif base is None:
+            base, stars = 'c_void_p', stars - 1
+        elif base == 'c_char' and stars:
+            # text handed to a callback is not NUL terminated, so the
+            # callback gets a pointer to use with ctypes.string_at
+            base = 'c_char_p' if const and usage != 'callback' else 'POINTER(c_char)'
+            stars -= 1
+        result = base
+        for _ in range(stars):
+            result = 'POINTER(%s)' % result
+        for dim in reversed(dims):
+            result = '(%s * %s)' % (result, self.dimension(dim))
+        return result
+
+    def base(self, spec):
+        """(python type, extra) for a specifier; see build for the markers."""
+        if not spec:
+            raise GeneratorError('missing type')
+        if spec[0] in ('struct', 'union'):
+            tag = spec[1]
+            if tag not in self.records:
+                self.records[tag] = Record(tag, spec[0])
+                self.record_order.append(tag)
+            return self.records[tag].name, None
+        if spec[0] == 'enum':
+            return 'c_int', None
+        key = tuple(spec)
+        if key in BUILTIN_TYPES:
+            return BUILTIN_TYPES[key], None
+        if len(spec) == 1:
+            name = spec[0]
+            if name == 'va_list':
+                return 'va_list', None
+            if name in self.typedefs:
+                kind, payload = self.typedefs[name]
+                if kind == 'function':
+                    return '<function>', name
+                base_type, stars, dims = payload
+                if dims:
+                    element_spec = base_type[1] if base_type[0] == 'spec' else None
+                    if element_spec is None or len(dims) != 1:
+                        raise GeneratorError('unsupported array typedef %s' % name)
+                    element = self.build(element_spec, 0, [], 'field')
+                    return '<array>', (name, self.dimension(dims[0]), element_spec)
+                if base_type[0] == 'record':
+                    record = self.records[base_type[1]]
+                    if stars:
+                        return self.build(['struct', record.tag], stars, [], 'field'), None
+                    return record.name, None
+                if base_type[0] == 'enum':
+                    return 'c_int', None
+                return name, None
+        return '<unknown>', None
+
+    def dimension(self, tokens):
+        try:
+            return str(self.constant(tokens))
+        except (GeneratorError, NameError, SyntaxError):
+            return ExpressionParser(tokens, self.sizeof_type).parse()
+
+    def sizeof_type(self, tokens):
+        return self.resolve(tokens, 'field')
+
+    # -- records -------------------------------------------------------------
+
+    def layout_records(self):
+        for tag in list(self.record_order):
+            record = self.records[tag]
+            if record.body is None:
+                continue
+            try:
+                record.fields = self.fields(record)
+            except GeneratorError as error:
+                record.error = str(error)
+                record.fields = None
+
+    def fields(self, record):
+        fields = []
+        for statement in split_statements(record.body):
+            if statement[0] in ('struct', 'union', 'enum') and '{' in statement:
+                base, rest = self.aggregate(statement)
+                if base[0] == 'record':
+                    nested = self.records[base[1]]
+                    nested.fields = self.fields(nested)
+                    spec = ['struct', base[1]]
+                else:
+                    spec = ['enum', base[1]]
+                for declarator in split_commas(rest):
+                    stars, name, dims = self.simple_declarator(declarator)
+                    fields.append((name, self.build(spec, stars, dims, 'field')))
+                continue
+            if ':' in top_level(statement):
+                raise GeneratorError('bit fields')
+            pointer = function_pointer_name(statement)
+            if pointer:
+                # function pointer member: ret (*name)(params)
+                fields.append((pointer, 'c_void_p'))
+                continue
+            parts = split_commas(statement)
+            spec, stars, name, dims = self.declarator(parts[0], first=True)
+            const = 'const' in spec
+            spec = [t for t in spec if t not in QUALIFIERS]
+            fields.append((name, self.build(spec, stars, dims, 'field', const)))
+            for part in parts[1:]:
+                stars, name, dims = self.simple_declarator(part)
+                fields.append((name, self.build(spec, stars, dims, 'field', const)))
+        return fields
+
+
+def matching(tokens, index):
+    pairs = {'(': ')', '[': ']', '{': '}'}
+    opening = tokens[index]
+    closing = pairs[opening]
+    depth = 0
+    for i in range(index, len(tokens)):
+        if tokens[i] == opening:
+            depth += 1
+        elif tokens[i] == closing:
+            depth -= 1
+            if depth == 0:
+                return i
+    raise GeneratorError('unbalanced %s' % opening)
+
+
+# ---------------------------------------------------------------------------
+# output
+# ---------------------------------------------------------------------------
+
+HEADER = '''\
+# Copyright (c) 2017-2018 William Emerison Six
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# GENERATED FILE, DO NOT EDIT.
+#
+# Produced by tools/generate_bindings.py from
+%(sources)s
+# built with
+%(defines)s
+#
+# Every procedure below has its argtypes and restype installed, so ctypes
+# converts arguments without guessing and structures, floats and doubles are
+# passed and returned by value correctly.  Procedures keep their C names;
+# nuklear.py builds the Pythonic NuklearContext methods on top of them.
+
+import inspect
+from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, Union, sizeof,
+                    c_byte, c_char, c_char_p, c_double, c_float, c_int,
+                    c_int8, c_int16, c_int32, c_int64, c_long, c_longlong,
+                    c_short, c_size_t, c_ssize_t, c_ubyte, c_uint, c_uint8,
+                    c_uint16, c_uint32, c_uint64, c_ulong, c_ulonglong,
+                    c_ushort, c_void_p)
+
+import pynuklearc
+_nuklear = CDLL(inspect.getfile(pynuklearc))
+'''
+
+
+def python_value(value):
+    return repr(value)
+
+
+def comment_list(items):
+    return '\n'.join('#     %s' % item for item in items)
+
+
+def emit(decls, sources, defines):
+    out = [HEADER % {'sources': comment_list(sources),
+                     'defines': comment_list(defines)}]
+
+    out.append('\n\n# constants\n\n')
+    seen = set()
+    for name, value in decls.constants:
+        if name in seen:
+            continue
+        seen.add(name)
+        out.append('%s = %s\n' % (name, python_value(value)))
+
+    out.append('\n\n# scalar types\n\n')
+    scalar_typedefs = []
+    for name in decls.typedef_order:
+        kind, payload = decls.typedefs[name]
+        if kind != 'alias':
+            continue
+        base_type, stars, dims = payload
+        if base_type[0] != 'spec' or dims:
+            continue
+        try:
+            python = decls.build(base_type[1], stars, [], 'field')
+        except GeneratorError:
+            continue
+        if python in ('None',) or python == name:
+            continue
+        out.append('%s = %s\n' % (name, python))
+        scalar_typedefs.append(name)
+    for name in decls.typedef_order:
+        kind, payload = decls.typedefs[name]
+        if kind == 'alias' and payload[2]:
+            base_type, stars, dims = payload
+            try:
+                python = decls.build(base_type[1], stars, dims, 'field')
+            except GeneratorError:
+                continue
+            out.append('%s = %s\n' % (name, python))
+
+    records = [decls.records[tag] for tag in decls.record_order
+               if tag.startswith('nk')]
+    out.append('\n\n# structures and unions, see _fields_ below\n\n')
+    for record in records:
+        base = 'Union' if record.kind == 'union' else 'Structure'
+        out.append('\nclass %s(%s):\n    pass\n\n' % (record.name, base))
+    for name in decls.typedef_order:
+        kind, payload = decls.typedefs[name]
+        if kind == 'alias' and payload[0][0] == 'record' and not payload[1] \
+                and decls.records[payload[0][1]].name != class_name(name):
+            out.append('%s = %s\n' % (class_name(name), decls.records[payload[0][1]].name))
+
+    out.append('\n\n# callback types, for building structures such as UserFont\n\n')
+    for name in decls.typedef_order:
+        kind, payload = decls.typedefs[name]
+        if kind != 'function':
+            continue
+        restype_tokens, params = payload
+        try:
+            restype = decls.resolve(restype_tokens, 'return')
+            parts = split_commas(params)
+            if parts == [['void']]:
+                parts = []
+            argtypes = [decls.resolve(p, 'callback') for p in parts]
+        except GeneratorError:
+            continue
+        out.append('%s = CFUNCTYPE(%s)\n' % (name, ', '.join([restype] + argtypes)))
+
+    out.append('\n\n# layouts, ordered so that members are complete before use\n')
+    opaque = []
+    done = set()
+
+    def dependencies(record):
+        # in order of use, so that the output does not depend on hashing
+        names = []
+        for _, python in record.fields:
+            found = re.findall(r'sizeof\((\w+)\)', python)
+            # member types that are not behind a pointer
+            for match in re.finditer(r'\b([A-Z]\w*)\b', python):
+                before = python[:match.start()]
+                if not before.endswith('POINTER('):
+                    found.append(match.group(1))
+            names.extend(n for n in found if n not in names)
+        by_name = {r.name: r for r in records}
+        return [by_name[n] for n in names if n in by_name and n != record.name]
+
+    def visit(record, stack):
+        if record.name in done:
+            return True
+        if record.fields is None:
+            return False
+        if record.name in stack:
+            raise GeneratorError('recursive layout %s' % record.name)
+        for dependency in dependencies(record):
+            if not visit(dependency, stack | {record.name}):
+                record.error = record.error or 'needs opaque %s' % dependency.name
+                record.fields = None
+                return False
+        done.add(record.name)
+        lines = ['%s._fields_ = [' % record.name]
+        indent = ' ' * len(lines[0])
+        for index, (field, python) in enumerate(record.fields):
+            entry = '(%r, %s)' % (field, python)
+            if index == 0:
+                lines[0] += entry
+            else:
+                lines.append(indent + entry)
+        lines[-1] += ']'
+        out.append('\n' + ',\n'.join(lines) + '\n')
+        return True
+
+    for record in records:
+        if not visit(record, frozenset()):
+            opaque.append(record)
+
+    if opaque:
+        out.append('\n# opaque, only usable through pointers:\n')
+        for record in opaque:
+            reason = record.error or 'no definition'
+            out.append('#   %s (%s)\n' % (record.name, reason))
+
+    out.append('\n\n# procedures\n')
+    for name in decls.function_order:
+        restype, argtypes = decls.functions[name]
+        out.append('\n%s = _nuklear.%s\n' % (name, name))
+        if argtypes:
+            line = '%s.argtypes = [' % name
+            indent = ' ' * len(line)
+            text = line
+            for index, argtype in enumerate(argtypes):
+                piece = argtype + (', ' if index < len(argtypes) - 1 else ']')
+                if len(text.split('\n')[-1]) + len(piece) > 79:
+                    text = text.rstrip() + '\n' + indent
+                text += piece
+            out.append(text + '\n')
+        else:
+            out.append('%s.argtypes = []\n' % name)
+        out.append('%s.restype = %s\n' % (name, restype))
+
+    if decls.skipped:
+        out.append('\n\n# not bound:\n')
+        for name, reason in decls.skipped:
+            if re.match(r'nk\w*$', name):
+                out.append('#   %s (%s)\n' % (name, reason))
+    return ''.join(out)
+
+
+def read_source(path):
+    """The NK_* defines and the local headers of the extension's .c file."""
+    defines = {}
+    headers = []
+    with open(path) as f:
+        text = f.read()
+    for _, line in logical_lines(text):
+        if re.match(r'\s*#\s*include\s+<Python.h>', line):
+            # the rest is the CPython module itself
+            break
+        match = re.match(r'\s*#\s*define\s+(NK_\w+)(?:\s+(.*))?$', line)
+        if match and not match.group(1).endswith('_IMPLEMENTATION'):
+            defines[match.group(1)] = (match.group(2) or '').strip()
+        match = re.match(r'\s*#\s*include\s+"(nuklear[^"]*)"', line)
+        if match:
+            headers.append(os.path.join(os.path.dirname(path), match.group(1)))
+    return defines, headers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='generate src/pynuklear/nuklear_h.py, the ctypes declarations of pynuklearc')
+    parser.add_argument('--source', default=DEFAULT_SOURCE,
+                        help='extension source whose defines and headers are used')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    defines, headers = read_source(args.source)
+    preprocessor = Preprocessor(dict(PREDEFINED, **defines))
+    for header in headers:
+        preprocessor.process_file(header)
+
+    decls = Declarations()
+    decls.macro_constants(preprocessor)
+    decls.parse(preprocessor.tokens)
+    decls.layout_records()
+
+    relative = [os.path.relpath(h, ROOT) for h in headers]
+    text = emit(decls, relative, sorted(defines))
+    with open(args.output, 'w') as f:
+        f.write(text)
+    print('%s: %d procedures, %d structures, %d skipped' %
+          (os.path.relpath(args.output, ROOT), len(decls.functions),
+           len([tag for tag in decls.records if tag.startswith('nk')]),
+           len([s for s in decls.skipped if s[0].startswith('nk')])))
+
+
+if __name__ == '__main__':
+    main()